@@ -4,8 +4,12 @@
 # share the state of the background managers and monitors. Else too much
 # API polling and processes having inconsistent states.
 
+# Each live video viewer holds a thread while the MJPEG relay streams
+# to it, so NUM_THREADS leaves room for MjpegRelay.MAX_CLIENTS on top of
+# the threads that serve ordinary requests.
+
 NUM_WORKERS=1
-NUM_THREADS=9
+NUM_THREADS=25
 BINDARG=unix:/var/run/gunicorn.sock
 
 check_redis() {
@@ -116,7 +116,8 @@ class Alert:
     def is_matching_alarm( self, alarm : Alarm ) -> bool:
         return bool( self._first_alarm.signature == alarm.signature )
 
-    def upsert_alarm( self, alarm : Alarm ):
+    def upsert_alarm( self, alarm : Alarm ) -> bool:
+        """ Returns whether the alarm was added (not a re-report). """
         assert alarm.signature == self.first_alarm.signature
         # Always refresh expiry from the incoming alarm. A follow-up
         # submission with a shorter lifetime correctly shortens the
@@ -129,9 +130,9 @@ class Alert:
         if alarm.source_alarm_id is not None:
             for existing in self._latest_alarms:
                 if existing.source_alarm_id == alarm.source_alarm_id:
-                    return
+                    return False
         self._latest_alarms.appendleft( alarm )
-        return
+        return True
         
     def get_latest_alarm(self) -> Alarm:
         if len(self._latest_alarms) > 0:
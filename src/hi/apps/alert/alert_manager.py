@@ -1,6 +1,8 @@
 from datetime import datetime
 import logging
 
+from django.conf import settings
+
 from hi.apps.common.singleton import Singleton
 from hi.apps.console.transient_view_manager import TransientViewManager
 from hi.apps.security.security_mixins import SecurityMixin
@@ -18,7 +20,7 @@ logger = logging.getLogger(__name__)
 class AlertManager( Singleton, NotificationMixin, SecurityMixin ):
 
     def __init_singleton__(self):
-        self._alert_queue = AlertQueue()
+        self._alert_queue = AlertQueue( max_alert_list_size = settings.ALERT_QUEUE_MAX_SIZE )
         self._was_initialized = False
         return
 
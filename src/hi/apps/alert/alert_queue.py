@@ -1,6 +1,9 @@
 from datetime import datetime
+import heapq
+import itertools
 import logging
 import threading
+from typing import Dict, List, Tuple
 
 import hi.apps.common.datetimeproxy as datetimeproxy
 
@@ -13,127 +16,166 @@ logger = logging.getLogger(__name__)
 
 
 class AlertQueue:
+    """
+    The active alerts, indexed for the alert status polling done by
+    every console:
 
-    MAX_ALERT_LIST_SIZE = 50
+      - Alerts by signature (in queue insertion order) and by id.
+      - A heap over (priority, recency) of alerts, for the most
+        important unacknowledged alert.
+      - A heap over (priority, age) of alerts, for evicting the least
+        important, oldest alert when the queue is at capacity.
+      - A heap over expiry time, for maintenance.
+
+    Heap entries are discarded lazily: acknowledged or removed alerts
+    are skipped when they reach the top, and an alert whose expiry is
+    extended gets a new entry, making its old one stale.
+    """
+
+    MAX_ALERT_LIST_SIZE = 500
+
+    # Rebuild a heap once stale entries outnumber live ones by this much.
+    HEAP_COMPACTION_FACTOR = 4
 
     TRACE = False  # for debugging
-    
-    def __init__(self):
-        self._alert_list = list()
+
+    def __init__( self, max_alert_list_size : int = None ):
+        if max_alert_list_size is None:
+            max_alert_list_size = self.MAX_ALERT_LIST_SIZE
+        self._max_alert_list_size = max_alert_list_size
+        self._signature_to_alert : Dict[ str, Alert ] = dict()
+        self._id_to_alert : Dict[ str, Alert ] = dict()
+        self._id_to_insertion_index : Dict[ str, int ] = dict()
+        self._acknowledged_alert_ids = set()
+        # Ids ordered by when their alert last received an alarm.
+        self._alarm_order_alert_ids : Dict[ str, None ] = dict()
+        self._priority_heap : List[ Tuple[ int, int, str ] ] = list()
+        self._eviction_heap : List[ Tuple[ int, int, str ] ] = list()
+        self._expiry_heap : List[ Tuple[ datetime, int, str ] ] = list()
+        self._insertion_counter = itertools.count()
+        self._unacknowledged_alert_list = None  # Lazily rebuilt after changes
         self._active_alerts_lock = threading.Lock()
         self._last_changed_datetime = datetimeproxy.now()
         return
 
     def __bool__(self):
-        return bool( self._alert_list )
-    
+        return bool( self._id_to_alert )
+
     def __len__(self):
-        return len( self._alert_list )
+        return len( self._id_to_alert )
+
+    @property
+    def max_alert_list_size(self) -> int:
+        return self._max_alert_list_size
 
     @property
     def unacknowledged_alert_list(self):
-        return [ x for x in self._alert_list if not x.is_acknowledged ]
-    
+        with self._active_alerts_lock:
+            if self._unacknowledged_alert_list is None:
+                self._unacknowledged_alert_list = [
+                    x for x in self._signature_to_alert.values() if not x.is_acknowledged
+                ]
+            return list( self._unacknowledged_alert_list )
+
     def get_alert( self, alert_id : str ) -> Alert:
-        for alert in self._alert_list:
-            if alert.id == alert_id:
-                return alert
-            continue
-        raise KeyError( f'Alert not found for {alert_id}' )
-        
+        alert = self._id_to_alert.get( alert_id )
+        if alert is None:
+            raise KeyError( f'Alert not found for {alert_id}' )
+        return alert
+
     def get_most_important_unacknowledged_alert( self, since_datetime : datetime = None ):
         """
         Returns the active alert that has the highest priority and which was
         added to the queue since the "since_datetime" passed (if any).  If there are
-        multiple events of the same priority, then an arbitrary one is
-        returned. Returns None if there are no active alerts in the
+        multiple events of the same priority, then the most recently added
+        one is returned. Returns None if there are no active alerts in the
         specified time frame.
         """
         with self._active_alerts_lock:
-            if len(self._alert_list) < 1:
-                return None
-            
             if since_datetime is None:
-                since_datetime = datetimeproxy.min()
-                
+                return self._peek_priority_heap()
+
+            # Newest alerts are last, and since_datetime is normally a
+            # console's previous poll, so this only visits the few
+            # alerts added since then.
             max_alert = None
-            for alert in self._alert_list:
-                if alert.is_acknowledged:
-                    continue
+            for alert in reversed( self._signature_to_alert.values() ):
                 # Use queue_insertion_datetime instead of start_datetime for "new alert" detection
                 if alert.queue_insertion_datetime is None or alert.queue_insertion_datetime <= since_datetime:
+                    break
+                if alert.is_acknowledged:
                     continue
-                if max_alert is None:
-                    max_alert = alert
-                elif alert.alert_priority > max_alert.alert_priority:
+                if max_alert is None or alert.alert_priority > max_alert.alert_priority:
                     max_alert = alert
                 continue
         return max_alert
 
     def get_most_recent_alarm( self, since_datetime : datetime = None ):
         """
-        Of all the alarms in all the alerts, return the most recent
-        one that is new than "since_datetime".  Original use of this routine
-        was to find a URL to switch to when automatically changing displays
-        based on alarms.
+        Of all the alarms in all the alerts, return the most recently
+        received one if it is newer than "since_datetime".  Original use of
+        this routine was to find a URL to switch to when automatically
+        changing displays based on alarms.
         """
-        latest_alarm = None
-        
         with self._active_alerts_lock:
-            if len(self._alert_list) < 1:
-                return None
-            
-            if since_datetime is None:
-                since_datetime = datetimeproxy.min()
-
-            latest_alarm_datetime = datetimeproxy.min()
-            for alert in self._alert_list:
+            for alert_id in reversed( self._alarm_order_alert_ids ):
+                alert = self._id_to_alert[alert_id]
                 if alert.is_acknowledged:
                     continue
                 alarm = alert.get_latest_alarm()
                 if not alarm:
                     continue
-                if alarm.timestamp <= since_datetime:
-                    continue
-                if alarm.timestamp >= latest_alarm_datetime:
-                    latest_alarm = alarm
-                    latest_alarm_datetime = alarm.timestamp
-                continue
-            
-        return latest_alarm
-    
+                if since_datetime is not None and alarm.timestamp <= since_datetime:
+                    return None
+                return alarm
+        return None
+
     def add_alarm( self, alarm : Alarm ) -> Alert:
         if alarm.alarm_level == AlarmLevel.NONE:
             raise ValueError( f'Alarm not alert-worthy: {alarm}'  )
         with self._active_alerts_lock:
-            for alert in self._alert_list:
-                if not alert.is_matching_alarm( alarm = alarm ):
-                    continue
-                alert.upsert_alarm( alarm = alarm )
-                self._last_changed_datetime = datetimeproxy.now()
+            alert = self._signature_to_alert.get( alarm.signature )
+            if alert:
+                is_new_alarm = alert.upsert_alarm( alarm = alarm )
+                self._push_expiry( alert )
+                # A re-reported alarm leaves the latest alarm, and so
+                # this order, unchanged.
+                if is_new_alarm:
+                    self._alarm_order_alert_ids.pop( alert.id, None )
+                    self._alarm_order_alert_ids[alert.id] = None
+                self._mark_changed()
                 logger.debug( f'Added to existing alert: alarm={alarm}, alert={alert}' )
                 return alert
-            
+
+            if len( self._id_to_alert ) >= self._max_alert_list_size:
+                self._evict_least_important()
+
             new_alert = Alert( first_alarm = alarm )
             new_alert.queue_insertion_datetime = datetimeproxy.now()
-            self._alert_list.append( new_alert )
-            self._last_changed_datetime = datetimeproxy.now()
+            insertion_index = next( self._insertion_counter )
+            self._signature_to_alert[new_alert.signature] = new_alert
+            self._id_to_alert[new_alert.id] = new_alert
+            self._id_to_insertion_index[new_alert.id] = insertion_index
+            self._alarm_order_alert_ids[new_alert.id] = None
+            heapq.heappush( self._priority_heap,
+                            ( -new_alert.alert_priority, -insertion_index, new_alert.id ))
+            heapq.heappush( self._eviction_heap,
+                            ( new_alert.alert_priority, insertion_index, new_alert.id ))
+            self._push_expiry( new_alert )
+            self._mark_changed()
             logger.debug( f'Added new alert: {new_alert}' )
             return new_alert
-    
-        return
 
     def acknowledge_alert( self, alert_id : str ):
         logger.debug( f'Acknoweldging alert id: {alert_id}' )
         with self._active_alerts_lock:
-            for alert in self._alert_list:
-                if alert.id != alert_id:
-                    continue
-                alert.is_acknowledged = True
-                self._last_changed_datetime = datetimeproxy.now()
-                return True
-
-            raise KeyError( f'Alert not found for {alert_id}' )
+            alert = self._id_to_alert.get( alert_id )
+            if alert is None:
+                raise KeyError( f'Alert not found for {alert_id}' )
+            alert.is_acknowledged = True
+            self._acknowledged_alert_ids.add( alert_id )
+            self._mark_changed()
+            return True
 
     def remove_expired_or_acknowledged_alerts(self):
         """Remove expired and acknowledged alerts and return detailed results."""
@@ -142,33 +184,116 @@ class AlertQueue:
 
         with self._active_alerts_lock:
             if self.TRACE:
-                logger.debug( f'Alert Check: List size = {len(self._alert_list)}')
-            if len( self._alert_list ) < 1:
+                logger.debug( f'Alert Check: List size = {len(self._id_to_alert)}')
+            if len( self._id_to_alert ) < 1:
                 return AlertQueueCleanupResult()
 
             now_datetime = datetimeproxy.now()
-            new_list = list()
-            for alert in self._alert_list:
-                if alert.end_datetime <= now_datetime:
-                    expired_removed += 1
+            while self._expiry_heap and self._expiry_heap[0][0] <= now_datetime:
+                end_datetime, _, alert_id = heapq.heappop( self._expiry_heap )
+                alert = self._id_to_alert.get( alert_id )
+                if alert is None or alert.end_datetime != end_datetime:
                     continue
-                if alert.is_acknowledged:
+                self._remove_alert( alert )
+                expired_removed += 1
+                continue
+
+            for alert_id in list( self._acknowledged_alert_ids ):
+                alert = self._id_to_alert.get( alert_id )
+                if alert is not None:
+                    self._remove_alert( alert )
                     acknowledged_removed += 1
-                    continue
-                new_list.append( alert )
                 continue
-            
+            self._acknowledged_alert_ids.clear()
+
             total_removed = expired_removed + acknowledged_removed
             logger.debug( f'Removed "{total_removed}" alerts: {expired_removed}'
                           f' expired, {acknowledged_removed} acknowledged.' )
             if total_removed > 0:
-                self._alert_list = new_list
-                self._last_changed_datetime = datetimeproxy.now()
+                self._compact_heaps()
+                self._mark_changed()
 
         return AlertQueueCleanupResult(
             expired_removed = expired_removed,
             acknowledged_removed = acknowledged_removed,
             total_removed = total_removed
         )
-    
-    
+
+    def clear(self):
+        with self._active_alerts_lock:
+            self._signature_to_alert.clear()
+            self._id_to_alert.clear()
+            self._id_to_insertion_index.clear()
+            self._acknowledged_alert_ids.clear()
+            self._alarm_order_alert_ids.clear()
+            self._priority_heap.clear()
+            self._eviction_heap.clear()
+            self._expiry_heap.clear()
+            self._mark_changed()
+        return
+
+    def _mark_changed(self):
+        self._unacknowledged_alert_list = None
+        self._last_changed_datetime = datetimeproxy.now()
+        return
+
+    def _peek_priority_heap(self) -> Alert:
+        while self._priority_heap:
+            alert = self._id_to_alert.get( self._priority_heap[0][2] )
+            if alert is not None and not alert.is_acknowledged:
+                return alert
+            heapq.heappop( self._priority_heap )
+            continue
+        return None
+
+    def _push_expiry( self, alert : Alert ):
+        heapq.heappush( self._expiry_heap,
+                        ( alert.end_datetime, self._id_to_insertion_index[alert.id], alert.id ))
+        if len( self._expiry_heap ) > self.HEAP_COMPACTION_FACTOR * ( len( self._id_to_alert ) + 16 ):
+            self._compact_heaps()
+        return
+
+    def _evict_least_important(self):
+        # Acknowledged alerts are only awaiting removal, so go first.
+        if self._acknowledged_alert_ids:
+            alert_id = min( self._acknowledged_alert_ids,
+                            key = lambda x: self._id_to_insertion_index[x] )
+            alert = self._id_to_alert[alert_id]
+        else:
+            alert = None
+            while self._eviction_heap:
+                _, _, alert_id = heapq.heappop( self._eviction_heap )
+                alert = self._id_to_alert.get( alert_id )
+                if alert is not None:
+                    break
+                continue
+        if alert is None:
+            return
+        logger.warning( f'Alert queue full ({self._max_alert_list_size}). Evicting: {alert}' )
+        self._remove_alert( alert )
+        return
+
+    def _remove_alert( self, alert : Alert ):
+        # Heap entries for the alert become stale and are dropped lazily.
+        del self._id_to_alert[alert.id]
+        del self._signature_to_alert[alert.signature]
+        del self._id_to_insertion_index[alert.id]
+        self._alarm_order_alert_ids.pop( alert.id, None )
+        self._acknowledged_alert_ids.discard( alert.id )
+        return
+
+    def _compact_heaps(self):
+        live_count = len( self._id_to_alert ) + 16
+        if len( self._priority_heap ) > self.HEAP_COMPACTION_FACTOR * live_count:
+            self._priority_heap = [ x for x in self._priority_heap if x[2] in self._id_to_alert ]
+            heapq.heapify( self._priority_heap )
+        if len( self._eviction_heap ) > self.HEAP_COMPACTION_FACTOR * live_count:
+            self._eviction_heap = [ x for x in self._eviction_heap if x[2] in self._id_to_alert ]
+            heapq.heapify( self._eviction_heap )
+        if len( self._expiry_heap ) > self.HEAP_COMPACTION_FACTOR * live_count:
+            self._expiry_heap = [
+                ( alert.end_datetime, self._id_to_insertion_index[alert.id], alert.id )
+                for alert in self._id_to_alert.values()
+            ]
+            heapq.heapify( self._expiry_heap )
+        return
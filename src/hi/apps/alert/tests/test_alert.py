@@ -140,7 +140,7 @@ class TestAlert(BaseTestCase):
             source_alarm_id = 'INCIDENT-A',
         )
         before_end = alert.end_datetime
-        alert.upsert_alarm( repoll_alarm )
+        self.assertFalse( alert.upsert_alarm( repoll_alarm ))
 
         self.assertEqual( alert.alarm_count, 1 )
         self.assertGreater( alert.end_datetime, before_end )
@@ -158,7 +158,7 @@ class TestAlert(BaseTestCase):
             timestamp = datetimeproxy.now(),
             source_alarm_id = 'INCIDENT-B',
         )
-        alert.upsert_alarm( distinct_alarm )
+        self.assertTrue( alert.upsert_alarm( distinct_alarm ))
         self.assertEqual( alert.alarm_count, 2 )
         return
 
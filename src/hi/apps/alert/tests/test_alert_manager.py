@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import hi.apps.common.datetimeproxy as datetimeproxy
 from hi.apps.alert.alert_manager import AlertManager, AlertMaintenanceResult
+from hi.apps.alert.alert_queue import AlertQueue
 from hi.apps.alert.alarm import Alarm
 from hi.apps.alert.enums import AlarmLevel, AlarmSource
 from hi.apps.security.enums import SecurityLevel
@@ -39,6 +40,17 @@ class TestAlertManager(BaseTestCase):
         self.assertTrue(manager._was_initialized)
         return
 
+    def test_alert_queue_size_from_settings(self):
+        manager = AlertManager()
+        try:
+            with self.settings(ALERT_QUEUE_MAX_SIZE=7):
+                manager.__init_singleton__()
+            self.assertEqual(manager._alert_queue.max_alert_list_size, 7)
+        finally:
+            manager.__init_singleton__()
+        self.assertEqual(manager._alert_queue.max_alert_list_size, AlertQueue.MAX_ALERT_LIST_SIZE)
+        return
+
     def test_alert_manager_unacknowledged_alert_list_delegation(self):
         """Test unacknowledged_alert_list property delegation - critical UI integration."""
         manager = AlertManager()
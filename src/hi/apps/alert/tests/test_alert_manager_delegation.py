@@ -39,7 +39,7 @@ class TestAlertManagerDelegation(BaseTestCase):
         
         # Clear AlertManager state (the AlertQueue)
         if hasattr(self, 'alert_manager'):
-            self.alert_manager._alert_queue._alert_list.clear()
+            self.alert_manager._alert_queue.clear()
         
         # Reset singletons for next test
         AlertManager._instance = None
@@ -1,8 +1,10 @@
 import logging
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from django.urls import reverse
 
+from hi.apps.console.console_helper import ConsoleSettingsHelper
 from hi.apps.console.constants import ConsoleConstants
 from hi.testing.view_test_base import AsyncViewTestCase
 
@@ -50,12 +52,29 @@ class TestStatusView(AsyncViewTestCase):
         session.save()
 
         url = reverse('api_status')
-        response = self.async_get(url)
+        with patch.object(ConsoleSettingsHelper, 'get_console_lock_password', return_value='secret'):
+            response = self.async_get(url)
 
         self.assertSuccessResponse(response)
         data = response.json()
         self.assertTrue(data['consoleLocked'])
 
+    def test_status_view_does_not_load_session_without_lock_password(self):
+        """Status polling leaves the session unloaded when no console can be locked."""
+        # Creates a saved session, so the request carries a session cookie.
+        self.assertIsNotNone(self.client.session.session_key)
+
+        url = reverse('api_status')
+        # The first poll moves the console's view into the view cookie.
+        self.async_get(url)
+        with patch.object(ConsoleSettingsHelper, 'get_console_lock_password', return_value=''), \
+             patch('django.contrib.sessions.backends.cached_db.SessionStore.load', return_value={}) as mock_load:
+            response = self.async_get(url)
+
+        self.assertSuccessResponse(response)
+        self.assertFalse(response.json()['consoleLocked'])
+        mock_load.assert_not_called()
+
     def test_status_view_timestamp_format(self):
         """Test that timestamps in status response are properly formatted."""
         url = reverse('api_status')
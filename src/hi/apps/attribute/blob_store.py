@@ -0,0 +1,123 @@
+"""
+Content-addressed storage for attribute files that arrive from
+integrations.  Each distinct file content is stored once, in a
+directory named by its SHA-256 digest, and any number of attributes
+may point at it.  Shared blobs are therefore never deleted along with
+an attribute; remove_unreferenced_blobs() is the cleanup pass.
+"""
+import hashlib
+import logging
+import os
+from pathlib import PurePosixPath
+from typing import Set, Type, TYPE_CHECKING
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils.text import get_valid_filename
+
+from .thumbnail import AttributeThumbnailRules
+
+if TYPE_CHECKING:
+    from .models import AttributeModel
+
+logger = logging.getLogger(__name__)
+
+
+class AttributeBlobStore:
+
+    BLOB_SUBDIRECTORY = 'blobs'
+    DEFAULT_FILENAME = 'attachment'
+
+    def __init__( self, attribute_model_class : Type[ 'AttributeModel' ] ):
+        self._attribute_model_class = attribute_model_class
+        upload_to = attribute_model_class().get_upload_to().rstrip( '/' )
+        self._blob_root = f'{upload_to}/{self.BLOB_SUBDIRECTORY}'
+        return
+
+    @classmethod
+    def is_blob_name( cls, file_name : str ) -> bool:
+        """ Blob names look like <upload_to>/blobs/<digest>/<filename>. """
+        if not file_name:
+            return False
+        parts = PurePosixPath( file_name ).parts
+        return bool( len( parts ) >= 3 and parts[-3] == cls.BLOB_SUBDIRECTORY )
+
+    def save_blob( self, content : bytes, filename : str ) -> str:
+        """
+        Returns the storage name of the blob holding this content,
+        writing it only if no blob with the same content exists.  The
+        first filename stored for a given content is the one kept.
+        """
+        digest = hashlib.sha256( content ).hexdigest()
+        blob_directory = f'{self._blob_root}/{digest}'
+        existing_name = self._get_blob_name( blob_directory )
+        if existing_name:
+            return existing_name
+        filename = get_valid_filename( filename ) if filename else ''
+        return default_storage.save(
+            f'{blob_directory}/{filename or self.DEFAULT_FILENAME}',
+            ContentFile( content ),
+        )
+
+    def remove_unreferenced_blobs(self) -> int:
+        """ Deletes blobs (and their thumbnails) no attribute refers to.  Returns the count. """
+        if not default_storage.exists( self._blob_root ):
+            return 0
+
+        referenced_digests = self._get_referenced_digests()
+        digest_list, _ = default_storage.listdir( self._blob_root )
+        removed_count = 0
+        for digest in digest_list:
+            if digest in referenced_digests:
+                continue
+            if self._delete_blob_directory( f'{self._blob_root}/{digest}' ):
+                removed_count += 1
+            continue
+
+        if removed_count:
+            logger.debug( f'Removed {removed_count} unreferenced attribute blobs from {self._blob_root}' )
+        return removed_count
+
+    def _get_referenced_digests(self) -> Set[ str ]:
+        model_manager = getattr( self._attribute_model_class, 'all_objects',
+                                 self._attribute_model_class.objects )
+        file_name_list = model_manager.filter(
+            file_value__startswith = f'{self._blob_root}/',
+        ).values_list( 'file_value', flat = True )
+        return { PurePosixPath( x ).parent.name for x in file_name_list }
+
+    def _get_blob_name( self, blob_directory : str ) -> str:
+        if not default_storage.exists( blob_directory ):
+            return None
+        _, file_list = default_storage.listdir( blob_directory )
+        if not file_list:
+            return None
+        return f'{blob_directory}/{sorted( file_list )[0]}'
+
+    def _delete_blob_directory( self, blob_directory : str ) -> bool:
+        """ Returns whether a blob file was deleted. """
+        was_deleted = False
+        thumbnail_directory = f'{blob_directory}/{AttributeThumbnailRules.THUMBNAIL_SUBDIRECTORY}'
+        for directory in [ thumbnail_directory, blob_directory ]:
+            try:
+                if not default_storage.exists( directory ):
+                    continue
+                _, file_list = default_storage.listdir( directory )
+                for filename in file_list:
+                    default_storage.delete( f'{directory}/{filename}' )
+                    was_deleted = True
+                    continue
+                self._remove_empty_directory( directory )
+            except Exception as e:
+                logger.warning( f'Error deleting attribute blob files in {directory}: {e}' )
+            continue
+        return was_deleted
+
+    def _remove_empty_directory( self, directory : str ):
+        # Storage backends have no directory API; only local file
+        # storage leaves empty directories behind.
+        try:
+            os.rmdir( default_storage.path( directory ))
+        except ( NotImplementedError, OSError ):
+            pass
+        return
@@ -9,6 +9,7 @@ from hi.apps.common.file_utils import generate_unique_filename
 
 from hi.integrations.transient_models import IntegrationKey
 
+from .blob_store import AttributeBlobStore
 from .enums import (
     AttributeValueType,
     AttributeType,
@@ -230,7 +231,8 @@ class AttributeModel(models.Model):
             if not self.value:
                 self.value = self.file_value.name
             all_manager = getattr( self.__class__, 'all_objects', self.__class__.objects )
-            if not self.pk or not all_manager.filter( pk = self.pk ).exists():
+            is_new = bool( not self.pk or not all_manager.filter( pk = self.pk ).exists() )
+            if is_new and not AttributeBlobStore.is_blob_name( self.file_value.name ):
                 self.file_value.name = generate_unique_filename( self.file_value.name )
         
         # Save the attribute first
@@ -270,7 +272,10 @@ class AttributeModel(models.Model):
         
         thumbnail_path = self.thumbnail_relative_path
 
-        if self.file_value:
+        if self.file_value and AttributeBlobStore.is_blob_name( self.file_value.name ):
+            # Possibly shared; AttributeBlobStore cleanup removes it once unreferenced.
+            thumbnail_path = None
+        elif self.file_value:
             try:
                 if default_storage.exists( self.file_value.name ):
                     default_storage.delete( self.file_value.name )
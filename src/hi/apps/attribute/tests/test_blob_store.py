@@ -0,0 +1,69 @@
+import logging
+
+from django.core.files.storage import default_storage
+
+from hi.apps.attribute.blob_store import AttributeBlobStore
+from hi.apps.attribute.enums import AttributeType, AttributeValueType
+from hi.apps.entity.models import Entity, EntityAttribute
+from hi.testing.base_test_case import BaseTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class TestAttributeBlobStore(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(self.in_memory_media_storage())
+        self.blob_store = AttributeBlobStore( EntityAttribute )
+        self.entity = Entity.objects.create( name = 'Test Entity', entity_type_str = 'OTHER' )
+        return
+
+    def _create_attribute( self, blob_name ):
+        return EntityAttribute.objects.create(
+            entity = self.entity,
+            name = 'Manual',
+            value_type_str = str( AttributeValueType.FILE ),
+            attribute_type_str = str( AttributeType.PREDEFINED ),
+            file_value = blob_name,
+        )
+
+    def test_identical_content_is_stored_once(self):
+        first_name = self.blob_store.save_blob( content = b'manual', filename = 'manual.pdf' )
+        second_name = self.blob_store.save_blob( content = b'manual', filename = 'other.pdf' )
+        third_name = self.blob_store.save_blob( content = b'different', filename = 'manual.pdf' )
+
+        self.assertEqual( first_name, second_name )
+        self.assertNotEqual( first_name, third_name )
+        self.assertTrue( AttributeBlobStore.is_blob_name( first_name ))
+        self.assertFalse( AttributeBlobStore.is_blob_name( 'entity/attributes/manual-123.pdf' ))
+
+    def test_blob_name_kept_on_save(self):
+        blob_name = self.blob_store.save_blob( content = b'manual', filename = 'manual.pdf' )
+        attribute = self._create_attribute( blob_name )
+        attribute.refresh_from_db()
+        self.assertEqual( attribute.file_value.name, blob_name )
+        self.assertEqual( attribute.value, blob_name )
+
+    def test_shared_blob_survives_until_unreferenced(self):
+        blob_name = self.blob_store.save_blob( content = b'manual', filename = 'manual.pdf' )
+        unused_name = self.blob_store.save_blob( content = b'unused', filename = 'unused.pdf' )
+        first_attribute = self._create_attribute( blob_name )
+        second_attribute = self._create_attribute( blob_name )
+
+        first_attribute.delete( hard_delete = True )
+        self.assertTrue( default_storage.exists( blob_name ))
+        self.assertEqual( self.blob_store.remove_unreferenced_blobs(), 1 )
+        self.assertTrue( default_storage.exists( blob_name ))
+        self.assertFalse( default_storage.exists( unused_name ))
+
+        second_attribute.delete( hard_delete = True )
+        self.assertEqual( self.blob_store.remove_unreferenced_blobs(), 1 )
+        self.assertFalse( default_storage.exists( blob_name ))
+
+    def test_soft_deleted_attribute_keeps_blob(self):
+        blob_name = self.blob_store.save_blob( content = b'manual', filename = 'manual.pdf' )
+        attribute = self._create_attribute( blob_name )
+        attribute.delete()
+        self.assertEqual( self.blob_store.remove_unreferenced_blobs(), 0 )
+        self.assertTrue( default_storage.exists( blob_name ))
@@ -26,7 +26,10 @@ class AudioManager(Singleton, SettingsMixin):
         if self._was_initialized:
             return
         
-        self.settings_manager().register_change_listener(self._reload_audio_map)
+        self.settings_manager().register_change_listener(
+            self._reload_audio_map,
+            setting_enums = [ x.audio_setting for x in AudioSignal if x.audio_setting ],
+        )
         self._audio_map = self._build_audio_map()
         self._was_initialized = True
         return
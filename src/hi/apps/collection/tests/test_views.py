@@ -52,10 +52,10 @@ class TestCollectionViewDefaultView(SyncViewTestCase):
         url = reverse('collection_view_default')
         _ = self.client.get(url)
 
-        # Check session values
-        session = self.client.session
-        self.assertEqual(session.get('view_type'), str(ViewType.COLLECTION))
-        self.assertEqual(session.get('collection_id'), self.collection.id)
+        # Check saved view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_type, ViewType.COLLECTION)
+        self.assertEqual(view_parameters.collection_id, self.collection.id)
 
     @patch.object(CollectionManager, 'get_default_collection')
     def test_raises_bad_request_when_no_collections(self, mock_get_default):
@@ -138,10 +138,10 @@ class TestCollectionViewView(DualModeViewTestCase):
 
         self.assertSuccessResponse(response)
         
-        # Check session was updated
-        session = self.client.session
-        self.assertEqual(session.get('view_type'), str(ViewType.COLLECTION))
-        self.assertEqual(session.get('collection_id'), self.collection.id)
+        # Check view parameters were updated
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_type, ViewType.COLLECTION)
+        self.assertEqual(view_parameters.collection_id, self.collection.id)
 
     def test_nonexistent_collection_returns_404(self):
         """Test that accessing nonexistent collection returns 404."""
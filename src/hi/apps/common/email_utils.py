@@ -1,12 +1,13 @@
 import logging
 import re
-import threading
-from typing import List
+from typing import Dict, List, Tuple
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 
+from hi.apps.common.mail_delivery import MailDeliveryService
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,14 +47,6 @@ def send_html_email( request,
                      files = None,
                      non_blocking = False,
                      from_email_name = None ):
-    if not from_email_address:
-        from_email_address = settings.DEFAULT_FROM_EMAIL
-    if not from_email_name:
-        from_email_name = settings.FROM_EMAIL_NAME
-        
-    if not isinstance( to_email_addresses, list ):
-        to_email_addresses = [ to_email_addresses, ]        
-
     if context is None:
         context = {}
 
@@ -62,15 +55,60 @@ def send_html_email( request,
     #
     if request and ( 'BASE_URL' not in context ):
         context['BASE_URL'] = request.build_absolute_uri('/')[:-1]
-            
+
+    subject, message_text, message_html = render_email_content(
+        subject_template_name = subject_template_name,
+        message_text_template_name = message_text_template_name,
+        message_html_template_name = message_html_template_name,
+        context = context,
+    )
+    message = build_html_email_message(
+        subject = subject,
+        message_text = message_text,
+        message_html = message_html,
+        to_email_addresses = to_email_addresses,
+        from_email_address = from_email_address,
+        files = files,
+        from_email_name = from_email_name,
+    )
+
+    if non_blocking and not settings.UNIT_TESTING:  # Unit tests will fail if async emails
+        MailDeliveryService().enqueue( [ message ] )
+    else:
+        message.send()
+        
+    return
+
+
+def render_email_content( subject_template_name,
+                          message_text_template_name,
+                          message_html_template_name,
+                          context : Dict ) -> Tuple[ str, str, str ]:
     subject = render_to_string( subject_template_name, context )
     subject = safe_subject( subject )
-    message_text = render_to_string( message_text_template_name, context )
+    message_text = render_to_string( message_text_template_name, context ).strip()
     message_html = render_to_string( message_html_template_name, context )
+    return ( subject, message_text, message_html )
+
+
+def build_html_email_message( subject            : str,
+                              message_text       : str,
+                              message_html       : str,
+                              to_email_addresses : List[str],
+                              from_email_address = None,
+                              files = None,
+                              from_email_name = None ) -> EmailMultiAlternatives:
+    if not from_email_address:
+        from_email_address = settings.DEFAULT_FROM_EMAIL
+    if not from_email_name:
+        from_email_name = settings.FROM_EMAIL_NAME
+        
+    if not isinstance( to_email_addresses, list ):
+        to_email_addresses = [ to_email_addresses, ]        
 
     message = EmailMultiAlternatives(
         subject,
-        message_text.strip(),
+        message_text,
         "%s <%s>" % ( from_email_name, from_email_address ),
         to_email_addresses,
     )
@@ -81,25 +119,4 @@ def send_html_email( request,
             files = [ files ]
         for file in files:
             message.attach_file(file)
-
-    if non_blocking and not settings.UNIT_TESTING:  # Unit tests will fail if async emails
-        EmailThread( message = message ).start()
-    else:
-        message.send()
-        
-    return
-
-
-class EmailThread( threading.Thread ):
-    
-    def __init__( self, message : EmailMultiAlternatives ):
-        self.message = message
-        threading.Thread.__init__( self )
-        return
-    
-    def run(self):
-        try:
-            self.message.send()
-        except Exception as e:
-            logger.exception( 'Problem in email thread.', e )
-        return
+    return message
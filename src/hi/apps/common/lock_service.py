@@ -0,0 +1,501 @@
+"""
+Named mutual exclusion using leases.  With Redis available, a lease is
+a key set with SET NX PX, so it excludes across processes; otherwise an
+in-process table is used, which is enough for single-process
+deployments.  If Redis fails, locks fall back to the in-process table
+until Redis is retried after a backoff and works again.  Either way, nothing is written to the database, so taking
+a lock never contends with other SQLite writers.
+
+Every lease carries a fencing token that increases with each grant of
+the same lock name.  A holder whose lease expired (e.g., it stalled past
+the lease time) can compare tokens to detect that someone else has since
+held the lock.  Leases taken with renew=True are extended in the
+background while held, so only a crashed holder's lease expires.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import os
+import socket
+from threading import Condition, Lock, Thread, current_thread
+import time
+from typing import Dict, List, Tuple
+
+import redis
+
+import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.apps.common.redis_client import get_redis_client
+from hi.apps.common.singleton import Singleton
+from hi.apps.system.enums import TimingMetricType
+from hi.apps.system.timing_metrics import TimingMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class LockTimeoutError( RuntimeError ):
+    pass
+
+
+@dataclass
+class LockLease:
+
+    name         : str
+    token        : int
+    holder       : str
+    lease_secs   : float
+    acquired_at  : datetime
+    backend_name : str       = None
+
+    @property
+    def value(self) -> str:
+        """ Identifies this grant of the lock in the backend. """
+        return f'{self.token}|{self.holder}'
+
+
+class InProcessLockBackend:
+
+    NAME = 'In-process'
+
+    def __init__(self):
+        self._lock = Lock()
+        self._lease_map : Dict[ str, Tuple[ LockLease, float ]] = dict()
+        self._fence_map : Dict[ str, int ] = dict()
+        return
+
+    def try_acquire( self, name : str, holder : str, lease_secs : float ) -> LockLease:
+        now = time.monotonic()
+        with self._lock:
+            existing = self._lease_map.get( name )
+            if existing and existing[1] > now:
+                return None
+            token = self._fence_map.get( name, 0 ) + 1
+            self._fence_map[name] = token
+            lease = LockLease(
+                name = name,
+                token = token,
+                holder = holder,
+                lease_secs = lease_secs,
+                acquired_at = datetimeproxy.now(),
+                backend_name = self.NAME,
+            )
+            self._lease_map[name] = ( lease, now + lease_secs )
+            return lease
+
+    def renew( self, lease : LockLease ) -> bool:
+        with self._lock:
+            if not self._is_current( lease ):
+                return False
+            self._lease_map[lease.name] = ( lease, time.monotonic() + lease.lease_secs )
+            return True
+
+    def release( self, lease : LockLease ) -> bool:
+        with self._lock:
+            if not self._is_current( lease ):
+                return False
+            del self._lease_map[lease.name]
+            return True
+
+    def get_holder( self, name : str ) -> str:
+        with self._lock:
+            existing = self._lease_map.get( name )
+            if not existing or existing[1] <= time.monotonic():
+                return None
+            return existing[0].holder
+
+    def _is_current( self, lease : LockLease ) -> bool:
+        """ Caller must hold the lock. """
+        existing = self._lease_map.get( lease.name )
+        return bool( existing
+                     and ( existing[0].token == lease.token )
+                     and ( existing[1] > time.monotonic() ))
+
+
+class RedisLockBackend:
+
+    NAME = 'Redis'
+    KEY_PREFIX = 'hi:lock:'
+
+    def __init__( self, redis_client ):
+        self._redis_client = redis_client
+        return
+
+    def try_acquire( self, name : str, holder : str, lease_secs : float ) -> LockLease:
+        # Tokens are taken even for failed attempts: they only need to
+        # increase, not be contiguous.
+        token = int( self._redis_client.incr( self._fence_key( name )))
+        lease = LockLease(
+            name = name,
+            token = token,
+            holder = holder,
+            lease_secs = lease_secs,
+            acquired_at = datetimeproxy.now(),
+            backend_name = self.NAME,
+        )
+        was_set = self._redis_client.set(
+            self._lease_key( name ),
+            lease.value,
+            nx = True,
+            px = self._lease_millis( lease_secs ),
+        )
+        return lease if was_set else None
+
+    def renew( self, lease : LockLease ) -> bool:
+        return self._update_if_current(
+            lease,
+            lambda pipe, key: pipe.pexpire( key, self._lease_millis( lease.lease_secs )),
+        )
+
+    def release( self, lease : LockLease ) -> bool:
+        return self._update_if_current(
+            lease,
+            lambda pipe, key: pipe.delete( key ),
+        )
+
+    def get_holder( self, name : str ) -> str:
+        value = self._redis_client.get( self._lease_key( name ))
+        if not value:
+            return None
+        return value.split( '|', 1 )[-1]
+
+    def _update_if_current( self, lease : LockLease, update_func ) -> bool:
+        """ Check-and-set, so a lease that expired and was re-granted is left alone. """
+        key = self._lease_key( lease.name )
+        with self._redis_client.pipeline() as pipe:
+            try:
+                pipe.watch( key )
+                if pipe.get( key ) != lease.value:
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                update_func( pipe, key )
+                pipe.execute()
+                return True
+            except redis.exceptions.WatchError:
+                return False
+
+    def _lease_key( self, name : str ) -> str:
+        return f'{self.KEY_PREFIX}{name}'
+
+    def _fence_key( self, name : str ) -> str:
+        return f'{self.KEY_PREFIX}{name}:fence'
+
+    def _lease_millis( self, lease_secs : float ) -> int:
+        return max( int( lease_secs * 1000 ), 1 )
+
+
+@dataclass
+class LockStats:
+
+    name              : str
+    acquired_count    : int    = 0
+    contended_count   : int    = 0
+    timeout_count     : int    = 0
+    lost_count        : int    = 0
+    total_wait_secs   : float  = 0.0
+    max_wait_secs     : float  = 0.0
+    last_holder       : str    = None
+    last_token        : int    = None
+
+    def to_dict( self, current_holder : str ) -> Dict:
+        return {
+            'name': self.name,
+            'acquired': self.acquired_count,
+            'contended': self.contended_count,
+            'timeouts': self.timeout_count,
+            'lost': self.lost_count,
+            'mean_wait_ms': ( round( self.total_wait_secs * 1000.0 / self.acquired_count, 3 )
+                              if self.acquired_count else None ),
+            'max_wait_ms': round( self.max_wait_secs * 1000.0, 3 ),
+            'current_holder': current_holder,
+            'last_holder': self.last_holder,
+            'last_token': self.last_token,
+        }
+
+
+class LockService( Singleton ):
+
+    WAIT_POLL_SECS = 0.05
+
+    # Renew when this fraction of the lease time has passed.
+    RENEW_FRACTION = 1.0 / 3.0
+
+    # After a Redis failure, use in-process locks this long before
+    # trying Redis again.
+    BACKEND_RETRY_SECS = 30.0
+
+    def __init_singleton__(self):
+        self._backend = None
+        self._fallback_backend = None
+        self._backend_retry_time = None  # Set while the backend is failing
+        self._stats_lock = Lock()
+        self._stats_map : Dict[ str, LockStats ] = dict()
+        self._renewal_condition = Condition()
+        self._renewal_map : Dict[ Tuple[ str, int ], Tuple[ LockLease, float ]] = dict()
+        self._renewal_thread : Thread = None
+        self._renewal_stop_requested = False
+        return
+
+    def stop(self):
+        """ Stops lease renewal. Held leases then expire on their own. """
+        with self._renewal_condition:
+            self._renewal_stop_requested = True
+            self._renewal_condition.notify_all()
+            renewal_thread = self._renewal_thread
+        if renewal_thread:
+            renewal_thread.join( timeout = 5 )
+        self._renewal_thread = None
+        return
+
+    @property
+    def backend_name(self) -> str:
+        return self._get_active_backend().NAME
+
+    def use_backend( self, backend ):
+        """ For tests and for forcing a backend choice. """
+        self._backend = backend
+        self._backend_retry_time = None
+        return
+
+    def acquire( self,
+                 name        : str,
+                 lease_secs  : float,
+                 wait_secs   : float  = 0,
+                 renew       : bool   = False ) -> LockLease:
+        holder = self._get_holder_id()
+        start_time = time.perf_counter()
+        deadline = start_time + wait_secs
+        was_contended = False
+        while True:
+            lease = self._try_acquire( name = name, holder = holder, lease_secs = lease_secs )
+            if lease:
+                break
+            was_contended = True
+            if time.perf_counter() >= deadline:
+                self._record_timeout( name = name )
+                raise LockTimeoutError(
+                    f'Could not acquire lock: {name} (held by {self.get_holder( name )})'
+                )
+            time.sleep( self.WAIT_POLL_SECS )
+            continue
+
+        self._record_acquire(
+            lease = lease,
+            wait_secs = time.perf_counter() - start_time,
+            was_contended = was_contended,
+        )
+        if renew:
+            self._start_renewing( lease )
+        return lease
+
+    def release( self, lease : LockLease ):
+        self.stop_renewing( lease )
+        try:
+            was_released = self._get_lease_backend( lease ).release( lease )
+        except redis.exceptions.RedisError as e:
+            logger.warning( f'Could not release lock {lease.name}: {e}' )
+            return
+        if not was_released:
+            self._record_lost( lease )
+        return
+
+    def stop_renewing( self, lease : LockLease ):
+        """ The lease then lasts until it expires. """
+        with self._renewal_condition:
+            self._renewal_map.pop( ( lease.name, lease.token ), None )
+        return
+
+    def get_holder( self, name : str ) -> str:
+        try:
+            return self._get_active_backend().get_holder( name )
+        except redis.exceptions.RedisError:
+            return None
+
+    def get_stats_list(self) -> List[ Dict ]:
+        with self._stats_lock:
+            stats_list = sorted( self._stats_map.values(), key = lambda x: x.name )
+        return [ x.to_dict( current_holder = self.get_holder( x.name )) for x in stats_list ]
+
+    def _try_acquire( self, name : str, holder : str, lease_secs : float ) -> LockLease:
+        backend = self._get_active_backend()
+        try:
+            lease = backend.try_acquire( name = name, holder = holder, lease_secs = lease_secs )
+        except redis.exceptions.RedisError as e:
+            if self._backend_retry_time is None:
+                logger.error( f'Redis lock backend failed, using in-process locks'
+                              f' for {self.BACKEND_RETRY_SECS}s: {e}' )
+            self._backend_retry_time = time.monotonic() + self.BACKEND_RETRY_SECS
+            return self._get_fallback_backend().try_acquire(
+                name = name,
+                holder = holder,
+                lease_secs = lease_secs,
+            )
+        if ( backend is self._backend ) and ( self._backend_retry_time is not None ):
+            logger.info( f'{backend.NAME} lock backend recovered.' )
+            self._backend_retry_time = None
+        return lease
+
+    def _get_active_backend(self):
+        """ The backend for new leases: the fallback while the backend awaits a retry. """
+        backend = self._get_backend()
+        if ( self._backend_retry_time is not None ) and ( time.monotonic() < self._backend_retry_time ):
+            return self._get_fallback_backend()
+        return backend
+
+    def _get_fallback_backend(self):
+        if self._fallback_backend is None:
+            self._fallback_backend = InProcessLockBackend()
+        return self._fallback_backend
+
+    def _get_lease_backend( self, lease : LockLease ):
+        """ Leases are renewed and released by the backend that granted them. """
+        if ( self._fallback_backend is not None ) and ( lease.backend_name == self._fallback_backend.NAME ):
+            return self._fallback_backend
+        return self._get_backend()
+
+    def _get_backend(self):
+        if self._backend is None:
+            redis_client = get_redis_client()
+            if redis_client:
+                self._backend = RedisLockBackend( redis_client )
+            else:
+                self._backend = InProcessLockBackend()
+            logger.info( f'Using {self._backend.NAME} lock backend.' )
+        return self._backend
+
+    def _get_holder_id(self) -> str:
+        return f'{socket.gethostname()}:{os.getpid()}:{current_thread().name}'
+
+    def _get_stats( self, name : str ) -> LockStats:
+        """ Caller must hold the stats lock. """
+        if name not in self._stats_map:
+            self._stats_map[name] = LockStats( name = name )
+        return self._stats_map[name]
+
+    def _record_acquire( self, lease : LockLease, wait_secs : float, was_contended : bool ):
+        with self._stats_lock:
+            stats = self._get_stats( lease.name )
+            stats.acquired_count += 1
+            if was_contended:
+                stats.contended_count += 1
+            stats.total_wait_secs += wait_secs
+            stats.max_wait_secs = max( stats.max_wait_secs, wait_secs )
+            stats.last_holder = lease.holder
+            stats.last_token = lease.token
+        TimingMetrics().record( TimingMetricType.LOCK_WAIT, lease.name, wait_secs )
+        return
+
+    def _record_timeout( self, name : str ):
+        with self._stats_lock:
+            self._get_stats( name ).timeout_count += 1
+        return
+
+    def _record_lost( self, lease : LockLease ):
+        logger.warning( f'Lock {lease.name} (token {lease.token}) expired before it was released.' )
+        with self._stats_lock:
+            self._get_stats( lease.name ).lost_count += 1
+        return
+
+    def _start_renewing( self, lease : LockLease ):
+        with self._renewal_condition:
+            self._renewal_map[( lease.name, lease.token )] = ( lease, self._next_renew_time( lease ))
+            if not ( self._renewal_thread and self._renewal_thread.is_alive() ):
+                self._renewal_stop_requested = False
+                self._renewal_thread = Thread(
+                    target = self._run_renewals,
+                    name = 'LockLeaseRenewal',
+                    daemon = True,
+                )
+                self._renewal_thread.start()
+            self._renewal_condition.notify()
+        return
+
+    def _next_renew_time( self, lease : LockLease ) -> float:
+        return time.monotonic() + lease.lease_secs * self.RENEW_FRACTION
+
+    def _run_renewals(self):
+        while True:
+            with self._renewal_condition:
+                while not self._renewal_map and not self._renewal_stop_requested:
+                    self._renewal_condition.wait()
+                    continue
+                if self._renewal_stop_requested:
+                    return
+                now = time.monotonic()
+                due_lease_list = [ x[0] for x in self._renewal_map.values() if x[1] <= now ]
+                if not due_lease_list:
+                    next_renew_time = min( x[1] for x in self._renewal_map.values() )
+                    self._renewal_condition.wait( timeout = next_renew_time - now )
+                    continue
+
+            for lease in due_lease_list:
+                self._renew( lease )
+                continue
+            continue
+
+    def _renew( self, lease : LockLease ):
+        try:
+            was_renewed = self._get_lease_backend( lease ).renew( lease )
+        except redis.exceptions.RedisError as e:
+            logger.warning( f'Could not renew lock {lease.name}: {e}' )
+            was_renewed = True  # Retry next interval; the lease may still be valid.
+
+        with self._renewal_condition:
+            key = ( lease.name, lease.token )
+            if key not in self._renewal_map:
+                return
+            if was_renewed:
+                self._renewal_map[key] = ( lease, self._next_renew_time( lease ))
+                return
+            del self._renewal_map[key]
+        self._record_lost( lease )
+        return
+
+
+class ExclusionLockContext:
+    """
+    Basic mutual exclusion lock.  Waits up to wait_seconds for the lock,
+    then raises LockTimeoutError (a RuntimeError).  The lease is renewed
+    while held, so timeout_seconds only matters if the holder dies.
+    """
+
+    def __init__( self, name, timeout_seconds = 300, wait_seconds = 0 ):
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        self.wait_seconds = wait_seconds
+        self.lock = None
+
+    def __enter__(self):
+        self.lock = LockService().acquire( name = self.name,
+                                           lease_secs = self.timeout_seconds,
+                                           wait_secs = self.wait_seconds,
+                                           renew = True )
+        return self.lock
+
+    def __exit__( self, exc_type, exc_val, exc_tb ):
+        if self.lock:
+            LockService().release( self.lock )
+        return
+
+
+class InitializationLockContext:
+    """
+    Grabs a lock for a specific duration so that only one thread performs
+    an operation in the given time period.  The lease is kept (not
+    released) on exit and expires after timeout_seconds.
+    """
+
+    def __init__( self, name, timeout_seconds = 300 ):
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        self.lock = None
+
+    def __enter__(self):
+        self.lock = LockService().acquire( name = self.name,
+                                           lease_secs = self.timeout_seconds,
+                                           renew = True )
+        return self.lock
+
+    def __exit__( self, exc_type, exc_val, exc_tb ):
+        if self.lock:
+            LockService().stop_renewing( self.lock )
+        return
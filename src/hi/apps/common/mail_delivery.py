@@ -0,0 +1,194 @@
+"""
+Sends queued email from one worker thread.  The worker waits a short
+coalescing window after the first message arrives, then sends everything
+queued over a single mail connection, so a burst of notifications costs
+one SMTP handshake rather than one per message (and one thread each).
+"""
+from collections import deque
+from dataclasses import dataclass
+import logging
+from threading import Condition, Thread
+import time
+from typing import Deque, Dict, List
+
+from django.core.mail import EmailMessage, get_connection
+
+from hi.apps.common.singleton import Singleton
+from hi.apps.system.enums import TimingMetricType
+from hi.apps.system.health_status_provider import HealthStatusProvider
+from hi.apps.system.provider_info import ProviderInfo
+from hi.apps.system.timing_metrics import TimingMetrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedEmail:
+
+    message       : EmailMessage
+    enqueue_time  : float
+
+
+class MailDeliveryService( Singleton, HealthStatusProvider ):
+
+    COALESCE_WINDOW_SECS = 1.0
+    MAX_BATCH_SIZE = 50
+    MAX_PENDING_MESSAGES = 500
+
+    TIMING_METRIC_NAME = 'Email'
+
+    def __init_singleton__(self):
+        self._ensure_health_status_provider_setup()
+        self._condition = Condition()
+        self._pending_queue : Deque[ QueuedEmail ] = deque()
+        self._worker : Thread = None
+        self._stop_requested = False
+        self._sent_count = 0
+        self._failed_count = 0
+        self._dropped_count = 0
+        self._batch_count = 0
+        self._connection_count = 0
+        self._total_send_secs = 0.0
+        self._last_batch_throughput = None
+        return
+
+    @classmethod
+    def get_provider_info(cls) -> ProviderInfo:
+        return ProviderInfo(
+            provider_id = 'hi.apps.common.mail_delivery',
+            provider_name = 'Email Delivery',
+            description = 'Sends queued notification and account emails.',
+        )
+
+    def enqueue( self, message_list : List[ EmailMessage ] ):
+        enqueue_time = time.perf_counter()
+        with self._condition:
+            for message in message_list:
+                if len( self._pending_queue ) >= self.MAX_PENDING_MESSAGES:
+                    self._dropped_count += 1
+                    logger.warning( f'Email queue full. Dropping email to {message.to}.' )
+                    continue
+                self._pending_queue.append( QueuedEmail( message = message, enqueue_time = enqueue_time ))
+                continue
+            self._ensure_worker_started()
+            self._condition.notify()
+        return
+
+    def stop(self):
+        with self._condition:
+            self._stop_requested = True
+            self._condition.notify_all()
+            worker = self._worker
+        if worker:
+            worker.join( timeout = 5 )
+        self._worker = None
+        return
+
+    def deliver_pending(self) -> int:
+        """ Sends everything queued over one connection. Returns the number sent. """
+        with self._condition:
+            queued_email_list = list( self._pending_queue )
+            self._pending_queue.clear()
+        if not queued_email_list:
+            return 0
+
+        start_time = time.perf_counter()
+        sent_count = 0
+        failed_count = 0
+        last_error = None
+        connection = None
+        for queued_email in queued_email_list:
+            try:
+                if connection is None:
+                    connection = get_connection()
+                    connection.open()
+                    self._connection_count += 1
+                # An open connection is reused rather than re-opened per message.
+                sent_count += connection.send_messages( [ queued_email.message ] )
+                TimingMetrics().record(
+                    TimingMetricType.EMAIL_DELIVERY,
+                    self.TIMING_METRIC_NAME,
+                    time.perf_counter() - queued_email.enqueue_time,
+                )
+            except Exception as e:
+                failed_count += 1
+                last_error = e
+                logger.exception( f'Problem sending email to {queued_email.message.to}: {e}' )
+                # The connection may be unusable after an error.
+                connection = self._close_connection( connection )
+            continue
+        self._close_connection( connection )
+
+        elapsed_secs = time.perf_counter() - start_time
+        with self._condition:
+            self._sent_count += sent_count
+            self._failed_count += failed_count
+            self._batch_count += 1
+            self._total_send_secs += elapsed_secs
+            self._last_batch_throughput = len( queued_email_list ) / elapsed_secs if elapsed_secs > 0 else None
+
+        if last_error:
+            self.record_error( f'{failed_count} of {len( queued_email_list )} emails failed: {last_error}' )
+        else:
+            self.record_healthy( f'Sent {sent_count} emails.' )
+        return sent_count
+
+    def get_status(self) -> Dict:
+        with self._condition:
+            return {
+                'is_running': bool( self._worker and self._worker.is_alive() ),
+                'queue_depth': len( self._pending_queue ),
+                'sent': self._sent_count,
+                'failed': self._failed_count,
+                'dropped': self._dropped_count,
+                'batches': self._batch_count,
+                'connections': self._connection_count,
+                'messages_per_sec': ( round( self._sent_count / self._total_send_secs, 1 )
+                                      if self._total_send_secs > 0 else None ),
+                'last_batch_messages_per_sec': ( round( self._last_batch_throughput, 1 )
+                                                 if self._last_batch_throughput else None ),
+            }
+
+    def _close_connection( self, connection ):
+        if connection is None:
+            return None
+        try:
+            connection.close()
+        except Exception as e:
+            logger.warning( f'Problem closing email connection: {e}' )
+        return None
+
+    def _ensure_worker_started(self):
+        """ Caller must hold the condition lock. """
+        if self._worker and self._worker.is_alive():
+            return
+        self._stop_requested = False
+        self._worker = Thread(
+            target = self._run_worker,
+            name = 'MailDelivery',
+            daemon = True,
+        )
+        self._worker.start()
+        return
+
+    def _run_worker(self):
+        while True:
+            with self._condition:
+                while not self._pending_queue and not self._stop_requested:
+                    self._condition.wait()
+                    continue
+                if self._stop_requested:
+                    return
+                deadline = time.monotonic() + self.COALESCE_WINDOW_SECS
+                while (( len( self._pending_queue ) < self.MAX_BATCH_SIZE )
+                       and not self._stop_requested ):
+                    remaining_secs = deadline - time.monotonic()
+                    if remaining_secs <= 0:
+                        break
+                    self._condition.wait( timeout = remaining_secs )
+                    continue
+            try:
+                self.deliver_pending()
+            except Exception:
+                logger.exception( 'Problem delivering queued emails.' )
+            continue
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.14 on 2026-10-18 22:44
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name="DatabaseLock",
+        ),
+    ]
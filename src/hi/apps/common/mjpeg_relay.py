@@ -0,0 +1,391 @@
+"""
+Fans one upstream MJPEG stream out to any number of browser clients.
+
+Each stream key gets a channel with a single upstream reader thread.
+The reader keeps only the most recent frame; each client waits for a
+newer one and sends that.  A slow client therefore skips frames rather
+than queueing them, and memory per stream stays at one frame no matter
+how many clients watch it.  When the last client leaves, the upstream
+connection is kept open for a grace period (page navigations and modal
+re-opens reconnect quickly) and then closed.
+"""
+from dataclasses import dataclass
+import logging
+import re
+from threading import Condition, Lock, Thread
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from django.db import close_old_connections
+
+from hi.apps.common.singleton import Singleton
+
+logger = logging.getLogger(__name__)
+
+
+class MjpegRelayFullError(RuntimeError):
+    pass
+
+
+class MjpegFrameParser:
+    """ Splits a multipart/x-mixed-replace byte stream into JPEG frames. """
+
+    MAX_BUFFER_BYTES = 8 * 1024 * 1024
+
+    def __init__( self, boundary : bytes ):
+        self._delimiter = b'--' + boundary
+        self._buffer = bytearray()
+        return
+
+    @classmethod
+    def boundary_from_content_type( cls, content_type : str ) -> Optional[ bytes ]:
+        match = re.search( r'boundary="?([^";]+)"?', content_type or '' )
+        if not match:
+            return None
+        boundary = match.group(1).strip()
+        # Some servers repeat the leading dashes in the header value.
+        if boundary.startswith( '--' ):
+            boundary = boundary[2:]
+        return boundary.encode( 'latin-1' )
+
+    def feed( self, chunk : bytes ) -> List[ bytes ]:
+        self._buffer.extend( chunk )
+        frame_list = list()
+        while True:
+            start = self._buffer.find( self._delimiter )
+            if start < 0:
+                # Keep a tail in case a delimiter is split across chunks.
+                del self._buffer[:-len( self._delimiter )]
+                break
+            if start > 0:
+                del self._buffer[:start]
+            header_end = self._buffer.find( b'\r\n\r\n' )
+            if header_end < 0:
+                break
+            headers = bytes( self._buffer[ len( self._delimiter ):header_end ] )
+            body_start = header_end + 4
+            content_length = self._get_content_length( headers )
+            if content_length is not None:
+                body_end = body_start + content_length
+                if len( self._buffer ) < body_end:
+                    break
+                frame = bytes( self._buffer[ body_start:body_end ] )
+            else:
+                body_end = self._buffer.find( self._delimiter, body_start )
+                if body_end < 0:
+                    break
+                frame = bytes( self._buffer[ body_start:body_end ] ).rstrip( b'\r\n' )
+            del self._buffer[:body_end]
+            if frame:
+                frame_list.append( frame )
+            continue
+
+        if len( self._buffer ) > self.MAX_BUFFER_BYTES:
+            logger.warning( 'MJPEG parser buffer overflow. Discarding partial frame.' )
+            self._buffer.clear()
+        return frame_list
+
+    def _get_content_length( self, headers : bytes ) -> Optional[ int ]:
+        match = re.search( rb'content-length:\s*(\d+)', headers, re.IGNORECASE )
+        if not match:
+            return None
+        return int( match.group(1) )
+
+
+@dataclass
+class MjpegChannelStats:
+
+    upstream_connects  : int  = 0
+    upstream_errors    : int  = 0
+    frames_received    : int  = 0
+    frames_sent        : int  = 0
+    frames_skipped     : int  = 0
+    peak_clients       : int  = 0
+
+
+class MjpegRelayChannel:
+
+    def __init__( self,
+                  stream_key        : str,
+                  upstream_url_func : Callable[ [], str ],
+                  relay             : 'MjpegRelay' ):
+        self._stream_key = stream_key
+        self._upstream_url_func = upstream_url_func
+        self._relay = relay
+        self._condition = Condition()
+        self._frame : bytes = None
+        self._frame_seq = 0
+        self._client_count = 0
+        self._idle_since = time.monotonic()
+        self._is_closed = False
+        self._stats = MjpegChannelStats()
+        self._upstream_thread = Thread(
+            target = self._run_upstream,
+            name = f'MjpegRelay-{stream_key}',
+            daemon = True,
+        )
+        return
+
+    @property
+    def stream_key(self) -> str:
+        return self._stream_key
+
+    @property
+    def client_count(self) -> int:
+        with self._condition:
+            return self._client_count
+
+    @property
+    def is_closed(self) -> bool:
+        with self._condition:
+            return self._is_closed
+
+    def start(self):
+        self._upstream_thread.start()
+        return
+
+    def add_client(self):
+        with self._condition:
+            self._client_count += 1
+            self._stats.peak_clients = max( self._stats.peak_clients, self._client_count )
+        return
+
+    def remove_client(self):
+        with self._condition:
+            self._client_count -= 1
+            if self._client_count <= 0:
+                self._client_count = 0
+                self._idle_since = time.monotonic()
+        return
+
+    def close(self):
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+        return
+
+    def is_idle_expired(self) -> bool:
+        with self._condition:
+            return bool(( self._client_count == 0 )
+                        and ( time.monotonic() - self._idle_since >= self._relay.IDLE_GRACE_SECS ))
+
+    def publish_frame( self, frame : bytes ):
+        with self._condition:
+            self._frame = frame
+            self._frame_seq += 1
+            self._stats.frames_received += 1
+            self._condition.notify_all()
+        return
+
+    def wait_for_frame( self, last_seq : int, timeout_secs : float ):
+        """ Returns ( frame, seq ) newer than last_seq, or ( None, last_seq ) on close or stall. """
+        with self._condition:
+            has_frame = self._condition.wait_for(
+                lambda: ( self._frame_seq > last_seq ) or self._is_closed,
+                timeout = timeout_secs,
+            )
+            if not has_frame or self._frame_seq <= last_seq:
+                return ( None, last_seq )
+            if last_seq > 0:
+                self._stats.frames_skipped += self._frame_seq - last_seq - 1
+            self._stats.frames_sent += 1
+            return ( self._frame, self._frame_seq )
+
+    def get_status(self) -> Dict:
+        with self._condition:
+            return {
+                'stream_key': self._stream_key,
+                'clients': self._client_count,
+                'peak_clients': self._stats.peak_clients,
+                'upstream_connects': self._stats.upstream_connects,
+                'upstream_errors': self._stats.upstream_errors,
+                'frames_received': self._stats.frames_received,
+                'frames_sent': self._stats.frames_sent,
+                'frames_skipped': self._stats.frames_skipped,
+            }
+
+    def _run_upstream(self):
+        try:
+            while not self.is_closed:
+                if self._relay.close_channel_if_idle( self ):
+                    break
+                try:
+                    self._stream_upstream()
+                except Exception as e:
+                    with self._condition:
+                        self._stats.upstream_errors += 1
+                    logger.warning( f'MJPEG upstream problem for {self._stream_key}:'
+                                    f' {self._describe_upstream_error( e )}' )
+
+                # Bounded upstream streams simply end; reconnect after a
+                # short pause unless every client has gone.
+                with self._condition:
+                    self._condition.wait( timeout = self._relay.RECONNECT_DELAY_SECS )
+                continue
+        finally:
+            close_old_connections()
+        return
+
+    def _describe_upstream_error( self, error : Exception ) -> str:
+        # Request errors embed the upstream URL, whose query string can
+        # carry credentials, so only the status or error type is logged.
+        if isinstance( error, requests.HTTPError ) and ( error.response is not None ):
+            return f'HTTP {error.response.status_code}'
+        if isinstance( error, requests.RequestException ):
+            return error.__class__.__name__
+        return f'{error.__class__.__name__}: {error}'
+
+    def _stream_upstream(self):
+        upstream_url = self._upstream_url_func()
+        with self._condition:
+            self._stats.upstream_connects += 1
+        response = requests.get(
+            upstream_url,
+            stream = True,
+            timeout = ( self._relay.CONNECT_TIMEOUT_SECS, self._relay.READ_TIMEOUT_SECS ),
+        )
+        with response:
+            response.raise_for_status()
+            boundary = MjpegFrameParser.boundary_from_content_type( response.headers.get( 'Content-Type' ))
+            if not boundary:
+                raise ValueError( f'Upstream is not a multipart stream: {response.headers.get( "Content-Type" )}' )
+            parser = MjpegFrameParser( boundary = boundary )
+            for chunk in response.iter_content( chunk_size = self._relay.READ_CHUNK_BYTES ):
+                for frame in parser.feed( chunk ):
+                    self.publish_frame( frame )
+                    continue
+                if self.is_closed or self.is_idle_expired():
+                    return
+                continue
+        return
+
+
+class MjpegRelaySubscription:
+    """
+    One client's view of a channel.  Handed to StreamingHttpResponse,
+    which calls close() when the client goes away (even if iteration
+    never started), so the client count cannot leak.
+    """
+
+    def __init__( self, channel : MjpegRelayChannel, relay : 'MjpegRelay' ):
+        self._channel = channel
+        self._relay = relay
+        self._is_closed = False
+        return
+
+    def __iter__(self):
+        last_seq = 0
+        try:
+            while not self._is_closed:
+                frame, last_seq = self._channel.wait_for_frame(
+                    last_seq = last_seq,
+                    timeout_secs = self._relay.STALL_TIMEOUT_SECS,
+                )
+                if frame is None:
+                    break
+                yield self._relay.encode_part( frame )
+                continue
+        finally:
+            self.close()
+        return
+
+    def close(self):
+        if self._is_closed:
+            return
+        self._is_closed = True
+        self._relay.unsubscribe( self._channel )
+        return
+
+
+class MjpegRelay( Singleton ):
+
+    BOUNDARY = 'HiMjpegRelayFrame'
+    IDLE_GRACE_SECS = 15.0
+    STALL_TIMEOUT_SECS = 30.0
+    RECONNECT_DELAY_SECS = 1.0
+    CONNECT_TIMEOUT_SECS = 5.0
+    READ_TIMEOUT_SECS = 15.0
+    READ_CHUNK_BYTES = 16 * 1024
+
+    # Each client holds a web server thread for as long as it watches.
+    # Past this, callers should send the client to the upstream directly.
+    MAX_CLIENTS = 16
+
+    def __init_singleton__(self):
+        self._lock = Lock()
+        self._channel_map : Dict[ str, MjpegRelayChannel ] = dict()
+        self._total_client_count = 0
+        self._rejected_count = 0
+        return
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/x-mixed-replace; boundary={self.BOUNDARY}'
+
+    def subscribe( self,
+                   stream_key        : str,
+                   upstream_url_func : Callable[ [], str ] ) -> MjpegRelaySubscription:
+        with self._lock:
+            if self._total_client_count >= self.MAX_CLIENTS:
+                self._rejected_count += 1
+                raise MjpegRelayFullError( f'MJPEG relay is at its limit of {self.MAX_CLIENTS} clients.' )
+            channel = self._channel_map.get( stream_key )
+            if channel is None or channel.is_closed:
+                channel = MjpegRelayChannel(
+                    stream_key = stream_key,
+                    upstream_url_func = upstream_url_func,
+                    relay = self,
+                )
+                self._channel_map[stream_key] = channel
+                channel.add_client()
+                channel.start()
+            else:
+                channel.add_client()
+            self._total_client_count += 1
+        return MjpegRelaySubscription( channel = channel, relay = self )
+
+    def unsubscribe( self, channel : MjpegRelayChannel ):
+        with self._lock:
+            self._total_client_count = max( 0, self._total_client_count - 1 )
+            channel.remove_client()
+        return
+
+    def close_channel_if_idle( self, channel : MjpegRelayChannel ) -> bool:
+        # Checked under the relay lock so a concurrent subscribe() either
+        # sees the channel closed (and makes a new one) or keeps it alive.
+        with self._lock:
+            if not channel.is_idle_expired():
+                return False
+            channel.close()
+            if self._channel_map.get( channel.stream_key ) is channel:
+                del self._channel_map[channel.stream_key]
+        logger.debug( f'Closed idle MJPEG upstream for {channel.stream_key}' )
+        return True
+
+    def stop(self):
+        with self._lock:
+            channel_list = list( self._channel_map.values() )
+            self._channel_map.clear()
+        for channel in channel_list:
+            channel.close()
+            continue
+        return
+
+    def encode_part( self, frame : bytes ) -> bytes:
+        return (
+            f'--{self.BOUNDARY}\r\n'
+            f'Content-Type: image/jpeg\r\n'
+            f'Content-Length: {len( frame )}\r\n\r\n'
+        ).encode( 'latin-1' ) + frame + b'\r\n'
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            channel_list = list( self._channel_map.values() )
+            return {
+                'clients': self._total_client_count,
+                'max_clients': self.MAX_CLIENTS,
+                'rejected': self._rejected_count,
+                'channels': [ channel.get_status() for channel in channel_list ],
+            }
@@ -0,0 +1,176 @@
+"""
+Targeted delivery of committed model changes.  Signal handlers record
+which rows changed on a ModelChangeTopic; after the transaction commits,
+the changes are merged with any others still pending for that topic and
+one dispatcher thread hands the topic's callback a single ModelChangeSet.
+Rolled-back changes are never delivered, since Django discards their
+on_commit callbacks.
+
+Usage:
+    def _apply_my_changes( change_set : ModelChangeSet ):
+        MyManager().apply_changes( change_set )
+
+    _my_changes = ModelChangeTopic(
+        name = 'my_manager',
+        callback_func = _apply_my_changes,
+    )
+
+    @receiver( post_save, sender = MyModel )
+    def my_model_changed( sender, instance, **kwargs ):
+        _my_changes.record( 'my_model', instance.id )
+"""
+from dataclasses import dataclass, field
+import logging
+from threading import Condition, Thread
+import time
+from typing import Callable, Dict, Hashable, Set
+
+from django.db import connection, transaction
+
+from hi.apps.common.singleton import Singleton
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelChangeSet:
+
+    id_map  : Dict[ str, Set[ Hashable ]]  = field( default_factory = dict )
+
+    def add( self, id_name : str, id_value : Hashable ):
+        self.id_map.setdefault( id_name, set() ).add( id_value )
+        return
+
+    def merge( self, other : 'ModelChangeSet' ):
+        for id_name, id_set in other.id_map.items():
+            self.id_map.setdefault( id_name, set() ).update( id_set )
+            continue
+        return
+
+    def get_ids( self, id_name : str ) -> Set[ Hashable ]:
+        return self.id_map.get( id_name, set() )
+
+    def __bool__(self):
+        return bool( any( self.id_map.values() ))
+
+
+class ModelChangeTopic:
+
+    def __init__( self, name : str, callback_func : Callable[ [ ModelChangeSet ], None ] ):
+        self.name = name
+        self.callback_func = callback_func
+        return
+
+    def record( self, id_name : str, id_value : Hashable ):
+        change_set = ModelChangeSet()
+        change_set.add( id_name, id_value )
+        transaction.on_commit( lambda: ModelChangeDispatcher().publish( self, change_set ))
+        return
+
+    def __repr__(self):
+        return f'ModelChangeTopic({self.name})'
+
+
+class ModelChangeDispatcher( Singleton ):
+
+    # Changes committed within this window of the first one are
+    # delivered together.
+    COALESCE_DELAY_SECS = 0.1
+
+    # The test runner sets this so changes are delivered inline on
+    # commit: a dispatcher thread querying SQLite on its own connection
+    # while a test writes leads to "database table is locked" errors.
+    DELIVER_SYNCHRONOUSLY = False
+
+    def __init_singleton__(self):
+        self._condition = Condition()
+        self._pending_map : Dict[ ModelChangeTopic, ModelChangeSet ] = dict()
+        self._thread : Thread = None
+        self._stop_requested = False
+        self._delivered_count = 0
+        self._failed_count = 0
+        return
+
+    def publish( self, topic : ModelChangeTopic, change_set : ModelChangeSet ):
+        with self._condition:
+            self._pending_map.setdefault( topic, ModelChangeSet() ).merge( change_set )
+            if not self.DELIVER_SYNCHRONOUSLY:
+                self._ensure_thread_started()
+                self._condition.notify()
+        logger.debug( f'{topic.name} model change published.' )
+        if self.DELIVER_SYNCHRONOUSLY:
+            self.dispatch_pending()
+        return
+
+    def stop(self):
+        with self._condition:
+            self._stop_requested = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread:
+            thread.join( timeout = 5 )
+        self._thread = None
+        return
+
+    def dispatch_pending(self):
+        with self._condition:
+            pending_map = self._pending_map
+            self._pending_map = dict()
+
+        for topic, change_set in pending_map.items():
+            try:
+                topic.callback_func( change_set )
+                self._delivered_count += 1
+            except Exception:
+                self._failed_count += 1
+                logger.exception( f'Problem delivering {topic.name} model changes.' )
+            continue
+        return
+
+    def get_status(self):
+        with self._condition:
+            return {
+                'is_running': bool( self._thread and self._thread.is_alive() ),
+                'pending_topics': len( self._pending_map ),
+                'delivered': self._delivered_count,
+                'failed': self._failed_count,
+            }
+
+    def _ensure_thread_started(self):
+        """ Caller must hold the condition lock. """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_requested = False
+        self._thread = Thread(
+            target = self._run,
+            name = 'ModelChangeDispatcher',
+            daemon = True,
+        )
+        self._thread.start()
+        return
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending_map and not self._stop_requested:
+                    self._condition.wait()
+                    continue
+                if self._stop_requested:
+                    return
+                # Lets the rest of a burst of commits arrive first.
+                deadline = time.monotonic() + self.COALESCE_DELAY_SECS
+                while not self._stop_requested:
+                    remaining_secs = deadline - time.monotonic()
+                    if remaining_secs <= 0:
+                        break
+                    self._condition.wait( timeout = remaining_secs )
+                    continue
+                if self._stop_requested:
+                    return
+            try:
+                self.dispatch_pending()
+            finally:
+                # Release this thread's connection (and any locks it
+                # holds) rather than keeping it open between deliveries.
+                connection.close()
+            continue
@@ -0,0 +1,34 @@
+from typing import List, Type
+
+from django.db import models, router
+from django.db.models.signals import post_save
+
+
+def bulk_create_with_signals( model_class    : Type[ models.Model ],
+                              instance_list  : List[ models.Model ] ) -> List[ models.Model ]:
+    """
+    A bulk_create() that still sends post_save for each created row.
+
+    Plain bulk_create() skips post_save, but the model change receivers
+    (manager reloads, rendered caches) are how the rest of the app learns
+    that rows were added.  Those receivers only queue a reload or bump a
+    generation, so sending one signal per row costs no queries.  The rows
+    need primary keys after the insert, which SQLite 3.35+ and PostgreSQL
+    both return.
+    """
+    if not instance_list:
+        return list()
+
+    created_list = model_class.objects.bulk_create( instance_list )
+    using = router.db_for_write( model_class )
+    for instance in created_list:
+        post_save.send(
+            sender = model_class,
+            instance = instance,
+            created = True,
+            update_fields = None,
+            raw = False,
+            using = using,
+        )
+        continue
+    return created_list
@@ -1,11 +1,13 @@
+import io
 import logging
 import os
+import tempfile
 import xml.etree.ElementTree as ET
 
 from django import forms
 from django.core.exceptions import ValidationError
 
-from hi.apps.common.svg_utils import process_svg_content
+from hi.apps.common.svg_utils import process_svg_stream
 
 logger = logging.getLogger(__name__)
 
@@ -97,9 +99,18 @@ class SvgFileForm(forms.Form):
         with open( default_svg_path, 'r' ) as f:
             return f.read()
     
-    MAX_SVG_FILE_SIZE_MEGABYTES = 5
+    def get_path_precision(self) -> int:
+        # Significant digits kept for geometry values, or None to keep as-is.
+        return None
+
+    # Uploads are parsed incrementally, so size is limited by disk and
+    # request handling rather than by parse memory.
+    MAX_SVG_FILE_SIZE_MEGABYTES = 50
     MAX_SVG_FILE_SIZE_BYTES = MAX_SVG_FILE_SIZE_MEGABYTES * 1024 * 1024
 
+    # Processed fragments larger than this are spooled to a temporary file.
+    FRAGMENT_SPOOL_MAX_BYTES = 1024 * 1024
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._has_dangerous_svg_items = bool( self.data.get('has_dangerous_svg_items', 'false' ) == 'true' )
@@ -130,22 +141,28 @@ class SvgFileForm(forms.Form):
             if require_svg_file:
                 raise ValidationError( 'You need to re-select the SVG file.' )
 
-            svg_content = self.get_default_svg_content()
+            svg_source = io.StringIO( self.get_default_svg_content() )
             svg_filename = self.get_default_basename()
         else:
+            if svg_file_handle.size > self.MAX_SVG_FILE_SIZE_BYTES:
+                raise ValidationError( f'SVG file too large. Max {self.MAX_SVG_FILE_SIZE_MEGABYTES} MB.' )
             svg_file_handle.seek(0)  # Guard against multiple calls to clean()
-            svg_content = svg_file_handle.read().decode('utf-8')
+            svg_source = svg_file_handle
             svg_filename = svg_file_handle.name
             
+        svg_fragment_file = tempfile.SpooledTemporaryFile(
+            max_size = self.FRAGMENT_SPOOL_MAX_BYTES,
+            mode = 'w+',
+            encoding = 'utf-8',
+        )
         try:
-            if len(svg_content) > self.MAX_SVG_FILE_SIZE_BYTES:
-                raise ValidationError( f'SVG file too large. Max {self.MAX_SVG_FILE_SIZE_MEGABYTES} MB.' )
-
-            result = process_svg_content(
-                svg_content = svg_content,
+            result = process_svg_stream(
+                svg_source = svg_source,
+                fragment_destination = svg_fragment_file,
                 media_destination_directory = self.get_media_destination_directory(),
                 source_filename = svg_filename,
                 remove_dangerous = bool( remove_dangerous_svg_items ),
+                path_precision = self.get_path_precision(),
             )
 
             self._dangerous_tag_counts = result['dangerous_tag_counts']
@@ -158,17 +175,29 @@ class SvgFileForm(forms.Form):
                 self.data = self.data.copy()
                 self.data['has_dangerous_svg_items'] = 'true'
                 self._has_dangerous_svg_items = True
+                # The form is now invalid, so no caller will consume the fragment.
+                svg_fragment_file.close()
+                return cleaned_data
 
-            cleaned_data['svg_fragment_content'] = result['svg_fragment_content']
+            svg_import_stats = result['svg_import_stats']
+            logger.info( f'Processed SVG "{svg_filename}": {svg_import_stats}' )
+            
+            # The caller owns the fragment file from here, and must close it.
+            svg_fragment_file.seek(0)
+            cleaned_data['svg_fragment_file'] = svg_fragment_file
             cleaned_data['svg_viewbox'] = result['svg_viewbox']
             cleaned_data['svg_fragment_filename'] = result['svg_fragment_filename']
+            cleaned_data['svg_import_stats'] = svg_import_stats
 
         except ET.ParseError as pe:
+            svg_fragment_file.close()
             logger.exception( pe )
             raise ValidationError( 'The uploaded file is not a valid XML (SVG) file.' )
         except ValueError as ve:
+            svg_fragment_file.close()
             raise ValidationError( str(ve) )
         except Exception as e:
+            svg_fragment_file.close()
             logger.exception( e )
             raise ValidationError(f'Error processing the SVG file: {str(e)}' )
 
@@ -237,3 +237,34 @@ class SvgItemPositionBounds:
 
     
     
+
+
+@dataclass
+class SvgImportStats:
+    source_bytes           : int  = 0
+    fragment_bytes         : int  = 0
+    element_count          : int  = 0
+    removed_element_count  : int  = 0
+    peak_memory_bytes      : int  = 0
+
+    @property
+    def size_reduction_percent(self) -> float:
+        if self.source_bytes <= 0:
+            return 0.0
+        return 100.0 * ( self.source_bytes - self.fragment_bytes ) / self.source_bytes
+
+    def __str__(self):
+        return ( f'source={self.source_bytes:,}B, fragment={self.fragment_bytes:,}B'
+                 f' ({self.size_reduction_percent:.1f}% smaller),'
+                 f' elements={self.element_count:,}, removed={self.removed_element_count:,},'
+                 f' peak_memory={self.peak_memory_bytes:,}B' )
+    
+    def to_dict(self):
+        return {
+            'source_bytes': self.source_bytes,
+            'fragment_bytes': self.fragment_bytes,
+            'element_count': self.element_count,
+            'removed_element_count': self.removed_element_count,
+            'peak_memory_bytes': self.peak_memory_bytes,
+            'size_reduction_percent': self.size_reduction_percent,
+        }
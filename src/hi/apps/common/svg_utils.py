@@ -1,14 +1,25 @@
+import io
 import logging
+import math
 import os
+import re
+from typing import BinaryIO, Dict, List, TextIO, Union
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+import psutil
 
 from hi.apps.common.file_utils import generate_unique_filename
-from hi.apps.common.svg_models import SvgViewBox
+from hi.apps.common.svg_models import SvgImportStats, SvgViewBox
 
 logger = logging.getLogger(__name__)
 
 ET.register_namespace('', 'http://www.w3.org/2000/svg')
 
+SVG_NAMESPACE = 'http://www.w3.org/2000/svg'
+XLINK_NAMESPACE = 'http://www.w3.org/1999/xlink'
+XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
+
 DANGEROUS_TAGS = {
     'script', 'foreignObject', 'iframe', 'object',
     'animation', 'audio', 'video', 'style',
@@ -21,22 +32,75 @@ HREF_ATTRS = {
     '{http://www.w3.org/1999/xlink}href',
 }
 
+# Drawing tools embed their own document state (layers, guides, export
+# settings, thumbnails) in private namespaces.  None of it affects
+# rendering, but for architectural exports it can be a large fraction of
+# the file.
+EDITOR_NAMESPACES = {
+    'http://www.inkscape.org/namespaces/inkscape',
+    'http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd',
+    'http://www.bohemiancoding.com/sketch/ns',
+    'http://www.serif.com/',
+    'http://ns.adobe.com/AdobeIllustrator/10.0/',
+    'http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/',
+    'http://ns.adobe.com/Extensibility/1.0/',
+    'http://ns.adobe.com/Flows/1.0/',
+    'http://ns.adobe.com/Graphs/1.0/',
+    'http://ns.adobe.com/ImageReplacement/1.0/',
+    'http://ns.adobe.com/SaveForWeb/1.0/',
+    'http://ns.adobe.com/Variables/1.0/',
+    'http://ns.adobe.com/xap/1.0/',
+    'http://purl.org/dc/elements/1.1/',
+    'http://creativecommons.org/ns#',
+    'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+}
+EDITOR_TAGS = {
+    'metadata',
+}
+
+# Only geometry attributes are candidates for precision reduction. Numbers
+# without a fractional part are never rewritten, which keeps path arc flags
+# and integer counts intact. Transforms are left alone: a matrix or scale
+# mixes tiny factors with large offsets, and any rounding of the factors
+# distorts everything drawn inside it.
+PRECISION_ATTRS = {
+    'd', 'points',
+    'x', 'y', 'x1', 'y1', 'x2', 'y2',
+    'cx', 'cy', 'r', 'rx', 'ry',
+    'width', 'height',
+}
+DECIMAL_NUMBER_RE = re.compile( r'-?(?:\d*\.\d+|\d+\.\d*)(?:[eE][-+]?\d+)?' )
+NUMBER_RE = re.compile( r'-?(?:\d*\.\d+|\d+\.?\d*)(?:[eE][-+]?\d+)?' )
+
+MEMORY_SAMPLE_ELEMENT_INTERVAL = 2000
+OUTPUT_BUFFER_CHARS = 64 * 1024
+
 
 def process_svg_content( svg_content,
                          media_destination_directory,
                          source_filename,
-                         remove_dangerous = True ):
+                         remove_dangerous       = True,
+                         strip_editor_metadata  = True,
+                         path_precision         = None ):
     """
     Process a full SVG document: validate, extract viewBox, strip the
     outer <svg> wrapper, clean namespaces, scan for dangerous elements,
     and generate a unique MEDIA_ROOT filename.
 
+    This is the in-memory convenience wrapper around process_svg_stream()
+    for small, already-loaded content (e.g., rendered templates).
+
     Args:
         svg_content: Full SVG content string with outer <svg> element.
         media_destination_directory: Relative directory in MEDIA_ROOT (e.g., 'location/svg').
         source_filename: Original filename for generating unique destination name.
         remove_dangerous: If True, silently remove dangerous elements.
                           If False, return counts but do not remove.
+        strip_editor_metadata: If True, drop <metadata> and drawing tool
+                               elements/attributes.
+        path_precision: If not None, round fractional geometry values to
+                        this many significant digits, relative to the
+                        largest number in each attribute value.
 
     Returns:
         dict with keys:
@@ -45,65 +109,407 @@ def process_svg_content( svg_content,
             'svg_fragment_filename': Generated filename relative to MEDIA_ROOT.
             'dangerous_tag_counts': dict of {tag_name: count} for dangerous tags found.
             'dangerous_attr_counts': dict of {attr_name: count} for dangerous attrs found.
+            'svg_import_stats': SvgImportStats instance.
+
+    Raises:
+        ValueError: If content is not valid SVG or missing viewBox.
+    """
+    fragment_destination = io.StringIO()
+    result = process_svg_stream(
+        svg_source = io.BytesIO( svg_content.encode( 'utf-8' )),
+        fragment_destination = fragment_destination,
+        media_destination_directory = media_destination_directory,
+        source_filename = source_filename,
+        remove_dangerous = remove_dangerous,
+        strip_editor_metadata = strip_editor_metadata,
+        path_precision = path_precision,
+    )
+    result['svg_fragment_content'] = fragment_destination.getvalue()
+    return result
+
+
+def process_svg_stream( svg_source                   : Union[ BinaryIO, TextIO ],
+                        fragment_destination         : TextIO,
+                        media_destination_directory  : str,
+                        source_filename              : str,
+                        remove_dangerous             : bool        = True,
+                        strip_editor_metadata        : bool        = True,
+                        path_precision               : int         = None ):
+    """
+    Incremental version of process_svg_content() for large documents. The
+    source is parsed with iterparse() and each element is sanitized and
+    written to fragment_destination as soon as it is complete, then
+    discarded, so peak memory is bounded by document depth rather than
+    document size.
+
+    Returns the same dict as process_svg_content() except that the
+    fragment content is in fragment_destination rather than the dict.
 
     Raises:
         ValueError: If content is not valid SVG or missing viewBox.
+        ET.ParseError: If the content is not well-formed XML.
+    """
+    writer = _SvgFragmentStreamWriter(
+        fragment_destination = fragment_destination,
+        remove_dangerous = remove_dangerous,
+        strip_editor_metadata = strip_editor_metadata,
+        path_precision = path_precision,
+    )
+    counting_source = _CountingReader( svg_source )
+    writer.process( counting_source )
+
+    writer.import_stats.source_bytes = counting_source.bytes_read
+    svg_fragment_filename = os.path.join(
+        media_destination_directory,
+        generate_unique_filename( source_filename ),
+    )
+    return {
+        'svg_viewbox': writer.svg_viewbox,
+        'svg_fragment_filename': svg_fragment_filename,
+        'dangerous_tag_counts': writer.dangerous_tag_counts,
+        'dangerous_attr_counts': writer.dangerous_attr_counts,
+        'svg_import_stats': writer.import_stats,
+    }
+
+
+def round_svg_numbers( value : str, precision : int ) -> str:
+    """
+    Rounds the fractional numbers in an attribute value to 'precision'
+    significant digits of its largest number, so a drawing keeps the same
+    relative detail whether its units are millimeters or kilometers.
+    Numbers that are tiny next to the rest of the value round to zero.
+    """
+    max_magnitude = max( ( abs( float( number_str )) for number_str in NUMBER_RE.findall( value )),
+                         default = 0.0 )
+    if not math.isfinite( max_magnitude ) or ( max_magnitude == 0.0 ):
+        return value
+    decimal_places = max( 0, precision - 1 - math.floor( math.log10( max_magnitude )))
+
+    def _round_match( match ):
+        number_str = match.group(0)
+        rounded_str = f'{float( number_str ):.{decimal_places}f}'
+        if '.' in rounded_str:
+            rounded_str = rounded_str.rstrip( '0' ).rstrip( '.' )
+        if rounded_str in ( '-0', '' ):
+            rounded_str = '0'
+        if len( rounded_str ) >= len( number_str ):
+            return number_str
+        return rounded_str
+
+    return DECIMAL_NUMBER_RE.sub( _round_match, value )
+
+
+class _CountingReader:
+
+    def __init__( self, source ):
+        self._source = source
+        self.bytes_read = 0
+        return
+
+    def read( self, size = -1 ):
+        data = self._source.read( size )
+        if isinstance( data, str ):
+            self.bytes_read += len( data.encode( 'utf-8' ))
+        else:
+            self.bytes_read += len( data )
+        return data
+
+
+class _OpenElement:
+
+    def __init__( self,
+                  element            : ET.Element,
+                  is_written         : bool,
+                  declared_prefixes  : Dict[ str, str ] ):
+        self.element = element
+        self.is_written = is_written
+        self.declared_prefixes = declared_prefixes
+        self.start_tag_open = is_written
+        self.text_written = False
+        return
+
+
+class _SvgFragmentStreamWriter:
+    """
+    Writes the children of the root <svg> element as they stream out of
+    iterparse().  Text and tail content is only final once the parser has
+    moved past it, so an element's text is flushed at its first child (or
+    its end) and its tail at the next sibling (or the parent's end).  Start
+    tags are left open until content arrives so empty elements can still be
+    written self-closed.
     """
-    root = ET.fromstring( svg_content )
-    if root.tag != '{http://www.w3.org/2000/svg}svg':
-        raise ValueError( 'Content is not a valid SVG.' )
 
-    view_box_str = root.attrib.get( 'viewBox' )
-    if not view_box_str:
-        raise ValueError( 'SVG must contain a viewBox attribute.' )
+    def __init__( self,
+                  fragment_destination   : TextIO,
+                  remove_dangerous       : bool,
+                  strip_editor_metadata  : bool,
+                  path_precision         : int ):
+        self._destination = fragment_destination
+        self._remove_dangerous = remove_dangerous
+        self._strip_editor_metadata = strip_editor_metadata
+        self._path_precision = path_precision
 
-    svg_viewbox = SvgViewBox.from_attribute_value( view_box_str )
+        self.svg_viewbox = None
+        self.dangerous_tag_counts = dict()
+        self.dangerous_attr_counts = dict()
+        self.import_stats = SvgImportStats()
 
-    dangerous_tag_counts = dict()
-    dangerous_attr_counts = dict()
+        self._prefix_by_namespace = {
+            XLINK_NAMESPACE: 'xlink',
+            XML_NAMESPACE: 'xml',
+        }
+        self._open_elements : List[ _OpenElement ] = list()
+        self._skip_depth = None
+        self._closed_element = None
+        self._output_parts = list()
+        self._output_chars = 0
+        self._process = psutil.Process()
+        self._baseline_rss = 0
+        return
 
-    for element in list( root.iter() ):
-        if element is root:
+    def process( self, svg_source ):
+        self._baseline_rss = self._process.memory_info().rss
+        self._sample_memory()
+
+        for event, item in ET.iterparse( svg_source, events = ( 'start-ns', 'start', 'end' )):
+            if event == 'start-ns':
+                prefix, namespace = item
+                if prefix and ( namespace not in self._prefix_by_namespace ):
+                    self._prefix_by_namespace[namespace] = prefix
+            elif event == 'start':
+                self._handle_start( item )
+            else:
+                self._handle_end( item )
             continue
 
-        if element.tag.startswith( '{http://www.w3.org/2000/svg}' ):
-            element.tag = element.tag.split( '}', 1 )[1]
+        self._flush_output()
+        self._sample_memory()
+        return
+
+    def _handle_start( self, element : ET.Element ):
+        if not self._open_elements:
+            self._handle_root( element )
+            return
+
+        self.import_stats.element_count += 1
+        if ( self.import_stats.element_count % MEMORY_SAMPLE_ELEMENT_INTERVAL ) == 0:
+            self._sample_memory()
+
+        parent = self._open_elements[-1]
+        self._flush_pending_content( parent )
+
+        namespace, tag_name = self._split_name( element.tag )
+        is_dangerous_tag = bool( tag_name in DANGEROUS_TAGS )
+        if is_dangerous_tag:
+            self.dangerous_tag_counts[tag_name] = self.dangerous_tag_counts.get( tag_name, 0 ) + 1
+
+        attribute_list = self._sanitize_attributes( element )
 
-        tag_name = element.tag.split( '}' )[-1]
-        if tag_name in DANGEROUS_TAGS:
-            dangerous_tag_counts[tag_name] = dangerous_tag_counts.get( tag_name, 0 ) + 1
-            if remove_dangerous:
+        if self._skip_depth is None:
+            if is_dangerous_tag and self._remove_dangerous:
                 logger.debug( f'Removing dangerous SVG tag "{tag_name}"' )
-                root.remove( element )
+                self._skip_depth = len( self._open_elements )
+            elif self._strip_editor_metadata and self._is_editor_element( namespace, tag_name ):
+                self._skip_depth = len( self._open_elements )
+
+        is_written = bool( self._skip_depth is None )
+        if not is_written:
+            self.import_stats.removed_element_count += 1
+            self._open_elements.append( _OpenElement(
+                element = element,
+                is_written = False,
+                declared_prefixes = parent.declared_prefixes,
+            ))
+            return
+
+        self._close_start_tag( parent )
+        declared_prefixes = parent.declared_prefixes
+        qualified_tag = self._qualify_name( namespace, tag_name )
+
+        new_declarations = dict()
+        for name_namespace in [ namespace ] + [ x[0] for x in attribute_list ]:
+            if name_namespace in ( None, SVG_NAMESPACE, XML_NAMESPACE ):
+                continue
+            prefix = self._prefix_for_namespace( name_namespace )
+            if declared_prefixes.get( prefix ) != name_namespace:
+                new_declarations[prefix] = name_namespace
+            continue
+        if new_declarations:
+            declared_prefixes = { **declared_prefixes, **new_declarations }
+
+        tag_parts = [ f'<{qualified_tag}' ]
+        for prefix, prefix_namespace in new_declarations.items():
+            tag_parts.append( f' xmlns:{prefix}={self._quote_attribute( prefix_namespace )}' )
             continue
+        for attr_namespace, attr_name, attr_value in attribute_list:
+            qualified_attr_name = self._qualify_name( attr_namespace, attr_name )
+            tag_parts.append( f' {qualified_attr_name}={self._quote_attribute( attr_value )}' )
+            continue
+        self._write( ''.join( tag_parts ))
+
+        self._open_elements.append( _OpenElement(
+            element = element,
+            is_written = True,
+            declared_prefixes = declared_prefixes,
+        ))
+        return
+
+    def _handle_end( self, element : ET.Element ):
+        open_element = self._open_elements[-1]
+        depth = len( self._open_elements ) - 1
+
+        if depth == 0:
+            self._flush_pending_content( open_element )
+            self._open_elements.pop()
+            return
+
+        if open_element.is_written:
+            self._flush_pending_content( open_element )
+            if open_element.start_tag_open:
+                self._write( ' />' )
+            else:
+                namespace, tag_name = self._split_name( element.tag )
+                self._write( f'</{self._qualify_name( namespace, tag_name )}>' )
+        else:
+            self._discard_closed_element( parent = element )
+
+        self._open_elements.pop()
+        if self._skip_depth == depth:
+            self._skip_depth = None
+
+        # Tail text belongs to the parent and is not complete until the
+        # parser moves on, so the element is only released once its tail
+        # has been written.
+        self._closed_element = element
+        return
+
+    def _handle_root( self, element : ET.Element ):
+        if element.tag != f'{{{SVG_NAMESPACE}}}svg':
+            raise ValueError( 'Content is not a valid SVG.' )
+
+        view_box_str = element.attrib.get( 'viewBox' )
+        if not view_box_str:
+            raise ValueError( 'SVG must contain a viewBox attribute.' )
+        self.svg_viewbox = SvgViewBox.from_attribute_value( view_box_str )
+
+        self._open_elements.append( _OpenElement(
+            element = element,
+            is_written = False,
+            declared_prefixes = dict(),
+        ))
+        return
+
+    def _flush_pending_content( self, open_element : _OpenElement ):
+        """
+        Writes whatever content of open_element is now known to be complete:
+        its leading text, and the tail of its most recently closed child.
+        """
+        if open_element.is_written and not open_element.text_written:
+            open_element.text_written = True
+            if open_element.element.text:
+                self._close_start_tag( open_element )
+                self._write( escape( open_element.element.text ))
 
-        for attr_name in list( element.attrib ):
+        closed_element = self._closed_element
+        if closed_element is None:
+            return
+        self._closed_element = None
+
+        if open_element.is_written and closed_element.tail:
+            self._close_start_tag( open_element )
+            self._write( escape( closed_element.tail ))
+
+        open_element.element.remove( closed_element )
+        closed_element.clear()
+        return
+
+    def _discard_closed_element( self, parent : ET.Element ):
+        closed_element = self._closed_element
+        if closed_element is None:
+            return
+        self._closed_element = None
+        parent.remove( closed_element )
+        closed_element.clear()
+        return
+
+    def _close_start_tag( self, open_element : _OpenElement ):
+        if open_element.start_tag_open:
+            open_element.start_tag_open = False
+            self._write( '>' )
+        return
+
+    def _sanitize_attributes( self, element : ET.Element ):
+        attribute_list = list()
+        for attr_name, attr_value in element.attrib.items():
             if attr_name in DANGEROUS_ATTRS:
-                dangerous_attr_counts[attr_name] = dangerous_attr_counts.get( attr_name, 0 ) + 1
-                if remove_dangerous:
+                self.dangerous_attr_counts[attr_name] = self.dangerous_attr_counts.get( attr_name, 0 ) + 1
+                if self._remove_dangerous:
                     logger.debug( f'Removing dangerous SVG attribute "{attr_name}"' )
-                    del element.attrib[attr_name]
+                    continue
             elif attr_name in HREF_ATTRS:
-                attr_value = element.attrib[attr_name].strip()
-                if not attr_value.startswith( '#' ):
-                    dangerous_attr_counts[attr_name] = dangerous_attr_counts.get( attr_name, 0 ) + 1
-                    if remove_dangerous:
+                if not attr_value.strip().startswith( '#' ):
+                    self.dangerous_attr_counts[attr_name] = self.dangerous_attr_counts.get( attr_name, 0 ) + 1
+                    if self._remove_dangerous:
                         logger.debug( f'Removing dangerous SVG href "{attr_name}={attr_value}"' )
-                        del element.attrib[attr_name]
+                        continue
 
-    inner_content = ''.join(
-        ET.tostring( element, encoding='unicode' ) for element in root
-    )
+            attr_namespace, local_name = self._split_name( attr_name )
+            if self._strip_editor_metadata and ( attr_namespace in EDITOR_NAMESPACES ):
+                continue
+            if ( self._path_precision is not None ) and ( local_name in PRECISION_ATTRS ):
+                attr_value = round_svg_numbers( attr_value, self._path_precision )
 
-    svg_fragment_filename = os.path.join(
-        media_destination_directory,
-        generate_unique_filename( source_filename ),
-    )
+            attribute_list.append( ( attr_namespace, local_name, attr_value ) )
+            continue
+        return attribute_list
 
-    return {
-        'svg_fragment_content': inner_content,
-        'svg_viewbox': svg_viewbox,
-        'svg_fragment_filename': svg_fragment_filename,
-        'dangerous_tag_counts': dangerous_tag_counts,
-        'dangerous_attr_counts': dangerous_attr_counts,
-    }
+    def _is_editor_element( self, namespace : str, tag_name : str ) -> bool:
+        if namespace in EDITOR_NAMESPACES:
+            return True
+        return bool( tag_name in EDITOR_TAGS )
+
+    def _split_name( self, name : str ):
+        if name.startswith( '{' ):
+            namespace, local_name = name[1:].split( '}', 1 )
+            return namespace, local_name
+        return None, name
+
+    def _prefix_for_namespace( self, namespace : str ) -> str:
+        prefix = self._prefix_by_namespace.get( namespace )
+        if not prefix:
+            prefix = f'ns{len( self._prefix_by_namespace )}'
+            self._prefix_by_namespace[namespace] = prefix
+        return prefix
+
+    def _qualify_name( self, namespace : str, local_name : str ) -> str:
+        if namespace in ( None, SVG_NAMESPACE ):
+            return local_name
+        prefix = self._prefix_for_namespace( namespace )
+        return f'{prefix}:{local_name}'
+
+    def _quote_attribute( self, value : str ) -> str:
+        escaped_value = escape( value, { '"': '&quot;', '\n': '&#10;', '\t': '&#09;' } )
+        return f'"{escaped_value}"'
+
+    def _write( self, content : str ):
+        self._output_parts.append( content )
+        self._output_chars += len( content )
+        if self._output_chars >= OUTPUT_BUFFER_CHARS:
+            self._flush_output()
+        return
+
+    def _flush_output( self ):
+        if not self._output_parts:
+            return
+        content = ''.join( self._output_parts )
+        self._destination.write( content )
+        self.import_stats.fragment_bytes += len( content.encode( 'utf-8' ))
+        self._output_parts = list()
+        self._output_chars = 0
+        return
+
+    def _sample_memory( self ):
+        rss_growth = self._process.memory_info().rss - self._baseline_rss
+        if rss_growth > self.import_stats.peak_memory_bytes:
+            self.import_stats.peak_memory_bytes = rss_growth
+        return
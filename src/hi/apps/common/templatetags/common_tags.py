@@ -1,8 +1,10 @@
 import os
 import random
+from threading import Lock
 import urllib
 import uuid
 
+from cachetools import LRUCache
 from django import template
 from django.conf import settings
 from django.template import engines
@@ -13,6 +15,13 @@ from hi.apps.common.utils import get_humanized_secs
 
 register = template.Library()
 
+# Compiled media templates keyed by (path, mtime, size) so that edits to
+# the file are picked up without re-reading and re-parsing it on every
+# render.  Location SVG fragments can be multiple MB.
+MEDIA_TEMPLATE_CACHE_SIZE = 16
+_media_template_cache = LRUCache( maxsize = MEDIA_TEMPLATE_CACHE_SIZE )
+_media_template_cache_lock = Lock()
+
 
 @register.filter
 def get_item(dictionary, key):
@@ -127,14 +136,21 @@ def include_media_template( context, file_path ):
     
     full_path = os.path.join( settings.MEDIA_ROOT, file_path )
 
-    if not os.path.exists(full_path):
+    try:
+        file_stat = os.stat( full_path )
+    except FileNotFoundError:
         return f'Template file not found: {full_path}'
 
-    with open(full_path, 'r') as file:
-        file_content = file.read()
-
-    template_engine = engines['django']
-    template_obj = template_engine.from_string( file_content )
+    cache_key = ( full_path, file_stat.st_mtime_ns, file_stat.st_size )
+    with _media_template_cache_lock:
+        template_obj = _media_template_cache.get( cache_key )
+    if template_obj is None:
+        with open(full_path, 'r') as file:
+            file_content = file.read()
+        template_engine = engines['django']
+        template_obj = template_engine.from_string( file_content )
+        with _media_template_cache_lock:
+            _media_template_cache[cache_key] = template_obj
 
     context_dict = context.flatten()
     return template_obj.render( context_dict )
@@ -0,0 +1,161 @@
+import logging
+from threading import Timer
+import time
+
+import fakeredis
+from django.test import TestCase
+
+from hi.apps.common.lock_service import (
+    ExclusionLockContext,
+    InitializationLockContext,
+    InProcessLockBackend,
+    LockService,
+    LockTimeoutError,
+    RedisLockBackend,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class LockBackendTestMixin:
+
+    def create_backend(self):
+        raise NotImplementedError()
+
+    def test_lock_excludes_until_released(self):
+        backend = self.create_backend()
+        lease = backend.try_acquire( 'sync', holder = 'a', lease_secs = 60 )
+        self.assertIsNotNone( lease )
+        self.assertIsNone( backend.try_acquire( 'sync', holder = 'b', lease_secs = 60 ))
+        self.assertIsNotNone( backend.try_acquire( 'other', holder = 'b', lease_secs = 60 ))
+        self.assertEqual( backend.get_holder( 'sync' ), 'a' )
+
+        self.assertTrue( backend.release( lease ))
+        self.assertIsNone( backend.get_holder( 'sync' ))
+        next_lease = backend.try_acquire( 'sync', holder = 'b', lease_secs = 60 )
+        self.assertGreater( next_lease.token, lease.token )
+
+    def test_expired_lease_cannot_release_or_renew_next_holder(self):
+        backend = self.create_backend()
+        stale_lease = backend.try_acquire( 'sync', holder = 'a', lease_secs = 0.05 )
+        time.sleep( 0.1 )
+        self.assertFalse( backend.renew( stale_lease ))
+        current_lease = backend.try_acquire( 'sync', holder = 'b', lease_secs = 60 )
+        self.assertIsNotNone( current_lease )
+
+        self.assertFalse( backend.release( stale_lease ))
+        self.assertEqual( backend.get_holder( 'sync' ), 'b' )
+        self.assertTrue( backend.renew( current_lease ))
+
+
+class TestInProcessLockBackend( LockBackendTestMixin, TestCase ):
+
+    def create_backend(self):
+        return InProcessLockBackend()
+
+
+class TestRedisLockBackend( LockBackendTestMixin, TestCase ):
+
+    def create_backend(self):
+        return RedisLockBackend( fakeredis.FakeRedis( decode_responses = True ))
+
+
+class TestLockService(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.lock_service = LockService()
+        self.lock_service.stop()
+        self.lock_service.__init_singleton__()
+        self.lock_service.use_backend( InProcessLockBackend() )
+        return
+
+    def tearDown(self):
+        self.lock_service.stop()
+        super().tearDown()
+        return
+
+    def test_timeout_is_counted_with_holder(self):
+        self.lock_service.acquire( 'sync', lease_secs = 60 )
+        with self.assertRaises( LockTimeoutError ) as context:
+            self.lock_service.acquire( 'sync', lease_secs = 60, wait_secs = 0.1 )
+        self.assertIn( 'held by', str( context.exception ))
+
+        stats = self.lock_service.get_stats_list()[0]
+        self.assertEqual( ( stats['acquired'], stats['timeouts'] ), ( 1, 1 ))
+        self.assertIsNotNone( stats['current_holder'] )
+
+    def test_waiter_acquires_after_release(self):
+        lease = self.lock_service.acquire( 'sync', lease_secs = 60 )
+        Timer( 0.1, self.lock_service.release, args = [ lease ] ).start()
+
+        next_lease = self.lock_service.acquire( 'sync', lease_secs = 60, wait_secs = 5 )
+
+        self.assertGreater( next_lease.token, lease.token )
+        stats = self.lock_service.get_stats_list()[0]
+        self.assertEqual( stats['contended'], 1 )
+        self.assertGreater( stats['max_wait_ms'], 50 )
+
+    def test_renewal_keeps_lease_past_lease_time(self):
+        lease = self.lock_service.acquire( 'sync', lease_secs = 0.15, renew = True )
+        time.sleep( 0.4 )
+        with self.assertRaises( LockTimeoutError ):
+            self.lock_service.acquire( 'sync', lease_secs = 60 )
+        self.lock_service.release( lease )
+        self.assertEqual( self.lock_service.get_stats_list()[0]['lost'], 0 )
+
+    def test_redis_is_retried_after_failure(self):
+        redis_server = fakeredis.FakeServer()
+        redis_client = fakeredis.FakeRedis( server = redis_server, decode_responses = True )
+        self.lock_service.use_backend( RedisLockBackend( redis_client ))
+        self.lock_service.BACKEND_RETRY_SECS = 0.1
+
+        redis_server.connected = False
+        outage_lease = self.lock_service.acquire( 'outage', lease_secs = 60 )
+        self.assertEqual( outage_lease.backend_name, InProcessLockBackend.NAME )
+
+        # Still backing off, even though Redis is back.
+        redis_server.connected = True
+        backoff_lease = self.lock_service.acquire( 'backoff', lease_secs = 60 )
+        self.assertEqual( backoff_lease.backend_name, InProcessLockBackend.NAME )
+
+        time.sleep( 0.15 )
+        recovered_lease = self.lock_service.acquire( 'recovered', lease_secs = 60 )
+        self.assertEqual( recovered_lease.backend_name, RedisLockBackend.NAME )
+        self.assertEqual( self.lock_service.backend_name, RedisLockBackend.NAME )
+        self.assertIsNotNone( redis_client.get( f'{RedisLockBackend.KEY_PREFIX}recovered' ))
+
+        # Fallback leases are still released where they were granted.
+        self.lock_service.release( outage_lease )
+        self.lock_service.release( backoff_lease )
+        self.lock_service.release( recovered_lease )
+        self.assertEqual( sum( x['lost'] for x in self.lock_service.get_stats_list() ), 0 )
+
+
+class TestLockContexts(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        LockService().stop()
+        LockService().__init_singleton__()
+        LockService().use_backend( InProcessLockBackend() )
+        return
+
+    def test_exclusion_context_releases_on_exit(self):
+        with ExclusionLockContext( name = 'sync' ) as lease:
+            self.assertIsNotNone( lease.token )
+            with self.assertRaises( RuntimeError ):
+                with ExclusionLockContext( name = 'sync' ):
+                    pass
+        with ExclusionLockContext( name = 'sync' ):
+            pass
+
+    def test_initialization_context_holds_until_lease_expires(self):
+        with InitializationLockContext( name = 'init', timeout_seconds = 0.1 ):
+            pass
+        with self.assertRaises( RuntimeError ):
+            with InitializationLockContext( name = 'init', timeout_seconds = 0.1 ):
+                pass
+        time.sleep( 0.15 )
+        with InitializationLockContext( name = 'init', timeout_seconds = 0.1 ):
+            pass
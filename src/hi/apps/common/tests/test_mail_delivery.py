@@ -0,0 +1,77 @@
+import logging
+import time
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase
+
+from hi.apps.common.mail_delivery import MailDeliveryService
+
+logging.disable(logging.CRITICAL)
+
+
+class FailingForOneRecipientBackend( EmailBackend ):
+
+    def send_messages( self, messages ):
+        if messages[0].to == [ 'bad@example.com' ]:
+            raise ConnectionError( 'Recipient refused' )
+        return super().send_messages( messages )
+
+
+class TestMailDeliveryService(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.service = MailDeliveryService()
+        self.service.stop()
+        self.service.__init_singleton__()
+        return
+
+    def tearDown(self):
+        self.service.stop()
+        super().tearDown()
+        return
+
+    def create_message( self, to_email_address ):
+        return EmailMessage( 'Subject', 'Body', 'from@example.com', [ to_email_address ] )
+
+    def test_queued_burst_is_sent_over_one_connection(self):
+        with patch.object( self.service, '_ensure_worker_started' ):
+            self.service.enqueue([ self.create_message( f'user{idx}@example.com' ) for idx in range( 20 ) ])
+            self.assertEqual( self.service.get_status()['queue_depth'], 20 )
+            sent_count = self.service.deliver_pending()
+
+        self.assertEqual( sent_count, 20 )
+        self.assertEqual( len( mail.outbox ), 20 )
+        status = self.service.get_status()
+        self.assertEqual( ( status['sent'], status['batches'], status['connections'] ), ( 20, 1, 1 ))
+        self.assertEqual( status['queue_depth'], 0 )
+
+    def test_failed_message_is_counted_and_does_not_block_others(self):
+        message_list = [ self.create_message( email_address )
+                         for email_address in [ 'a@example.com', 'bad@example.com', 'b@example.com' ] ]
+        with patch.object( self.service, '_ensure_worker_started' ):
+            with patch( 'hi.apps.common.mail_delivery.get_connection',
+                        side_effect = lambda: FailingForOneRecipientBackend() ):
+                self.service.enqueue( message_list )
+                sent_count = self.service.deliver_pending()
+
+        self.assertEqual( sent_count, 2 )
+        self.assertEqual( [ message.to for message in mail.outbox ], [ [ 'a@example.com' ], [ 'b@example.com' ] ] )
+        status = self.service.get_status()
+        self.assertEqual( ( status['sent'], status['failed'], status['connections'] ), ( 2, 1, 2 ))
+        self.assertIn( 'Recipient refused', self.service.health_status.last_message )
+
+    def test_worker_delivers_after_coalescing_window(self):
+        with patch.object( MailDeliveryService, 'COALESCE_WINDOW_SECS', 0.05 ):
+            self.service.enqueue([ self.create_message( 'a@example.com' ) ])
+            self.service.enqueue([ self.create_message( 'b@example.com' ) ])
+            for _ in range( 100 ):
+                if len( mail.outbox ) == 2:
+                    break
+                time.sleep( 0.05 )
+                continue
+        self.assertEqual( len( mail.outbox ), 2 )
+        self.assertEqual( self.service.get_status()['batches'], 1 )
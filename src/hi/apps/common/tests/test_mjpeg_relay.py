@@ -0,0 +1,213 @@
+import logging
+from threading import Event as ThreadEvent
+import time
+from unittest.mock import Mock, patch
+
+import requests
+
+from django.test import TestCase
+
+from hi.apps.common.mjpeg_relay import (
+    MjpegFrameParser,
+    MjpegRelay,
+    MjpegRelayFullError,
+)
+from hi.simulator.services.zoneminder.zm_media import (
+    iter_bounded_mjpeg_parts,
+    mjpeg_content_type,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class FakeUpstreamResponse:
+    """ Replays the ZoneMinder simulator's MJPEG stream in small chunks. """
+
+    def __init__( self, frame_count = 3, chunk_size = 500, release_event = None, first_frame_gate = None ):
+        self.headers = { 'Content-Type': mjpeg_content_type() }
+        self._part_list = list( iter_bounded_mjpeg_parts(
+            text_lines = [ 'Monitor 1' ],
+            frame_count = frame_count,
+            frame_interval = 0.0,
+        ))
+        self._chunk_size = chunk_size
+        self._release_event = release_event
+        self._first_frame_gate = first_frame_gate
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__( self, *args ):
+        return
+
+    def raise_for_status(self):
+        return
+
+    def iter_content( self, chunk_size ):
+        for part_index, part in enumerate( self._part_list ):
+            for offset in range( 0, len( part ), self._chunk_size ):
+                yield part[ offset:offset + self._chunk_size ]
+                continue
+            if ( part_index == 0 ) and self._first_frame_gate:
+                self._first_frame_gate.wait( timeout = 5 )
+            continue
+        # Hold the connection open like a live feed until the test lets go.
+        if self._release_event:
+            self._release_event.wait( timeout = 5 )
+        return
+
+
+class TestMjpegFrameParser(TestCase):
+
+    def test_splits_simulator_stream_across_chunk_boundaries(self):
+        body = b''.join( iter_bounded_mjpeg_parts( text_lines = [ 'x' ], frame_count = 4, frame_interval = 0.0 ))
+        parser = MjpegFrameParser( boundary = MjpegFrameParser.boundary_from_content_type( mjpeg_content_type() ))
+
+        frame_list = list()
+        for offset in range( 0, len( body ), 7 ):
+            frame_list.extend( parser.feed( body[ offset:offset + 7 ] ))
+            continue
+
+        self.assertEqual( len( frame_list ), 4 )
+        for frame in frame_list:
+            self.assertTrue( frame.startswith( b'\xff\xd8' ))
+            self.assertTrue( frame.endswith( b'\xff\xd9' ))
+            continue
+
+    def test_parts_without_content_length_end_at_next_boundary(self):
+        parser = MjpegFrameParser( boundary = b'frame' )
+        frame_list = parser.feed(
+            b'--frame\r\nContent-Type: image/jpeg\r\n\r\nAAA\r\n'
+            b'--frame\r\nContent-Type: image/jpeg\r\n\r\nBBB\r\n--frame'
+        )
+        self.assertEqual( frame_list, [ b'AAA', b'BBB' ] )
+
+
+class TestMjpegRelay(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.relay = MjpegRelay()
+        self.relay.stop()
+        self.relay.__init_singleton__()
+        self.release_event = ThreadEvent()
+        return
+
+    def tearDown(self):
+        self.release_event.set()
+        self.relay.stop()
+        super().tearDown()
+        return
+
+    def subscribe( self, stream_key = 'zm.monitor.1' ):
+        return self.relay.subscribe(
+            stream_key = stream_key,
+            upstream_url_func = lambda: f'http://zm/{stream_key}',
+        )
+
+    def test_clients_share_one_upstream_connection(self):
+        with patch( 'hi.apps.common.mjpeg_relay.requests.get',
+                    return_value = FakeUpstreamResponse( release_event = self.release_event )) as mock_get:
+            subscription_list = [ self.subscribe() for _ in range( 5 ) ]
+            client_iter_list = [ iter( subscription ) for subscription in subscription_list ]
+            part_list = [ next( client_iter ) for client_iter in client_iter_list ]
+
+        mock_get.assert_called_once()
+        for part in part_list:
+            self.assertTrue( part.startswith( f'--{MjpegRelay.BOUNDARY}\r\n'.encode() ))
+            continue
+        status = self.relay.get_status()
+        self.assertEqual( status['clients'], 5 )
+        self.assertEqual( status['channels'][0]['upstream_connects'], 1 )
+
+        for subscription in subscription_list:
+            subscription.close()
+            continue
+        self.assertEqual( self.relay.get_status()['clients'], 0 )
+
+    def test_slow_client_skips_to_latest_frame(self):
+        first_frame_gate = ThreadEvent()
+        upstream_response = FakeUpstreamResponse(
+            frame_count = 6,
+            release_event = self.release_event,
+            first_frame_gate = first_frame_gate,
+        )
+        with patch( 'hi.apps.common.mjpeg_relay.requests.get', return_value = upstream_response ):
+            subscription = self.subscribe()
+            client_iter = iter( subscription )
+            next( client_iter )
+            # The client stalls while the upstream delivers every remaining frame.
+            first_frame_gate.set()
+            for _ in range( 100 ):
+                if self.relay.get_status()['channels'][0]['frames_received'] == 6:
+                    break
+                time.sleep( 0.01 )
+                continue
+            next( client_iter )
+
+        channel_status = self.relay.get_status()['channels'][0]
+        self.assertEqual( channel_status['frames_received'], 6 )
+        self.assertEqual( channel_status['frames_sent'], 2 )
+        self.assertEqual( channel_status['frames_skipped'], 4 )
+        subscription.close()
+
+    def test_idle_upstream_closes_after_grace_period(self):
+        with patch.object( MjpegRelay, 'IDLE_GRACE_SECS', 0.05 ):
+            with patch( 'hi.apps.common.mjpeg_relay.requests.get',
+                        return_value = FakeUpstreamResponse( frame_count = 2 )):
+                subscription = self.subscribe()
+                next( iter( subscription ))
+                subscription.close()
+                for _ in range( 100 ):
+                    if not self.relay.get_status()['channels']:
+                        break
+                    time.sleep( 0.02 )
+                    continue
+        self.assertEqual( self.relay.get_status()['channels'], [] )
+
+    def test_client_limit_is_enforced(self):
+        with patch.object( MjpegRelay, 'MAX_CLIENTS', 1 ):
+            with patch( 'hi.apps.common.mjpeg_relay.requests.get',
+                        return_value = FakeUpstreamResponse( release_event = self.release_event )):
+                subscription = self.subscribe()
+                with self.assertRaises( MjpegRelayFullError ):
+                    self.subscribe( stream_key = 'zm.monitor.2' )
+                subscription.close()
+        self.assertEqual( self.relay.get_status()['rejected'], 1 )
+
+    def test_upstream_errors_do_not_log_upstream_url(self):
+        secret_url = 'http://zm/cgi-bin/nph-zms?monitor=1&token=SECRET-TOKEN'
+        http_error_response = Mock( status_code = 401 )
+        http_error_response.raise_for_status.side_effect = requests.HTTPError(
+            f'401 Client Error: Unauthorized for url: {secret_url}',
+            response = http_error_response,
+        )
+        http_error_response.__enter__ = Mock( return_value = http_error_response )
+        http_error_response.__exit__ = Mock( return_value = False )
+        error_list = [
+            ( http_error_response, 'HTTP 401' ),
+            ( requests.ConnectionError( f'Max retries exceeded with url: {secret_url}' ), 'ConnectionError' ),
+        ]
+        for upstream_result, expected_message in error_list:
+            self.relay.stop()
+            self.relay.__init_singleton__()
+            with patch( 'hi.apps.common.mjpeg_relay.requests.get', side_effect = [ upstream_result ] ), \
+                 patch( 'hi.apps.common.mjpeg_relay.logger' ) as mock_logger:
+                subscription = self.relay.subscribe(
+                    stream_key = 'zm.monitor.1',
+                    upstream_url_func = lambda: secret_url,
+                )
+                for _ in range( 100 ):
+                    if mock_logger.warning.called:
+                        break
+                    time.sleep( 0.01 )
+                    continue
+                subscription.close()
+                self.relay.stop()
+
+            message = mock_logger.warning.call_args[0][0]
+            self.assertIn( 'zm.monitor.1', message )
+            self.assertIn( expected_message, message )
+            self.assertNotIn( 'SECRET-TOKEN', message )
+            continue
@@ -0,0 +1,93 @@
+import logging
+from threading import Event as ThreadEvent
+from unittest.mock import Mock, patch
+
+from django.db import transaction
+from django.test import TestCase
+
+from hi.apps.common.model_change_dispatcher import (
+    ModelChangeDispatcher,
+    ModelChangeSet,
+    ModelChangeTopic,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class TestModelChangeDispatcher(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Exercise the dispatcher thread that runs outside of tests.
+        self.synchronous_patcher = patch.object( ModelChangeDispatcher, 'DELIVER_SYNCHRONOUSLY', False )
+        self.synchronous_patcher.start()
+        self.dispatcher = ModelChangeDispatcher()
+        self.dispatcher.stop()
+        self.dispatcher.__init_singleton__()
+        return
+
+    def tearDown(self):
+        self.dispatcher.stop()
+        self.synchronous_patcher.stop()
+        super().tearDown()
+        return
+
+    def test_changes_in_transaction_are_merged_per_topic(self):
+        first_callback = Mock()
+        second_callback = Mock()
+        first_topic = ModelChangeTopic( name = 'first', callback_func = first_callback )
+        second_topic = ModelChangeTopic( name = 'second', callback_func = second_callback )
+
+        with patch.object( self.dispatcher, '_ensure_thread_started' ):
+            with self.captureOnCommitCallbacks( execute = True ):
+                with transaction.atomic():
+                    first_topic.record( 'row', 1 )
+                    first_topic.record( 'row', 2 )
+                    first_topic.record( 'row', 1 )
+                    first_topic.record( 'other_row', 'a' )
+                    second_topic.record( 'row', 3 )
+            self.dispatcher.dispatch_pending()
+
+        first_callback.assert_called_once()
+        change_set = first_callback.call_args.args[0]
+        self.assertEqual( change_set.get_ids( 'row' ), { 1, 2 } )
+        self.assertEqual( change_set.get_ids( 'other_row' ), { 'a' } )
+        self.assertEqual( change_set.get_ids( 'missing' ), set() )
+        self.assertEqual( second_callback.call_args.args[0].get_ids( 'row' ), { 3 } )
+
+    def test_rolled_back_changes_are_not_published(self):
+        topic = ModelChangeTopic( name = 'test', callback_func = Mock() )
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    topic.record( 'row', 1 )
+                    raise ValueError()
+            except ValueError:
+                pass
+        self.assertEqual( callbacks, [] )
+
+    def test_failed_callback_does_not_block_other_topics(self):
+        delivered = ThreadEvent()
+        failing_topic = ModelChangeTopic( name = 'failing', callback_func = Mock( side_effect = RuntimeError() ))
+        working_topic = ModelChangeTopic( name = 'working', callback_func = lambda change_set: delivered.set() )
+        change_set = ModelChangeSet()
+        change_set.add( 'row', 1 )
+
+        self.dispatcher.publish( failing_topic, change_set )
+        self.dispatcher.publish( working_topic, change_set )
+
+        self.assertTrue( delivered.wait( timeout = 5 ))
+        self.dispatcher.stop()
+        status = self.dispatcher.get_status()
+        self.assertEqual( status['delivered'], 1 )
+        self.assertEqual( status['failed'], 1 )
+
+    def test_synchronous_delivery_happens_on_commit(self):
+        callback = Mock()
+        topic = ModelChangeTopic( name = 'test', callback_func = callback )
+        with patch.object( ModelChangeDispatcher, 'DELIVER_SYNCHRONOUSLY', True ):
+            with self.captureOnCommitCallbacks( execute = True ):
+                with transaction.atomic():
+                    topic.record( 'row', 1 )
+        callback.assert_called_once()
+        self.assertFalse( self.dispatcher.get_status()['is_running'] )
@@ -70,7 +70,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertIn('href="#section1"', fragment_content)
 
     def test_external_href_is_removed_when_dangerous_items_accepted(self):
@@ -79,7 +79,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg, remove_dangerous=True)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertNotIn('http://evil.com', fragment_content)
         self.assertNotIn('href=', fragment_content)
 
@@ -102,7 +102,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         # The attribute value should reference the internal fragment
         self.assertIn('#my-symbol', fragment_content)
 
@@ -115,7 +115,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg, remove_dangerous=True)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertNotIn('evil.com', fragment_content)
 
     def test_onclick_event_handler_is_flagged(self):
@@ -124,7 +124,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg, remove_dangerous=True)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertNotIn('onclick', fragment_content)
         self.assertNotIn('alert', fragment_content)
 
@@ -143,7 +143,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg, remove_dangerous=True)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertNotIn('onload', fragment_content)
 
     def test_onmouseover_event_handler_is_flagged(self):
@@ -152,7 +152,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg, remove_dangerous=True)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertNotIn('onmouseover', fragment_content)
 
     def test_multiple_dangerous_attrs_are_all_counted(self):
@@ -176,7 +176,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertIn('fill="blue"', fragment_content)
         self.assertIn('stroke="red"', fragment_content)
 
@@ -189,7 +189,7 @@ class TestSvgFileFormHrefHandling(BaseTestCase):
         form, is_valid = self._submit_form(svg, remove_dangerous=True)
 
         self.assertTrue(is_valid)
-        fragment_content = form.cleaned_data['svg_fragment_content']
+        fragment_content = form.cleaned_data['svg_fragment_file'].read()
         self.assertNotIn('script', fragment_content)
         self.assertNotIn('alert', fragment_content)
 
@@ -0,0 +1,210 @@
+import io
+import logging
+import xml.etree.ElementTree as ET
+
+from hi.apps.common.svg_utils import (
+    process_svg_content,
+    process_svg_stream,
+    round_svg_numbers,
+)
+from hi.testing.base_test_case import BaseTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+def _make_svg(inner_content, extra_namespaces=''):
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg"'
+        ' xmlns:xlink="http://www.w3.org/1999/xlink"'
+        f'{extra_namespaces} viewBox="0 0 100 50">'
+        f'{inner_content}'
+        '</svg>'
+    )
+
+
+INKSCAPE_NAMESPACES = (
+    ' xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"'
+    ' xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"'
+)
+
+
+class TestProcessSvgContent(BaseTestCase):
+
+    def _process(self, svg, **kwargs):
+        return process_svg_content(
+            svg_content=svg,
+            media_destination_directory='test/svg',
+            source_filename='test.svg',
+            **kwargs,
+        )
+
+    def test_fragment_is_well_formed_when_rewrapped(self):
+        """Streamed output must re-parse as the children of an <svg> element."""
+        svg = _make_svg(
+            '<g id="outer"><text>A &amp; B <tspan>x</tspan> tail</text>'
+            '<use xlink:href="#outer"/></g>\n<rect width="10" height="10"/>'
+        )
+        result = self._process(svg)
+        fragment = result['svg_fragment_content']
+
+        wrapped = f'<svg xmlns="http://www.w3.org/2000/svg">{fragment}</svg>'
+        root = ET.fromstring(wrapped)
+        tags = [child.tag.split('}')[-1] for child in root]
+        self.assertEqual(tags, ['g', 'rect'])
+
+        text_element = root.find('.//{http://www.w3.org/2000/svg}text')
+        self.assertEqual(text_element.text, 'A & B ')
+        self.assertEqual(text_element[0].tail, ' tail')
+
+        use_element = root.find('.//{http://www.w3.org/2000/svg}use')
+        self.assertEqual(use_element.attrib['{http://www.w3.org/1999/xlink}href'], '#outer')
+
+    def test_viewbox_is_extracted(self):
+        result = self._process(_make_svg('<rect/>'))
+        self.assertEqual(result['svg_viewbox'].width, 100)
+        self.assertEqual(result['svg_viewbox'].height, 50)
+
+    def test_missing_viewbox_raises_value_error(self):
+        svg = '<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>'
+        with self.assertRaises(ValueError):
+            self._process(svg)
+
+    def test_non_svg_root_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self._process('<html viewBox="0 0 1 1"><rect/></html>')
+
+    def test_nested_dangerous_tag_is_removed(self):
+        """Dangerous tags below the top level are removed along with their content."""
+        svg = _make_svg('<g><g><script>alert(1)</script><rect/></g></g>')
+        result = self._process(svg, remove_dangerous=True)
+
+        self.assertNotIn('script', result['svg_fragment_content'])
+        self.assertNotIn('alert', result['svg_fragment_content'])
+        self.assertIn('<rect', result['svg_fragment_content'])
+        self.assertEqual(result['dangerous_tag_counts'], {'script': 1})
+
+    def test_dangerous_counts_match_with_and_without_removal(self):
+        svg = _make_svg(
+            '<g onclick="x()"><script>alert(1)</script>'
+            '<a href="http://evil.example"><rect onload="y()"/></a></g>'
+        )
+        flagged = self._process(svg, remove_dangerous=False)
+        removed = self._process(svg, remove_dangerous=True)
+
+        self.assertEqual(flagged['dangerous_tag_counts'], removed['dangerous_tag_counts'])
+        self.assertEqual(flagged['dangerous_attr_counts'], removed['dangerous_attr_counts'])
+        self.assertIn('onclick', flagged['svg_fragment_content'])
+        self.assertNotIn('onclick', removed['svg_fragment_content'])
+
+    def test_editor_metadata_is_stripped(self):
+        svg = _make_svg(
+            '<metadata><rdf/></metadata>'
+            '<sodipodi:namedview pagecolor="#fff"><inkscape:grid/></sodipodi:namedview>'
+            '<g inkscape:label="Walls" inkscape:groupmode="layer" id="walls"><rect/></g>',
+            extra_namespaces=INKSCAPE_NAMESPACES,
+        )
+        result = self._process(svg)
+        fragment = result['svg_fragment_content']
+
+        self.assertNotIn('metadata', fragment)
+        self.assertNotIn('namedview', fragment)
+        self.assertNotIn('inkscape', fragment)
+        self.assertIn('id="walls"', fragment)
+        self.assertEqual(result['svg_import_stats'].removed_element_count, 4)
+
+    def test_editor_metadata_is_kept_when_not_stripping(self):
+        svg = _make_svg(
+            '<g inkscape:label="Walls"><rect/></g>',
+            extra_namespaces=INKSCAPE_NAMESPACES,
+        )
+        result = self._process(svg, strip_editor_metadata=False)
+        fragment = result['svg_fragment_content']
+
+        self.assertIn('inkscape:label="Walls"', fragment)
+        # Still well-formed on its own since the prefix is declared inline.
+        ET.fromstring(f'<svg xmlns="http://www.w3.org/2000/svg">{fragment}</svg>')
+
+    def test_path_precision_reduces_fragment_size(self):
+        svg = _make_svg(
+            '<path d="M 10.123456789 20.987654321 L 30.5 40.000001 A 5 5 0 0 1 50.4444 60"/>'
+        )
+        full = self._process(svg)
+        reduced = self._process(svg, path_precision=4)
+
+        self.assertIn('d="M 10.12 20.99 L 30.5 40 A 5 5 0 0 1 50.44 60"',
+                      reduced['svg_fragment_content'])
+        self.assertLess(reduced['svg_import_stats'].fragment_bytes,
+                        full['svg_import_stats'].fragment_bytes)
+
+    def test_transform_is_not_rounded(self):
+        svg = _make_svg(
+            '<g transform="matrix(0.00035 0 0 -0.00035 12.5 40.12345)">'
+            '<path d="M 100.123456 200.654321"/></g>'
+        )
+        result = self._process(svg, path_precision=4)
+
+        self.assertIn('transform="matrix(0.00035 0 0 -0.00035 12.5 40.12345)"',
+                      result['svg_fragment_content'])
+        self.assertIn('d="M 100.1 200.7"', result['svg_fragment_content'])
+
+    def test_import_stats_are_populated(self):
+        svg = _make_svg('<g><rect/><rect/></g>')
+        result = self._process(svg)
+        stats = result['svg_import_stats']
+
+        self.assertEqual(stats.source_bytes, len(svg.encode('utf-8')))
+        self.assertEqual(stats.fragment_bytes, len(result['svg_fragment_content'].encode('utf-8')))
+        self.assertEqual(stats.element_count, 3)
+        self.assertGreaterEqual(stats.peak_memory_bytes, 0)
+        self.assertGreater(stats.size_reduction_percent, 0)
+
+
+class TestProcessSvgStream(BaseTestCase):
+
+    def test_large_document_streams_all_elements(self):
+        """Many top-level elements are written in order without being retained."""
+        element_count = 5000
+        inner = ''.join(f'<rect id="r{i}" x="{i}.123456"/>' for i in range(element_count))
+        svg_source = io.BytesIO(_make_svg(inner).encode('utf-8'))
+        fragment_destination = io.StringIO()
+
+        result = process_svg_stream(
+            svg_source=svg_source,
+            fragment_destination=fragment_destination,
+            media_destination_directory='test/svg',
+            source_filename='big.svg',
+            path_precision=5,
+        )
+
+        fragment = fragment_destination.getvalue()
+        root = ET.fromstring(f'<svg xmlns="http://www.w3.org/2000/svg">{fragment}</svg>')
+        self.assertEqual(len(root), element_count)
+        self.assertEqual(root[-1].attrib['id'], f'r{element_count - 1}')
+        self.assertEqual(root[-1].attrib['x'], f'{element_count - 1}.1')
+        self.assertEqual(result['svg_import_stats'].element_count, element_count)
+        self.assertTrue(result['svg_fragment_filename'].startswith('test/svg/'))
+
+    def test_malformed_xml_raises_parse_error(self):
+        with self.assertRaises(ET.ParseError):
+            process_svg_stream(
+                svg_source=io.BytesIO(b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1 1"><g>'),
+                fragment_destination=io.StringIO(),
+                media_destination_directory='test/svg',
+                source_filename='bad.svg',
+            )
+
+
+class TestRoundSvgNumbers(BaseTestCase):
+
+    def test_integers_and_arc_flags_are_untouched(self):
+        self.assertEqual(round_svg_numbers('a 5 5 0 0 1 10 10', 1), 'a 5 5 0 0 1 10 10')
+
+    def test_negative_zero_is_normalized(self):
+        self.assertEqual(round_svg_numbers('M -0.0001 3.14159', 3), 'M 0 3.14')
+
+    def test_never_lengthens_values(self):
+        self.assertEqual(round_svg_numbers('1.5 .25', 3), '1.5 .25')
+
+    def test_precision_is_relative_to_value_magnitude(self):
+        self.assertEqual(round_svg_numbers('M 0.000351234 0.000123456', 3), 'M 0.000351 0.000123')
+        self.assertEqual(round_svg_numbers('M 1234.5678 10.25', 5), 'M 1234.6 10.2')
@@ -1,13 +1,13 @@
 from datetime import datetime
 import logging
 from threading import Lock
-from typing import List
+from typing import Iterable, List, Set
 
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 import hi.apps.common.datetimeproxy as datetimeproxy
-from hi.apps.common.delayed_signal_processor import DelayedSignalProcessor
+from hi.apps.common.model_change_dispatcher import ModelChangeSet, ModelChangeTopic
 from hi.apps.common.singleton import Singleton
 
 from .models import Subsystem, SubsystemAttribute
@@ -22,6 +22,7 @@ class SettingsManager( Singleton ):
         self._server_start_datetime = datetimeproxy.now()
         self._subsystem_list = list()
         self._attribute_value_map = dict()
+        self._attribute_key_map = dict()  # SubsystemAttribute id -> setting key
         self._change_listeners = list()
         self._was_initialized = False
         self._subsystems_lock = Lock()
@@ -43,12 +44,14 @@ class SettingsManager( Singleton ):
         with self._attributes_lock:
             self._subsystem_list = sorted(self._subsystem_list, key=lambda s: s.name)
             self._attribute_value_map = dict()
+            self._attribute_key_map = dict()
             for subsystem in self._subsystem_list:
                 try:
                     subsystem.refresh_from_db()
                     for subsystem_attribute in subsystem.attributes.all():
                         attr_type = subsystem_attribute.setting_key
                         self._attribute_value_map[attr_type] = subsystem_attribute.value
+                        self._attribute_key_map[subsystem_attribute.id] = attr_type
                         continue
                 except Subsystem.DoesNotExist:
                     # Log error - this should not normally happen outside of test teardown
@@ -59,13 +62,56 @@ class SettingsManager( Singleton ):
         self._notify_change_listeners()
         return
 
-    def register_change_listener( self, callback ):
+    def apply_changes( self, change_set : ModelChangeSet ):
+        """
+        Refreshes only the changed setting values and notifies only the
+        listeners interested in them.  Subsystems are only added or
+        removed by settings syncs, so those still get a full reload.
+        """
+        if change_set.get_ids( 'subsystem' ):
+            with self._subsystems_lock:
+                self._subsystem_list = self._load_settings()
+            self.reload()
+            return
+
+        attribute_ids = change_set.get_ids( 'subsystem_attribute' )
+        if not attribute_ids:
+            return
+        changed_setting_keys = set()
+        with self._attributes_lock:
+            found_attribute_ids = set()
+            for subsystem_attribute in SubsystemAttribute.objects.filter( id__in = attribute_ids ):
+                attr_type = subsystem_attribute.setting_key
+                self._attribute_value_map[attr_type] = subsystem_attribute.value
+                self._attribute_key_map[subsystem_attribute.id] = attr_type
+                changed_setting_keys.add( attr_type )
+                found_attribute_ids.add( subsystem_attribute.id )
+                continue
+            for attribute_id in attribute_ids - found_attribute_ids:
+                attr_type = self._attribute_key_map.pop( attribute_id, None )
+                if attr_type is None:
+                    continue
+                self._attribute_value_map.pop( attr_type, None )
+                changed_setting_keys.add( attr_type )
+                continue
+        self._notify_change_listeners( changed_setting_keys = changed_setting_keys )
+        return
+    
+    def register_change_listener( self,
+                                  callback,
+                                  setting_enums  : Iterable[ SettingEnum ]  = None ):
+        """ Without setting_enums, the callback is called for any setting change. """
         logger.debug( f'Adding SYSTEM setting change listener from {callback.__module__}' )
-        self._change_listeners.append( callback )
+        setting_keys = { x.key for x in setting_enums } if setting_enums is not None else None
+        self._change_listeners.append( ( callback, setting_keys ) )
         return
     
-    def _notify_change_listeners(self):
-        for callback in self._change_listeners:
+    def _notify_change_listeners( self, changed_setting_keys : Set[ str ] = None ):
+        for callback, setting_keys in self._change_listeners:
+            if (( changed_setting_keys is not None )
+                    and ( setting_keys is not None )
+                    and not ( setting_keys & changed_setting_keys )):
+                continue
             try:
                 callback()
             except Exception as e:
@@ -109,31 +155,32 @@ class SettingsManager( Singleton ):
         return list( Subsystem.objects.prefetch_related('attributes').all() )
 
 
-def _settings_manager_reload_callback():
-    """Callback function for delayed settings manager reload."""
+def _apply_settings_changes( change_set : ModelChangeSet ):
     settings_manager = SettingsManager()
     settings_manager.ensure_initialized()
-    settings_manager.reload()
+    settings_manager.apply_changes( change_set )
+    return
 
 
-# Create the delayed signal processor for settings manager
-_settings_processor = DelayedSignalProcessor(
-    name="settings_manager",
-    callback_func=_settings_manager_reload_callback,
-    delay_seconds=0.1
+_settings_changes = ModelChangeTopic(
+    name = 'settings_manager',
+    callback_func = _apply_settings_changes,
 )
 
 
 @receiver( post_save, sender = Subsystem )
-@receiver( post_save, sender = SubsystemAttribute )
 @receiver( post_delete, sender = Subsystem )
+def settings_manager_subsystem_changed( sender, instance, **kwargs ):
+    _settings_changes.record( 'subsystem', instance.id )
+    return
+
+
+@receiver( post_save, sender = SubsystemAttribute )
 @receiver( post_delete, sender = SubsystemAttribute )
-def settings_manager_model_changed( sender, instance, **kwargs ):
+def settings_manager_attribute_changed( sender, instance, **kwargs ):
     """
-    Queue the SettingsManager.reload() call to execute after the transaction
-    is committed.  This prevents reloading multiple times if multiple
-    models saved as part of a transaction (which is the normal case for
-    SettingsDefinition and its related models.)
+    Only the changed rows are re-read, after the transaction commits, and
+    all changes from a transaction arrive together.
     """
-    _settings_processor.schedule_processing()
-        
+    _settings_changes.record( 'subsystem_attribute', instance.id )
+    return
@@ -3,6 +3,7 @@ from threading import Lock
 import threading
 import time
 
+from hi.apps.common.model_change_dispatcher import ModelChangeSet
 from hi.apps.config.models import Subsystem, SubsystemAttribute
 from hi.apps.config.settings_manager import SettingsManager
 from hi.apps.config.setting_enums import SettingEnum, SettingDefinition
@@ -22,6 +23,15 @@ class TestSetting(SettingEnum):
         is_required=True,
         initial_value='test_initial',
     )
+    OTHER_SETTING = SettingDefinition(
+        label='Other Setting',
+        description='Another test setting',
+        value_type=AttributeValueType.TEXT,
+        value_range_str='',
+        is_editable=True,
+        is_required=True,
+        initial_value='other_initial',
+    )
 
 
 class TestSettingsManager(BaseTestCase):
@@ -207,6 +217,55 @@ class TestSettingsManager(BaseTestCase):
         self.assertEqual(updated_value, 'sync_modified_value')
         return
 
+    def test_apply_changes_notifies_only_interested_listeners(self):
+        """Test row-level changes refresh only those settings and listeners."""
+        manager = SettingsManager()
+        manager.ensure_initialized()
+        subsystem = Subsystem.objects.create(
+            name='Delta Test Subsystem',
+            subsystem_key='delta_test',
+        )
+        attribute_map = {
+            setting: SubsystemAttribute.objects.create(
+                subsystem=subsystem,
+                setting_key=setting.key,
+                value_type=AttributeValueType.TEXT,
+                value='initial',
+            )
+            for setting in TestSetting
+        }
+        manager._subsystem_list = manager._load_settings()
+        manager.reload()
+
+        notification_log = []
+        manager.register_change_listener(lambda: notification_log.append('test'),
+                                         setting_enums=[TestSetting.TEST_SETTING])
+        manager.register_change_listener(lambda: notification_log.append('other'),
+                                         setting_enums=[TestSetting.OTHER_SETTING])
+        manager.register_change_listener(lambda: notification_log.append('any'))
+
+        test_attribute = attribute_map[TestSetting.TEST_SETTING]
+        test_attribute.value = 'changed'
+        test_attribute.save()
+        change_set = ModelChangeSet()
+        change_set.add('subsystem_attribute', test_attribute.id)
+        manager.apply_changes(change_set)
+
+        self.assertEqual(manager.get_setting_value(TestSetting.TEST_SETTING), 'changed')
+        self.assertEqual(sorted(notification_log), ['any', 'test'])
+
+        other_attribute = attribute_map[TestSetting.OTHER_SETTING]
+        other_attribute_id = other_attribute.id
+        other_attribute.delete()
+        notification_log.clear()
+        change_set = ModelChangeSet()
+        change_set.add('subsystem_attribute', other_attribute_id)
+        manager.apply_changes(change_set)
+
+        self.assertIsNone(manager.get_setting_value(TestSetting.OTHER_SETTING))
+        self.assertEqual(sorted(notification_log), ['any', 'other'])
+        return
+
     def test_subsystem_management(self):
         """Test subsystem management functionality."""
         manager = SettingsManager()
@@ -269,7 +328,7 @@ class TestSettingsManager(BaseTestCase):
     def test_no_deadlock_on_setting_save(self):
         """Test that setting a value doesn't cause deadlock from signal-triggered reload.
 
-        The background reload via ``_settings_processor`` is scheduled
+        The background update via ``_settings_changes`` is published
         from ``transaction.on_commit``, which doesn't fire under
         ``TestCase`` (the wrapping transaction rolls back), so this
         test only asserts the synchronous no-deadlock contract."""
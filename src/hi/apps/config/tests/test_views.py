@@ -57,9 +57,9 @@ class TestConfigSettingsView(DualModeViewTestCase):
         self.assertTemplateRendered(response, 'config/panes/settings.html')
         
         # Check that view parameters are set
-        session = self.client.session
-        self.assertEqual(session.get('view_type'), str(ViewType.CONFIGURATION))
-        self.assertEqual(session.get('view_mode'), str(ViewMode.MONITOR))
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_type, ViewType.CONFIGURATION)
+        self.assertEqual(view_parameters.view_mode, ViewMode.MONITOR)
 
     def test_get_settings_page_async(self):
         """Test getting settings page with AJAX request."""
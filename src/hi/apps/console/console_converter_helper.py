@@ -24,11 +24,12 @@ per-state-type branching at the call sites.
 """
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from hi.apps.console.console_helper import ConsoleSettingsHelper
 from hi.apps.entity.enums import EntityStateType
 from hi.apps.entity.models import EntityState
-from hi.units import UnitQuantity, get_display_quantity
+from hi.units import UnitConversion, get_display_unit_conversion, get_unit_conversion
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +80,20 @@ class ConsoleConverterHelper:
     def _display_unit_override( cls, entity_state : EntityState ):
         return cls.DISPLAY_UNIT_OVERRIDES.get( entity_state.entity_state_type )
 
+    @classmethod
+    def _display_unit_conversion( cls, entity_state : EntityState ) -> Optional[ UnitConversion ]:
+        """ None when the EntityState's units are unknown. """
+        override = cls._display_unit_override( entity_state )
+        if override is not None:
+            display_units = None
+        else:
+            display_units = ConsoleSettingsHelper().get_display_units()
+        return get_display_unit_conversion(
+            unit = entity_state.units,
+            display_units = display_units,
+            override_unit = override,
+        )
+
     @classmethod
     def to_entity_state_value(
             cls,
@@ -95,16 +110,8 @@ class ConsoleConverterHelper:
         entity_state_unit_str = entity_state.units
         if not entity_state_unit_str:
             return display_value
-        entity_state_quantity = UnitQuantity( 0, entity_state_unit_str )
-        override = cls._display_unit_override( entity_state )
-        if override is not None:
-            display_unit = UnitQuantity( 1, override ).units
-        else:
-            display_units = ConsoleSettingsHelper().get_display_units()
-            display_unit = get_display_quantity(
-                entity_state_quantity, display_units,
-            ).units
-        if display_unit == entity_state_quantity.units:
+        display_conversion = cls._display_unit_conversion( entity_state )
+        if display_conversion is None or display_conversion.is_identity:
             return display_value
         try:
             display_value_float = float( display_value )
@@ -115,10 +122,11 @@ class ConsoleConverterHelper:
                 f' skipping unit translation.'
             )
             return display_value
-        display_quantity = UnitQuantity( display_value_float, display_unit )
-        return str(
-            display_quantity.to( entity_state_unit_str ).magnitude
+        inbound_conversion = get_unit_conversion(
+            display_conversion.to_unit,
+            display_conversion.from_unit,
         )
+        return str( inbound_conversion.convert( display_value_float ) )
 
     @classmethod
     def from_entity_state_value(
@@ -140,24 +148,17 @@ class ConsoleConverterHelper:
         if not units:
             return DisplayValue( magnitude = raw_str )
         try:
-            quantity = UnitQuantity( float( entity_state_value ), units )
+            value_float = float( entity_state_value )
         except Exception:
             return DisplayValue( magnitude = raw_str )
-        override = cls._display_unit_override( entity_state )
-        if override is not None:
-            try:
-                display_quantity = quantity.to( override )
-            except Exception:
-                display_quantity = quantity
-        else:
-            display_units = ConsoleSettingsHelper().get_display_units()
-            display_quantity = get_display_quantity( quantity, display_units )
+        display_conversion = cls._display_unit_conversion( entity_state )
+        if display_conversion is None:
+            return DisplayValue( magnitude = raw_str )
         try:
-            magnitude = str( round( display_quantity.magnitude, 1 ) )
+            magnitude = str( round( display_conversion.convert( value_float ), 1 ) )
         except Exception:
             magnitude = raw_str
-        try:
-            unit_symbol = f'{display_quantity.units:~P}'
-        except Exception:
-            unit_symbol = ''
-        return DisplayValue( magnitude = magnitude, unit_symbol = unit_symbol )
+        return DisplayValue(
+            magnitude = magnitude,
+            unit_symbol = display_conversion.unit_symbol,
+        )
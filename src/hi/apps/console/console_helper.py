@@ -51,7 +51,11 @@ class ConsoleSettingsHelper( Singleton, SettingsMixin ):
         return self.settings_manager().get_setting_value( ConsoleSetting.SLEEP_OVERLAY_OPACITY )
 
     def is_console_locked( self, request : HttpRequest ) -> bool:
-        return request.session.get( ConsoleConstants.CONSOLE_LOCKED_SESSION_VAR, False )
+        # Locking requires a lock password (and unlocking without one always
+        # succeeds), so until one is set the session is not even loaded.
+        if not self.get_console_lock_password():
+            return False
+        return bool( request.session.get( ConsoleConstants.CONSOLE_LOCKED_SESSION_VAR, False ))
     
     def get_console_lock_password( self ) -> str:
         return self.settings_manager().get_setting_value( ConsoleSetting.CONSOLE_LOCK_PASSWORD )
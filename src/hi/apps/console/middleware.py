@@ -27,11 +27,14 @@ class ConsoleLockMiddleware:
         return self.process_response( request, response )
 
     def process_request( self, request ):
+        # The session is only loaded when there is something to act on: a
+        # pending AWAY auto-lock, or a lockable console on a path that the
+        # lock applies to. Status polling otherwise never touches it.
         self._process_away_auto_lock( request )
 
-        if request.session.get( ConsoleConstants.CONSOLE_LOCKED_SESSION_VAR, False ):
-            if request.path in self.EXCLUDED_PATHS:
-                return None
+        if request.path in self.EXCLUDED_PATHS:
+            return None
+        if ConsoleSettingsHelper().is_console_locked( request ):
             return ConsoleUnlockView().get( request )
         return None
 
@@ -5,6 +5,7 @@ from django.http import HttpResponse
 from django.test import RequestFactory
 from django.urls import reverse
 
+from hi.apps.console.console_helper import ConsoleSettingsHelper
 from hi.apps.console.constants import ConsoleConstants
 from hi.apps.console.middleware import ConsoleLockMiddleware
 from hi.testing.base_test_case import BaseTestCase
@@ -101,9 +102,8 @@ class TestConsoleLockMiddleware( BaseTestCase ):
         request.session = {}
 
         with patch( 'hi.apps.console.middleware.SecurityManager' ) as mock_security_manager, \
-             patch( 'hi.apps.console.middleware.ConsoleSettingsHelper' ) as mock_helper:
+             patch.object( ConsoleSettingsHelper, 'get_console_lock_password', return_value = '' ):
             mock_security_manager.return_value.get_console_away_lock_timestamp.return_value = '2'
-            mock_helper.return_value.get_console_lock_password.return_value = ''
 
             response = self.middleware.process_request( request )
 
@@ -135,3 +135,38 @@ class TestConsoleLockMiddleware( BaseTestCase ):
             )
             self.assertTrue( request.session[ConsoleConstants.CONSOLE_LOCKED_SESSION_VAR] )
         return
+
+    def test_session_not_loaded_without_lock_password_or_away_event( self ):
+        """Polling requests leave the session unloaded when no console can be locked."""
+        for path in [ reverse( 'api_status' ), reverse( 'home' ) ]:
+            request = self.factory.get( path )
+            request.session = Mock()
+
+            with patch( 'hi.apps.console.middleware.SecurityManager' ) as mock_security_manager, \
+                 patch.object( ConsoleSettingsHelper, 'get_console_lock_password', return_value = '' ):
+                mock_security_manager.return_value.get_console_away_lock_timestamp.return_value = None
+
+                response = self.middleware.process_request( request )
+
+                self.assertIsNone( response )
+                self.assertEqual( request.session.mock_calls, [] )
+            continue
+        return
+
+    def test_locked_console_is_blocked_when_lock_password_set( self ):
+        """A locked session is sent to the unlock view on non-excluded paths."""
+        request = self.factory.get( reverse( 'home' ) )
+        request.session = {
+            ConsoleConstants.CONSOLE_LOCKED_SESSION_VAR: True,
+        }
+
+        with patch( 'hi.apps.console.middleware.SecurityManager' ) as mock_security_manager, \
+             patch.object( ConsoleSettingsHelper, 'get_console_lock_password', return_value = 'secret' ), \
+             patch( 'hi.apps.console.middleware.ConsoleUnlockView' ) as mock_unlock_view:
+            mock_security_manager.return_value.get_console_away_lock_timestamp.return_value = None
+            mock_unlock_view.return_value.get.return_value = HttpResponse( 'locked', status = 403 )
+
+            response = self.middleware.process_request( request )
+
+            self.assertEqual( response.status_code, 403 )
+        return
@@ -49,9 +49,9 @@ class TestEditStartView(SyncViewTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, '/test/page/')
         
-        # Should set edit mode in session
-        session = self.client.session
-        self.assertEqual(session.get('view_mode'), str(ViewMode.EDIT))
+        # Should set edit mode in view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_mode, ViewMode.EDIT)
 
     def test_edit_start_without_referer(self):
         """Test starting edit mode without referer."""
@@ -65,9 +65,9 @@ class TestEditStartView(SyncViewTestCase):
         home_url = reverse('home')
         self.assertRedirects(response, home_url, fetch_redirect_response=False)
         
-        # Should set edit mode in session
-        session = self.client.session
-        self.assertEqual(session.get('view_mode'), str(ViewMode.EDIT))
+        # Should set edit mode in view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_mode, ViewMode.EDIT)
 
     def test_edit_start_with_non_editable_view_type(self):
         """Test starting edit mode with view type that doesn't allow editing."""
@@ -81,9 +81,9 @@ class TestEditStartView(SyncViewTestCase):
         home_url = reverse('home')
         self.assertRedirects(response, home_url, fetch_redirect_response=False)
         
-        # Should still set edit mode in session
-        session = self.client.session
-        self.assertEqual(session.get('view_mode'), str(ViewMode.EDIT))
+        # Should still set edit mode in view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_mode, ViewMode.EDIT)
 
     def test_post_not_allowed(self):
         """Test that POST requests are not allowed."""
@@ -113,9 +113,9 @@ class TestEditEndView(SyncViewTestCase):
         self.assertIn('/location/view/1', response.url)
         self.assertIn('details=', response.url)  # Should be empty
         
-        # Should set monitor mode in session
-        session = self.client.session
-        self.assertEqual(session.get('view_mode'), str(ViewMode.MONITOR))
+        # Should set monitor mode in view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_mode, ViewMode.MONITOR)
 
     def test_edit_end_without_referer(self):
         """Test ending edit mode without referer."""
@@ -129,9 +129,9 @@ class TestEditEndView(SyncViewTestCase):
         home_url = reverse('home')
         self.assertRedirects(response, home_url, fetch_redirect_response=False)
         
-        # Should set monitor mode in session
-        session = self.client.session
-        self.assertEqual(session.get('view_mode'), str(ViewMode.MONITOR))
+        # Should set monitor mode in view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_mode, ViewMode.MONITOR)
 
     def test_edit_end_preserves_other_query_params(self):
         """Test that other query parameters are preserved when clearing sidebar."""
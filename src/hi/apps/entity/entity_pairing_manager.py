@@ -1,13 +1,21 @@
-from typing import List, Set
+import logging
+from threading import Lock
+from typing import Dict, List, Set
 
 from django.db import transaction
+from django.db.models import Count, Exists, Max, OuterRef
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
+from hi.apps.common.model_utils import bulk_create_with_signals
 from hi.apps.common.singleton import Singleton
 from hi.apps.location.models import LocationView
 
 from . import enums
 from . import models
-from .transient_models import EntityPairing
+from .transient_models import EntityDelegationGraph, EntityPairing
+
+logger = logging.getLogger(__name__)
 
 
 class EntityPairingError(Exception):
@@ -28,6 +36,54 @@ class EntityPairingManager(Singleton):
     }
     
     def __init_singleton__(self):
+        self._delegation_graph = None
+        self._delegation_graph_fingerprint = None
+        self._delegation_graph_generation = 0
+        self._delegation_graph_lock = Lock()
+        return
+
+    def get_delegation_graph(self) -> EntityDelegationGraph:
+        """
+        Process-wide principal/delegate graph, so status display, location
+        views and the pairing editor can resolve delegations without
+        walking per-entity relations.
+
+        The cached graph is checked against a one-row (count, max id)
+        fingerprint of the delegation table.  Signals alone are not
+        enough: they miss rolled back transactions and writes made by
+        other processes.  The signals still cover deletes that reuse ids
+        within this process.
+        """
+        fingerprint = tuple( models.EntityStateDelegation.objects.aggregate(
+            count = Count( 'id' ),
+            max_id = Max( 'id' ),
+        ).values() )
+        with self._delegation_graph_lock:
+            generation = self._delegation_graph_generation
+            if (( self._delegation_graph is not None )
+                    and ( self._delegation_graph_fingerprint == fingerprint )):
+                return self._delegation_graph
+
+        delegation_graph = EntityDelegationGraph.from_delegation_rows(
+            models.EntityStateDelegation.objects.order_by( 'id' ).values_list(
+                'entity_state_id',
+                'entity_state__entity_id',
+                'delegate_entity_id',
+            )
+        )
+        # A change that lands while building must not be overwritten by
+        # the (possibly older) graph built here.
+        with self._delegation_graph_lock:
+            if generation == self._delegation_graph_generation:
+                self._delegation_graph = delegation_graph
+                self._delegation_graph_fingerprint = fingerprint
+        return delegation_graph
+
+    def invalidate_delegation_graph(self):
+        with self._delegation_graph_lock:
+            self._delegation_graph_generation += 1
+            self._delegation_graph = None
+            self._delegation_graph_fingerprint = None
         return
 
     def get_entity_pairing_list( self, entity : models.Entity ) -> List[ EntityPairing ]:
@@ -57,149 +113,170 @@ class EntityPairingManager(Singleton):
         """ We only allow pairing entities with states to those without states.  """
         entity_has_states = bool( entity.states.exists() )
 
-        candidate_entity_list = list()
-        for candidate_entity in models.Entity.objects.all():
-            candidate_entity_has_states = bool( candidate_entity.states.exists() )
-
-            if (( entity_has_states and not candidate_entity_has_states )
-                or ( not entity_has_states and candidate_entity_has_states )):
-                candidate_entity_list.append( candidate_entity )
-                
-            continue
-        return candidate_entity_list
+        candidate_queryset = models.Entity.objects.annotate(
+            has_states = Exists( models.EntityState.objects.filter( entity_id = OuterRef( 'pk' ) )),
+        ).filter(
+            has_states = not entity_has_states,
+        )
+        return list( candidate_queryset )
     
     def get_delegate_entities( self, entity : models.Entity ) -> List[ models.Entity ]:
-        delegate_entity_set = set()
-        for entity_state in entity.states.all():
-            for entity_state_delegation in entity_state.entity_state_delegations.all():
-                delegate_entity_set.add( entity_state_delegation.delegate_entity )
-                continue
-            continue
-        delegate_entity_list = list( delegate_entity_set )
-        delegate_entity_list.sort( key = lambda entity : entity.name )
-        return delegate_entity_list
+        delegate_entity_ids = self.get_delegation_graph().get_delegate_entity_ids( entity.id )
+        return self._get_entities_sorted_by_name( entity_ids = delegate_entity_ids )
         
     def get_principal_entities( self, entity : models.Entity ) -> List[ models.Entity ]:
-        principal_entity_set = set()
-        delegation_queryset = entity.entity_state_delegations.select_related(
-            'entity_state',
-            'entity_state__entity'
-        ).all()
-        for entity_state_delegation in delegation_queryset:
-            principal_entity_set.add( entity_state_delegation.entity_state.entity )
-            continue
-        principal_entity_list = list( principal_entity_set )
-        principal_entity_list.sort( key = lambda entity : entity.name )
-        return principal_entity_list
+        principal_entity_ids = self.get_delegation_graph().get_principal_entity_ids( entity.id )
+        return self._get_entities_sorted_by_name( entity_ids = principal_entity_ids )
+
+    def _get_entities_sorted_by_name( self, entity_ids : Set[ int ] ) -> List[ models.Entity ]:
+        if not entity_ids:
+            return list()
+        entity_list = list( models.Entity.objects.filter( id__in = entity_ids ))
+        entity_list.sort( key = lambda entity : entity.name )
+        return entity_list
         
     def get_delegate_entities_with_defaults( self, entity : models.Entity ) -> List[ models.Entity ]:
+        """
+        The entity's delegates, first creating the default delegates (see
+        CREATE_BY_DEFAULT_MAP) for any of its states that need one.  We only
+        create one delegate entity per entity type, and reuse an existing
+        delegate of that type if the entity already has one.
+        """
+        delegate_entities_map = self.get_delegate_entities_map(
+            entities = [ entity ],
+            default_entity_ids = { entity.id },
+        )
+        return delegate_entities_map[entity.id]
+
+    def get_delegate_entities_map( self,
+                                   entities            : List[ models.Entity ],
+                                   default_entity_ids  : Set[ int ]            ) -> Dict[ int, List[ models.Entity ] ]:
+        """
+        Bulk counterpart of get_delegate_entities() and
+        get_delegate_entities_with_defaults() for placing many entities at
+        once.  Returns each entity's delegates keyed by entity id.  Entities
+        in default_entity_ids get the same default delegates that
+        get_delegate_entities_with_defaults() would create.  The query count
+        does not depend on how many entities are passed in.
+        """
+        entity_by_id = { x.id: x for x in entities }
+        entity_state_list = list( models.EntityState.objects.filter(
+            entity_id__in = entity_by_id.keys(),
+        ).order_by( 'id' ))
+        delegation_queryset = models.EntityStateDelegation.objects.filter(
+            entity_state__entity_id__in = entity_by_id.keys(),
+        ).select_related( 'delegate_entity' ).order_by( 'id' )
+
+        delegate_entity_list_by_state_id = dict()
+        for entity_state_delegation in delegation_queryset:
+            delegate_entity_list_by_state_id.setdefault( entity_state_delegation.entity_state_id, list() ).append(
+                entity_state_delegation.delegate_entity
+            )
+            continue
 
-        # We only want to create one entity of each entity type.  Multiple
-        # states of the entity may need delegates, so we collate the states
-        # by entity types.
-        #
-        entity_type_to_state_list_map = dict()
-
-        # If the entity already has delegates of a given entity type,
-        # then we will want to use those instead of creating new ones of
-        # the same entity type.
-        #
-        entity_type_to_delegate_entity_list_map = dict()
-
-        # Used to make sure we do not create a delegation if it already exists.
-        entity_state_to_delegate_entity_map = dict()
-        
-        for entity_state in entity.states.all():
-
-            for entity_state_delegation in entity_state.entity_state_delegations.all():
-                entity_state_to_delegate_entity_map[entity_state] = entity_state_delegation.delegate_entity
+        delegate_entity_dict_map = { x: dict() for x in entity_by_id.keys() }
+        entity_type_to_delegate_entity_maps = { x: dict() for x in entity_by_id.keys() }
+        entity_states_needing_delegates_maps = { x: dict() for x in entity_by_id.keys() }
+
+        for entity_state in entity_state_list:
+            entity_id = entity_state.entity_id
+            state_delegate_entity_list = delegate_entity_list_by_state_id.get( entity_state.id, list() )
+            for delegate_entity in state_delegate_entity_list:
+                delegate_entity_dict_map[entity_id][delegate_entity.id] = delegate_entity
+                entity_type_to_delegate_entity_maps[entity_id].setdefault(
+                    delegate_entity.entity_type, delegate_entity )
+                continue
 
-                delegate_entity = entity_state_delegation.delegate_entity
-                entity_type = delegate_entity.entity_type
-                if entity_type not in entity_type_to_delegate_entity_list_map:
-                    entity_type_to_delegate_entity_list_map[entity_type] = list()
-                entity_type_to_delegate_entity_list_map[entity_type].append( delegate_entity )
+            if entity_id not in default_entity_ids:
+                continue
+            if state_delegate_entity_list:
                 continue
-            
             if entity_state.entity_state_type not in self.CREATE_BY_DEFAULT_MAP:
                 continue
             entity_type = self.CREATE_BY_DEFAULT_MAP[entity_state.entity_state_type]
-            if entity_type not in entity_type_to_state_list_map:
-                entity_type_to_state_list_map[entity_type] = list()
-            entity_type_to_state_list_map[entity_type].append( entity_state )
+            entity_states_needing_delegates_maps[entity_id].setdefault( entity_type, list() ).append(
+                entity_state
+            )
             continue
 
-        delegate_entity_list = list( entity_state_to_delegate_entity_map.values() )
-
-        for entity_type, entity_state_list in entity_type_to_state_list_map.items():
-
-            entity_states_needing_delegates = set()
-            for entity_state in entity_state_list:
-                if entity_state in entity_state_to_delegate_entity_map:
+        # Delegate entities must exist (have ids) before the delegations
+        # referencing them can be inserted, hence the two passes.
+        new_delegate_entity_list = list()
+        pending_delegation_list = list()
+        for entity_id, entity_states_needing_delegates_map in entity_states_needing_delegates_maps.items():
+            entity = entity_by_id[entity_id]
+            for entity_type, entity_state_list in entity_states_needing_delegates_map.items():
+                delegate_entity = entity_type_to_delegate_entity_maps[entity_id].get( entity_type )
+                if delegate_entity is None:
+                    delegate_entity = models.Entity(
+                        name = f'{entity.name} - {entity_type.label}',
+                        entity_type = entity_type,
+                        can_user_delete = True,
+                        integration_id = None,
+                        integration_name = None,
+                    )
+                    new_delegate_entity_list.append( ( entity_id, delegate_entity ) )
+                for entity_state in entity_state_list:
+                    pending_delegation_list.append( ( entity_state, delegate_entity ) )
                     continue
-                entity_states_needing_delegates.add( entity_state )
-                continue
-
-            if not entity_states_needing_delegates:
                 continue
+            continue
 
-            if entity_type in entity_type_to_delegate_entity_list_map:
-                delegate_entity = entity_type_to_delegate_entity_list_map[entity_type][0]  # Choose first
-            else:                
-                delegate_entity = models.Entity.objects.create(
-                    name = f'{entity.name} - {entity_type.label}',
-                    entity_type = entity_type,
-                    can_user_delete = True,
-                    integration_id = None,
-                    integration_name = None,
-                )
-                delegate_entity_list.append( delegate_entity )
-                
-            for entity_state in entity_states_needing_delegates:
-                _ = models.EntityStateDelegation.objects.create(
+        with transaction.atomic():
+            bulk_create_with_signals( models.Entity, [ x[1] for x in new_delegate_entity_list ] )
+            bulk_create_with_signals( models.EntityStateDelegation, [
+                models.EntityStateDelegation(
                     entity_state = entity_state,
                     delegate_entity = delegate_entity,
                 )
-                continue
-            continue
+                for entity_state, delegate_entity in pending_delegation_list
+            ])
 
-        return delegate_entity_list
+        for entity_id, delegate_entity in new_delegate_entity_list:
+            delegate_entity_dict_map[entity_id][delegate_entity.id] = delegate_entity
+            continue
+        return { x: list( y.values() ) for x, y in delegate_entity_dict_map.items() }
 
     def remove_delegate_entities_from_view_if_needed( self,
                                                       entity : models.Entity,
                                                       location_view : LocationView ):
         # We only remove the entity's delegates if the entity is its only principal.
-        
-        delegate_entities = set( self.get_delegate_entities( entity ))
-        for delegate_entity in delegate_entities:
-            principal_entities = set( self.get_principal_entities( entity = delegate_entity ))
-            if (( len(principal_entities) == 1 )
-                and ( next(iter(principal_entities)) == entity )):
-                try:
-                    entity_view = models.EntityView.objects.get(
-                        entity = delegate_entity,
-                        location_view = location_view,
-                    )
-                    entity_view.delete()
-                except models.EntityView.DoesNotExist:
-                    pass
-            continue
 
+        delegation_graph = self.get_delegation_graph()
+        sole_delegate_entity_ids = [
+            delegate_entity_id
+            for delegate_entity_id in delegation_graph.get_delegate_entity_ids( entity.id )
+            if delegation_graph.get_principal_entity_ids( delegate_entity_id ) == { entity.id }
+        ]
+        if not sole_delegate_entity_ids:
+            return
+
+        # Deleted one at a time so the post_delete receivers fire.
+        for entity_view in models.EntityView.objects.filter(
+                entity_id__in = sole_delegate_entity_ids,
+                location_view = location_view ):
+            entity_view.delete()
+            continue
         return
 
     def adjust_entity_pairings( self, entity : models.Entity, desired_paired_entity_ids : Set[ int ] ):
 
-        previous_entity_pairings = self.get_entity_pairing_list( entity = entity )
-        previous_paired_entity_ids = { x.paired_entity.id for x in previous_entity_pairings }
+        delegation_graph = self.get_delegation_graph()
+        previous_paired_entity_ids = ( delegation_graph.get_principal_entity_ids( entity.id )
+                                       | delegation_graph.get_delegate_entity_ids( entity.id ) )
 
         to_add_entity_ids = desired_paired_entity_ids - previous_paired_entity_ids
         to_delete_entity_ids = previous_paired_entity_ids - desired_paired_entity_ids
         
         entity_has_states = bool( entity.states.exists() )
-        to_add_paired_entities = list( models.Entity.objects.filter( id__in = list(to_add_entity_ids) ) )
+        to_add_paired_entities = list( models.Entity.objects.filter(
+            id__in = list(to_add_entity_ids),
+        ).annotate(
+            has_states = Exists( models.EntityState.objects.filter( entity_id = OuterRef( 'pk' ) )),
+        ))
 
         for candidate_entity in to_add_paired_entities:
-            candidate_entity_has_states = bool( candidate_entity.states.exists() )
+            candidate_entity_has_states = bool( candidate_entity.has_states )
 
             if entity_has_states and candidate_entity_has_states:
                 raise EntityPairingError(
@@ -209,16 +286,26 @@ class EntityPairingManager(Singleton):
                     f'Cannot pair entities both without states: {entity} and {candidate_entity}' )
             continue
 
+        # Principal states for all the new pairings in one query.
+        if entity_has_states:
+            principal_entity_ids = { entity.id }
+        else:
+            principal_entity_ids = { x.id for x in to_add_paired_entities }
+        entity_states_by_principal_id = dict()
+        for entity_state in models.EntityState.objects.filter( entity_id__in = principal_entity_ids ):
+            entity_states_by_principal_id.setdefault( entity_state.entity_id, list() ).append( entity_state )
+            continue
+
         with transaction.atomic():
             for to_add_entity in to_add_paired_entities:
                 if entity_has_states:
-                    principle_entity = entity
+                    principle_entity_id = entity.id
                     delegate_entity = to_add_entity
                 else:
-                    principle_entity = to_add_entity
+                    principle_entity_id = to_add_entity.id
                     delegate_entity = entity
                     
-                for entity_state in principle_entity.states.all():
+                for entity_state in entity_states_by_principal_id.get( principle_entity_id, list() ):
                     models.EntityStateDelegation.objects.create(
                         entity_state = entity_state,
                         delegate_entity = delegate_entity,
@@ -226,20 +313,31 @@ class EntityPairingManager(Singleton):
                     continue
                 continue
 
-            for to_delete_entity_id in to_delete_entity_ids:
-                to_delete_entity = models.Entity.objects.get(id=to_delete_entity_id)
+            if to_delete_entity_ids:
                 if entity_has_states:
-                    principle_entity = entity
-                    delegate_entity = to_delete_entity
+                    delegation_queryset = models.EntityStateDelegation.objects.filter(
+                        entity_state__entity = entity,
+                        delegate_entity_id__in = to_delete_entity_ids,
+                    )
                 else:
-                    principle_entity = to_delete_entity
-                    delegate_entity = entity
-
-                delegation_queryset = delegate_entity.entity_state_delegations.select_related(
-                    'entity_state',
-                    'entity_state__entity' ).all()
+                    delegation_queryset = models.EntityStateDelegation.objects.filter(
+                        entity_state__entity_id__in = to_delete_entity_ids,
+                        delegate_entity = entity,
+                    )
+                # Deleted one at a time so the post_delete receivers fire.
                 for delegation in delegation_queryset:
-                    if delegation.entity_state.entity == principle_entity:
-                        delegation.delete()
+                    delegation.delete()
                     continue
         return
+
+
+@receiver( post_save, sender = models.EntityStateDelegation )
+@receiver( post_delete, sender = models.EntityStateDelegation )
+def entity_delegation_model_changed( sender, instance, **kwargs ):
+    """
+    Entity and EntityState deletes cascade to their delegations, which
+    also arrive here.
+    """
+    logger.debug( f'Invalidating entity delegation graph on {sender.__name__} change.' )
+    EntityPairingManager().invalidate_delegation_graph()
+    return
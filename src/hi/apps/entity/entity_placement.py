@@ -23,18 +23,20 @@ Two collaborating classes:
 
 Known limitation (carried over from earlier code, not introduced by
 this module): when an entity carrying delegate entities is placed
-into a view, the delegates are placed at the viewbox center
-without any spread. Multiple delegates therefore overlap. Phase 3
-inherits this behavior; revisit when it bites.
+into a view one at a time, the delegates are placed at the viewbox
+center without any spread. Multiple delegates therefore overlap. The
+bulk ``place_entities_in_view`` flow centers them on their principal
+instead.
 """
 
 from dataclasses import dataclass, field
 from decimal import Decimal
 import logging
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from django.db import transaction
 
+from hi.apps.common.model_utils import bulk_create_with_signals
 from hi.apps.entity.edit.forms import EntityPositionForm
 from hi.apps.entity.enums import EntityType, EntityTransitionType
 from hi.apps.location.models import Location, LocationView
@@ -327,7 +329,7 @@ class EntityPlacementCalculator:
         """Return the placement shape for a single entity centered on
         the current viewbox."""
         svg_x, svg_y = PositionGeometry.view_center( location_view )
-        return self._shape_at_point(
+        return self.shape_at_point(
             entity = entity,
             location_view = location_view,
             svg_x = svg_x,
@@ -359,6 +361,32 @@ class EntityPlacementCalculator:
             for index, entity in enumerate( entities )
         ]
 
+    def shape_at_point( self,
+                        entity         : Entity,
+                        location_view  : LocationView,
+                        svg_x          : float,
+                        svg_y          : float ) -> PlacementShape:
+        """Return the placement shape for an entity centered on the
+        given SVG point: a Path for path entities, otherwise a Point
+        at the default icon scale."""
+        entity_type = entity.entity_type
+        if entity_type.requires_path():
+            svg_path = PathGeometry.create_default_path_string(
+                location_view = location_view,
+                is_path_closed = entity_type.requires_closed_path(),
+                center_x = svg_x,
+                center_y = svg_y,
+                entity_type = entity_type,
+            )
+            return PlacementPath( svg_path = svg_path )
+
+        return PlacementPoint(
+            svg_x = svg_x,
+            svg_y = svg_y,
+            svg_scale = self.default_icon_scale(
+                entity = entity, location_view = location_view ),
+        )
+
     def default_icon_scale( self,
                             entity         : Entity,
                             location_view  : LocationView ) -> Decimal:
@@ -379,36 +407,13 @@ class EntityPlacementCalculator:
             grid_index = grid_index,
             grid_total = grid_total,
         )
-        return self._shape_at_point(
+        return self.shape_at_point(
             entity = entity,
             location_view = location_view,
             svg_x = svg_x,
             svg_y = svg_y,
         )
 
-    def _shape_at_point( self,
-                         entity         : Entity,
-                         location_view  : LocationView,
-                         svg_x          : float,
-                         svg_y          : float ) -> PlacementShape:
-        entity_type = entity.entity_type
-        if entity_type.requires_path():
-            svg_path = PathGeometry.create_default_path_string(
-                location_view = location_view,
-                is_path_closed = entity_type.requires_closed_path(),
-                center_x = svg_x,
-                center_y = svg_y,
-                entity_type = entity_type,
-            )
-            return PlacementPath( svg_path = svg_path )
-
-        return PlacementPoint(
-            svg_x = svg_x,
-            svg_y = svg_y,
-            svg_scale = self.default_icon_scale(
-                entity = entity, location_view = location_view ),
-        )
-
 
 class EntityPlacer:
     """DB-touching placement operations. Persists shapes computed by
@@ -492,21 +497,32 @@ class EntityPlacer:
 
     def _build_delegate_shape(
             self,
-            principal_entity : Entity,
-            principal_shape  : PlacementShape,
-            delegate_entity  : Entity,
-            location_view    : LocationView,
+            principal_entity     : Entity,
+            principal_shape      : Optional[PlacementShape],
+            delegate_entity      : Entity,
+            location_view        : LocationView,
+            center_on_principal  : bool           = False,
     ) -> PlacementShape:
         """Compute the delegate's placement shape. Default is the
-        calculator's centered default. When the principal is an icon
-        entity whose source-icon facing direction is known and the
-        delegate is an AREA, build a triangular coverage path with its
-        apex anchored near the principal's position so the delegate
-        visually reads as the principal's coverage cone."""
-        default_shape = self._calculator.shape_for_entity(
-            entity = delegate_entity,
-            location_view = location_view,
-        )
+        calculator's centered default, or with ``center_on_principal``
+        the same shape centered on an icon principal's position. When
+        the principal is an icon entity whose source-icon facing
+        direction is known and the delegate is an AREA, build a
+        triangular coverage path with its apex anchored near the
+        principal's position so the delegate visually reads as the
+        principal's coverage cone."""
+        if center_on_principal and isinstance( principal_shape, PlacementPoint ):
+            default_shape = self._calculator.shape_at_point(
+                entity = delegate_entity,
+                location_view = location_view,
+                svg_x = principal_shape.svg_x,
+                svg_y = principal_shape.svg_y,
+            )
+        else:
+            default_shape = self._calculator.shape_for_entity(
+                entity = delegate_entity,
+                location_view = location_view,
+            )
         if delegate_entity.entity_type != EntityType.AREA:
             return default_shape
         if not isinstance( principal_shape, PlacementPoint ):
@@ -543,25 +559,168 @@ class EntityPlacer:
     def place_entities_in_view( self,
                                 entities       : List[Entity],
                                 location_view  : LocationView ):
-        """Place a group of entities into a location view in a single
-        layout pass. Used by the post-sync dispatcher to position all
-        items in a result group together. The grid is computed once
-        across the entire group; per-entity delegates are placed by
-        the single-entity flow."""
-        shapes = self._calculator.shapes_for_entities(
-            entities = entities,
-            location_view = location_view,
-        )
+        """Place a group of entities (and their delegates) into a location
+        view in a single layout pass. Used by the post-sync dispatcher to
+        position all items in a result group together.
+
+        Equivalent to calling ``place_entity_in_view`` for each entity
+        in turn, but all the existing positions, paths, views and
+        delegations are read up front and the new rows are written with
+        bulk inserts, so the query count does not grow with the number
+        of entities. New icons and paths are laid out on grid slots
+        that avoid items already in the location, and delegates without
+        a coverage shape are centered on their principal rather than on
+        the viewbox."""
+        entity_by_id = dict()
+        for entity in entities:
+            entity_by_id.setdefault( entity.id, entity )
+            continue
+        if not entity_by_id:
+            return
+
+        location = location_view.location
         with transaction.atomic():
-            for entity, shape in zip( entities, shapes ):
-                self.place_entity_in_view(
-                    entity = entity,
-                    location_view = location_view,
-                    placement_shape = shape,
+            # Default delegates are only created when an entity is added
+            # to its first view, same as the single-entity flow.
+            entity_ids_with_views = set( EntityView.objects.filter(
+                entity_id__in = entity_by_id.keys(),
+            ).values_list( 'entity_id', flat = True ))
+            delegate_entities_map = EntityPairingManager().get_delegate_entities_map(
+                entities = list( entity_by_id.values() ),
+                default_entity_ids = set( entity_by_id.keys() ) - entity_ids_with_views,
+            )
+
+            # Principal/delegate placement order matches what the
+            # single-entity flow would do entity by entity.
+            principal_by_entity_id = dict()
+            placed_entity_by_id = dict()
+            for entity in entity_by_id.values():
+                if entity.id not in placed_entity_by_id:
+                    placed_entity_by_id[entity.id] = entity
+                    principal_by_entity_id[entity.id] = None
+                for delegate_entity in delegate_entities_map.get( entity.id, [] ):
+                    if delegate_entity.id not in placed_entity_by_id:
+                        placed_entity_by_id[delegate_entity.id] = delegate_entity
+                        principal_by_entity_id[delegate_entity.id] = entity
+                    continue
+                continue
+
+            existing_point_by_entity_id = {
+                entity_id: PlacementPoint(
+                    svg_x = float( svg_x ),
+                    svg_y = float( svg_y ),
+                    svg_scale = svg_scale,
                 )
+                for entity_id, svg_x, svg_y, svg_scale in EntityPosition.objects.filter(
+                    location = location,
+                ).values_list( 'entity_id', 'svg_x', 'svg_y', 'svg_scale' )
+            }
+            existing_path_by_entity_id = dict( EntityPath.objects.filter(
+                location = location,
+            ).values_list( 'entity_id', 'svg_path' ))
+            entity_ids_in_view = set( EntityView.objects.filter(
+                location_view = location_view,
+                entity_id__in = placed_entity_by_id.keys(),
+            ).values_list( 'entity_id', flat = True ))
+
+            placement_shape_by_entity_id = self._layout_bulk_placement_shapes(
+                placed_entity_by_id = placed_entity_by_id,
+                principal_by_entity_id = principal_by_entity_id,
+                location_view = location_view,
+                existing_point_by_entity_id = existing_point_by_entity_id,
+                existing_path_by_entity_id = existing_path_by_entity_id,
+            )
+
+            new_entity_position_list = list()
+            new_entity_path_list = list()
+            for entity_id, placement_shape in placement_shape_by_entity_id.items():
+                if isinstance( placement_shape, PlacementPoint ):
+                    new_entity_position_list.append( EntityPosition(
+                        entity_id = entity_id,
+                        location = location,
+                        svg_x = Decimal( str( placement_shape.svg_x ) ),
+                        svg_y = Decimal( str( placement_shape.svg_y ) ),
+                        svg_scale = placement_shape.svg_scale,
+                        svg_rotate = Decimal( '0.0' ),
+                    ))
+                else:
+                    new_entity_path_list.append( EntityPath(
+                        entity_id = entity_id,
+                        location = location,
+                        svg_path = placement_shape.svg_path,
+                    ))
                 continue
+            new_entity_view_list = [
+                EntityView( entity_id = entity_id, location_view = location_view )
+                for entity_id in placed_entity_by_id.keys()
+                if entity_id not in entity_ids_in_view
+            ]
+
+            bulk_create_with_signals( EntityPosition, new_entity_position_list )
+            bulk_create_with_signals( EntityPath, new_entity_path_list )
+            bulk_create_with_signals( EntityView, new_entity_view_list )
         return
 
+    def _layout_bulk_placement_shapes(
+            self,
+            placed_entity_by_id          : Dict[ int, Entity ],
+            principal_by_entity_id       : Dict[ int, Optional[Entity] ],
+            location_view                : LocationView,
+            existing_point_by_entity_id  : Dict[ int, PlacementPoint ],
+            existing_path_by_entity_id   : Dict[ int, str ] ) -> Dict[ int, PlacementShape ]:
+        """Shapes for the entities that do not yet have the position or
+        path row their type calls for. Existing rows are preserved, as
+        in the single-entity flow."""
+        def needs_shape( entity ):
+            if entity.entity_type.requires_path():
+                return bool( entity.id not in existing_path_by_entity_id )
+            return bool( entity.id not in existing_point_by_entity_id )
+
+        occupied_points = [ ( x.svg_x, x.svg_y ) for x in existing_point_by_entity_id.values() ]
+        for svg_path in existing_path_by_entity_id.values():
+            center_x, center_y = PositionGeometry.path_center( svg_path )
+            if center_x is not None and center_y is not None:
+                occupied_points.append( ( center_x, center_y ) )
+            continue
+
+        new_principal_list = [
+            entity for entity_id, entity in placed_entity_by_id.items()
+            if principal_by_entity_id[entity_id] is None and needs_shape( entity )
+        ]
+        free_slot_list = PositionGeometry.free_grid_slots(
+            location_view = location_view,
+            slot_count = len( new_principal_list ),
+            occupied_points = occupied_points,
+        )
+        placement_shape_by_entity_id = dict()
+        for entity, ( svg_x, svg_y ) in zip( new_principal_list, free_slot_list ):
+            placement_shape_by_entity_id[entity.id] = self._calculator.shape_at_point(
+                entity = entity,
+                location_view = location_view,
+                svg_x = svg_x,
+                svg_y = svg_y,
+            )
+            continue
+
+        for entity_id, principal_entity in principal_by_entity_id.items():
+            if principal_entity is None:
+                continue
+            delegate_entity = placed_entity_by_id[entity_id]
+            if not needs_shape( delegate_entity ):
+                continue
+            principal_shape = placement_shape_by_entity_id.get( principal_entity.id )
+            if principal_shape is None:
+                principal_shape = existing_point_by_entity_id.get( principal_entity.id )
+            placement_shape_by_entity_id[entity_id] = self._build_delegate_shape(
+                principal_entity = principal_entity,
+                principal_shape = principal_shape,
+                delegate_entity = delegate_entity,
+                location_view = location_view,
+                center_on_principal = True,
+            )
+            continue
+        return placement_shape_by_entity_id
+
     def toggle_entity_in_view( self,
                                entity         : Entity,
                                location_view  : LocationView ) -> bool:
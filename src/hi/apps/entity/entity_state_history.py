@@ -8,9 +8,10 @@ intents (control actions that produced no confirming observation
 within the merge window) emit as standalone rows so failed or
 yet-to-be-confirmed commands stay visible."""
 
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 
 from hi.apps.common.enums import LabeledEnum
 from hi.apps.control.models import ControllerHistory
@@ -148,30 +149,38 @@ def get_entity_state_history_page(
     Returned rows are descending by timestamp; the caller derives
     the next-page cursor from the oldest row's timestamp."""
 
-    obs_query = SensorHistory.objects.filter( sensor__entity_state = entity_state )
+    # Both queries are keyset range scans over the (instrument, -time)
+    # indexes, bounded by the cursor and the page's time span, with the
+    # instrument joined in so rows render without further queries.
+    obs_query = SensorHistory.objects.select_related( 'sensor' ).filter(
+        sensor__entity_state = entity_state,
+    )
     if before is not None:
         obs_query = obs_query.filter( response_datetime__lt = before )
     observation_rows = list(
         obs_query.order_by( '-response_datetime' )[ : page_size ]
     )
 
-    intent_query = ControllerHistory.objects.filter(
+    intent_query = ControllerHistory.objects.select_related( 'controller' ).filter(
         controller__entity_state = entity_state,
     )
     if before is not None:
         intent_query = intent_query.filter( created_datetime__lt = before )
 
     if observation_rows:
-        t_oldest = min( o.response_datetime for o in observation_rows )
+        t_oldest = observation_rows[-1].response_datetime
         intent_query = intent_query.filter(
             created_datetime__gte = t_oldest - timedelta( seconds = window_seconds ),
         )
-        intent_rows = list( intent_query )
+        intent_rows = list( intent_query.order_by( '-created_datetime' ))
     else:
         intent_rows = list(
             intent_query.order_by( '-created_datetime' )[ : page_size ]
         )
 
+    # Ascending input keeps merge_history's sorts linear.
+    observation_rows.reverse()
+    intent_rows.reverse()
     return merge_history(
         entity_state     = entity_state,
         observation_rows = observation_rows,
@@ -195,29 +204,38 @@ def merge_history(
     equality. Claimed observations carry the intent as an
     annotation; unclaimed intents emit standalone."""
 
+    # Already-ascending input (the usual case) sorts in linear time.
     observations_asc = sorted( observation_rows, key = lambda h: h.response_datetime )
     intents_asc = sorted( intent_rows, key = lambda h: h.created_datetime )
 
+    # Single forward pass over both timelines. Observations enter
+    # per-value queues once they are within the window of the current
+    # intent, and leave when claimed or when they fall before it, so
+    # each intent claims the front of its value's queue.
     window = timedelta( seconds = window_seconds )
     claimed_obs : Dict[ int, ControllerHistory ] = {}
     unmatched_intents : List[ ControllerHistory ] = []
+    value_to_obs_indices : Dict[ str, Deque[ int ] ] = defaultdict( deque )
+    next_obs_index = 0
 
     for intent in intents_asc:
-        matched = False
-        for i, obs in enumerate( observations_asc ):
-            if i in claimed_obs:
-                continue
-            if obs.response_datetime < intent.created_datetime:
-                continue
-            if obs.response_datetime > intent.created_datetime + window:
-                # Ascending sort: no later observation can fall in window.
-                break
-            if obs.value == intent.value:
-                claimed_obs[ i ] = intent
-                matched = True
-                break
+        window_end = intent.created_datetime + window
+        while (( next_obs_index < len( observations_asc ))
+               and ( observations_asc[next_obs_index].response_datetime <= window_end )):
+            obs = observations_asc[next_obs_index]
+            value_to_obs_indices[obs.value].append( next_obs_index )
+            next_obs_index += 1
+            continue
+
+        obs_indices = value_to_obs_indices.get( intent.value )
+        while obs_indices and ( observations_asc[obs_indices[0]].response_datetime
+                                < intent.created_datetime ):
+            obs_indices.popleft()
             continue
-        if not matched:
+
+        if obs_indices:
+            claimed_obs[ obs_indices.popleft() ] = intent
+        else:
             unmatched_intents.append( intent )
         continue
 
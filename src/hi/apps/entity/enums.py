@@ -490,6 +490,32 @@ class EntityStateType(LabeledEnum):
         the matching ``EntityStateType`` member; lookup is by name."""
         return EntityStateRole[ self.name ]
 
+    @property
+    def is_numeric(self) -> bool:
+        """ Whether sensed values are numbers that can be aggregated over time. """
+        return bool( self in NUMERIC_ENTITY_STATE_TYPES )
+
+
+NUMERIC_ENTITY_STATE_TYPES = {
+    EntityStateType.CONTINUOUS,
+    EntityStateType.AIR_PRESSURE,
+    EntityStateType.BANDWIDTH_USAGE,
+    EntityStateType.BATTERY_LEVEL,
+    EntityStateType.COLOR_TEMPERATURE,
+    EntityStateType.ELECTRIC_USAGE,
+    EntityStateType.HUE,
+    EntityStateType.HUMIDITY,
+    EntityStateType.LIGHT_DIMMER,
+    EntityStateType.LIGHT_LEVEL,
+    EntityStateType.OPEN_CLOSE_POSITION,
+    EntityStateType.POWER_LEVEL,
+    EntityStateType.SATURATION,
+    EntityStateType.SOUND_LEVEL,
+    EntityStateType.TEMPERATURE,
+    EntityStateType.WATER_FLOW,
+    EntityStateType.WIND_SPEED,
+}
+
 
 class TemperatureUnit(LabeledEnum):
 
@@ -0,0 +1,197 @@
+import logging
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hi.apps.entity.entity_pairing_manager import EntityPairingError, EntityPairingManager
+from hi.apps.entity.enums import EntityStateType, EntityType
+from hi.apps.entity.models import Entity, EntityState, EntityStateDelegation, EntityView
+from hi.apps.location.tests.synthetic_data import LocationSyntheticData
+from hi.testing.base_test_case import BaseTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class EntityPairingManagerTestCase(BaseTestCase):
+
+    def create_entity(self, name, entity_type=EntityType.MOTION_SENSOR, with_state=False):
+        entity = Entity.objects.create(
+            name=name,
+            entity_type_str=str(entity_type),
+            integration_id=f'{name}_id',
+            integration_name='test_integration',
+        )
+        if with_state:
+            EntityState.objects.create(
+                entity=entity,
+                entity_state_type_str=str(EntityStateType.MOVEMENT),
+                name=f'{name} Motion',
+            )
+        return entity
+
+    def delegate(self, principal_entity, delegate_entity):
+        for entity_state in principal_entity.states.all():
+            EntityStateDelegation.objects.create(
+                entity_state=entity_state,
+                delegate_entity=delegate_entity,
+            )
+            continue
+        return
+
+    def count_queries(self, callable_fn):
+        with CaptureQueriesContext(connection) as context:
+            result = callable_fn()
+        return result, len(context.captured_queries)
+
+
+class TestEntityDelegationGraph(EntityPairingManagerTestCase):
+
+    def test_graph_reflects_delegations_in_both_directions(self):
+        principal = self.create_entity('Sensor', with_state=True)
+        area_a = self.create_entity('Area A', entity_type=EntityType.AREA)
+        area_b = self.create_entity('Area B', entity_type=EntityType.AREA)
+        self.delegate(principal, area_a)
+        self.delegate(principal, area_b)
+
+        graph = EntityPairingManager().get_delegation_graph()
+        self.assertEqual(graph.get_delegate_entity_ids(principal.id), {area_a.id, area_b.id})
+        self.assertEqual(graph.get_principal_entity_ids(area_a.id), {principal.id})
+        self.assertEqual(
+            graph.get_delegated_entity_state_ids(area_b.id),
+            [principal.states.get().id],
+        )
+        self.assertEqual(graph.get_delegate_entity_ids(area_a.id), set())
+
+    def test_unchanged_graph_is_reused(self):
+        principal = self.create_entity('Sensor', with_state=True)
+        self.delegate(principal, self.create_entity('Area', entity_type=EntityType.AREA))
+
+        manager = EntityPairingManager()
+        first_graph = manager.get_delegation_graph()
+        second_graph, query_count = self.count_queries(manager.get_delegation_graph)
+        self.assertIs(first_graph, second_graph)
+        # Only the fingerprint check.
+        self.assertEqual(query_count, 1)
+
+    def test_graph_is_rebuilt_after_delegation_changes(self):
+        principal = self.create_entity('Sensor', with_state=True)
+        area = self.create_entity('Area', entity_type=EntityType.AREA)
+        manager = EntityPairingManager()
+        self.assertEqual(manager.get_delegation_graph().get_delegate_entity_ids(principal.id), set())
+
+        self.delegate(principal, area)
+        self.assertEqual(manager.get_delegation_graph().get_delegate_entity_ids(principal.id), {area.id})
+
+        area.delete()
+        self.assertEqual(manager.get_delegation_graph().get_delegate_entity_ids(principal.id), set())
+
+    def test_stale_graph_is_detected_without_signals(self):
+        principal = self.create_entity('Sensor', with_state=True)
+        area = self.create_entity('Area', entity_type=EntityType.AREA)
+        manager = EntityPairingManager()
+        manager.get_delegation_graph()
+
+        # bulk_create sends no signals, like a write from another process.
+        EntityStateDelegation.objects.bulk_create([
+            EntityStateDelegation(entity_state=principal.states.get(), delegate_entity=area),
+        ])
+        self.assertEqual(manager.get_delegation_graph().get_delegate_entity_ids(principal.id), {area.id})
+
+
+class TestEntityPairingLookups(EntityPairingManagerTestCase):
+
+    def test_candidates_are_entities_with_opposite_state_presence(self):
+        sensor_a = self.create_entity('Sensor A', with_state=True)
+        sensor_b = self.create_entity('Sensor B', with_state=True)
+        area_a = self.create_entity('Area A', entity_type=EntityType.AREA)
+        area_b = self.create_entity('Area B', entity_type=EntityType.AREA)
+        manager = EntityPairingManager()
+
+        self.assertEqual(
+            {x.id for x in manager.get_candidate_entities(sensor_a)}, {area_a.id, area_b.id},
+        )
+        self.assertEqual(
+            {x.id for x in manager.get_candidate_entities(area_a)}, {sensor_a.id, sensor_b.id},
+        )
+
+    def test_candidate_query_count_is_independent_of_entity_count(self):
+        sensor = self.create_entity('Sensor', with_state=True)
+        manager = EntityPairingManager()
+        _, small_count = self.count_queries(lambda: manager.get_candidate_entities(sensor))
+        for index in range(20):
+            self.create_entity(f'Area {index}', entity_type=EntityType.AREA)
+            continue
+        _, large_count = self.count_queries(lambda: manager.get_candidate_entities(sensor))
+        self.assertEqual(small_count, large_count)
+
+    def test_pairing_list_sorted_by_name(self):
+        principal = self.create_entity('Sensor', with_state=True)
+        area_z = self.create_entity('Zeta Area', entity_type=EntityType.AREA)
+        area_a = self.create_entity('Alpha Area', entity_type=EntityType.AREA)
+        self.delegate(principal, area_z)
+        self.delegate(principal, area_a)
+
+        manager = EntityPairingManager()
+        self.assertEqual(
+            [x.id for x in manager.get_delegate_entities(principal)], [area_a.id, area_z.id],
+        )
+        self.assertEqual(
+            [x.paired_entity.id for x in manager.get_entity_pairing_list(area_a)], [principal.id],
+        )
+
+    def test_delegates_with_defaults_creates_one_area_once(self):
+        principal = self.create_entity('Sensor', with_state=True)
+        manager = EntityPairingManager()
+
+        first_delegates = manager.get_delegate_entities_with_defaults(principal)
+        second_delegates = manager.get_delegate_entities_with_defaults(principal)
+
+        self.assertEqual(len(first_delegates), 1)
+        self.assertEqual(first_delegates[0].entity_type, EntityType.AREA)
+        self.assertEqual([x.id for x in second_delegates], [first_delegates[0].id])
+
+
+class TestEntityPairingChanges(EntityPairingManagerTestCase):
+
+    def test_adjust_entity_pairings_adds_and_removes(self):
+        principal = self.create_entity('Sensor', with_state=True)
+        area_a = self.create_entity('Area A', entity_type=EntityType.AREA)
+        area_b = self.create_entity('Area B', entity_type=EntityType.AREA)
+        manager = EntityPairingManager()
+
+        manager.adjust_entity_pairings(principal, {area_a.id, area_b.id})
+        self.assertEqual(
+            {x.id for x in manager.get_delegate_entities(principal)}, {area_a.id, area_b.id},
+        )
+
+        manager.adjust_entity_pairings(area_b, set())
+        self.assertEqual(
+            {x.id for x in manager.get_delegate_entities(principal)}, {area_a.id},
+        )
+
+    def test_adjust_entity_pairings_rejects_two_stateful_entities(self):
+        sensor_a = self.create_entity('Sensor A', with_state=True)
+        sensor_b = self.create_entity('Sensor B', with_state=True)
+        with self.assertRaises(EntityPairingError):
+            EntityPairingManager().adjust_entity_pairings(sensor_a, {sensor_b.id})
+
+    def test_remove_delegates_from_view_keeps_shared_delegates(self):
+        location_view = LocationSyntheticData.create_test_location_view()
+        sensor_a = self.create_entity('Sensor A', with_state=True)
+        sensor_b = self.create_entity('Sensor B', with_state=True)
+        own_area = self.create_entity('Own Area', entity_type=EntityType.AREA)
+        shared_area = self.create_entity('Shared Area', entity_type=EntityType.AREA)
+        self.delegate(sensor_a, own_area)
+        self.delegate(sensor_a, shared_area)
+        self.delegate(sensor_b, shared_area)
+        for area in (own_area, shared_area):
+            EntityView.objects.create(entity=area, location_view=location_view)
+            continue
+
+        EntityPairingManager().remove_delegate_entities_from_view_if_needed(
+            entity=sensor_a, location_view=location_view,
+        )
+        self.assertEqual(
+            set(EntityView.objects.filter(location_view=location_view).values_list('entity_id', flat=True)),
+            {shared_area.id},
+        )
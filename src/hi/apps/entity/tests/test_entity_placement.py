@@ -19,6 +19,7 @@ from unittest.mock import Mock
 from hi.apps.entity.entity_placement import (
     EntityPlacementCalculator,
     EntityPlacer,
+    PlacementPath,
     PlacementPoint,
 )
 from hi.apps.entity.models import Entity, EntityPosition
@@ -168,6 +169,29 @@ class TestEntityPlacementCalculatorBulkShapes(BaseTestCase):
         self.assertEqual(len(set(positions)), 4)
 
 
+    def test_shape_at_point_routes_by_entity_type(self):
+        calculator = EntityPlacementCalculator()
+        location_view = self._make_location_view()
+        camera = Entity.objects.create(
+            name='Point Camera',
+            entity_type_str=str(EntityType.CAMERA),
+        )
+        wire = Entity.objects.create(
+            name='Point Wire',
+            entity_type_str=str(EntityType.ELECTRIC_WIRE),
+        )
+        camera_shape = calculator.shape_at_point(
+            entity=camera, location_view=location_view, svg_x=120.0, svg_y=340.0,
+        )
+        wire_shape = calculator.shape_at_point(
+            entity=wire, location_view=location_view, svg_x=120.0, svg_y=340.0,
+        )
+        self.assertIsInstance(camera_shape, PlacementPoint)
+        self.assertAlmostEqual(camera_shape.svg_x, 120.0)
+        self.assertAlmostEqual(camera_shape.svg_y, 340.0)
+        self.assertIsInstance(wire_shape, PlacementPath)
+
+
 class TestEntityPlacerSetEntityPath(BaseTestCase):
     """User-drawn-path persistence: creates a new EntityPath row when
     none exists, updates in place when one does."""
@@ -456,3 +480,163 @@ class EntityPlacementServiceTests(BaseTestCase):
         self.assertTrue(outcome.primary_summary.is_collection)
         # Highest-count is Tools (2 entities).
         self.assertEqual(outcome.primary_summary.collection, tools)
+
+
+class TestEntityPlacerBulkPlacement(BaseTestCase):
+    """place_entities_in_view: bulk reads and writes, same end state as
+    placing entity by entity."""
+
+    def setUp(self):
+        from hi.apps.location.tests.synthetic_data import LocationSyntheticData
+        self.location_view = LocationSyntheticData.create_test_location_view()
+        self.location = self.location_view.location
+
+    def _create_entities(self, count, entity_type=EntityType.LIGHT, prefix='Bulk'):
+        return [
+            Entity.objects.create(
+                name=f'{prefix} {i}',
+                entity_type_str=str(entity_type),
+                integration_id=f'{prefix}_{i}',
+                integration_name='test_integration',
+            )
+            for i in range(count)
+        ]
+
+    def _count_queries(self, callable_fn):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as context:
+            callable_fn()
+        return len(context.captured_queries)
+
+    def test_places_icons_and_paths_with_view_links(self):
+        from hi.apps.entity.models import EntityPath, EntityView
+        icon_entities = self._create_entities(3)
+        path_entities = self._create_entities(2, entity_type=EntityType.ELECTRIC_WIRE, prefix='Wire')
+
+        EntityPlacer().place_entities_in_view(
+            entities=icon_entities + path_entities,
+            location_view=self.location_view,
+        )
+
+        self.assertEqual(
+            EntityView.objects.filter(location_view=self.location_view).count(), 5,
+        )
+        self.assertEqual(
+            EntityPosition.objects.filter(location=self.location).count(), 3,
+        )
+        self.assertEqual(
+            EntityPath.objects.filter(location=self.location).count(), 2,
+        )
+        point_set = set(
+            EntityPosition.objects.filter(location=self.location).values_list('svg_x', 'svg_y')
+        )
+        self.assertEqual(len(point_set), 3)
+
+    def test_query_count_is_independent_of_entity_count(self):
+        small_view = self.location_view
+        from hi.apps.location.tests.synthetic_data import LocationSyntheticData
+        large_view = LocationSyntheticData.create_test_location_view()
+
+        small_entities = self._create_entities(3, prefix='Small')
+        large_entities = self._create_entities(40, prefix='Large')
+
+        small_count = self._count_queries(
+            lambda: EntityPlacer().place_entities_in_view(
+                entities=small_entities, location_view=small_view,
+            )
+        )
+        large_count = self._count_queries(
+            lambda: EntityPlacer().place_entities_in_view(
+                entities=large_entities, location_view=large_view,
+            )
+        )
+        self.assertEqual(small_count, large_count)
+
+    def test_existing_position_is_preserved_and_avoided(self):
+        from hi.apps.location.position_geometry import PositionGeometry
+        existing_entity, new_entity = self._create_entities(2)
+        center_x, center_y = PositionGeometry.view_center(self.location_view)
+        EntityPosition.objects.create(
+            entity=existing_entity,
+            location=self.location,
+            svg_x=Decimal(str(center_x)),
+            svg_y=Decimal(str(center_y)),
+            svg_scale=Decimal('1.0'),
+            svg_rotate=Decimal('0.0'),
+        )
+
+        EntityPlacer().place_entities_in_view(
+            entities=[existing_entity, new_entity],
+            location_view=self.location_view,
+        )
+
+        existing_position = EntityPosition.objects.get(entity=existing_entity)
+        self.assertEqual(existing_position.svg_scale, Decimal('1.0'))
+        new_position = EntityPosition.objects.get(entity=new_entity)
+        self.assertNotEqual(
+            (float(new_position.svg_x), float(new_position.svg_y)),
+            (center_x, center_y),
+        )
+
+    def test_repeat_placement_is_idempotent(self):
+        from hi.apps.entity.models import EntityView
+        entities = self._create_entities(4)
+        placer = EntityPlacer()
+        placer.place_entities_in_view(entities=entities, location_view=self.location_view)
+        positions_before = list(
+            EntityPosition.objects.order_by('id').values_list('entity_id', 'svg_x', 'svg_y')
+        )
+        placer.place_entities_in_view(entities=entities, location_view=self.location_view)
+
+        self.assertEqual(
+            list(EntityPosition.objects.order_by('id').values_list('entity_id', 'svg_x', 'svg_y')),
+            positions_before,
+        )
+        self.assertEqual(
+            EntityView.objects.filter(location_view=self.location_view).count(), 4,
+        )
+
+    def test_default_delegates_are_created_and_placed(self):
+        from hi.apps.entity.enums import EntityStateType
+        from hi.apps.entity.models import (
+            EntityPath,
+            EntityState,
+            EntityStateDelegation,
+            EntityView,
+        )
+        motion_sensors = self._create_entities(3, entity_type=EntityType.MOTION_SENSOR, prefix='Motion')
+        for motion_sensor in motion_sensors:
+            EntityState.objects.create(
+                entity=motion_sensor,
+                entity_state_type_str=str(EntityStateType.MOVEMENT),
+                name='Motion',
+            )
+            continue
+
+        EntityPlacer().place_entities_in_view(
+            entities=motion_sensors, location_view=self.location_view,
+        )
+
+        for motion_sensor in motion_sensors:
+            delegation = EntityStateDelegation.objects.get(entity_state__entity=motion_sensor)
+            delegate_entity = delegation.delegate_entity
+            self.assertEqual(delegate_entity.entity_type, EntityType.AREA)
+            self.assertTrue(
+                EntityView.objects.filter(
+                    entity=delegate_entity, location_view=self.location_view,
+                ).exists()
+            )
+            self.assertTrue(
+                EntityPath.objects.filter(entity=delegate_entity, location=self.location).exists()
+            )
+            continue
+
+    def test_signals_reach_change_listeners(self):
+        from hi.apps.location.location_view_overlay_cache import LocationViewOverlayCache
+        entities = self._create_entities(2)
+        generation_before = LocationViewOverlayCache().generation
+        EntityPlacer().place_entities_in_view(
+            entities=entities, location_view=self.location_view,
+        )
+        self.assertGreater(LocationViewOverlayCache().generation, generation_before)
@@ -1,6 +1,9 @@
 import logging
 from datetime import datetime, timedelta, timezone
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from hi.apps.control.models import Controller, ControllerHistory
 from hi.apps.entity.entity_state_history import (
     InstrumentType,
@@ -662,3 +665,98 @@ class TestGetEntityStateHistoryPage( BaseTestCase ):
         values = [ r.value for r in rows ]
         self.assertIn( 'mine', values )
         self.assertNotIn( 'should-not-appear', values )
+
+    def test_page_query_count_is_independent_of_row_count(self):
+        def page_query_count():
+            with CaptureQueriesContext( connection ) as context:
+                rows = get_entity_state_history_page( entity_state = self.state, page_size = 25 )
+                for row in rows:
+                    _ = ( row.instrument.name, row.provides_video_stream )
+                    if row.matched_intent:
+                        _ = row.matched_intent.instrument.name
+                    continue
+            return len( context.captured_queries )
+
+        self._observation( 'on', _at( 0 ) )
+        self._intent( 'on', _at( -2 ) )
+        small_count = page_query_count()
+
+        for i in range( 1, 20 ):
+            value = 'on' if i % 2 else 'off'
+            self._intent( value, _at( 10 * i - 2 ) )
+            self._intent( 'unconfirmed', _at( 10 * i - 1 ) )
+            self._observation( value, _at( 10 * i ) )
+            continue
+        self.assertEqual( page_query_count(), small_count )
+        self.assertEqual( small_count, 2 )
+
+
+class TestMergeHistoryMatchesReference( BaseTestCase ):
+    """The single-pass merge claims the same observations as the
+    straightforward per-intent scan it replaced."""
+
+    @staticmethod
+    def _reference_claims( observations_asc, intents_asc, window_seconds ):
+        window = timedelta( seconds = window_seconds )
+        claims = {}
+        for intent in intents_asc:
+            for i, obs in enumerate( observations_asc ):
+                if i in claims or obs.response_datetime < intent.created_datetime:
+                    continue
+                if obs.response_datetime > intent.created_datetime + window:
+                    break
+                if obs.value == intent.value:
+                    claims[i] = intent
+                    break
+                continue
+            continue
+        return { observations_asc[i].id: intent.id for i, intent in claims.items() }
+
+    def test_random_timelines(self):
+        import random
+        entity = Entity.objects.create( name = 'Plug', entity_type_str = 'WALL_SWITCH' )
+        state = EntityState.objects.create(
+            entity = entity, name = 'on_off', entity_state_type_str = 'ON_OFF',
+        )
+        sensor = Sensor.objects.create(
+            entity_state = state, name = 'plug-sensor',
+            sensor_type_str = 'DEFAULT', integration_payload = '{}',
+        )
+        controller = Controller.objects.create(
+            entity_state = state, name = 'plug-ctrl',
+            controller_type_str = 'DEFAULT', integration_payload = '{}',
+        )
+        rng = random.Random( 11 )
+        for trial in range( 20 ):
+            observations = sorted([
+                SensorHistory( id = index, sensor = sensor, value = rng.choice([ 'on', 'off' ]),
+                               response_datetime = _at( rng.randrange( 200 )))
+                for index in range( 30 )
+            ], key = lambda h: h.response_datetime )
+            intents = sorted([
+                ControllerHistory( id = index, controller = controller, value = rng.choice([ 'on', 'off' ]),
+                                   created_datetime = _at( rng.randrange( 200 )))
+                for index in range( 30 )
+            ], key = lambda h: h.created_datetime )
+
+            rows = merge_history(
+                entity_state = state,
+                observation_rows = observations,
+                intent_rows = intents,
+                window_seconds = 10,
+            )
+            claims = {}
+            for row in rows:
+                if row.matched_intent is not None:
+                    claims[row.sensor_history_id] = row.matched_intent.timestamp
+                continue
+            expected = self._reference_claims( observations, intents, 10 )
+            intent_by_id = { x.id: x for x in intents }
+            self.assertEqual(
+                claims,
+                { obs_id: intent_by_id[intent_id].created_datetime for obs_id, intent_id in expected.items() },
+                f'trial {trial}',
+            )
+            self.assertEqual( len( rows ), len( observations ) + len( intents ) - len( expected ))
+            continue
+        return
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 from hi.apps.entity.edit.forms import EntityPositionForm
 
@@ -71,7 +71,45 @@ class EntityPairing:
     entity         : Entity
     paired_entity  : Entity
     pairing_type   : EntityPairingType
-    
+
+
+@dataclass
+class EntityDelegationGraph:
+    """
+    In-memory snapshot of all EntityStateDelegation rows as id maps, so
+    principal/delegate lookups need no queries.  Holds ids rather than
+    model instances so a cached graph never hands out stale objects.
+    Delegated state ids are kept in delegation creation order.
+    """
+    delegate_ids_by_principal_id        : Dict[ int, Set[ int ] ]   = field( default_factory = dict )
+    principal_ids_by_delegate_id        : Dict[ int, Set[ int ] ]   = field( default_factory = dict )
+    delegated_state_ids_by_delegate_id  : Dict[ int, List[ int ] ]  = field( default_factory = dict )
+
+    @classmethod
+    def from_delegation_rows( cls, delegation_rows : Iterable[ Tuple[ int, int, int ] ] ):
+        """ Rows are ( entity_state_id, principal_entity_id, delegate_entity_id ). """
+        delegation_graph = cls()
+        for entity_state_id, principal_entity_id, delegate_entity_id in delegation_rows:
+            delegation_graph.delegate_ids_by_principal_id.setdefault(
+                principal_entity_id, set() ).add( delegate_entity_id )
+            delegation_graph.principal_ids_by_delegate_id.setdefault(
+                delegate_entity_id, set() ).add( principal_entity_id )
+            delegated_state_id_list = delegation_graph.delegated_state_ids_by_delegate_id.setdefault(
+                delegate_entity_id, list() )
+            if entity_state_id not in delegated_state_id_list:
+                delegated_state_id_list.append( entity_state_id )
+            continue
+        return delegation_graph
+
+    def get_delegate_entity_ids( self, principal_entity_id : int ) -> Set[ int ]:
+        return self.delegate_ids_by_principal_id.get( principal_entity_id, set() )
+
+    def get_principal_entity_ids( self, delegate_entity_id : int ) -> Set[ int ]:
+        return self.principal_ids_by_delegate_id.get( delegate_entity_id, set() )
+
+    def get_delegated_entity_state_ids( self, delegate_entity_id : int ) -> List[ int ]:
+        return self.delegated_state_ids_by_delegate_id.get( delegate_entity_id, list() )
+
 
 @dataclass
 class EntityEditModeData:
@@ -161,8 +161,8 @@ class TestEventDefinitionEditView(DualModeViewTestCase):
         self.assertEqual(alarm_actions[0].security_level_str, 'low')
         self.assertEqual(alarm_actions[0].alarm_level_str, 'warning')
         
-        # Verify event manager reload was called
-        mock_manager.reload.assert_called_once()
+        # Model signals update the event manager incrementally
+        mock_manager.reload.assert_not_called()
 
     def test_post_invalid_form_data(self):
         """Test POST request with invalid form data."""
@@ -457,8 +457,8 @@ class TestEventDefinitionAddView(DualModeViewTestCase):
         self.assertEqual(alarm_actions[0].security_level_str, 'high')
         self.assertEqual(alarm_actions[0].alarm_level_str, 'warning')
         
-        # Verify event manager reload was called
-        mock_manager.reload.assert_called_once()
+        # Model signals update the event manager incrementally
+        mock_manager.reload.assert_not_called()
 
     def test_get_event_definition_returns_none(self):
         """Test that get_event_definition returns None for add view."""
@@ -530,8 +530,8 @@ class TestEventDefinitionDeleteView(DualModeViewTestCase):
         with self.assertRaises(EventDefinition.DoesNotExist):
             EventDefinition.objects.get(id=self.event_definition.id)
         
-        # Should reload event manager
-        mock_manager.reload.assert_called_once()
+        # Model signals update the event manager incrementally
+        mock_manager.reload.assert_not_called()
 
     def test_nonexistent_event_definition_returns_404(self):
         """Test that accessing nonexistent event definition returns 404."""
@@ -111,8 +111,6 @@ class EventDefinitionEditView( HiModalView, EventViewMixin, EventMixin ):
             alarm_action_formset.save()
             control_action_formset.save()
 
-        self.event_manager().reload()
-
         redirect_url = reverse( 'event_definitions' )
         return self.redirect_response( request = request,
                                        redirect_url = redirect_url )
@@ -146,8 +144,6 @@ class EventDefinitionDeleteView( HiModalView, EventViewMixin, EventMixin ):
         event_definition = self.get_event_definition( request, *args, **kwargs )
         event_definition.delete()
 
-        self.event_manager().reload()
-        
         redirect_url = reverse( 'event_definitions' )
         return self.redirect_response( request = request,
                                        redirect_url = redirect_url )
@@ -0,0 +1,246 @@
+"""
+Runs the alarm and control actions of detected events on a small pool
+of worker threads, so a slow integration call triggered by a rule never
+holds up sensor ingestion for every integration.
+
+Actions for security events are taken before all others, and alarms
+before control actions.  Repeated control actions for a controller
+that have not run yet coalesce (the last value wins), and actions for
+any one controller never run concurrently.
+"""
+from dataclasses import dataclass
+import heapq
+import logging
+from threading import Condition, Thread
+import time
+from typing import Dict, List, Tuple
+
+from hi.apps.alert.alarm import Alarm
+from hi.apps.alert.alert_mixins import AlertMixin
+from hi.apps.common.singleton import Singleton
+from hi.apps.control.control_mixins import ControllerMixin
+from hi.apps.control.models import Controller
+from hi.apps.system.enums import TimingMetricType
+from hi.apps.system.health_status_provider import HealthStatusProvider
+from hi.apps.system.provider_info import ProviderInfo
+from hi.apps.system.timing_metrics import TimingMetrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EventActionItem:
+
+    key            : Tuple
+    priority       : int
+    sequence       : int
+    enqueue_time   : float
+    alarm          : Alarm  = None
+    controller_id  : int    = None
+    control_value  : str    = None
+
+    @property
+    def is_alarm(self) -> bool:
+        return bool( self.alarm is not None )
+
+
+class EventActionDispatcher( Singleton, HealthStatusProvider, AlertMixin, ControllerMixin ):
+
+    WORKER_COUNT = 4
+    MAX_PENDING_ACTIONS = 1000
+
+    SECURITY_ALARM_PRIORITY = 0
+    ALARM_PRIORITY = 1
+    SECURITY_CONTROL_PRIORITY = 2
+    CONTROL_PRIORITY = 3
+
+    ALARM_METRIC_NAME = 'Alarm'
+    CONTROL_METRIC_NAME = 'Control'
+
+    def __init_singleton__(self):
+        self._ensure_health_status_provider_setup()
+        self._condition = Condition()
+        self._heap : List[ Tuple[ int, int, Tuple ]] = list()
+        self._pending_map : Dict[ Tuple, EventActionItem ] = dict()
+        self._in_flight_keys = set()
+        # Keys taken off the heap while their previous action was still
+        # running.  Re-queued when that action finishes.
+        self._deferred_keys = set()
+        self._sequence = 0
+        self._worker_list : List[ Thread ] = list()
+        self._stop_requested = False
+        self._completed_count = 0
+        self._failed_count = 0
+        self._coalesced_count = 0
+        self._dropped_count = 0
+        return
+
+    @classmethod
+    def get_provider_info(cls) -> ProviderInfo:
+        return ProviderInfo(
+            provider_id = 'hi.apps.event.event_actions',
+            provider_name = 'Event Actions',
+            description = 'Runs the alarm and control actions of detected events.',
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return bool( any( x.is_alive() for x in self._worker_list ))
+
+    def start(self):
+        with self._condition:
+            if self.is_running:
+                return
+            self._stop_requested = False
+            self._worker_list = [
+                Thread(
+                    target = self._run_worker,
+                    name = f'EventActionWorker-{index}',
+                    daemon = True,
+                )
+                for index in range( self.WORKER_COUNT )
+            ]
+        for worker in self._worker_list:
+            worker.start()
+            continue
+        self.record_healthy( f'Running {self.WORKER_COUNT} workers.' )
+        return
+
+    def stop(self):
+        with self._condition:
+            self._stop_requested = True
+            self._condition.notify_all()
+        for worker in self._worker_list:
+            worker.join( timeout = 5 )
+            continue
+        self._worker_list = list()
+        self.record_disabled( 'Stopped.' )
+        return
+
+    def enqueue_alarm( self, alarm : Alarm, is_security : bool ):
+        with self._condition:
+            self._sequence += 1
+            self._add_item( EventActionItem(
+                key = ( 'alarm', self._sequence ),
+                priority = self.SECURITY_ALARM_PRIORITY if is_security else self.ALARM_PRIORITY,
+                sequence = self._sequence,
+                enqueue_time = time.perf_counter(),
+                alarm = alarm,
+            ))
+        return
+
+    def enqueue_control( self,
+                         controller_id  : int,
+                         control_value  : str,
+                         is_security    : bool ):
+        key = ( 'control', controller_id )
+        with self._condition:
+            pending_item = self._pending_map.get( key )
+            if pending_item:
+                # Keeps its queue position and original enqueue time so
+                # latency still measures from the first request.
+                pending_item.control_value = control_value
+                self._coalesced_count += 1
+                return
+            self._sequence += 1
+            self._add_item( EventActionItem(
+                key = key,
+                priority = self.SECURITY_CONTROL_PRIORITY if is_security else self.CONTROL_PRIORITY,
+                sequence = self._sequence,
+                enqueue_time = time.perf_counter(),
+                controller_id = controller_id,
+                control_value = control_value,
+            ))
+        return
+
+    def _add_item( self, item : EventActionItem ):
+        """ Caller must hold the condition lock. """
+        if (( len( self._pending_map ) >= self.MAX_PENDING_ACTIONS )
+                and ( item.priority != self.SECURITY_ALARM_PRIORITY )):
+            self._dropped_count += 1
+            logger.warning( f'Event action queue full. Dropping action: {item.key}' )
+            return
+        self._pending_map[item.key] = item
+        heapq.heappush( self._heap, ( item.priority, item.sequence, item.key ))
+        self._condition.notify()
+        return
+
+    def _take_next(self) -> EventActionItem:
+        """ Blocks until an action can run, or returns None when stopping. """
+        with self._condition:
+            while not self._stop_requested:
+                while self._heap:
+                    _, _, key = heapq.heappop( self._heap )
+                    if key in self._in_flight_keys:
+                        self._deferred_keys.add( key )
+                        continue
+                    self._in_flight_keys.add( key )
+                    return self._pending_map.pop( key )
+                self._condition.wait()
+                continue
+        return None
+
+    def _finish( self, item : EventActionItem, succeeded : bool ):
+        with self._condition:
+            self._in_flight_keys.discard( item.key )
+            if succeeded:
+                self._completed_count += 1
+            else:
+                self._failed_count += 1
+            if item.key in self._deferred_keys:
+                self._deferred_keys.discard( item.key )
+                deferred_item = self._pending_map[item.key]
+                heapq.heappush( self._heap, ( deferred_item.priority, deferred_item.sequence, item.key ))
+                self._condition.notify()
+        return
+
+    def _run_worker(self):
+        while True:
+            item = self._take_next()
+            if item is None:
+                return
+            succeeded = False
+            try:
+                self._execute( item )
+                succeeded = True
+            except Exception:
+                logger.exception( f'Problem running event action: {item.key}' )
+            finally:
+                self._finish( item, succeeded = succeeded )
+            continue
+
+    def _execute( self, item : EventActionItem ):
+        if item.is_alarm:
+            self.alert_manager().upsert_alarm( alarm = item.alarm )
+            metric_name = self.ALARM_METRIC_NAME
+        else:
+            try:
+                controller = Controller.objects.select_related( 'entity_state' ).get( id = item.controller_id )
+            except Controller.DoesNotExist:
+                logger.warning( f'Controller {item.controller_id} for event action no longer exists.' )
+                return
+            self.controller_manager().do_control(
+                controller = controller,
+                control_value = item.control_value,
+            )
+            metric_name = self.CONTROL_METRIC_NAME
+
+        TimingMetrics().record(
+            TimingMetricType.EVENT_ACTION_LATENCY,
+            metric_name,
+            time.perf_counter() - item.enqueue_time,
+        )
+        return
+
+    def get_status(self) -> Dict:
+        with self._condition:
+            return {
+                'is_running': self.is_running,
+                'worker_count': len( self._worker_list ),
+                'queue_depth': len( self._pending_map ),
+                'in_flight': len( self._in_flight_keys ),
+                'completed': self._completed_count,
+                'failed': self._failed_count,
+                'coalesced': self._coalesced_count,
+                'dropped': self._dropped_count,
+            }
@@ -3,15 +3,16 @@ from cachetools import TTLCache
 from collections import deque
 import logging
 from threading import Lock
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
-from hi.apps.alert.alert_mixins import AlertMixin
 from hi.apps.alert.enums import AlarmLevel
 import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.apps.common.model_change_dispatcher import ModelChangeSet, ModelChangeTopic
 from hi.apps.common.singleton import Singleton
-from hi.apps.control.control_mixins import ControllerMixin
 from hi.apps.entity.models import EntityState
 from hi.apps.security.enums import SecurityLevel
 from hi.apps.security.security_mixins import SecurityMixin
@@ -19,13 +20,14 @@ from hi.apps.security.security_mixins import SecurityMixin
 from hi.integrations.transient_models import IntegrationKey
 
 from .enums import EventClauseOperator, EventType
-from .models import AlarmAction, EventClause, EventDefinition, EventHistory
+from .event_action_dispatcher import EventActionDispatcher
+from .models import AlarmAction, ControlAction, EventClause, EventDefinition, EventHistory
 from .transient_models import Event, EntityStateTransition
 
 logger = logging.getLogger(__name__)
 
 
-class EventManager( Singleton, AlertMixin, ControllerMixin, SecurityMixin ):
+class EventManager( Singleton, SecurityMixin ):
 
     RECENT_EVENT_CACHE_SIZE = 1000
     RECENT_EVENT_CACHE_TTL_SECS = 3600
@@ -42,7 +44,9 @@ class EventManager( Singleton, AlertMixin, ControllerMixin, SecurityMixin ):
         self._recent_transitions = deque()
         self._recent_events = TTLCache( maxsize = self.RECENT_EVENT_CACHE_SIZE,
                                         ttl = self.RECENT_EVENT_CACHE_TTL_SECS )
-        self._event_definitions = False
+        # Replaced as a whole, never mutated, so the ingestion path can
+        # iterate it without holding the lock while it is being rebuilt.
+        self._event_definition_map : Dict[ int, EventDefinition ] = dict()
         self._event_definition_reload_needed = True
         self._event_definitions_lock = Lock()
         self._was_initialized = False
@@ -56,21 +60,57 @@ class EventManager( Singleton, AlertMixin, ControllerMixin, SecurityMixin ):
         return
 
     def reload(self):
-        """ Called when integration models are changed (via signals below). """
+        """ Full rebuild. Model changes are applied incrementally (via signals below). """
         logger.debug( 'Reloading event definitions' )
         with self._event_definitions_lock:
-            self._event_definitions = list( EventDefinition.objects.prefetch_related(
-                'event_clauses',
-                'event_clauses__entity_state',
-                'alarm_actions',
-                'control_actions',
-            ).filter( enabled = True ))
+            self._event_definition_map = {
+                x.id: x for x in self._get_event_definition_queryset().filter( enabled = True )
+            }
             self._event_definition_reload_needed = False
         return
 
     def set_event_definition_reload_needed(self):
         self._event_definition_reload_needed = True
         return
+
+    def apply_event_definition_changes( self, event_definition_ids : Iterable[ int ] ):
+        """
+        Upserts or removes only the changed definitions, then swaps in the
+        new map.  Runs on the model change dispatcher thread, not the
+        ingestion path.
+        """
+        changed_ids = set( event_definition_ids )
+        if not changed_ids:
+            return
+
+        # Disabled and deleted definitions are simply absent here.
+        changed_event_definition_map = {
+            x.id: x for x in self._get_event_definition_queryset().filter(
+                id__in = changed_ids,
+                enabled = True,
+            )
+        }
+        logger.debug( f'Applying event definition changes: {len(changed_ids)} changed,'
+                      f' {len(changed_event_definition_map)} enabled' )
+        with self._event_definitions_lock:
+            event_definition_map = dict( self._event_definition_map )
+            for event_definition_id in changed_ids:
+                event_definition = changed_event_definition_map.get( event_definition_id )
+                if event_definition:
+                    event_definition_map[event_definition_id] = event_definition
+                else:
+                    event_definition_map.pop( event_definition_id, None )
+                continue
+            self._event_definition_map = event_definition_map
+        return
+
+    def _get_event_definition_queryset(self):
+        return EventDefinition.objects.prefetch_related(
+            'event_clauses',
+            'event_clauses__entity_state',
+            'alarm_actions',
+            'control_actions',
+        )
     
     async def add_entity_state_transitions( self,
                                             entity_state_transition_list : List[ EntityStateTransition ] ):
@@ -93,17 +133,16 @@ class EventManager( Singleton, AlertMixin, ControllerMixin, SecurityMixin ):
         if self._event_definition_reload_needed:
             self.reload()
 
-        with self._event_definitions_lock:
-            new_event_list = list()
-            for event_definition in self._event_definitions:
-                if self._has_recent_event( event_definition ):
-                    continue
-                event = self._create_event_if_detected( event_definition )
-                if not event:
-                    continue
-                self._recent_events[event_definition.id] = event
-                new_event_list.append( event )
+        new_event_list = list()
+        for event_definition in self._event_definition_map.values():
+            if self._has_recent_event( event_definition ):
+                continue
+            event = self._create_event_if_detected( event_definition )
+            if not event:
                 continue
+            self._recent_events[event_definition.id] = event
+            new_event_list.append( event )
+            continue
 
         return new_event_list
 
@@ -115,13 +154,14 @@ class EventManager( Singleton, AlertMixin, ControllerMixin, SecurityMixin ):
         return bool( recent_event_timedelta.total_seconds() <= event_definition.dedupe_window_secs )
     
     def _create_event_if_detected( self, event_definition : EventDefinition ) -> bool:
-        if not event_definition.event_clauses.exists():
+        # Uses the prefetched clauses: no queries per definition per batch.
+        event_clauses = list( event_definition.event_clauses.all() )
+        if not event_clauses:
             return False
 
         current_timestamp = datetimeproxy.now()
         sensor_response_list = list()
 
-        event_clauses = list(event_definition.event_clauses.select_related('entity_state').all())
         for event_clause in event_clauses:
             matches = False
             for transition in self._recent_transitions:
@@ -195,28 +235,32 @@ class EventManager( Singleton, AlertMixin, ControllerMixin, SecurityMixin ):
         return
 
     async def _do_new_event_action( self, event_list : List[ Event ] ):
-        alert_manager = await self.alert_manager_async()
-        if not alert_manager:
-            return
-        controller_manager = await self.controller_manager_async()
-        
+        """
+        Only queues the actions.  They run on the dispatcher's workers so
+        a slow controller does not delay the next sensor batch.
+        """
+        event_action_dispatcher = EventActionDispatcher()
         current_security_level = self.security_manager().security_level
 
         for event in event_list:
+            is_security = bool( event.event_definition.event_type == EventType.SECURITY )
 
             alarm_actions = await sync_to_async(list)(event.event_definition.alarm_actions.all())
             for alarm_action in alarm_actions:
                 if alarm_action.security_level != current_security_level:
                     continue
-                alarm = event.to_alarm( alarm_action = alarm_action )
-                await alert_manager.upsert_alarm_async( alarm )
+                event_action_dispatcher.enqueue_alarm(
+                    alarm = event.to_alarm( alarm_action = alarm_action ),
+                    is_security = is_security,
+                )
                 continue
             
             control_actions = await sync_to_async(list)(event.event_definition.control_actions.all())
             for control_action in control_actions:
-                await controller_manager.do_control_async(
-                    controller = control_action.controller,
+                event_action_dispatcher.enqueue_control(
+                    controller_id = control_action.controller_id,
                     control_value = control_action.value,
+                    is_security = is_security,
                 )
                 continue
             continue
@@ -272,6 +316,33 @@ class EventManager( Singleton, AlertMixin, ControllerMixin, SecurityMixin ):
                 )
                 continue
 
-            self._event_definition_reload_needed = True
             return event_definition
 
+
+def _apply_event_definition_changes( change_set : ModelChangeSet ):
+    EventManager().apply_event_definition_changes( change_set.get_ids( 'event_definition' ))
+    return
+
+
+_event_definition_changes = ModelChangeTopic(
+    name = 'event_manager',
+    callback_func = _apply_event_definition_changes,
+)
+
+
+@receiver( post_save, sender = EventDefinition )
+@receiver( post_delete, sender = EventDefinition )
+def event_definition_model_changed( sender, instance, **kwargs ):
+    _event_definition_changes.record( 'event_definition', instance.id )
+    return
+
+
+@receiver( post_save, sender = EventClause )
+@receiver( post_save, sender = AlarmAction )
+@receiver( post_save, sender = ControlAction )
+@receiver( post_delete, sender = EventClause )
+@receiver( post_delete, sender = AlarmAction )
+@receiver( post_delete, sender = ControlAction )
+def event_definition_child_model_changed( sender, instance, **kwargs ):
+    _event_definition_changes.record( 'event_definition', instance.event_definition_id )
+    return
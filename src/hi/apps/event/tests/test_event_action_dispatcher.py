@@ -0,0 +1,102 @@
+import logging
+from threading import Event as ThreadEvent
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from hi.apps.event.event_action_dispatcher import EventActionDispatcher
+
+logging.disable(logging.CRITICAL)
+
+
+class TestEventActionDispatcherQueue(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.dispatcher = EventActionDispatcher()
+        self.dispatcher.stop()
+        self.dispatcher.__init_singleton__()
+        return
+
+    def test_security_alarms_run_first(self):
+        self.dispatcher.enqueue_control( controller_id = 1, control_value = 'on', is_security = False )
+        self.dispatcher.enqueue_alarm( alarm = Mock( name = 'info' ), is_security = False )
+        self.dispatcher.enqueue_control( controller_id = 2, control_value = 'on', is_security = True )
+        security_alarm = Mock( name = 'security' )
+        self.dispatcher.enqueue_alarm( alarm = security_alarm, is_security = True )
+
+        item_list = [ self.dispatcher._take_next() for _ in range( 4 ) ]
+        self.assertIs( item_list[0].alarm, security_alarm )
+        self.assertTrue( item_list[1].is_alarm )
+        self.assertEqual( item_list[2].controller_id, 2 )
+        self.assertEqual( item_list[3].controller_id, 1 )
+
+    def test_pending_control_actions_coalesce(self):
+        for control_value in [ 'on', 'off', 'dim' ]:
+            self.dispatcher.enqueue_control( controller_id = 7, control_value = control_value, is_security = False )
+            continue
+        item = self.dispatcher._take_next()
+        self.assertEqual( item.control_value, 'dim' )
+        status = self.dispatcher.get_status()
+        self.assertEqual( status['queue_depth'], 0 )
+        self.assertEqual( status['coalesced'], 2 )
+
+    def test_controller_actions_do_not_run_concurrently(self):
+        self.dispatcher.enqueue_control( controller_id = 7, control_value = 'on', is_security = False )
+        first_item = self.dispatcher._take_next()
+        self.dispatcher.enqueue_control( controller_id = 7, control_value = 'off', is_security = False )
+        self.dispatcher.enqueue_control( controller_id = 8, control_value = 'on', is_security = False )
+
+        # Controller 7 is in flight, so controller 8 runs next.
+        self.assertEqual( self.dispatcher._take_next().controller_id, 8 )
+        self.dispatcher._finish( first_item, succeeded = True )
+        second_item = self.dispatcher._take_next()
+        self.assertEqual( ( second_item.controller_id, second_item.control_value ), ( 7, 'off' ) )
+
+    def test_full_queue_drops_all_but_security_alarms(self):
+        with patch.object( EventActionDispatcher, 'MAX_PENDING_ACTIONS', 1 ):
+            self.dispatcher.enqueue_control( controller_id = 1, control_value = 'on', is_security = False )
+            self.dispatcher.enqueue_alarm( alarm = Mock(), is_security = False )
+            self.dispatcher.enqueue_alarm( alarm = Mock(), is_security = True )
+        status = self.dispatcher.get_status()
+        self.assertEqual( status['queue_depth'], 2 )
+        self.assertEqual( status['dropped'], 1 )
+
+
+class TestEventActionDispatcherWorkers(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.dispatcher = EventActionDispatcher()
+        self.dispatcher.stop()
+        self.dispatcher.__init_singleton__()
+        return
+
+    def tearDown(self):
+        self.dispatcher.stop()
+        super().tearDown()
+        return
+
+    def test_workers_run_alarm_actions(self):
+        upserted = ThreadEvent()
+        mock_alert_manager = Mock()
+        mock_alert_manager.upsert_alarm.side_effect = lambda alarm: upserted.set()
+        alarm = Mock()
+
+        with patch.object( self.dispatcher, 'alert_manager', return_value = mock_alert_manager ):
+            self.dispatcher.start()
+            self.dispatcher.enqueue_alarm( alarm = alarm, is_security = True )
+            self.assertTrue( upserted.wait( timeout = 5 ))
+
+        mock_alert_manager.upsert_alarm.assert_called_once_with( alarm = alarm )
+
+    def test_failed_action_does_not_stop_worker(self):
+        mock_alert_manager = Mock()
+        mock_alert_manager.upsert_alarm.side_effect = RuntimeError( 'boom' )
+        item = Mock( is_alarm = True, key = ( 'alarm', 1 ))
+
+        with patch.object( self.dispatcher, 'alert_manager', return_value = mock_alert_manager ), \
+             patch.object( self.dispatcher, '_take_next', side_effect = [ item, None ] ):
+            self.dispatcher._run_worker()
+
+        self.assertEqual( self.dispatcher.get_status()['failed'], 1 )
@@ -1,11 +1,14 @@
 import logging
 from datetime import timedelta
-from unittest.mock import patch, AsyncMock
+import statistics
+import time
+from unittest.mock import patch
 from asgiref.sync import sync_to_async
 
 from django.utils import timezone
 
 from hi.apps.alert.enums import AlarmLevel
+from hi.apps.common.model_change_dispatcher import ModelChangeDispatcher
 from hi.apps.entity.models import Entity, EntityState
 from hi.apps.security.enums import SecurityLevel
 from hi.apps.sense.transient_models import SensorResponse
@@ -130,7 +133,7 @@ class TestEventManagerEventDefinitionLoading(BaseTestCase):
         manager.reload()
         
         # Should only load enabled definitions
-        loaded_ids = [ed.id for ed in manager._event_definitions]
+        loaded_ids = list(manager._event_definition_map.keys())
         self.assertIn(enabled_event_def.id, loaded_ids)
         self.assertNotIn(disabled_event_def.id, loaded_ids)
         self.assertFalse(manager._event_definition_reload_needed)
@@ -162,6 +165,119 @@ class TestEventManagerEventDefinitionLoading(BaseTestCase):
         return
 
 
+class TestEventManagerIncrementalChanges(BaseTestCase):
+    """Test signal-driven incremental maintenance of the loaded event definitions."""
+
+    def setUp(self):
+        super().setUp()
+        EventManager._instances = {}
+        self.manager = EventManager()
+        self.entity = Entity.objects.create(name='Test Entity', entity_type_str='CAMERA')
+        self.entity_state = EntityState.objects.create(
+            entity=self.entity,
+            entity_state_type_str='ON_OFF'
+        )
+        return
+
+    def create_event_definition(self, name, enabled=True):
+        event_definition = EventDefinition.objects.create(
+            name=name,
+            event_type_str='SECURITY',
+            event_window_secs=60,
+            dedupe_window_secs=300,
+            enabled=enabled,
+        )
+        EventClause.objects.create(
+            event_definition=event_definition,
+            entity_state=self.entity_state,
+            value='on'
+        )
+        return event_definition
+
+    def test_model_changes_publish_parent_definition_ids(self):
+        event_def = self.create_event_definition('Event')
+
+        with patch.object(ModelChangeDispatcher(), 'publish') as mock_publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                AlarmAction.objects.create(
+                    event_definition=event_def,
+                    security_level_str='high',
+                    alarm_level_str='critical',
+                    alarm_lifetime_secs=600
+                )
+        change_set = mock_publish.call_args.args[1]
+        self.assertEqual(change_set.get_ids('event_definition'), {event_def.id})
+        return
+
+    def test_apply_changes_upserts_and_removes_only_changed_definitions(self):
+        unchanged_def = self.create_event_definition('Unchanged')
+        edited_def = self.create_event_definition('Edited')
+        disabled_def = self.create_event_definition('Disabled')
+        deleted_def = self.create_event_definition('Deleted')
+        self.manager.reload()
+        unchanged_instance = self.manager._event_definition_map[unchanged_def.id]
+
+        edited_def.name = 'Edited Again'
+        edited_def.save()
+        disabled_def.enabled = False
+        disabled_def.save()
+        deleted_def_id = deleted_def.id
+        deleted_def.delete()
+        added_def = self.create_event_definition('Added')
+
+        with patch.object(self.manager, 'reload') as mock_reload:
+            self.manager.apply_event_definition_changes(
+                [edited_def.id, disabled_def.id, deleted_def_id, added_def.id]
+            )
+            mock_reload.assert_not_called()
+
+        event_definition_map = self.manager._event_definition_map
+        self.assertEqual(set(event_definition_map.keys()), {unchanged_def.id, edited_def.id, added_def.id})
+        self.assertIs(event_definition_map[unchanged_def.id], unchanged_instance)
+        self.assertEqual(event_definition_map[edited_def.id].name, 'Edited Again')
+        self.assertNotIn(deleted_def_id, event_definition_map)
+        return
+
+    def test_definition_edit_burst_does_not_slow_ingestion(self):
+        """Ingestion latency while 500 definition edits are applied in between batches."""
+        event_def_list = [self.create_event_definition(f'Event {i}') for i in range(50)]
+        self.manager.reload()
+        self.manager._recent_transitions.append(EntityStateTransition(
+            entity_state=self.entity_state,
+            latest_sensor_response=create_test_sensor_response(value='off', timestamp=timezone.now()),
+            previous_value='on'
+        ))
+
+        def timed_ingestion():
+            start_time = time.perf_counter()
+            with self.assertNumQueries(0):
+                self.assertEqual(self.manager._get_new_events(), [])
+            return time.perf_counter() - start_time
+
+        baseline_latencies = [timed_ingestion() for _ in range(50)]
+
+        burst_latencies = list()
+        changed_ids = set()
+        with patch.object(self.manager, 'reload') as mock_reload:
+            for edit_index in range(500):
+                event_def = event_def_list[edit_index % len(event_def_list)]
+                event_def.name = f'Event {edit_index}'
+                event_def.save()
+                changed_ids.add(event_def.id)
+                if edit_index % 25 == 24:
+                    self.manager.apply_event_definition_changes(changed_ids)
+                    changed_ids = set()
+                burst_latencies.append(timed_ingestion())
+                continue
+            mock_reload.assert_not_called()
+
+        self.assertEqual(len(self.manager._event_definition_map), len(event_def_list))
+        self.assertEqual(self.manager._event_definition_map[event_def_list[-1].id].name, 'Event 499')
+        self.assertLessEqual(statistics.median(burst_latencies),
+                             3 * statistics.median(baseline_latencies) + 0.002)
+        return
+
+
 class TestEventManagerTransitionProcessing(AsyncEventManagerTestCase):
     """Test entity state transition processing and event detection."""
 
@@ -520,12 +636,8 @@ class TestEventManagerEventActions(AsyncEventManagerTestCase):
                 sensor_response_list=[sensor_response]
             )
             
-            # Mock external managers but let database operations proceed normally
-            mock_alert_manager = AsyncMock()
-            mock_controller_manager = AsyncMock()
-            
-            with patch.object(self.manager, 'alert_manager_async', return_value=mock_alert_manager), \
-                 patch.object(self.manager, 'controller_manager_async', return_value=mock_controller_manager), \
+            # Actions are only queued; the dispatcher's workers run them.
+            with patch('hi.apps.event.event_manager.EventActionDispatcher') as mock_dispatcher_class, \
                  patch.object(self.manager, 'security_manager') as mock_security:
                 
                 # Set current security level to HIGH to match alarm action
@@ -534,11 +646,13 @@ class TestEventManagerEventActions(AsyncEventManagerTestCase):
                 # Call method under test - let it use real database operations
                 await self.manager._do_new_event_action([event])
                 
-                # Examine the results - should have called alert manager with correct alarm
-                mock_alert_manager.upsert_alarm_async.assert_called_once()
-                alarm_call_args = mock_alert_manager.upsert_alarm_async.call_args[0][0]
-                self.assertEqual(alarm_call_args.title, 'Test Event')
-                self.assertEqual(alarm_call_args.alarm_level, AlarmLevel.CRITICAL)
+                # Examine the results - should have queued the correct alarm
+                mock_dispatcher = mock_dispatcher_class.return_value
+                mock_dispatcher.enqueue_alarm.assert_called_once()
+                alarm_call_kwargs = mock_dispatcher.enqueue_alarm.call_args.kwargs
+                self.assertEqual(alarm_call_kwargs['alarm'].title, 'Test Event')
+                self.assertEqual(alarm_call_kwargs['alarm'].alarm_level, AlarmLevel.CRITICAL)
+                self.assertTrue(alarm_call_kwargs['is_security'])
         
         self.run_async(async_test_logic())
         return
@@ -564,11 +678,7 @@ class TestEventManagerEventActions(AsyncEventManagerTestCase):
                 sensor_response_list=[sensor_response]
             )
             
-            # Mock external managers but let database operations proceed normally
-            mock_alert_manager = AsyncMock()
-            
-            with patch.object(self.manager, 'alert_manager_async', return_value=mock_alert_manager), \
-                 patch.object(self.manager, 'controller_manager_async'), \
+            with patch('hi.apps.event.event_manager.EventActionDispatcher') as mock_dispatcher_class, \
                  patch.object(self.manager, 'security_manager') as mock_security:
                 
                 # Set current security level to LOW (doesn't match HIGH alarm action)
@@ -577,8 +687,8 @@ class TestEventManagerEventActions(AsyncEventManagerTestCase):
                 # Call method under test - let it use real database operations
                 await self.manager._do_new_event_action([event])
                 
-                # Examine the results - should NOT have called alert manager
-                mock_alert_manager.upsert_alarm_async.assert_not_called()
+                # Examine the results - should NOT have queued an alarm
+                mock_dispatcher_class.return_value.enqueue_alarm.assert_not_called()
         
         self.run_async(async_test_logic())
         return
@@ -641,16 +751,18 @@ class TestEventManagerHelperMethods(BaseTestCase):
         
         manager = EventManager()
         
-        event_def = manager.create_simple_alarm_event_definition(
-            name='Simple Alarm Event',
-            event_type=EventType.SECURITY,
-            entity_state=entity_state,
-            value='on',
-            security_to_alarm_level=security_to_alarm_mapping,
-            event_window_secs=60,
-            dedupe_window_secs=300,
-            alarm_lifetime_secs=3600
-        )
+        with patch.object(ModelChangeDispatcher(), 'publish') as mock_publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                event_def = manager.create_simple_alarm_event_definition(
+                    name='Simple Alarm Event',
+                    event_type=EventType.SECURITY,
+                    entity_state=entity_state,
+                    value='on',
+                    security_to_alarm_level=security_to_alarm_mapping,
+                    event_window_secs=60,
+                    dedupe_window_secs=300,
+                    alarm_lifetime_secs=3600
+                )
         
         # Should create event definition
         self.assertEqual(event_def.name, 'Simple Alarm Event')
@@ -671,8 +783,11 @@ class TestEventManagerHelperMethods(BaseTestCase):
         self.assertEqual(action_levels[SecurityLevel.HIGH], AlarmLevel.CRITICAL)
         self.assertEqual(action_levels[SecurityLevel.LOW], AlarmLevel.WARNING)
         
-        # Should mark for reload
-        self.assertTrue(manager._event_definition_reload_needed)
+        # Should publish an incremental update rather than mark a full reload
+        published_ids = set()
+        for call in mock_publish.call_args_list:
+            published_ids.update(call.args[1].get_ids('event_definition'))
+        self.assertEqual(published_ids, {event_def.id})
         return
 
 
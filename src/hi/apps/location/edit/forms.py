@@ -21,6 +21,7 @@ class LocationSvgFileForm( SvgFileForm ):
 
     BACKGROUNDS_TEMPLATE_DIR = 'profiles/svg/backgrounds'
     DEFAULT_BACKGROUND_TEMPLATE = 'single-story-0.svg'
+    FLOOR_PLAN_PATH_PRECISION = 6
 
     def get_default_source_directory(self):
         return os.path.join(
@@ -43,6 +44,11 @@ class LocationSvgFileForm( SvgFileForm ):
     def get_media_destination_directory(self):
         return 'location/svg'
 
+    def get_path_precision(self):
+        # Six significant digits is well below a pixel at any zoom a floor
+        # plan is viewed at; CAD-level precision beyond that only adds bytes.
+        return self.FLOOR_PLAN_PATH_PRECISION
+
     
 class LocationAddForm( LocationSvgFileForm ):
 
@@ -0,0 +1,52 @@
+import logging
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from hi.apps.location.edit.forms import LocationSvgFileForm
+from hi.testing.base_test_case import BaseTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class TestLocationSvgFileFormPrecision(BaseTestCase):
+
+    def _upload(self, svg_content):
+        svg_file = SimpleUploadedFile(
+            name='cad_export.svg',
+            content=svg_content.encode('utf-8'),
+            content_type='image/svg+xml',
+        )
+        form = LocationSvgFileForm(
+            data={'has_dangerous_svg_items': 'false'},
+            files={'svg_file': svg_file},
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        svg_fragment_file = form.cleaned_data['svg_fragment_file']
+        try:
+            return svg_fragment_file.read()
+        finally:
+            svg_fragment_file.close()
+
+    def test_tiny_scale_cad_geometry_survives_upload(self):
+        """CAD exports in meters scale by tiny factors; rounding must not flatten them."""
+        fragment = self._upload(
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 0.02 0.01">'
+            '<g transform="matrix(0.00035 0 0 -0.00035 12.5 40.12345)">'
+            '<g transform="scale(0.0254)">'
+            '<path d="M 0.0012345678 0.0023456789 L 0.0154321 0.0098765"/>'
+            '<circle cx="0.00512345" cy="0.00498765" r="0.00012345"/>'
+            '</g></g></svg>'
+        )
+        self.assertIn('transform="matrix(0.00035 0 0 -0.00035 12.5 40.12345)"', fragment)
+        self.assertIn('transform="scale(0.0254)"', fragment)
+        self.assertIn('d="M 0.0012346 0.0023457 L 0.0154321 0.0098765"', fragment)
+        self.assertIn('cx="0.00512345"', fragment)
+        self.assertIn('r="0.00012345"', fragment)
+
+    def test_floor_plan_scale_geometry_is_still_reduced(self):
+        fragment = self._upload(
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 500">'
+            '<path d="M 123.456789123 456.123456789 L 987.654321987 12.3456789"/>'
+            '</svg>'
+        )
+        self.assertIn('d="M 123.457 456.123 L 987.654 12.346"', fragment)
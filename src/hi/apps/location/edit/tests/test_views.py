@@ -1,4 +1,5 @@
 import logging
+from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
@@ -115,6 +116,8 @@ class TestLocationAddView(DualModeViewTestCase):
         self.assertTrue(data['location'].startswith(home_url))
         # Normal add redirects to home with the location edit sidebar preloaded
         self.assertIn('details=', data['location'])
+        self.assertGreater(data['svg_import_stats']['fragment_bytes'], 0)
+        self.assertIn('peak_memory_bytes', data['svg_import_stats'])
         
         # Test that new Location was created
         self.assertEqual(Location.objects.count(), initial_location_count + 1)
@@ -279,6 +282,7 @@ class TestLocationSvgReplaceView(DualModeViewTestCase):
         response_data = response.json()
         expected_url = reverse('home')
         self.assertEqual(response_data['location'], expected_url)
+        self.assertEqual(response_data['svg_import_stats']['source_bytes'], len(svg_content))
         
         # Refresh from database to get updated values
         self.location.refresh_from_db()
@@ -291,6 +295,30 @@ class TestLocationSvgReplaceView(DualModeViewTestCase):
         # The filename should contain 'new_location' from our uploaded file
         self.assertIn('new_location', self.location.svg_fragment_filename)
 
+    def test_post_closes_fragment_file(self):
+        svg_file = SimpleUploadedFile(
+            'new_location.svg',
+            b'<svg viewBox="0 0 200 200" xmlns="http://www.w3.org/2000/svg"><rect width="200"/></svg>',
+            content_type='image/svg+xml'
+        )
+        fragment_file_list = list()
+        original_write = LocationManager._write_svg_fragment_file
+
+        def capture_write(manager, svg_fragment_filename, svg_fragment_file):
+            fragment_file_list.append(svg_fragment_file)
+            return original_write(manager, svg_fragment_filename, svg_fragment_file)
+
+        url = reverse('location_edit_svg_replace', kwargs={'location_id': self.location.id})
+        with patch.object(LocationManager, '_write_svg_fragment_file', autospec=True, side_effect=capture_write):
+            response = self.client.post(url, {
+                'svg_file': svg_file,
+                'has_dangerous_svg_items': 'false'
+            })
+
+        self.assertSuccessResponse(response)
+        self.assertEqual(len(fragment_file_list), 1)
+        self.assertTrue(fragment_file_list[0].closed)
+
     def test_nonexistent_location_returns_404(self):
         """Test that accessing nonexistent location returns 404."""
         url = reverse('location_edit_svg_replace', kwargs={'location_id': 99999})
@@ -137,25 +137,33 @@ class LocationAddView( HiModalView, LocationViewMixin ):
             }
             return self.modal_response( request, context )
 
+        svg_fragment_file = location_add_form.cleaned_data.get('svg_fragment_file')
         try:
             location = LocationManager().create_location(
                 name = location_add_form.cleaned_data.get('name'),
                 svg_fragment_filename = location_add_form.cleaned_data.get('svg_fragment_filename'),
-                svg_fragment_content = location_add_form.cleaned_data.get('svg_fragment_content'),
+                svg_fragment_file = svg_fragment_file,
                 svg_viewbox = location_add_form.cleaned_data.get('svg_viewbox'),
             )
         except ValueError as ve:
             raise BadRequest( str(ve) )
+        finally:
+            svg_fragment_file.close()
 
         location_view = location.views.order_by( 'order_id' ).first()
         request.view_parameters.view_type = ViewType.LOCATION_VIEW
         request.view_parameters.update_location_view( location_view )
         request.view_parameters.to_session( request )
 
-        return self.post_create_redirect( request, location, location_view )
+        return self.post_create_redirect(
+            request = request,
+            location = location,
+            location_view = location_view,
+            svg_import_stats = location_add_form.cleaned_data.get('svg_import_stats'),
+        )
 
-    def post_create_redirect( self, request, location, location_view ):
-        return self.redirect_to_location_edit_side_view( location )
+    def post_create_redirect( self, request, location, location_view, svg_import_stats ):
+        return self.redirect_to_location_edit_side_view( location, svg_import_stats = svg_import_stats )
 
 
 class LocationAddFirstView( LocationAddView ):
@@ -163,9 +171,9 @@ class LocationAddFirstView( LocationAddView ):
     def get_template_name( self ) -> str:
         return 'location/edit/modals/location_add_first.html'
 
-    def post_create_redirect( self, request, location, location_view ):
+    def post_create_redirect( self, request, location, location_view, svg_import_stats ):
         redirect_url = reverse( 'home' )
-        return antinode.redirect_response( redirect_url )
+        return self.svg_upload_redirect_response( redirect_url, svg_import_stats )
 
     
 @method_decorator( edit_required, name='dispatch' )
@@ -216,18 +224,24 @@ class LocationSvgReplaceView( HiModalView, LocationViewMixin ):
             }
             return self.modal_response( request, context )
 
+        svg_fragment_file = location_svg_file_form.cleaned_data.get('svg_fragment_file')
         try:
             location = LocationManager().update_location_svg(
                 location = location,
                 svg_fragment_filename = location_svg_file_form.cleaned_data.get('svg_fragment_filename'),
-                svg_fragment_content = location_svg_file_form.cleaned_data.get('svg_fragment_content'),
+                svg_fragment_file = svg_fragment_file,
                 svg_viewbox = location_svg_file_form.cleaned_data.get('svg_viewbox'),
             )
         except ValueError as ve:
             raise BadRequest( str(ve) )
+        finally:
+            svg_fragment_file.close()
 
         redirect_url = reverse('home')
-        return antinode.redirect_response( redirect_url )
+        return self.svg_upload_redirect_response(
+            redirect_url,
+            location_svg_file_form.cleaned_data.get('svg_import_stats'),
+        )
 
 
 class LocationPropertiesEditView( View, LocationViewMixin, LocationEditViewMixin ):
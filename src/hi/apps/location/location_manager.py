@@ -1,6 +1,7 @@
 from decimal import Decimal
 import os
-from typing import List
+import shutil
+from typing import List, TextIO
 
 from django.core.files.storage import default_storage, FileSystemStorage
 from django.db import transaction
@@ -55,7 +56,7 @@ class LocationManager(Singleton):
     def create_location( self,
                          name                   : str,
                          svg_fragment_filename  : str,
-                         svg_fragment_content   : str,
+                         svg_fragment_file      : TextIO,
                          svg_viewbox            : SvgViewBox ) -> LocationView:
 
         last_location = Location.objects.all().order_by( '-order_id' ).first()
@@ -64,9 +65,10 @@ class LocationManager(Singleton):
         else:
             order_id = 0
             
-        self._ensure_directory_exists( svg_fragment_filename )
-        with default_storage.open( svg_fragment_filename, 'w') as destination:
-            destination.write( svg_fragment_content )
+        self._write_svg_fragment_file(
+            svg_fragment_filename = svg_fragment_filename,
+            svg_fragment_file = svg_fragment_file,
+        )
         
         with transaction.atomic():
             location = Location.objects.create(
@@ -86,12 +88,13 @@ class LocationManager(Singleton):
     def update_location_svg( self,
                              location               : Location,
                              svg_fragment_filename  : str,
-                             svg_fragment_content   : str,
+                             svg_fragment_file      : TextIO,
                              svg_viewbox            : SvgViewBox ) -> LocationView:
 
-        self._ensure_directory_exists( svg_fragment_filename )
-        with default_storage.open( svg_fragment_filename, 'w') as destination:
-            destination.write( svg_fragment_content )
+        self._write_svg_fragment_file(
+            svg_fragment_filename = svg_fragment_filename,
+            svg_fragment_file = svg_fragment_file,
+        )
         
         location.svg_fragment_filename = svg_fragment_filename
         location.svg_view_box_str = str( svg_viewbox )
@@ -124,12 +127,9 @@ class LocationManager(Singleton):
         the Location model.
         """
         result = self.render_svg_template_to_media( svg_template_name )
-        self.update_location_svg(
-            location = location,
-            svg_fragment_filename = result['svg_fragment_filename'],
-            svg_fragment_content = result['svg_fragment_content'],
-            svg_viewbox = result['svg_viewbox'],
-        )
+        location.svg_fragment_filename = result['svg_fragment_filename']
+        location.svg_view_box_str = str( result['svg_viewbox'] )
+        location.save()
         return result
 
     def get_draft_svg_filename( self, location : Location ) -> str:
@@ -190,6 +190,16 @@ class LocationManager(Singleton):
         default_storage.delete( draft_filename )
         return
 
+    def _write_svg_fragment_file( self,
+                                  svg_fragment_filename  : str,
+                                  svg_fragment_file      : TextIO ):
+        # Copied in chunks since uploaded floor plans can be tens of MB.
+        self._ensure_directory_exists( svg_fragment_filename )
+        svg_fragment_file.seek(0)
+        with default_storage.open( svg_fragment_filename, 'w' ) as destination:
+            shutil.copyfileobj( svg_fragment_file, destination )
+        return
+
     def _ensure_directory_exists( self, filepath ):
         if isinstance( default_storage, FileSystemStorage ):
             directory = os.path.dirname( default_storage.path( filepath ))
@@ -1,10 +1,13 @@
 from dataclasses import dataclass
 from typing import Dict, Generator, List, Set
 
+from django.utils.safestring import SafeString
+
 from hi.apps.collection.models import Collection, CollectionPath, CollectionPosition
 from hi.apps.common.svg_models import SvgIconItem, SvgPathItem
 from hi.apps.entity.entity_state_role_order import ENTITY_PRIMARY_STATE_ORDERING
 from hi.apps.entity.models import Entity, EntityPosition, EntityPath
+from hi.apps.location.location_view_overlay_cache import LocationViewOverlayCache
 from hi.apps.location.svg_item_factory import SvgItemFactory
 from hi.apps.monitor.display_data import EntityStateDisplayData
 from hi.apps.monitor.status_data import EntityStateStatusData
@@ -38,6 +41,13 @@ class LocationViewData:
         self._state_id_map = self._get_state_id_map()
         return
 
+    def svg_overlay_html(self) -> SafeString:
+        return LocationViewOverlayCache().get_overlay_html(
+            location_view = self.location_view,
+            svg_path_items = list( self.svg_path_items() ),
+            svg_icon_items = list( self.svg_icon_items() ),
+        )
+    
     def svg_icon_items(self) -> Generator[ SvgIconItem, None, None ]:
 
         for entity_position in self.entity_positions:
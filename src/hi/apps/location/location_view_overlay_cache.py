@@ -0,0 +1,178 @@
+import logging
+from threading import Lock
+from typing import Dict, List, Tuple
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.template.loader import get_template
+from django.utils.safestring import SafeString, mark_safe
+
+from hi.apps.collection.models import (
+    Collection,
+    CollectionPath,
+    CollectionPosition,
+    CollectionView,
+)
+from hi.apps.common.singleton import Singleton
+from hi.apps.common.svg_models import SvgIconItem, SvgPathItem
+from hi.apps.entity.models import Entity, EntityPath, EntityPosition, EntityView
+
+from .models import Location, LocationView
+
+logger = logging.getLogger(__name__)
+
+
+class _CachedOverlay:
+
+    def __init__( self, generation : int ):
+        self.generation = generation
+        self.fragment_by_fingerprint : Dict[ Tuple, str ] = dict()
+        self.fingerprints : Tuple = tuple()
+        self.overlay_html : SafeString = mark_safe( '' )
+        return
+
+
+class LocationViewOverlayCache( Singleton ):
+    """
+    Rendered entity/collection SVG overlay layer, per LocationView.
+
+    The overlay markup depends on item geometry (positions and paths),
+    entity/collection types and LocationView membership, which only change
+    in edit mode, and on the initial status styling of each item, which
+    changes with sensor readings.  Each item is fingerprinted on all the
+    values its markup depends on, so:
+
+      - When nothing changed, the whole previously rendered layer is
+        returned as-is.
+      - When only some item statuses changed, only those items are
+        re-rendered and the layer is re-spliced from cached fragments.
+
+    Any save/delete of the models that define the layer bumps a
+    generation counter, which discards all cached fragments, so edits
+    never see stale markup and fragments for removed items do not
+    accumulate.
+    """
+
+    SVG_ICON_ITEM_TEMPLATE_NAME = 'location/panes/svg_icon_item.html'
+    SVG_PATH_ITEM_TEMPLATE_NAME = 'location/panes/svg_path_item.html'
+
+    # Status churn creates new fragments for an item while the old ones
+    # remain cached. Bound that by pruning once the fragment count exceeds
+    # this multiple of the current item count.
+    MAX_FRAGMENTS_PER_ITEM = 4
+
+    def __init_singleton__(self):
+        self._overlays : Dict[ int, _CachedOverlay ] = dict()
+        self._generation = 0
+        self._lock = Lock()
+        return
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._overlays = dict()
+        return
+
+    def get_overlay_html( self,
+                          location_view   : LocationView,
+                          svg_path_items  : List[ SvgPathItem ],
+                          svg_icon_items  : List[ SvgIconItem ] ) -> SafeString:
+        # Paths are drawn before icons so icons stay clickable on top.
+        template_item_list = (
+            [ ( self.SVG_PATH_ITEM_TEMPLATE_NAME, 'svg_path_item', x ) for x in svg_path_items ]
+            + [ ( self.SVG_ICON_ITEM_TEMPLATE_NAME, 'svg_icon_item', x ) for x in svg_icon_items ]
+        )
+        fingerprints = tuple([ self._get_fingerprint( svg_item = x[2] ) for x in template_item_list ])
+
+        with self._lock:
+            generation = self._generation
+            cached_overlay = self._overlays.get( location_view.id )
+        if ( cached_overlay is None ) or ( cached_overlay.generation != generation ):
+            cached_overlay = _CachedOverlay( generation = generation )
+
+        if fingerprints == cached_overlay.fingerprints:
+            return cached_overlay.overlay_html
+
+        fragment_list = list()
+        for ( template_name, context_name, svg_item ), fingerprint in zip( template_item_list, fingerprints ):
+            fragment = cached_overlay.fragment_by_fingerprint.get( fingerprint )
+            if fragment is None:
+                template = get_template( template_name )
+                fragment = template.render({ context_name: svg_item })
+                cached_overlay.fragment_by_fingerprint[fingerprint] = fragment
+            fragment_list.append( fragment )
+            continue
+
+        fragment_by_fingerprint = cached_overlay.fragment_by_fingerprint
+        max_fragment_count = self.MAX_FRAGMENTS_PER_ITEM * max( len( fingerprints ), 1 )
+        if len( fragment_by_fingerprint ) > max_fragment_count:
+            fragment_by_fingerprint = dict( zip( fingerprints, fragment_list ))
+
+        # Replaced rather than updated in place so concurrent readers always
+        # see a consistent fingerprints/html pair.
+        updated_overlay = _CachedOverlay( generation = generation )
+        updated_overlay.fragment_by_fingerprint = fragment_by_fingerprint
+        updated_overlay.fingerprints = fingerprints
+        updated_overlay.overlay_html = mark_safe( ''.join( fragment_list ))
+
+        with self._lock:
+            if self._generation == generation:
+                self._overlays[location_view.id] = updated_overlay
+        return updated_overlay.overlay_html
+
+    def _get_fingerprint( self, svg_item ) -> Tuple:
+        if isinstance( svg_item, SvgIconItem ):
+            return (
+                SvgIconItem,
+                svg_item.html_id,
+                svg_item.state_id,
+                svg_item.status_value,
+                svg_item.template_name,
+                svg_item.bounding_box.width,
+                svg_item.bounding_box.height,
+                svg_item.position_x,
+                svg_item.position_y,
+                svg_item.rotate,
+                svg_item.scale,
+            )
+        return (
+            SvgPathItem,
+            svg_item.html_id,
+            svg_item.state_id,
+            svg_item.svg_path,
+            svg_item.stroke_color,
+            svg_item.stroke_width,
+            tuple( svg_item.stroke_dasharray or () ),
+            svg_item.fill_color,
+            svg_item.fill_opacity,
+        )
+
+
+@receiver( post_save, sender = Location )
+@receiver( post_save, sender = LocationView )
+@receiver( post_save, sender = Entity )
+@receiver( post_save, sender = EntityPosition )
+@receiver( post_save, sender = EntityPath )
+@receiver( post_save, sender = EntityView )
+@receiver( post_save, sender = Collection )
+@receiver( post_save, sender = CollectionPosition )
+@receiver( post_save, sender = CollectionPath )
+@receiver( post_save, sender = CollectionView )
+@receiver( post_delete, sender = Location )
+@receiver( post_delete, sender = LocationView )
+@receiver( post_delete, sender = Entity )
+@receiver( post_delete, sender = EntityPosition )
+@receiver( post_delete, sender = EntityPath )
+@receiver( post_delete, sender = EntityView )
+@receiver( post_delete, sender = Collection )
+@receiver( post_delete, sender = CollectionPosition )
+@receiver( post_delete, sender = CollectionPath )
+@receiver( post_delete, sender = CollectionView )
+def location_view_overlay_model_changed( sender, instance, **kwargs ):
+    logger.debug( f'Invalidating location view overlays on {sender.__name__} change.' )
+    LocationViewOverlayCache().invalidate()
+    return
@@ -9,6 +9,8 @@ like once you've decided where").
 * ``view_center`` — the center of the current viewbox.
 * ``grid_slot`` — one slot of a centered grid laid over the
   viewbox; used to lay out a group of entities arriving together.
+* ``free_grid_slots`` — grid slots for a group of new items that
+  avoid points already occupied by existing items.
 * ``clamp_to_viewbox`` — keep a point inside the viewbox margin.
 * ``default_icon_scale`` — entity-aware icon scale: ~10% of the
   viewbox's smaller dimension, clamped to the location's
@@ -26,7 +28,7 @@ heuristic live here as the canonical home.
 from decimal import Decimal
 import math
 import re
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from hi.apps.location.models import LocationView
 from hi.hi_styles import EntityStyle
@@ -41,6 +43,9 @@ class PositionGeometry:
     # viewbox without clamping.
     DEFAULT_GRID_SPACING_FRACTION = 0.12
     DEFAULT_VIEWBOX_MARGIN_FRACTION = 0.05
+    # Largest grid ``free_grid_slots`` will try, as a multiple of the
+    # new plus occupied item count.
+    FREE_GRID_MAX_GROWTH_FACTOR = 4
 
     @classmethod
     def view_center( cls, location_view : LocationView ) -> Tuple[float, float]:
@@ -110,6 +115,85 @@ class PositionGeometry:
             view_box = view_box,
         )
 
+    @classmethod
+    def free_grid_slots( cls,
+                         location_view    : LocationView,
+                         slot_count       : int,
+                         occupied_points  : Sequence[ Tuple[ float, float ] ] ) -> List[ Tuple[ float, float ] ]:
+        """Return ``slot_count`` grid slots whose icon-sized footprint
+        does not overlap any of the occupied points, preferring the
+        free slots nearest the view center. The grid grows until enough
+        slots are free; if even the largest grid tried comes up short,
+        occupied slots fill the remainder so that every new item still
+        gets a slot."""
+        if slot_count <= 0:
+            return []
+
+        clearance = cls.slot_clearance( location_view )
+        occupied_cells = dict()
+        for svg_x, svg_y in occupied_points:
+            cell = ( math.floor( svg_x / clearance ), math.floor( svg_y / clearance ) )
+            occupied_cells.setdefault( cell, [] ).append( ( svg_x, svg_y ) )
+            continue
+
+        def is_occupied( svg_x, svg_y ):
+            cell_x = math.floor( svg_x / clearance )
+            cell_y = math.floor( svg_y / clearance )
+            for neighbor_x in ( cell_x - 1, cell_x, cell_x + 1 ):
+                for neighbor_y in ( cell_y - 1, cell_y, cell_y + 1 ):
+                    for point_x, point_y in occupied_cells.get( ( neighbor_x, neighbor_y ), () ):
+                        if (( abs( point_x - svg_x ) < clearance )
+                                and ( abs( point_y - svg_y ) < clearance )):
+                            return True
+                        continue
+                    continue
+                continue
+            return False
+
+        # A centered grid only opens up free slots around occupied
+        # points once it is a few times larger than the item count, so
+        # grow geometrically to keep the number of passes small.
+        max_grid_total = cls.FREE_GRID_MAX_GROWTH_FACTOR * ( slot_count + len( occupied_points ))
+        grid_total = slot_count
+        while True:
+            grid_slot_list = [
+                cls.grid_slot(
+                    location_view = location_view,
+                    grid_index = grid_index,
+                    grid_total = grid_total,
+                )
+                for grid_index in range( grid_total )
+            ]
+            free_slot_list = [ x for x in grid_slot_list if not is_occupied( *x ) ]
+            if len( free_slot_list ) >= slot_count:
+                break
+            if grid_total >= max_grid_total:
+                free_slot_set = set( free_slot_list )
+                occupied_slot_list = [ x for x in grid_slot_list if x not in free_slot_set ]
+                shortfall = slot_count - len( free_slot_list )
+                return free_slot_list + occupied_slot_list[:shortfall]
+            grid_total = min( max( grid_total + 1, math.ceil( grid_total * 1.5 )), max_grid_total )
+            continue
+
+        if len( free_slot_list ) == slot_count:
+            return free_slot_list
+
+        center_x, center_y = cls.view_center( location_view )
+        nearest_index_list = sorted(
+            range( len( free_slot_list )),
+            key = lambda index: math.hypot( free_slot_list[index][0] - center_x,
+                                            free_slot_list[index][1] - center_y ),
+        )[:slot_count]
+        return [ free_slot_list[index] for index in sorted( nearest_index_list ) ]
+
+    @classmethod
+    def slot_clearance( cls, location_view : LocationView ) -> float:
+        """Minimum center-to-center distance (per axis) for two default
+        sized icons not to overlap."""
+        view_box = location_view.svg_view_box
+        size_fraction = cls.DEFAULT_ICON_SIZE_PERCENT_OF_VIEWBOX / 100.0
+        return max( min( view_box.width, view_box.height ) * size_fraction, 1e-6 )
+
     @classmethod
     def clamp_to_viewbox( cls,
                           svg_x    : float,
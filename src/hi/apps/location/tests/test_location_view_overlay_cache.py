@@ -0,0 +1,169 @@
+import logging
+from unittest.mock import patch
+
+from django.template.loader import get_template
+
+from hi.apps.common.svg_models import SvgIconItem, SvgPathItem, SvgViewBox
+from hi.apps.entity.models import EntityPosition, EntityView
+from hi.apps.location.location_manager import LocationManager
+from hi.apps.location.location_view_overlay_cache import LocationViewOverlayCache
+from hi.apps.location.tests.synthetic_data import LocationSyntheticData
+from hi.testing.base_test_case import BaseTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+def _make_icon_item(html_id, status_value='idle', position_x=10.0):
+    return SvgIconItem(
+        html_id=html_id,
+        state_id=None,
+        status_value=status_value,
+        template_name='entity/svg/type.light.svg',
+        bounding_box=SvgViewBox(x=0, y=0, width=32, height=32),
+        position_x=position_x,
+        position_y=20.0,
+        rotate=0.0,
+        scale=1.0,
+    )
+
+
+def _make_path_item(html_id, stroke_color='#000000'):
+    return SvgPathItem(
+        html_id=html_id,
+        state_id=None,
+        svg_path='M 0,0 L 10,10 Z',
+        stroke_color=stroke_color,
+        stroke_width=2.0,
+        stroke_dasharray=[],
+        fill_color='#ffffff',
+        fill_opacity=0.5,
+    )
+
+
+class TestLocationViewOverlayCache(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        LocationViewOverlayCache._instance = None
+        self.cache = LocationViewOverlayCache()
+        self.location_view = LocationSyntheticData.create_test_location_view()
+        return
+
+    def tearDown(self):
+        LocationViewOverlayCache._instance = None
+        super().tearDown()
+        return
+
+    def _render_count_while(self, callable_fn):
+        real_get_template = get_template
+        render_calls = []
+
+        def counting_get_template(template_name):
+            render_calls.append(template_name)
+            return real_get_template(template_name)
+
+        with patch('hi.apps.location.location_view_overlay_cache.get_template',
+                   side_effect=counting_get_template):
+            result = callable_fn()
+        return result, len(render_calls)
+
+    def test_overlay_matches_individual_item_rendering(self):
+        icon_item = _make_icon_item('hi-entity-1')
+        path_item = _make_path_item('hi-entity-2')
+
+        html = self.cache.get_overlay_html(
+            location_view=self.location_view,
+            svg_path_items=[path_item],
+            svg_icon_items=[icon_item],
+        )
+
+        expected = (
+            get_template('location/panes/svg_path_item.html').render({'svg_path_item': path_item})
+            + get_template('location/panes/svg_icon_item.html').render({'svg_icon_item': icon_item})
+        )
+        self.assertEqual(html, expected)
+        # Paths are drawn before icons.
+        self.assertLess(html.index('hi-entity-2'), html.index('hi-entity-1'))
+
+    def test_unchanged_overlay_is_not_re_rendered(self):
+        icon_items = [_make_icon_item(f'hi-entity-{i}') for i in range(10)]
+        first_html, first_renders = self._render_count_while(
+            lambda: self.cache.get_overlay_html(self.location_view, [], icon_items)
+        )
+        second_html, second_renders = self._render_count_while(
+            lambda: self.cache.get_overlay_html(self.location_view, [], icon_items)
+        )
+        self.assertEqual(first_renders, 10)
+        self.assertEqual(second_renders, 0)
+        self.assertIs(first_html, second_html)
+
+    def test_status_change_re_renders_only_changed_item(self):
+        icon_items = [_make_icon_item(f'hi-entity-{i}') for i in range(10)]
+        self.cache.get_overlay_html(self.location_view, [], icon_items)
+
+        icon_items[3] = _make_icon_item('hi-entity-3', status_value='active')
+        html, render_count = self._render_count_while(
+            lambda: self.cache.get_overlay_html(self.location_view, [], icon_items)
+        )
+        self.assertEqual(render_count, 1)
+        self.assertIn('status="active"', html)
+
+    def test_position_save_invalidates_overlay(self):
+        location = self.location_view.location
+        entity = LocationSyntheticData.create_test_entity_with_position(location=location)
+        EntityView.objects.create(entity=entity, location_view=self.location_view)
+
+        manager = LocationManager()
+        location_view_data = manager.get_location_view_data(
+            location_view=self.location_view,
+            include_status_display_data=False,
+        )
+        generation_before = self.cache.generation
+        location_view_data.svg_overlay_html()
+
+        entity_position = EntityPosition.objects.get(entity=entity, location=location)
+        entity_position.svg_x = 321
+        entity_position.save()
+        self.assertGreater(self.cache.generation, generation_before)
+
+        location_view_data = manager.get_location_view_data(
+            location_view=self.location_view,
+            include_status_display_data=False,
+        )
+        html, render_count = self._render_count_while(location_view_data.svg_overlay_html)
+        self.assertEqual(render_count, 1)
+        self.assertIn(entity.html_id, html)
+
+    def test_location_view_save_invalidates_overlay(self):
+        icon_items = [_make_icon_item('hi-entity-1')]
+        self.cache.get_overlay_html(self.location_view, [], icon_items)
+
+        self.location_view.svg_rotate = 45
+        self.location_view.save()
+
+        _, render_count = self._render_count_while(
+            lambda: self.cache.get_overlay_html(self.location_view, [], icon_items)
+        )
+        self.assertEqual(render_count, 1)
+
+    def test_overlays_are_per_location_view(self):
+        other_location_view = LocationSyntheticData.create_test_location_view(
+            location=self.location_view.location,
+        )
+        self.cache.get_overlay_html(self.location_view, [], [_make_icon_item('hi-entity-1')])
+        other_html = self.cache.get_overlay_html(
+            other_location_view, [], [_make_icon_item('hi-entity-9')],
+        )
+        self.assertIn('hi-entity-9', other_html)
+        self.assertNotIn('hi-entity-1', other_html)
+
+    def test_fragment_cache_is_bounded_under_status_churn(self):
+        for iteration in range(50):
+            icon_items = [_make_icon_item('hi-entity-1', status_value=f'status-{iteration}')]
+            self.cache.get_overlay_html(self.location_view, [], icon_items)
+            continue
+        cached_overlay = self.cache._overlays[self.location_view.id]
+        self.assertLessEqual(
+            len(cached_overlay.fragment_by_fingerprint),
+            LocationViewOverlayCache.MAX_FRAGMENTS_PER_ITEM + 1,
+        )
@@ -155,3 +155,69 @@ class TestPositionGeometryPathCenter(BaseTestCase):
         x, y = PositionGeometry.path_center('M -10,-5 L 10,5')
         self.assertAlmostEqual(x, 0.0)
         self.assertAlmostEqual(y, 0.0)
+
+
+class TestPositionGeometryFreeGridSlots(BaseTestCase):
+
+    def _make_view(self, x, y, width, height):
+        from hi.apps.common.svg_models import SvgViewBox
+
+        location_view = Mock()
+        location_view.svg_view_box = SvgViewBox(x=x, y=y, width=width, height=height)
+        return location_view
+
+    def test_no_occupied_points_matches_grid(self):
+        view = self._make_view(0, 0, 1000, 1000)
+        slots = PositionGeometry.free_grid_slots(
+            location_view=view, slot_count=5, occupied_points=[],
+        )
+        expected = [
+            PositionGeometry.grid_slot(location_view=view, grid_index=i, grid_total=5)
+            for i in range(5)
+        ]
+        self.assertEqual(slots, expected)
+
+    def test_zero_slots_returns_empty(self):
+        view = self._make_view(0, 0, 1000, 1000)
+        self.assertEqual(
+            PositionGeometry.free_grid_slots(location_view=view, slot_count=0, occupied_points=[(1, 1)]),
+            [],
+        )
+
+    def test_occupied_center_is_avoided(self):
+        view = self._make_view(0, 0, 1000, 1000)
+        center = PositionGeometry.view_center(view)
+        slots = PositionGeometry.free_grid_slots(
+            location_view=view, slot_count=1, occupied_points=[center],
+        )
+        self.assertEqual(len(slots), 1)
+        clearance = PositionGeometry.slot_clearance(view)
+        self.assertTrue(
+            abs(slots[0][0] - center[0]) >= clearance
+            or abs(slots[0][1] - center[1]) >= clearance
+        )
+
+    def test_slots_avoid_all_occupied_points(self):
+        view = self._make_view(0, 0, 1000, 1000)
+        occupied = [
+            PositionGeometry.grid_slot(location_view=view, grid_index=i, grid_total=9)
+            for i in range(9)
+        ]
+        slots = PositionGeometry.free_grid_slots(
+            location_view=view, slot_count=9, occupied_points=occupied,
+        )
+        self.assertEqual(len(slots), 9)
+        clearance = PositionGeometry.slot_clearance(view)
+        for slot_x, slot_y in slots:
+            for point_x, point_y in occupied:
+                self.assertFalse(
+                    abs(slot_x - point_x) < clearance and abs(slot_y - point_y) < clearance
+                )
+
+    def test_always_returns_requested_count_when_crowded(self):
+        view = self._make_view(0, 0, 100, 100)
+        occupied = [(x, y) for x in range(0, 100, 2) for y in range(0, 100, 2)]
+        slots = PositionGeometry.free_grid_slots(
+            location_view=view, slot_count=7, occupied_points=occupied,
+        )
+        self.assertEqual(len(slots), 7)
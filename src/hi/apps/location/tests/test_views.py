@@ -52,9 +52,9 @@ class TestLocationViewDefaultView(SyncViewTestCase):
         expected_url = reverse('location_view', kwargs={'location_view_id': self.location_view.id})
         self.assertEqual(response.url, expected_url)
         
-        # Should set view parameters in session
-        session = self.client.session
-        self.assertEqual(session.get('view_type'), str(ViewType.LOCATION_VIEW))
+        # Should set view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_type, ViewType.LOCATION_VIEW)
 
     @patch.object(LocationManager, 'get_default_location_view')
     def test_redirect_to_start_when_no_location_view(self, mock_get_default):
@@ -201,9 +201,9 @@ class TestLocationViewView(DualModeViewTestCase):
 
         self.assertSuccessResponse(response)
         
-        # Should set view type and location view in session
-        session = self.client.session
-        self.assertEqual(session.get('view_type'), str(ViewType.LOCATION_VIEW))
+        # Should set view type and location view
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_type, ViewType.LOCATION_VIEW)
 
     def test_nonexistent_location_view_returns_404(self):
         """Test that accessing nonexistent location view returns 404."""
@@ -260,9 +260,9 @@ class TestLocationSwitchView(SyncViewTestCase):
         expected_url = reverse('location_view', kwargs={'location_view_id': self.location_view1.id})
         self.assertEqual(response.url, expected_url)
         
-        # Should set view parameters in session
-        session = self.client.session
-        self.assertEqual(session.get('view_type'), str(ViewType.LOCATION_VIEW))
+        # Should set view parameters
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_type, ViewType.LOCATION_VIEW)
 
     def test_switch_to_location_with_no_views(self):
         """Test switching to location with no views raises BadRequest."""
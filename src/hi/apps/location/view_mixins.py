@@ -5,6 +5,7 @@ from django.http import Http404, HttpResponse
 from django.urls import reverse
 
 import hi.apps.common.antinode as antinode
+from hi.apps.common.svg_models import SvgImportStats
 from hi.apps.entity.models import Entity
 from hi.apps.location.location_manager import LocationManager
 from hi.apps.location.models import Location, LocationView
@@ -45,14 +46,27 @@ class LocationViewMixin:
         except LocationView.DoesNotExist:
             raise Http404( request )
 
-    def redirect_to_location_edit_side_view( self, location : Location ) -> HttpResponse:
+    def redirect_to_location_edit_side_view( self,
+                                             location          : Location,
+                                             svg_import_stats  : SvgImportStats  = None ) -> HttpResponse:
         """ Redirect to home with the location edit sidebar loaded alongside. """
         side_url = reverse( 'location_edit_mode', kwargs={ 'location_id': location.id } )
         redirect_url = (
             reverse( 'home' )
             + '?' + urllib.parse.urlencode({ HiSideView.SIDE_URL_PARAM_NAME: side_url })
         )
-        return antinode.redirect_response( redirect_url )
+        return self.svg_upload_redirect_response( redirect_url, svg_import_stats )
+
+    def svg_upload_redirect_response( self,
+                                      redirect_url      : str,
+                                      svg_import_stats  : SvgImportStats  = None ) -> HttpResponse:
+        """ Redirect, reporting the import stats when an SVG was just uploaded. """
+        if not svg_import_stats:
+            return antinode.redirect_response( redirect_url )
+        return antinode.http_response({
+            'location': redirect_url,
+            'svg_import_stats': svg_import_stats.to_dict(),
+        })
 
     def get_entity_svg_update_reponse( self, entity : Entity ) -> HttpResponse:
         """ For updating a single entity in the location view vis antinode reponse """
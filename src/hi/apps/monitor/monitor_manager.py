@@ -10,6 +10,7 @@ from django.conf import settings
 
 from hi.apps.common.singleton import Singleton
 from hi.apps.common.module_utils import import_module_safe
+from hi.apps.system.timing_metrics import EventLoopLagSampler
 
 from .periodic_monitor import PeriodicMonitor
 
@@ -51,6 +52,9 @@ class AppMonitorManager( Singleton ):
             self._initialized = True
             self._monitor_event_loop = event_loop
 
+        asyncio.create_task( EventLoopLagSampler( loop_name = 'App Monitors' ).run(),
+                             name = 'App-event-loop-lag' )
+
         # Discovery and instantiation (no lock needed for discovery)
         logger.info('Discovering and starting app monitors...')
         periodic_monitor_class_list = self._discover_periodic_monitors()
@@ -1,7 +1,10 @@
 import asyncio
 import logging
+import time
 
+from hi.apps.system.enums import TimingMetricType
 from hi.apps.system.health_status_provider import HealthStatusProvider
+from hi.apps.system.timing_metrics import TimingMetrics
 
 
 class PeriodicMonitor( HealthStatusProvider ):
@@ -40,7 +43,14 @@ class PeriodicMonitor( HealthStatusProvider ):
             self._logger.debug( f"{self.__class__.__name__} initialized successfully,"
                                 f" entering monitoring loop")
 
+            scheduled_start_time = None
             while self._is_running:
+                if scheduled_start_time is not None:
+                    TimingMetrics().record(
+                        TimingMetricType.MONITOR_START_LAG,
+                        self.id,
+                        time.perf_counter() - scheduled_start_time,
+                    )
                 try:
                     await self.run_query()
                     self.record_heartbeat()
@@ -53,6 +63,7 @@ class PeriodicMonitor( HealthStatusProvider ):
                 # Log sleep phase for debugging hanging issues
                 self._logger.debug(f"{self.__class__.__name__} sleeping"
                                    f" for {self._query_interval_secs}s")
+                scheduled_start_time = time.perf_counter() + self._query_interval_secs
                 await asyncio.sleep(self._query_interval_secs)
                 self._logger.debug( f"{self.__class__.__name__} woke up,"
                                     f" checking if still running: {self._is_running}")
@@ -89,6 +100,7 @@ class PeriodicMonitor( HealthStatusProvider ):
 
         import hi.apps.common.datetimeproxy as datetimeproxy
         query_start_time = datetimeproxy.now()
+        cycle_start_time = time.perf_counter()
 
         try:
             await self.do_work()
@@ -128,6 +140,14 @@ class PeriodicMonitor( HealthStatusProvider ):
             # path that fires alarms on HEALTHY -> ERROR transitions.
             self.record_error( error_message )
             # Don't re-raise - the monitor loop in start() will continue despite failures
+        finally:
+            # Failed cycles count too: a timing-out upstream is exactly
+            # what shows up as a slow cycle.
+            TimingMetrics().record(
+                TimingMetricType.MONITOR_CYCLE,
+                self.id,
+                time.perf_counter() - cycle_start_time,
+            )
         return
 
     async def do_work(self) -> None:
@@ -3,10 +3,11 @@ from cachetools import TTLCache
 from typing import Dict, List, Set, Sequence
 
 from django.conf import settings
-from django.db.models import prefetch_related_objects
+from django.db.models import Q
 
 from hi.apps.control.transient_models import ControllerData
 from hi.apps.common.singleton import Singleton
+from hi.apps.entity.entity_pairing_manager import EntityPairingManager
 from hi.apps.entity.models import Entity, EntityState
 from hi.apps.location.svg_item_factory import SvgItemFactory
 from hi.apps.sense.models import Sensor
@@ -122,12 +123,13 @@ class StatusDisplayManager( Singleton, SensorResponseMixin ):
         if entity.has_live_feed:
             entity_for_video = entity
 
-        entity_state_set = set( entity.states.all() )
-        for entity_state_delegation in entity.entity_state_delegations.all():
-            entity_state_set.add( entity_state_delegation.entity_state )
-            if ( not entity_for_video
-                 and entity_state_delegation.entity_state.entity.has_live_feed ):
-                entity_for_video = entity_state_delegation.entity_state.entity
+        entity_state_list = self.get_entity_to_entity_state_list( entities = [ entity ] )[entity]
+        entity_state_set = set( entity_state_list )
+        for entity_state in entity_state_list:
+            if entity_state.entity_id == entity.id:
+                continue
+            if not entity_for_video and entity_state.entity.has_live_feed:
+                entity_for_video = entity_state.entity
             continue
 
         entity_state_to_status_data = self._get_entity_state_to_entity_state_status_data(
@@ -190,14 +192,10 @@ class StatusDisplayManager( Singleton, SensorResponseMixin ):
         # Gather all EntityStates for all Entities so we can issue a single
         # fetch of the latest SensorResponses.
         #
-        entity_to_entity_state_set = { x: set( x.states.all() ) for x in entities }
+        entity_to_entity_state_list = self.get_entity_to_entity_state_list( entities = entities )
         all_entity_states = set()
-        for entity, entity_state_set in entity_to_entity_state_set.items():
-            all_entity_states.update( entity_state_set )
-            for entity_state_delegation in entity.entity_state_delegations.all():
-                entity_state_set.add( entity_state_delegation.entity_state )
-                all_entity_states.add( entity_state_delegation.entity_state )
-                continue
+        for entity_state_list in entity_to_entity_state_list.values():
+            all_entity_states.update( entity_state_list )
             continue
 
         # Includes a single fetch for getting all latest sensor data.
@@ -299,22 +297,12 @@ class StatusDisplayManager( Singleton, SensorResponseMixin ):
         ``ENTITY_PRIMARY_STATE_ORDERING`` — no EntityStateType
         pre-filter is applied here."""
 
-        # Batch-prefetch the relations this flow will walk so the
-        # per-entity loop below doesn't issue 2N delegation/states
-        # queries and the downstream sensor/controller fetches don't
-        # add 2M more.
-        prefetch_related_objects(
-            list( entities ),
-            'states__sensors',
-            'states__controllers',
-            'entity_state_delegations__entity_state__sensors',
-            'entity_state_delegations__entity_state__controllers',
-        )
+        entity_to_all_entity_state_list = self.get_entity_to_entity_state_list( entities = entities )
 
         entity_to_entity_state_list = dict()
         all_entity_states = set()
         for entity in entities:
-            entity_states = self.all_entity_states_including_delegations( entity )
+            entity_states = entity_to_all_entity_state_list[entity]
             if not entity_states:
                 continue
             entity_to_entity_state_list[entity] = entity_states
@@ -341,28 +329,61 @@ class StatusDisplayManager( Singleton, SensorResponseMixin ):
             self, entity : Entity ) -> List[ EntityState ]:
         """All EntityStates the entity exposes for status display:
         its own ``states`` plus any states delegated from principals
-        via ``EntityStateDelegation``. Deduplicated to guard against
-        the unusual case of an entity delegating one of its own
-        states or two delegations resolving to the same state.
-
-        ``.all()`` is used (not ``.select_related(...).all()``) so
-        callers that have prefetched ``entity_state_delegations__
-        entity_state`` use the cache. For single-entity callers with
-        no prefetch, the additional FK fetch per delegation is
-        bounded and acceptable."""
-        seen = set()
-        result = []
-        for d in entity.entity_state_delegations.all():
-            if d.entity_state.id in seen:
+        via ``EntityStateDelegation``. See
+        ``get_entity_to_entity_state_list``."""
+        return self.get_entity_to_entity_state_list( entities = [ entity ] )[entity]
+
+    def get_entity_to_entity_state_list(
+            self,
+            entities : Sequence[ Entity ] ) -> Dict[ Entity, List[ EntityState ] ]:
+        """Each entity's own states plus any states delegated from
+        principals, delegated states first. Deduplicated to guard
+        against the unusual case of an entity delegating one of its
+        own states or two delegations resolving to the same state.
+
+        Delegations come from the cached delegation graph, so all the
+        states, with their entity, sensors and controllers, are loaded
+        in a fixed number of queries however many entities are
+        passed."""
+        delegation_graph = EntityPairingManager().get_delegation_graph()
+        entity_ids = set()
+        delegated_state_ids = set()
+        for entity in entities:
+            entity_ids.add( entity.id )
+            delegated_state_ids.update( delegation_graph.get_delegated_entity_state_ids( entity.id ) )
+            continue
+
+        entity_state_by_id = dict()
+        entity_states_by_entity_id = dict()
+        if entity_ids:
+            entity_state_queryset = EntityState.objects.filter(
+                Q( entity_id__in = entity_ids ) | Q( id__in = delegated_state_ids )
+            ).select_related( 'entity' ).prefetch_related( 'sensors', 'controllers' ).order_by( 'id' )
+            for entity_state in entity_state_queryset:
+                entity_state_by_id[entity_state.id] = entity_state
+                entity_states_by_entity_id.setdefault( entity_state.entity_id, list() ).append( entity_state )
                 continue
-            seen.add( d.entity_state.id )
-            result.append( d.entity_state )
-        for state in entity.states.all():
-            if state.id in seen:
+
+        entity_to_entity_state_list = dict()
+        for entity in entities:
+            seen = set()
+            result = []
+            for entity_state_id in delegation_graph.get_delegated_entity_state_ids( entity.id ):
+                entity_state = entity_state_by_id.get( entity_state_id )
+                if entity_state is None or entity_state_id in seen:
+                    continue
+                seen.add( entity_state_id )
+                result.append( entity_state )
                 continue
-            seen.add( state.id )
-            result.append( state )
-        return result
+            for entity_state in entity_states_by_entity_id.get( entity.id, list() ):
+                if entity_state.id in seen:
+                    continue
+                seen.add( entity_state.id )
+                result.append( entity_state )
+                continue
+            entity_to_entity_state_list[entity] = result
+            continue
+        return entity_to_entity_state_list
 
     def get_latest_sensor_response( self, entity_state : EntityState ) -> SensorResponse:
         sensor_list = list( entity_state.sensors.all() )
@@ -271,3 +271,42 @@ class TestStatusDisplayManager(BaseTestCase):
         self.assertNotIn('svg_style', result[state_id_key])
         self.assertNotIn('status', result[state_id_key])
         self.assertIn('display', result[state_id_key])
+
+
+class TestStatusDisplayManagerDelegatedStates(BaseTestCase):
+
+    def _create_sensor_with_area(self, index):
+        from hi.apps.entity.models import EntityStateDelegation
+        principal = Entity.objects.create(name=f'Motion {index}', entity_type_str='MOTION_SENSOR')
+        entity_state = EntityState.objects.create(
+            entity=principal, entity_state_type_str='MOVEMENT', name=f'Motion {index}',
+        )
+        area = Entity.objects.create(name=f'Area {index}', entity_type_str='AREA')
+        EntityStateDelegation.objects.create(entity_state=entity_state, delegate_entity=area)
+        return principal, area, entity_state
+
+    def test_delegates_include_principal_states(self):
+        principal, area, entity_state = self._create_sensor_with_area(0)
+        own_state = EntityState.objects.create(
+            entity=area, entity_state_type_str='ON_OFF', name='Area Light',
+        )
+        entity_to_entity_state_list = StatusDisplayManager().get_entity_to_entity_state_list(
+            entities=[principal, area],
+        )
+        self.assertEqual(entity_to_entity_state_list[principal], [entity_state])
+        self.assertEqual(entity_to_entity_state_list[area], [entity_state, own_state])
+
+    def test_query_count_is_independent_of_entity_count(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        manager = StatusDisplayManager()
+        small_areas = [self._create_sensor_with_area(i)[1] for i in range(2)]
+        large_areas = [self._create_sensor_with_area(i)[1] for i in range(2, 22)]
+        manager.get_entity_to_entity_state_list(entities=small_areas)
+
+        with CaptureQueriesContext(connection) as small_context:
+            manager.get_entity_to_entity_state_list(entities=small_areas)
+        with CaptureQueriesContext(connection) as large_context:
+            manager.get_entity_to_entity_state_list(entities=large_areas)
+        self.assertEqual(len(small_context.captured_queries), len(large_context.captured_queries))
@@ -7,8 +7,14 @@ from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpRequest
 from django.urls import reverse
+from django.utils.html import escape
 
-from hi.apps.common.email_utils import send_html_email
+from hi.apps.common.email_utils import (
+    build_html_email_message,
+    render_email_content,
+    send_html_email,
+)
+from hi.apps.common.mail_delivery import MailDeliveryService
 from hi.apps.common.utils import hash_with_seed
 
 from .models import UnsubscribedEmail
@@ -120,17 +126,24 @@ class EmailSender:
         return
     
     def _add_unsubscribe_url( self, context : Dict ):
-        token = hash_with_seed( self._data.to_email_address )
+        unsubscribe_url = self._get_unsubscribe_url( email_address = self._data.to_email_address,
+                                                     context = context )
+        if unsubscribe_url:
+            context['UNSUBSCRIBE_URL'] = unsubscribe_url
+        return
+
+    def _get_unsubscribe_url( self, email_address : str, context : Dict ) -> str:
+        token = hash_with_seed( email_address )
         relative_url = reverse( self.UNSUBSCRIBE_URL_NAME,
                                 kwargs = {
-                                    'email': self._data.to_email_address,
+                                    'email': email_address,
                                     'token': token,
                                 })
         if self._data.request:
-            context['UNSUBSCRIBE_URL'] = self._data.request.build_absolute_uri( relative_url )
+            return self._data.request.build_absolute_uri( relative_url )
         elif "BASE_URL" in context:
-            context['UNSUBSCRIBE_URL'] = f'{context["BASE_URL"]}{relative_url}'
-        return
+            return f'{context["BASE_URL"]}{relative_url}'
+        return None
     
     async def _assert_not_unsubscribed_async( self ):
         await sync_to_async( self._assert_not_unsubscribed,
@@ -171,3 +184,88 @@ class EmailSender:
                 missing_names.append( setting_name )
             continue
         return missing_names
+
+
+class BulkEmailSender( EmailSender ):
+    """
+    For sending the same email to a list of recipients.  Templates are
+    rendered once and each recipient gets its own message (with its own
+    unsubscribe link) queued for pooled delivery.  Unsubscribed recipients
+    are skipped rather than failing the whole send.  With an override
+    "to" address, only one message is sent (with the first recipient's
+    unsubscribe link) rather than one copy per recipient.
+    """
+
+    UNSUBSCRIBE_URL_PLACEHOLDER = 'HI-UNSUBSCRIBE-URL-PLACEHOLDER'
+
+    def send(self) -> int:
+        email_address_list = self._get_subscribed_email_addresses()
+        return self._send_bulk_helper( email_address_list = email_address_list )
+
+    async def send_async(self) -> int:
+        email_address_list = await sync_to_async( self._get_subscribed_email_addresses,
+                                                  thread_sensitive = True )()
+        return self._send_bulk_helper( email_address_list = email_address_list )
+
+    def _send_bulk_helper( self, email_address_list : List[ str ] ) -> int:
+        if not email_address_list:
+            return 0
+        self._assert_email_configured()
+
+        context = self._data.template_context
+        self._add_base_url( context = context )
+        self._add_home_url( context = context )
+        if 'BASE_URL' in context:
+            context['UNSUBSCRIBE_URL'] = self.UNSUBSCRIBE_URL_PLACEHOLDER
+
+        subject, message_text, message_html = render_email_content(
+            subject_template_name = self._data.subject_template_name,
+            message_text_template_name = self._data.message_text_template_name,
+            message_html_template_name = self._data.message_html_template_name,
+            context = context,
+        )
+
+        if self._data.override_to_email_address:
+            email_address_list = email_address_list[:1]
+
+        message_list = list()
+        for email_address in email_address_list:
+            unsubscribe_url = self._get_unsubscribe_url( email_address = email_address,
+                                                         context = context )
+            if self._data.override_to_email_address:
+                effective_to_email_address = self._data.override_to_email_address
+            else:
+                effective_to_email_address = email_address
+            message = build_html_email_message(
+                subject = subject,
+                message_text = message_text.replace( self.UNSUBSCRIBE_URL_PLACEHOLDER,
+                                                     unsubscribe_url or '' ),
+                message_html = message_html.replace( self.UNSUBSCRIBE_URL_PLACEHOLDER,
+                                                     escape( unsubscribe_url or '' )),
+                to_email_addresses = effective_to_email_address,
+                from_email_address = self._data.from_email_address,
+                files = self._data.files,
+            )
+            message_list.append( message )
+            continue
+
+        if self._data.non_blocking and not settings.UNIT_TESTING:
+            MailDeliveryService().enqueue( message_list )
+        else:
+            for message in message_list:
+                message.send()
+                continue
+        return len( message_list )
+
+    def _get_subscribed_email_addresses(self) -> List[ str ]:
+        email_address_list = self._data.to_email_address
+        if not isinstance( email_address_list, list ):
+            email_address_list = [ email_address_list ]
+        subscribed_list = list()
+        for email_address in email_address_list:
+            if UnsubscribedEmail.objects.exists_by_email( email = email_address ):
+                logger.info( f'Skipping unsubscribed email address {email_address}' )
+                continue
+            subscribed_list.append( email_address )
+            continue
+        return subscribed_list
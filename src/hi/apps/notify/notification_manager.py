@@ -7,7 +7,7 @@ from hi.apps.common.utils import str_to_bool
 from hi.apps.config.settings_mixins import SettingsMixin
 from hi.apps.notify.notification_queue import NotificationQueue
 
-from .email_sender import EmailData, EmailSender
+from .email_sender import BulkEmailSender, EmailData
 from .transient_models import Notification, NotificationItem
 from .settings import NotifySetting
 from .transient_models import NotificationMaintenanceResult
@@ -145,7 +145,7 @@ class NotificationManager( Singleton, SettingsMixin ):
         )
 
         try:
-            email_sender = EmailSender( data = email_data )
+            email_sender = BulkEmailSender( data = email_data )
             await email_sender.send_async()
             return True
         except Exception as e:
@@ -2,9 +2,16 @@ import logging
 from unittest.mock import AsyncMock, Mock, patch
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpRequest
+from django.core import mail
 from django.test import override_settings
 
-from hi.apps.notify.email_sender import EmailData, EmailSender, UnsubscribedEmailError
+from hi.apps.common.email_utils import render_email_content
+from hi.apps.notify.email_sender import (
+    BulkEmailSender,
+    EmailData,
+    EmailSender,
+    UnsubscribedEmailError,
+)
 from hi.apps.notify.models import UnsubscribedEmail
 from hi.testing.base_test_case import BaseTestCase
 
@@ -335,3 +342,66 @@ class TestEmailSender(BaseTestCase):
         # Run the async test
         import asyncio
         asyncio.run(async_test())
+
+
+@override_settings( BASE_URL_FOR_EMAIL_LINKS = 'https://production.com',
+                    EMAIL_HOST = 'smtp.example.com',
+                    EMAIL_HOST_USER = 'user@example.com',
+                    DEFAULT_FROM_EMAIL = 'noreply@example.com',
+                    SERVER_EMAIL = 'server@example.com' )
+class TestBulkEmailSender(BaseTestCase):
+
+    def create_email_data( self, to_email_address, non_blocking = False ):
+        return EmailData(
+            request = None,
+            subject_template_name = 'notify/emails/notification_subject.txt',
+            message_text_template_name = 'notify/emails/notification_message.txt',
+            message_html_template_name = 'notify/emails/notification_message.html',
+            to_email_address = to_email_address,
+            template_context = { 'notification': Mock( title = 'Alert', item_list = [] ) },
+            non_blocking = non_blocking,
+        )
+
+    def test_renders_once_with_per_recipient_unsubscribe_url(self):
+        email_address_list = [ 'a@example.com', 'b@example.com' ]
+        with patch( 'hi.apps.notify.email_sender.render_email_content',
+                    wraps = render_email_content ) as mock_render:
+            sent_count = BulkEmailSender( data = self.create_email_data( email_address_list )).send()
+
+        self.assertEqual( sent_count, 2 )
+        mock_render.assert_called_once()
+        self.assertEqual( [ message.to for message in mail.outbox ], [ [ 'a@example.com' ], [ 'b@example.com' ] ] )
+        for message, email_address in zip( mail.outbox, email_address_list ):
+            html_body = message.alternatives[0][0]
+            self.assertNotIn( BulkEmailSender.UNSUBSCRIBE_URL_PLACEHOLDER, message.body )
+            self.assertNotIn( BulkEmailSender.UNSUBSCRIBE_URL_PLACEHOLDER, html_body )
+            self.assertIn( f'/{email_address}', message.body )
+            self.assertIn( f'/{email_address}', html_body )
+            continue
+
+    def test_unsubscribed_recipients_are_skipped(self):
+        UnsubscribedEmail.objects.create( email = 'gone@example.com' )
+        sent_count = BulkEmailSender(
+            data = self.create_email_data([ 'GONE@example.com', 'kept@example.com' ]),
+        ).send()
+        self.assertEqual( sent_count, 1 )
+        self.assertEqual( mail.outbox[0].to, [ 'kept@example.com' ] )
+
+    def test_override_address_gets_one_message(self):
+        email_data = self.create_email_data([ 'a@example.com', 'b@example.com', 'c@example.com' ])
+        email_data.override_to_email_address = 'override@example.com'
+        sent_count = BulkEmailSender( data = email_data ).send()
+
+        self.assertEqual( sent_count, 1 )
+        self.assertEqual( [ message.to for message in mail.outbox ], [ [ 'override@example.com' ] ] )
+        self.assertIn( '/a@example.com', mail.outbox[0].body )
+
+    def test_non_blocking_send_queues_for_pooled_delivery(self):
+        with patch( 'hi.apps.notify.email_sender.MailDeliveryService' ) as mock_service_class:
+            sent_count = BulkEmailSender(
+                data = self.create_email_data([ 'a@example.com', 'b@example.com' ], non_blocking = True ),
+            ).send()
+        self.assertEqual( sent_count, 2 )
+        message_list = mock_service_class.return_value.enqueue.call_args.args[0]
+        self.assertEqual( len( message_list ), 2 )
+        self.assertEqual( mail.outbox, [] )
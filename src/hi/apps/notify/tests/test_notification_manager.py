@@ -235,7 +235,7 @@ class TestNotificationManager(AsyncManagerTestCase):
             mock_settings_manager.get_setting_value.return_value = 'admin@example.com, user@example.com'
             
             with patch.object(self.manager, 'settings_manager_async') as mock_settings_async:
-                with patch('hi.apps.notify.notification_manager.EmailSender') as mock_email_sender_class:
+                with patch('hi.apps.notify.notification_manager.BulkEmailSender') as mock_email_sender_class:
                     mock_settings_async.return_value = mock_settings_manager
                     
                     # Mock EmailSender instance
@@ -279,7 +279,7 @@ class TestNotificationManager(AsyncManagerTestCase):
             mock_settings_manager.get_setting_value.return_value = ''
             
             with patch.object(self.manager, 'settings_manager_async') as mock_settings_async:
-                with patch('hi.apps.notify.notification_manager.EmailSender') as mock_email_sender_class:
+                with patch('hi.apps.notify.notification_manager.BulkEmailSender') as mock_email_sender_class:
                     mock_settings_async.return_value = mock_settings_manager
                     
                     result = await self.manager.send_email_notification_if_needed_async(notification)
@@ -305,7 +305,7 @@ class TestNotificationManager(AsyncManagerTestCase):
             mock_settings_manager.get_setting_value.return_value = 'invalid-email, another-invalid'
             
             with patch.object(self.manager, 'settings_manager_async') as mock_settings_async:
-                with patch('hi.apps.notify.notification_manager.EmailSender') as mock_email_sender_class:
+                with patch('hi.apps.notify.notification_manager.BulkEmailSender') as mock_email_sender_class:
                     mock_settings_async.return_value = mock_settings_manager
                     
                     # Mock EmailSender instance
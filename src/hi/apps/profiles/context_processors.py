@@ -1,3 +1,5 @@
+from functools import partial
+
 from .session_helpers import (
     should_show_view_intro_help,
     should_show_edit_intro_help,
@@ -5,8 +7,12 @@ from .session_helpers import (
 
 
 def profiles_context(request):
-    """Provide profile-related context variables for templates."""
+    """
+    Provide profile-related context variables for templates. Templates
+    call these when they use them, so rendering a template that does not
+    (e.g., status polling fragments) does not load the session.
+    """
     return {
-        'show_view_intro_help': should_show_view_intro_help(request),
-        'show_edit_intro_help': should_show_edit_intro_help(request),
+        'show_view_intro_help': partial(should_show_view_intro_help, request),
+        'show_edit_intro_help': partial(should_show_edit_intro_help, request),
     }
@@ -1,12 +1,16 @@
+from contextlib import contextmanager
 import json
 import logging
+import time
 from decimal import Decimal
 from pathlib import Path
 from typing import Dict, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from django.db import transaction
 
+from hi.apps.common.model_utils import bulk_create_with_signals
+
 from hi.apps.entity.models import Entity, EntityPosition, EntityPath, EntityView
 from hi.apps.entity.enums import EntityType
 from hi.apps.location.models import Location, LocationView
@@ -72,6 +76,22 @@ class ProfileLoadingStats:
     collection_views_attempted: int = 0
     collection_views_succeeded: int = 0
     collection_views_failed: int = 0
+
+    # Wall-clock seconds per loading stage, in the order the stages ran.
+    stage_timings: Dict[str, float] = field( default_factory = dict )
+
+    @contextmanager
+    def time_stage( self, stage_name : str ):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[stage_name] = time.perf_counter() - start_time
+        return
+
+    @property
+    def total_seconds(self) -> float:
+        return sum( self.stage_timings.values() )
     
     def log_summary(self, profile_label: str):
         """Log a comprehensive summary of loading results."""
@@ -95,6 +115,11 @@ class ProfileLoadingStats:
         
         if total_failed > 0:
             logger.warning(f'Total failures during profile loading: {total_failed}')
+
+        if self.stage_timings:
+            stage_timings_str = ', '.join([ f'{stage_name}={seconds * 1000.0:.1f}ms'
+                                            for stage_name, seconds in self.stage_timings.items() ])
+            logger.info(f'  Stage timings: {stage_timings_str} (total {self.total_seconds * 1000.0:.1f}ms)')
     
     def meets_minimum_requirements(self) -> bool:
         """Check if minimum viable profile was loaded (at least 1 Location and 1 Entity)."""
@@ -119,7 +144,8 @@ class ProfileManager:
         
         Continues loading even if individual items fail, but ensures minimum viable profile.
         Requires database to be empty (no entities or locations).
-        All operations performed in a single atomic transaction.
+        All operations performed in a single atomic transaction, with one
+        bulk insert per model type.  Per-stage timings are in the returned stats.
         
         Returns:
             ProfileLoadingStats: Detailed statistics about what succeeded and failed during loading
@@ -131,56 +157,65 @@ class ProfileManager:
             json.JSONDecodeError: If profile JSON is invalid
             Exception: For other fundamental errors during profile loading
         """
+        stats = ProfileLoadingStats()
+
         # Validate database is empty before starting
         self._validate_empty_database()
-        
-        json_file_path = self._get_profile_json_path(profile_type)
-        profile_data = self._load_json_file( json_file_path )
+
+        with stats.time_stage( 'read_json' ):
+            json_file_path = self._get_profile_json_path(profile_type)
+            profile_data = self._load_json_file( json_file_path )
         
         # Validate fundamental requirements before starting
         self._validate_fundamental_requirements(profile_data)
         
         # Copy SVG fragment files from assets to MEDIA_ROOT before validation
-        self._render_svg_templates(profile_data)
-        
-        # Initialize tracking
-        stats = ProfileLoadingStats()
-        
+        with stats.time_stage( 'render_svg' ):
+            self._render_svg_templates(profile_data)
+
+        location_data_list = profile_data.get( PC.PROFILE_FIELD_LOCATIONS, [] )
+        entity_data_list = profile_data.get( PC.PROFILE_FIELD_ENTITIES, [] )
+        collection_data_list = profile_data.get( PC.PROFILE_FIELD_COLLECTIONS, [] )
+
+        # Each stage resolves its references from the in-memory lookups
+        # built by earlier stages and writes its rows with one bulk
+        # insert, so stages must run in foreign key dependency order.
         with transaction.atomic():
-            # Create core models with error tracking
-            locations, location_lookup = self._create_locations_robust(
-                profile_data.get(PC.PROFILE_FIELD_LOCATIONS, []), stats)
-            
-            entities, entity_lookup = self._create_entities_robust(
-                profile_data.get(PC.PROFILE_FIELD_ENTITIES, []), stats)
+            with stats.time_stage( 'locations' ):
+                locations, location_lookup = self._create_locations_robust(
+                    location_data_list, stats)
+
+            with stats.time_stage( 'location_views' ):
+                location_view_lookup = self._create_location_views_robust(
+                    location_data_list, location_lookup, stats)
             
-            collections, collection_lookup = self._create_collections_robust(
-                profile_data.get(PC.PROFILE_FIELD_COLLECTIONS, []), stats)
+            with stats.time_stage( 'entities' ):
+                entities, entity_lookup = self._create_entities_robust(
+                    entity_data_list, stats)
             
-            # Create relationships with error tracking
-            self._create_entity_positions_and_paths_robust(
-                profile_data.get(PC.PROFILE_FIELD_ENTITIES, []), 
-                entity_lookup, location_lookup, stats)
+            with stats.time_stage( 'collections' ):
+                collections, collection_lookup = self._create_collections_robust(
+                    collection_data_list, stats)
             
-            self._create_location_views_robust(
-                profile_data.get(PC.PROFILE_FIELD_LOCATIONS, []), 
-                location_lookup, stats)
+            with stats.time_stage( 'entity_positions_and_paths' ):
+                self._create_entity_positions_and_paths_robust(
+                    entity_data_list, entity_lookup, location_lookup, stats)
             
-            self._create_entity_views_robust(
-                profile_data.get(PC.PROFILE_FIELD_ENTITIES, []),
-                entity_lookup, location_lookup, stats)
+            with stats.time_stage( 'entity_views' ):
+                self._create_entity_views_robust(
+                    entity_data_list, entity_lookup, location_view_lookup, stats)
             
-            self._create_collection_entities_robust(
-                profile_data.get( PC.PROFILE_FIELD_COLLECTIONS, [] ),
-                collection_lookup, entity_lookup, stats)
+            with stats.time_stage( 'collection_entities' ):
+                self._create_collection_entities_robust(
+                    collection_data_list, collection_lookup, entity_lookup, stats)
             
-            self._create_collection_positions_and_paths_robust(
-                profile_data.get(PC.PROFILE_FIELD_COLLECTIONS, []),
-                collection_lookup, location_lookup, stats)
+            with stats.time_stage( 'collection_positions_and_paths' ):
+                self._create_collection_positions_and_paths_robust(
+                    collection_data_list, collection_lookup, location_lookup, stats)
             
-            self._create_collection_views_robust(
-                profile_data.get(PC.PROFILE_FIELD_COLLECTIONS, []),
-                collection_lookup, location_lookup, stats)
+            with stats.time_stage( 'collection_views' ):
+                self._create_collection_views_robust(
+                    collection_data_list, collection_lookup, location_view_lookup, stats)
             
             # Validate minimum requirements were met
             if not stats.meets_minimum_requirements():
@@ -604,11 +639,17 @@ class ProfileManager:
         logger.debug(f'Created {view_count} collection views')
         return
 
-    # Robust error handling versions of creation methods
+    # Robust error handling versions of creation methods.
+    #
+    # Each one validates and resolves every item in memory first, so a bad
+    # item is counted as failed without touching the database, then inserts
+    # all of the good items with a single bulk insert.  Items that would
+    # violate a uniqueness constraint are rejected up front since a database
+    # error would fail the whole batch rather than just that item.
     
     def _create_locations_robust(self, location_data_list: List[dict], stats: ProfileLoadingStats) -> tuple[List[Location], Dict[str, Location]]:
         """Create locations with error tracking and graceful failure handling."""
-        locations = []
+        new_locations = []
         
         for location_data in location_data_list:
             stats.locations_attempted += 1
@@ -616,28 +657,28 @@ class ProfileManager:
                 svg_fragment_filename = location_data['_svg_fragment_filename']
                 svg_view_box_str = location_data['_svg_view_box_str']
 
-                location = Location.objects.create(
+                new_locations.append( Location(
                     name = location_data[PC.LOCATION_FIELD_NAME],
                     svg_fragment_filename = svg_fragment_filename,
                     svg_view_box_str = svg_view_box_str,
                     order_id = location_data.get(PC.LOCATION_FIELD_ORDER_ID, 0),
-                )
-                locations.append(location)
-                stats.locations_succeeded += 1
+                ))
                 
             except Exception as e:
                 stats.locations_failed += 1
                 location_name = location_data.get(PC.LOCATION_FIELD_NAME, 'unknown')
                 logger.error(f'Failed to create location "{location_name}": {e}')
-                continue
-                
+            continue
+
+        locations = bulk_create_with_signals( Location, new_locations )
+        stats.locations_succeeded += len(locations)
         location_lookup = { location.name: location for location in locations }
         logger.debug(f'Created {len(locations)} locations ({stats.locations_succeeded} succeeded, {stats.locations_failed} failed)')
         return locations, location_lookup
 
     def _create_entities_robust(self, entity_data_list: List[dict], stats: ProfileLoadingStats) -> tuple[List[Entity], Dict[str, Entity]]:
         """Create entities with error tracking and graceful failure handling."""
-        entities = []
+        new_entities = []
         
         for entity_data in entity_data_list:
             # Skip comment-only entries
@@ -649,26 +690,26 @@ class ProfileManager:
                 input_str = entity_data[PC.ENTITY_FIELD_TYPE_STR]
                 entity_type = EntityType.from_name( input_str )
                     
-                entity = Entity.objects.create(
+                new_entities.append( Entity(
                     name = entity_data[PC.ENTITY_FIELD_NAME],
                     entity_type_str = str(entity_type),
-                )
-                entities.append(entity)
-                stats.entities_succeeded += 1
+                ))
                 
             except Exception as e:
                 stats.entities_failed += 1
                 entity_name = entity_data.get(PC.ENTITY_FIELD_NAME, 'unknown')
                 logger.error(f'Failed to create entity "{entity_name}": {e}')
-                continue
-                
+            continue
+
+        entities = bulk_create_with_signals( Entity, new_entities )
+        stats.entities_succeeded += len(entities)
         entity_lookup = { entity.name: entity for entity in entities }
         logger.debug(f'Created {len(entities)} entities ({stats.entities_succeeded} succeeded, {stats.entities_failed} failed)')
         return entities, entity_lookup
 
     def _create_collections_robust(self, collection_data_list: List[dict], stats: ProfileLoadingStats) -> tuple[List[Collection], Dict[str, Collection]]:
         """Create collections with error tracking and graceful failure handling."""
-        collections = []
+        new_collections = []
         
         for collection_data in collection_data_list:
             # Skip comment-only entries
@@ -683,21 +724,21 @@ class ProfileManager:
                 input_str = collection_data[PC.COLLECTION_FIELD_VIEW_TYPE_STR]
                 collection_view_type = CollectionViewType.from_name( input_str )
                     
-                collection = Collection.objects.create(
+                new_collections.append( Collection(
                     name = collection_data[PC.COLLECTION_FIELD_NAME],
                     collection_type_str = str(collection_type),
                     collection_view_type_str = str(collection_view_type),
                     order_id = collection_data.get(PC.COLLECTION_FIELD_ORDER_ID, 0),
-                )
-                collections.append(collection)
-                stats.collections_succeeded += 1
+                ))
                 
             except Exception as e:
                 stats.collections_failed += 1
                 collection_name = collection_data.get(PC.COLLECTION_FIELD_NAME, 'unknown')
                 logger.error(f'Failed to create collection "{collection_name}": {e}')
-                continue
-                
+            continue
+
+        collections = bulk_create_with_signals( Collection, new_collections )
+        stats.collections_succeeded += len(collections)
         collection_lookup = { collection.name: collection for collection in collections }
         logger.debug(f'Created {len(collections)} collections ({stats.collections_succeeded} succeeded, {stats.collections_failed} failed)')
         return collections, collection_lookup
@@ -707,6 +748,11 @@ class ProfileManager:
                                                   location_lookup: Dict[str, Location],
                                                   stats: ProfileLoadingStats):
         """Create entity positions and paths with error tracking and graceful failure handling."""
+        new_positions = []
+        new_paths = []
+        position_keys = set()
+        path_keys = set()
+        
         for entity_data in entity_data_list:
             if PC.ENTITY_FIELD_NAME not in entity_data:
                 continue
@@ -721,56 +767,57 @@ class ProfileManager:
             for position_data in entity_data.get(PC.ENTITY_FIELD_POSITIONS, []):
                 stats.entity_positions_attempted += 1
                 try:
-                    location_name = position_data[PC.COMMON_FIELD_LOCATION_NAME]
-                    if location_name not in location_lookup:
-                        raise ValueError(f'Location "{location_name}" not found')
-                    
-                    location = location_lookup[location_name]
-                    
-                    EntityPosition.objects.create(
+                    location = self._resolve_location( position_data, location_lookup )
+                    self._claim_unique_key( position_keys, ( location.id, entity.id ) )
+                    new_positions.append( EntityPosition(
                         entity = entity,
                         location = location,
                         svg_x = Decimal(str(position_data[PC.COMMON_FIELD_SVG_X])),
                         svg_y = Decimal(str(position_data[PC.COMMON_FIELD_SVG_Y])),
                         svg_scale = Decimal(str(position_data.get(PC.COMMON_FIELD_SVG_SCALE, 1.0))),
                         svg_rotate = Decimal(str(position_data.get(PC.COMMON_FIELD_SVG_ROTATE, 0.0))),
-                    )
-                    stats.entity_positions_succeeded += 1
+                    ))
                     
                 except Exception as e:
                     stats.entity_positions_failed += 1
                     logger.error(f'Failed to create position for entity "{entity_name}": {e}')
-                    continue
+                continue
             
             # Handle paths
             for path_data in entity_data.get(PC.ENTITY_FIELD_PATHS, []):
                 stats.entity_paths_attempted += 1
                 try:
-                    location_name = path_data[PC.COMMON_FIELD_LOCATION_NAME]
-                    if location_name not in location_lookup:
-                        raise ValueError(f'Location "{location_name}" not found')
-                    
-                    location = location_lookup[location_name]
-                    
-                    EntityPath.objects.create(
+                    location = self._resolve_location( path_data, location_lookup )
+                    self._claim_unique_key( path_keys, ( location.id, entity.id ) )
+                    new_paths.append( EntityPath(
                         entity = entity,
                         location = location,
                         svg_path = path_data[PC.COMMON_FIELD_SVG_PATH],
-                    )
-                    stats.entity_paths_succeeded += 1
+                    ))
                     
                 except Exception as e:
                     stats.entity_paths_failed += 1
                     logger.error(f'Failed to create path for entity "{entity_name}": {e}')
-                    continue
-        
+                continue
+            continue
+
+        stats.entity_positions_succeeded += len( bulk_create_with_signals( EntityPosition, new_positions ))
+        stats.entity_paths_succeeded += len( bulk_create_with_signals( EntityPath, new_paths ))
         logger.debug(f'Created entity positioning: {stats.entity_positions_succeeded} positions, {stats.entity_paths_succeeded} paths')
         return
 
     def _create_location_views_robust(self, location_data_list: List[dict], 
                                       location_lookup: Dict[str, Location],
-                                      stats: ProfileLoadingStats):
-        """Create location views with error tracking and graceful failure handling."""
+                                      stats: ProfileLoadingStats) -> Dict[str, LocationView]:
+        """
+        Create location views with error tracking and graceful failure handling.
+
+        Returns the created views by name.  Profiles refer to views by name
+        alone, so when two locations share a view name the first location's
+        view wins.
+        """
+        new_location_views = []
+        
         for location_data in location_data_list:
             location_name = location_data[PC.LOCATION_FIELD_NAME]
             if location_name not in location_lookup:
@@ -789,7 +836,7 @@ class ProfileManager:
                     input_str = view_data[PC.LOCATION_VIEW_FIELD_SVG_STYLE_NAME_STR]
                     svg_style_name = SvgStyleName.from_name( input_str )
                     
-                    LocationView.objects.create(
+                    new_location_views.append( LocationView(
                         location = location,
                         name = location_view_name,
                         location_view_type_str= str( location_view_type ),
@@ -797,23 +844,32 @@ class ProfileManager:
                         svg_style_name_str = str(svg_style_name),
                         svg_rotate = Decimal( str(view_data.get(PC.COMMON_FIELD_SVG_ROTATE, 0.0)) ),
                         order_id = view_data.get(PC.LOCATION_VIEW_FIELD_ORDER_ID, 0),
-                    )
-                    stats.location_views_succeeded += 1
+                    ))
                     
                 except Exception as e:
                     stats.location_views_failed += 1
                     view_name = view_data.get(PC.LOCATION_VIEW_FIELD_NAME, 'unknown')
                     logger.error(f'Failed to create location view "{view_name}" for location "{location_name}": {e}')
-                    continue
-        
+                continue
+            continue
+
+        location_views = bulk_create_with_signals( LocationView, new_location_views )
+        stats.location_views_succeeded += len(location_views)
+        location_view_lookup = dict()
+        for location_view in location_views:
+            location_view_lookup.setdefault( location_view.name, location_view )
+            continue
         logger.debug(f'Created {stats.location_views_succeeded} location views')
-        return
+        return location_view_lookup
 
     def _create_entity_views_robust(self, entity_data_list: List[dict], 
                                     entity_lookup: Dict[str, Entity],
-                                    location_lookup: Dict[str, Location],
+                                    location_view_lookup: Dict[str, LocationView],
                                     stats: ProfileLoadingStats):
         """Create entity views with error tracking and graceful failure handling."""
+        new_entity_views = []
+        entity_view_keys = set()
+        
         for entity_data in entity_data_list:
             if PC.ENTITY_FIELD_NAME not in entity_data:
                 continue
@@ -827,32 +883,20 @@ class ProfileManager:
             for view_name in entity_data.get(PC.ENTITY_FIELD_VISIBLE_IN_VIEWS, []):
                 stats.entity_views_attempted += 1
                 try:
-                    # Find the LocationView by searching all locations
-                    location_view = None
-                    for location in location_lookup.values():
-                        try:
-                            location_view = LocationView.objects.get(
-                                location =location,
-                                name =view_name
-                            )
-                            break
-                        except LocationView.DoesNotExist:
-                            continue
-                    
-                    if location_view:
-                        EntityView.objects.create(
-                            entity = entity,
-                            location_view = location_view,
-                        )
-                        stats.entity_views_succeeded += 1
-                    else:
-                        raise ValueError(f'LocationView "{view_name}" not found')
+                    location_view = self._resolve_location_view( view_name, location_view_lookup )
+                    self._claim_unique_key( entity_view_keys, ( entity.id, location_view.id ) )
+                    new_entity_views.append( EntityView(
+                        entity = entity,
+                        location_view = location_view,
+                    ))
                         
                 except Exception as e:
                     stats.entity_views_failed += 1
                     logger.error(f'Failed to create entity view for "{entity_name}" in view "{view_name}": {e}')
-                    continue
-        
+                continue
+            continue
+
+        stats.entity_views_succeeded += len( bulk_create_with_signals( EntityView, new_entity_views ))
         logger.debug(f'Created {stats.entity_views_succeeded} entity views')
         return
 
@@ -861,6 +905,8 @@ class ProfileManager:
                                            entity_lookup: Dict[str, Entity],
                                            stats: ProfileLoadingStats):
         """Create collection-entity relationships with error tracking and graceful failure handling."""
+        new_collection_entities = []
+        
         for collection_data in collection_data_list:
             if PC.COLLECTION_FIELD_NAME not in collection_data:
                 continue
@@ -877,20 +923,20 @@ class ProfileManager:
                     if entity_name not in entity_lookup:
                         raise ValueError(f'Entity "{entity_name}" not found')
                     
-                    entity = entity_lookup[entity_name]
-                    
-                    CollectionEntity.objects.create(
+                    new_collection_entities.append( CollectionEntity(
                         collection = collection,
-                        entity = entity,
+                        entity = entity_lookup[entity_name],
                         order_id = order_id,
-                    )
-                    stats.collection_entities_succeeded += 1
+                    ))
                     
                 except Exception as e:
                     stats.collection_entities_failed += 1
                     logger.error(f'Failed to add entity "{entity_name}" to collection "{collection_name}": {e}')
-                    continue
-        
+                continue
+            continue
+
+        stats.collection_entities_succeeded += len(
+            bulk_create_with_signals( CollectionEntity, new_collection_entities ))
         logger.debug(f'Created {stats.collection_entities_succeeded} collection-entity relationships')
         return
 
@@ -899,6 +945,11 @@ class ProfileManager:
                                                       location_lookup: Dict[str, Location],
                                                       stats: ProfileLoadingStats):
         """Create collection positions and paths with error tracking and graceful failure handling."""
+        new_positions = []
+        new_paths = []
+        position_keys = set()
+        path_keys = set()
+        
         for collection_data in collection_data_list:
             if PC.COLLECTION_FIELD_NAME not in collection_data:
                 continue
@@ -913,57 +964,52 @@ class ProfileManager:
             for position_data in collection_data.get(PC.COLLECTION_FIELD_POSITIONS, []):
                 stats.collection_positions_attempted += 1
                 try:
-                    location_name = position_data[PC.COMMON_FIELD_LOCATION_NAME]
-                    if location_name not in location_lookup:
-                        raise ValueError(f'Location "{location_name}" not found')
-                    
-                    location = location_lookup[location_name]
-                    
-                    CollectionPosition.objects.create(
+                    location = self._resolve_location( position_data, location_lookup )
+                    self._claim_unique_key( position_keys, ( location.id, collection.id ) )
+                    new_positions.append( CollectionPosition(
                         collection = collection,
                         location = location,
                         svg_x = Decimal(str(position_data[PC.COMMON_FIELD_SVG_X])),
                         svg_y = Decimal(str(position_data[PC.COMMON_FIELD_SVG_Y])),
                         svg_scale = Decimal(str(position_data.get(PC.COMMON_FIELD_SVG_SCALE, 1.0))),
                         svg_rotate = Decimal(str(position_data.get(PC.COMMON_FIELD_SVG_ROTATE, 0.0))),
-                    )
-                    stats.collection_positions_succeeded += 1
+                    ))
                     
                 except Exception as e:
                     stats.collection_positions_failed += 1
                     logger.error(f'Failed to create position for collection "{collection_name}": {e}')
-                    continue
+                continue
             
             # Handle paths
             for path_data in collection_data.get(PC.COLLECTION_FIELD_PATHS, []):
                 stats.collection_paths_attempted += 1
                 try:
-                    location_name = path_data[PC.COMMON_FIELD_LOCATION_NAME]
-                    if location_name not in location_lookup:
-                        raise ValueError(f'Location "{location_name}" not found')
-                    
-                    location = location_lookup[location_name]
-                    
-                    CollectionPath.objects.create(
+                    location = self._resolve_location( path_data, location_lookup )
+                    self._claim_unique_key( path_keys, ( location.id, collection.id ) )
+                    new_paths.append( CollectionPath(
                         collection=collection,
                         location=location,
                         svg_path=path_data[PC.COMMON_FIELD_SVG_PATH],
-                    )
-                    stats.collection_paths_succeeded += 1
+                    ))
                     
                 except Exception as e:
                     stats.collection_paths_failed += 1
                     logger.error(f'Failed to create path for collection "{collection_name}": {e}')
-                    continue
-        
+                continue
+            continue
+
+        stats.collection_positions_succeeded += len( bulk_create_with_signals( CollectionPosition, new_positions ))
+        stats.collection_paths_succeeded += len( bulk_create_with_signals( CollectionPath, new_paths ))
         logger.debug(f'Created collection positioning: {stats.collection_positions_succeeded} positions, {stats.collection_paths_succeeded} paths')
         return
 
     def _create_collection_views_robust(self, collection_data_list: List[dict], 
                                         collection_lookup: Dict[str, Collection],
-                                        location_lookup: Dict[str, Location],
+                                        location_view_lookup: Dict[str, LocationView],
                                         stats: ProfileLoadingStats):
         """Create collection views with error tracking and graceful failure handling."""
+        new_collection_views = []
+        
         for collection_data in collection_data_list:
             if PC.COLLECTION_FIELD_NAME not in collection_data:
                 continue
@@ -977,31 +1023,38 @@ class ProfileManager:
             for view_name in collection_data.get(PC.COLLECTION_FIELD_VISIBLE_IN_VIEWS, []):
                 stats.collection_views_attempted += 1
                 try:
-                    # Find the LocationView by searching all locations
-                    location_view = None
-                    for location in location_lookup.values():
-                        try:
-                            location_view = LocationView.objects.get(
-                                location=location,
-                                name=view_name
-                            )
-                            break
-                        except LocationView.DoesNotExist:
-                            continue
-                    
-                    if location_view:
-                        CollectionView.objects.create(
-                            collection=collection,
-                            location_view=location_view,
-                        )
-                        stats.collection_views_succeeded += 1
-                    else:
-                        raise ValueError(f'LocationView "{view_name}" not found')
+                    new_collection_views.append( CollectionView(
+                        collection=collection,
+                        location_view=self._resolve_location_view( view_name, location_view_lookup ),
+                    ))
                         
                 except Exception as e:
                     stats.collection_views_failed += 1
                     logger.error(f'Failed to create collection view for "{collection_name}" in view "{view_name}": {e}')
-                    continue
-        
+                continue
+            continue
+
+        stats.collection_views_succeeded += len( bulk_create_with_signals( CollectionView, new_collection_views ))
         logger.debug(f'Created {stats.collection_views_succeeded} collection views')
         return
+
+    def _resolve_location( self,
+                           item_data        : dict,
+                           location_lookup  : Dict[str, Location] ) -> Location:
+        location_name = item_data[PC.COMMON_FIELD_LOCATION_NAME]
+        if location_name not in location_lookup:
+            raise ValueError(f'Location "{location_name}" not found')
+        return location_lookup[location_name]
+
+    def _resolve_location_view( self,
+                                view_name             : str,
+                                location_view_lookup  : Dict[str, LocationView] ) -> LocationView:
+        if view_name not in location_view_lookup:
+            raise ValueError(f'LocationView "{view_name}" not found')
+        return location_view_lookup[view_name]
+
+    def _claim_unique_key( self, claimed_keys : set, unique_key : tuple ):
+        if unique_key in claimed_keys:
+            raise ValueError(f'Duplicate item for {unique_key}')
+        claimed_keys.add( unique_key )
+        return
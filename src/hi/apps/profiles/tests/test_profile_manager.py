@@ -1,6 +1,9 @@
 import logging
 from pathlib import Path
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from hi.apps.profiles.profile_manager import ProfileManager
 from hi.apps.profiles.enums import ProfileType
 from hi.apps.entity.models import Entity, EntityPosition
@@ -262,3 +265,54 @@ class TestProfileManager(BaseTestCase):
 
             with self.assertRaises(Exception):
                 self.profile_manager._render_svg_templates(profile_data)
+
+
+
+class TestProfileLoaderBenchmark(BaseTestCase):
+    """
+    Loads every shipped profile and checks the bulk loader's cost: one
+    insert per model type regardless of how many items a profile defines.
+    Timings are logged at INFO when this module does not disable logging.
+    """
+
+    # Empty-database checks, savepoint and one insert per model type.
+    MAX_QUERIES_PER_PROFILE = 20
+
+    EXPECTED_STAGES = [
+        'read_json',
+        'render_svg',
+        'locations',
+        'location_views',
+        'entities',
+        'collections',
+        'entity_positions_and_paths',
+        'entity_views',
+        'collection_entities',
+        'collection_positions_and_paths',
+        'collection_views',
+    ]
+
+    def test_shipped_profiles_load_with_bounded_queries(self):
+        for profile_type in ProfileType:
+            with self.subTest(profile_type = profile_type):
+                with self.in_memory_media_storage():
+                    with CaptureQueriesContext(connection) as context:
+                        stats = ProfileManager().load_profile(profile_type)
+
+                item_count = (stats.locations_succeeded + stats.entities_succeeded
+                              + stats.entity_positions_succeeded + stats.entity_views_succeeded)
+                self.assertGreater(item_count, self.MAX_QUERIES_PER_PROFILE)
+                self.assertLessEqual(len(context.captured_queries), self.MAX_QUERIES_PER_PROFILE)
+
+                self.assertEqual(list(stats.stage_timings), self.EXPECTED_STAGES)
+                self.assertTrue(all( x >= 0.0 for x in stats.stage_timings.values() ))
+                self.assertAlmostEqual(stats.total_seconds, sum(stats.stage_timings.values()))
+                logging.getLogger(__name__).info(
+                    f'{profile_type}: {len(context.captured_queries)} queries, {stats.total_seconds * 1000.0:.1f}ms')
+
+                Entity.objects.all().delete()
+                for location in Location.objects.all():
+                    location.delete()
+                    continue
+            continue
+        return
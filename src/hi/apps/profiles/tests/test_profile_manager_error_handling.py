@@ -1,8 +1,8 @@
 import logging
 
 from hi.apps.profiles.profile_manager import ProfileManager, ProfileLoadingStats
-from hi.apps.entity.models import Entity, EntityPosition
-from hi.apps.location.models import Location
+from hi.apps.entity.models import Entity, EntityPosition, EntityView
+from hi.apps.location.models import Location, LocationView
 from hi.testing.base_test_case import BaseTestCase
 
 from .test_data_utils import ProfileTestDataGenerator
@@ -344,3 +344,95 @@ class TestProfileManagerErrorHandling(BaseTestCase):
         # Verify foreign key relationships work
         self.assertEqual(position.entity, entity)
         self.assertEqual(position.location, location)
+
+
+class TestProfileManagerBulkItemAccounting(BaseTestCase):
+    """Per-item failures are counted while the remaining items of the same type still get inserted."""
+
+    def setUp(self):
+        super().setUp()
+        self.profile_manager = ProfileManager()
+        self.stats = ProfileLoadingStats()
+        self.locations, self.location_lookup = self.profile_manager._create_locations_robust(
+            [
+                {
+                    'name': 'Main Floor',
+                    '_svg_fragment_filename': 'location/svg/main.svg',
+                    '_svg_view_box_str': '0 0 100 100',
+                    'views': [
+                        {
+                            'name': 'Overview',
+                            'location_view_type_str': 'default',
+                            'svg_view_box_str': '0 0 100 100',
+                            'svg_style_name_str': 'color',
+                        },
+                        {
+                            'name': 'Broken',
+                            'location_view_type_str': 'INVALID_VIEW_TYPE',
+                            'svg_view_box_str': '0 0 100 100',
+                            'svg_style_name_str': 'color',
+                        },
+                    ],
+                },
+                { 'name': 'No Svg Location' },
+            ],
+            self.stats,
+        )
+
+    def test_bad_locations_and_views_counted_individually(self):
+        self.assertEqual(self.stats.locations_attempted, 2)
+        self.assertEqual(self.stats.locations_succeeded, 1)
+        self.assertEqual(self.stats.locations_failed, 1)
+        self.assertEqual(list(self.location_lookup), ['Main Floor'])
+
+        location_view_lookup = self.profile_manager._create_location_views_robust(
+            [{ 'name': 'Main Floor', 'views': [] }], self.location_lookup, self.stats)
+        self.assertEqual(location_view_lookup, {})
+
+    def test_entity_relations_reject_unknown_references_and_duplicates(self):
+        location_view_lookup = self.profile_manager._create_location_views_robust(
+            [{
+                'name': 'Main Floor',
+                'views': [{
+                    'name': 'Overview',
+                    'location_view_type_str': 'default',
+                    'svg_view_box_str': '0 0 100 100',
+                    'svg_style_name_str': 'color',
+                }],
+            }],
+            self.location_lookup,
+            self.stats,
+        )
+        self.assertEqual(self.stats.location_views_succeeded, 1)
+        self.assertEqual(location_view_lookup['Overview'], LocationView.objects.get())
+
+        entity_data_list = [
+            {
+                'name': 'Lamp',
+                'entity_type_str': 'light',
+                'positions': [
+                    { 'location_name': 'Main Floor', 'svg_x': 10, 'svg_y': 20 },
+                    { 'location_name': 'Main Floor', 'svg_x': 30, 'svg_y': 40 },
+                    { 'location_name': 'Missing Floor', 'svg_x': 1, 'svg_y': 2 },
+                ],
+                'visible_in_views': [ 'Overview', 'Overview', 'Missing View' ],
+            },
+            { 'name': 'Mystery', 'entity_type_str': 'INVALID_ENTITY_TYPE' },
+        ]
+        _, entity_lookup = self.profile_manager._create_entities_robust(entity_data_list, self.stats)
+        self.assertEqual(self.stats.entities_succeeded, 1)
+        self.assertEqual(self.stats.entities_failed, 1)
+
+        self.profile_manager._create_entity_positions_and_paths_robust(
+            entity_data_list, entity_lookup, self.location_lookup, self.stats)
+        self.assertEqual(self.stats.entity_positions_attempted, 3)
+        self.assertEqual(self.stats.entity_positions_succeeded, 1)
+        self.assertEqual(self.stats.entity_positions_failed, 2)
+        self.assertEqual(EntityPosition.objects.get().svg_x, 10)
+
+        self.profile_manager._create_entity_views_robust(
+            entity_data_list, entity_lookup, location_view_lookup, self.stats)
+        self.assertEqual(self.stats.entity_views_attempted, 3)
+        self.assertEqual(self.stats.entity_views_succeeded, 1)
+        self.assertEqual(self.stats.entity_views_failed, 2)
+        self.assertEqual(EntityView.objects.count(), 1)
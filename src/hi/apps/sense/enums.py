@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from hi.apps.common.enums import LabeledEnum
 
 
@@ -16,3 +18,32 @@ class CorrelationRole(LabeledEnum):
     END                  = ( 'End', 'Event end/completion' )
 
 
+class SensorHistoryResolution(LabeledEnum):
+    """
+    Bucket widths of the numeric sensor history rollups, finest first.
+    Buckets are aligned to UTC (e.g., daily buckets start at UTC midnight).
+
+    The fine resolutions are trimmed by the history cleanup, so they are
+    only guaranteed to cover their minimum retention days.  A retention
+    of None means they are kept indefinitely.
+    """
+
+    ONE_MINUTE       = ( '1 Minute'   , '', 60               , 7 )
+    FIFTEEN_MINUTES  = ( '15 Minutes' , '', 15 * 60          , 90 )
+    ONE_HOUR         = ( '1 Hour'     , '', 60 * 60          , None )
+    ONE_DAY          = ( '1 Day'      , '', 24 * 60 * 60     , None )
+
+    def __init__( self,
+                  label               : str,
+                  description         : str,
+                  bucket_secs         : int,
+                  min_retention_days  : int ):
+        super().__init__( label, description )
+        self.bucket_secs = bucket_secs
+        self.min_retention_days = min_retention_days
+        return
+
+    def bucket_start( self, timestamp : datetime ) -> datetime:
+        epoch_secs = int( timestamp.timestamp() )
+        return datetime.fromtimestamp( epoch_secs - ( epoch_secs % self.bucket_secs ),
+                                       tz = timezone.utc )
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from hi.apps.sense.models import Sensor
+from hi.apps.sense.sensor_history_rollup_manager import SensorHistoryRollupManager
+
+
+class Command(BaseCommand):
+    help = 'Rebuild numeric sensor history rollups from the existing sensor history.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sensor-id',
+            type=int,
+            help='Only rebuild the rollups of this sensor.',
+        )
+
+    def handle(self, *args, **options):
+        rollup_manager = SensorHistoryRollupManager()
+        queryset = Sensor.objects.select_related('entity_state').order_by('id')
+        if options['sensor_id'] is not None:
+            queryset = queryset.filter(id=options['sensor_id'])
+
+        sensor_count = 0
+        rollup_count = 0
+        for sensor in queryset:
+            if not rollup_manager.is_rollup_sensor(sensor):
+                continue
+            rollup_count += rollup_manager.backfill_sensor(sensor)
+            sensor_count += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rollup backfill summary: sensors={sensor_count}, rollups={rollup_count}'
+        ))
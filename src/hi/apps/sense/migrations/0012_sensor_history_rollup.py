@@ -0,0 +1,58 @@
+# Generated by Django 5.2.14 on 2026-10-18 21:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sense", "0011_add_previous_integration_identity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SensorHistoryRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resolution_str",
+                    models.CharField(max_length=32, verbose_name="Resolution"),
+                ),
+                ("bucket_start", models.DateTimeField(verbose_name="Bucket Start")),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="Count")),
+                ("min_value", models.FloatField(verbose_name="Minimum")),
+                ("max_value", models.FloatField(verbose_name="Maximum")),
+                ("total", models.FloatField(default=0.0, verbose_name="Total")),
+                ("last_value", models.FloatField(verbose_name="Last Value")),
+                ("last_datetime", models.DateTimeField(verbose_name="Last Timestamp")),
+                (
+                    "sensor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="history_rollups",
+                        to="sense.sensor",
+                        verbose_name="Sensor",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Sensor History Rollup",
+                "verbose_name_plural": "Sensor History Rollups",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("sensor", "resolution_str", "bucket_start"),
+                        name="sensor_history_rollup_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,3 +1,4 @@
+from datetime import datetime
 import json
 
 from django.db import models
@@ -8,7 +9,7 @@ from hi.apps.entity.models import EntityState
 
 from hi.integrations.models import IntegrationDetailsModel
 
-from .enums import SensorType, CorrelationRole
+from .enums import SensorType, CorrelationRole, SensorHistoryResolution
 
 
 class SensorHistoryManager(models.Manager):
@@ -188,3 +189,108 @@ class SensorHistory(models.Model):
             return reverse( 'sense_sensor_history_details',
                             kwargs = { 'sensor_history_id': self.id })        
         return None
+
+
+class SensorHistoryRollup(models.Model):
+    """
+    Aggregate of a numeric sensor's values over one time bucket at one
+    resolution.  Charting a long time range reads one row per bucket
+    instead of every SensorHistory row, and rollups outlive the raw
+    history that the cleanup manager trims.
+    """
+
+    sensor = models.ForeignKey(
+        Sensor,
+        related_name = 'history_rollups',
+        verbose_name = 'Sensor',
+        on_delete = models.CASCADE,
+    )
+    resolution_str = models.CharField(
+        'Resolution',
+        max_length = 32,
+        null = False, blank = False,
+    )
+    bucket_start = models.DateTimeField(
+        'Bucket Start',
+    )
+    count = models.PositiveIntegerField(
+        'Count',
+        default = 0,
+    )
+    min_value = models.FloatField(
+        'Minimum',
+    )
+    max_value = models.FloatField(
+        'Maximum',
+    )
+    total = models.FloatField(
+        'Total',
+        default = 0.0,
+    )
+    last_value = models.FloatField(
+        'Last Value',
+    )
+    last_datetime = models.DateTimeField(
+        'Last Timestamp',
+    )
+
+    class Meta:
+        verbose_name = 'Sensor History Rollup'
+        verbose_name_plural = 'Sensor History Rollups'
+        constraints = [
+            # Also the index for range reads of one sensor's buckets.
+            models.UniqueConstraint(
+                fields = [ 'sensor', 'resolution_str', 'bucket_start' ],
+                name = 'sensor_history_rollup_bucket',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.sensor_id} {self.resolution_str} {self.bucket_start} (n={self.count})'
+
+    @property
+    def resolution(self) -> SensorHistoryResolution:
+        return SensorHistoryResolution.from_name_safe( self.resolution_str )
+
+    @resolution.setter
+    def resolution( self, resolution : SensorHistoryResolution ):
+        self.resolution_str = str(resolution)
+        return
+
+    @property
+    def mean_value(self) -> float:
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def add_value( self, value : float, value_datetime : datetime ):
+        if self.count:
+            self.min_value = min( self.min_value, value )
+            self.max_value = max( self.max_value, value )
+        else:
+            self.min_value = value
+            self.max_value = value
+        self.count += 1
+        self.total += value
+        # Responses can arrive out of order, so "last" is by timestamp.
+        if self.last_datetime is None or value_datetime >= self.last_datetime:
+            self.last_value = value
+            self.last_datetime = value_datetime
+        return
+
+    def merge( self, other : 'SensorHistoryRollup' ):
+        """ Fold in another aggregate of the same bucket. """
+        if not other.count:
+            return
+        if self.count:
+            self.min_value = min( self.min_value, other.min_value )
+            self.max_value = max( self.max_value, other.max_value )
+        else:
+            self.min_value = other.min_value
+            self.max_value = other.max_value
+        self.count += other.count
+        self.total += other.total
+        if self.last_datetime is None or other.last_datetime >= self.last_datetime:
+            self.last_value = other.last_value
+            self.last_datetime = other.last_datetime
+        return
@@ -5,6 +5,7 @@ from typing import List
 from hi.apps.common.singleton import Singleton
 
 from .models import SensorHistory
+from .sensor_history_rollup_manager import SensorHistoryRollupManager
 from .transient_models import SensorResponse
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,7 @@ class SensorHistoryManager( Singleton ):
             continue
 
         created_histories = await self._bulk_create_sensor_history_async( sensor_history_list )
+        await self._add_to_rollups_async( [ sensor_response_list[i] for i in response_indices ] )
 
         # Update the sensor_history_id field in the original SensorResponse objects
         # Safety check: Only update if we got the expected number of results
@@ -80,3 +82,13 @@ class SensorHistoryManager( Singleton ):
                                                thread_sensitive = True)( sensor_history_list )
         return created_objects
 
+    async def _add_to_rollups_async( self, sensor_response_list : List[ SensorResponse ] ):
+        if not sensor_response_list:
+            return
+        try:
+            await sync_to_async( SensorHistoryRollupManager().add_sensor_responses,
+                                 thread_sensitive = True )( sensor_response_list )
+        except Exception as e:
+            # Rollups are derived data (see backfill), so never lose history over them.
+            logger.exception( f'Problem updating sensor history rollups: {e}' )
+        return
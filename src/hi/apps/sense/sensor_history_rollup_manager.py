@@ -0,0 +1,241 @@
+from datetime import datetime, timedelta, timezone
+import logging
+import math
+from typing import Dict, List, Tuple
+
+from django.db import transaction
+import numpy as np
+
+import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.apps.common.singleton import Singleton
+
+from .enums import SensorHistoryResolution
+from .models import Sensor, SensorHistory, SensorHistoryRollup
+from .transient_models import SensorHistoryPoint, SensorHistorySeries, SensorResponse
+
+logger = logging.getLogger(__name__)
+
+
+class SensorHistoryRollupManager( Singleton ):
+    """
+    Maintains per-sensor min/max/mean/count/last buckets at each
+    SensorHistoryResolution for sensors of numeric entity state types,
+    and serves long time ranges from the coarsest buckets needed to
+    stay within a point budget.
+
+    Buckets are updated as sensor responses are persisted to history,
+    with one read and at most one insert and one update per batch.
+    Existing history can be rolled up in bulk with backfill_sensor().
+    """
+
+    BACKFILL_BATCH_SIZE = 1000
+
+    def __init_singleton__(self):
+        return
+
+    @staticmethod
+    def is_rollup_sensor( sensor : Sensor ) -> bool:
+        return bool( sensor
+                     and sensor.persist_history
+                     and sensor.entity_state.entity_state_type.is_numeric )
+
+    @staticmethod
+    def to_numeric_value( value : str ) -> float:
+        """ The float of the sensed value string, or None if not a finite number. """
+        try:
+            numeric_value = float( value )
+        except ( TypeError, ValueError ):
+            return None
+        if not math.isfinite( numeric_value ):
+            return None
+        return numeric_value
+
+    def add_sensor_responses( self, sensor_response_list : List[ SensorResponse ] ):
+        bucket_key_to_rollup : Dict[ Tuple[ int, str, datetime ], SensorHistoryRollup ] = dict()
+        for sensor_response in sensor_response_list:
+            if not self.is_rollup_sensor( sensor_response.sensor ):
+                continue
+            value = self.to_numeric_value( sensor_response.value )
+            if value is None:
+                continue
+            for resolution in SensorHistoryResolution:
+                bucket_key = ( sensor_response.sensor.id,
+                               str(resolution),
+                               resolution.bucket_start( sensor_response.timestamp ) )
+                rollup = bucket_key_to_rollup.get( bucket_key )
+                if rollup is None:
+                    rollup = SensorHistoryRollup(
+                        sensor_id = bucket_key[0],
+                        resolution_str = bucket_key[1],
+                        bucket_start = bucket_key[2],
+                    )
+                    bucket_key_to_rollup[bucket_key] = rollup
+                rollup.add_value( value, sensor_response.timestamp )
+                continue
+            continue
+
+        if bucket_key_to_rollup:
+            self._merge_rollups( bucket_key_to_rollup )
+        return
+
+    def _merge_rollups( self, bucket_key_to_rollup : Dict[ Tuple[ int, str, datetime ], SensorHistoryRollup ] ):
+        # Responses are persisted from a single thread (thread-sensitive
+        # sync_to_async), so this read-modify-write does not race itself.
+        sensor_ids = { x[0] for x in bucket_key_to_rollup.keys() }
+        bucket_starts = { x[2] for x in bucket_key_to_rollup.keys() }
+        with transaction.atomic():
+            existing_queryset = SensorHistoryRollup.objects.filter(
+                sensor_id__in = sensor_ids,
+                bucket_start__in = bucket_starts,
+            )
+            updated_rollup_list = list()
+            for existing_rollup in existing_queryset:
+                bucket_key = ( existing_rollup.sensor_id,
+                               existing_rollup.resolution_str,
+                               existing_rollup.bucket_start )
+                new_rollup = bucket_key_to_rollup.pop( bucket_key, None )
+                if new_rollup is None:
+                    continue
+                existing_rollup.merge( new_rollup )
+                updated_rollup_list.append( existing_rollup )
+                continue
+
+            if updated_rollup_list:
+                SensorHistoryRollup.objects.bulk_update(
+                    updated_rollup_list,
+                    [ 'count', 'min_value', 'max_value', 'total', 'last_value', 'last_datetime' ],
+                )
+            if bucket_key_to_rollup:
+                SensorHistoryRollup.objects.bulk_create( list( bucket_key_to_rollup.values() ))
+        return
+
+    def backfill_sensor( self, sensor : Sensor ) -> int:
+        """
+        Rebuilds all of the sensor's rollups from its SensorHistory.
+        Returns the number of rollups written.
+        """
+        datetime_list = list()
+        value_list = list()
+        history_queryset = SensorHistory.objects.filter( sensor = sensor ).order_by( 'response_datetime' )
+        for response_datetime, value_str in history_queryset.values_list( 'response_datetime', 'value' ):
+            value = self.to_numeric_value( value_str )
+            if value is None:
+                continue
+            datetime_list.append( response_datetime )
+            value_list.append( value )
+            continue
+
+        rollup_list = list()
+        if value_list:
+            epoch_secs = np.array( [ int( x.timestamp() ) for x in datetime_list ], dtype = np.int64 )
+            values = np.array( value_list, dtype = np.float64 )
+            for resolution in SensorHistoryResolution:
+                rollup_list.extend( self._rollups_from_arrays(
+                    sensor = sensor,
+                    resolution = resolution,
+                    datetime_list = datetime_list,
+                    epoch_secs = epoch_secs,
+                    values = values,
+                ))
+                continue
+
+        with transaction.atomic():
+            SensorHistoryRollup.objects.filter( sensor = sensor ).delete()
+            SensorHistoryRollup.objects.bulk_create( rollup_list, batch_size = self.BACKFILL_BATCH_SIZE )
+
+        logger.debug( f'Backfilled {len(rollup_list)} rollups from {len(value_list)} values for {sensor}' )
+        return len( rollup_list )
+
+    def _rollups_from_arrays( self,
+                              sensor         : Sensor,
+                              resolution     : SensorHistoryResolution,
+                              datetime_list  : List[ datetime ],
+                              epoch_secs     : np.ndarray,
+                              values         : np.ndarray ) -> List[ SensorHistoryRollup ]:
+        # Values are in time order, so each bucket is a contiguous run.
+        bucket_ids = epoch_secs // resolution.bucket_secs
+        run_starts = np.flatnonzero( np.diff( bucket_ids, prepend = bucket_ids[0] - 1 ))
+        run_ends = np.append( run_starts[1:], len( values ))
+        counts = run_ends - run_starts
+        min_values = np.minimum.reduceat( values, run_starts )
+        max_values = np.maximum.reduceat( values, run_starts )
+        totals = np.add.reduceat( values, run_starts )
+        last_indices = run_ends - 1
+
+        rollup_list = list()
+        for run_index in range( len( run_starts )):
+            last_index = int( last_indices[run_index] )
+            rollup_list.append( SensorHistoryRollup(
+                sensor = sensor,
+                resolution_str = str(resolution),
+                bucket_start = datetime.fromtimestamp(
+                    int( bucket_ids[run_starts[run_index]] ) * resolution.bucket_secs,
+                    tz = timezone.utc,
+                ),
+                count = int( counts[run_index] ),
+                min_value = float( min_values[run_index] ),
+                max_value = float( max_values[run_index] ),
+                total = float( totals[run_index] ),
+                last_value = float( values[last_index] ),
+                last_datetime = datetime_list[last_index],
+            ))
+            continue
+        return rollup_list
+
+    def choose_resolution( self,
+                           start_datetime  : datetime,
+                           end_datetime    : datetime,
+                           max_points      : int ) -> SensorHistoryResolution:
+        """
+        The finest resolution whose bucket count over the range is within
+        max_points and whose retention covers the range start, else the
+        coarsest resolution.
+        """
+        span_secs = max( ( end_datetime - start_datetime ).total_seconds(), 0 )
+        now_datetime = datetimeproxy.now()
+        resolution_list = SensorHistoryResolution.all()
+        for resolution in resolution_list:
+            if resolution.min_retention_days is not None:
+                retention_start = now_datetime - timedelta( days = resolution.min_retention_days )
+                if start_datetime < retention_start:
+                    continue
+            bucket_count = math.ceil( span_secs / resolution.bucket_secs ) + 1
+            if bucket_count <= max_points:
+                return resolution
+            continue
+        return resolution_list[-1]
+
+    def get_history_series( self,
+                            sensor          : Sensor,
+                            start_datetime  : datetime,
+                            end_datetime    : datetime,
+                            max_points      : int ) -> SensorHistorySeries:
+        if max_points < 1:
+            raise ValueError( f'Invalid max points: {max_points}' )
+        resolution = self.choose_resolution(
+            start_datetime = start_datetime,
+            end_datetime = end_datetime,
+            max_points = max_points,
+        )
+        rollup_queryset = SensorHistoryRollup.objects.filter(
+            sensor = sensor,
+            resolution_str = str(resolution),
+            bucket_start__gte = resolution.bucket_start( start_datetime ),
+            bucket_start__lte = end_datetime,
+        ).order_by( 'bucket_start' )
+        point_list = [
+            SensorHistoryPoint(
+                bucket_start = rollup.bucket_start,
+                min_value = rollup.min_value,
+                max_value = rollup.max_value,
+                mean_value = rollup.mean_value,
+                last_value = rollup.last_value,
+                count = rollup.count,
+            )
+            for rollup in rollup_queryset
+        ]
+        return SensorHistorySeries(
+            sensor_id = sensor.id,
+            resolution = resolution,
+            point_list = point_list,
+        )
@@ -0,0 +1,331 @@
+from datetime import datetime, timedelta, timezone
+import logging
+import random
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.apps.entity.models import Entity, EntityState
+from hi.apps.sense.enums import SensorHistoryResolution
+from hi.apps.sense.models import Sensor, SensorHistory, SensorHistoryRollup
+from hi.apps.sense.sensor_history_manager import SensorHistoryManager
+from hi.apps.sense.sensor_history_rollup_manager import SensorHistoryRollupManager
+from hi.apps.sense.transient_models import SensorResponse
+from hi.integrations.transient_models import IntegrationKey
+from hi.testing.async_task_utils import AsyncTaskTestCase
+from hi.testing.base_test_case import BaseTestCase
+from hi.testing.view_test_base import SyncViewTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class RollupTestMixin:
+
+    BASE_DATETIME = datetime( 2026, 3, 1, 12, 0, 0, tzinfo = timezone.utc )
+
+    def create_sensor( self, entity_state_type_str = 'TEMPERATURE', name = 'Temp', persist_history = True ):
+        entity = Entity.objects.create(
+            name = f'{name} Entity',
+            entity_type_str = 'THERMOMETER',
+        )
+        entity_state = EntityState.objects.create(
+            entity = entity,
+            entity_state_type_str = entity_state_type_str,
+        )
+        return Sensor.objects.create(
+            name = name,
+            entity_state = entity_state,
+            sensor_type_str = 'DEFAULT',
+            integration_id = f'{name}_id',
+            integration_name = 'test_integration',
+            persist_history = persist_history,
+        )
+
+    def create_response( self, sensor, value, timestamp ):
+        return SensorResponse(
+            integration_key = IntegrationKey( sensor.integration_id, sensor.integration_name ),
+            value = str(value),
+            timestamp = timestamp,
+            sensor = sensor,
+        )
+
+    def get_rollup( self, sensor, resolution, bucket_start ):
+        return SensorHistoryRollup.objects.get(
+            sensor = sensor,
+            resolution_str = str(resolution),
+            bucket_start = bucket_start,
+        )
+
+
+class TestSensorHistoryResolution(BaseTestCase):
+
+    def test_bucket_start_aligns_to_utc(self):
+        timestamp = datetime( 2026, 3, 1, 12, 37, 45, tzinfo = timezone.utc )
+        self.assertEqual( SensorHistoryResolution.ONE_MINUTE.bucket_start( timestamp ),
+                          datetime( 2026, 3, 1, 12, 37, tzinfo = timezone.utc ))
+        self.assertEqual( SensorHistoryResolution.FIFTEEN_MINUTES.bucket_start( timestamp ),
+                          datetime( 2026, 3, 1, 12, 30, tzinfo = timezone.utc ))
+        self.assertEqual( SensorHistoryResolution.ONE_HOUR.bucket_start( timestamp ),
+                          datetime( 2026, 3, 1, 12, 0, tzinfo = timezone.utc ))
+        self.assertEqual( SensorHistoryResolution.ONE_DAY.bucket_start( timestamp ),
+                          datetime( 2026, 3, 1, tzinfo = timezone.utc ))
+
+
+class TestSensorHistoryRollupIncremental( RollupTestMixin, BaseTestCase ):
+
+    def setUp(self):
+        super().setUp()
+        self.manager = SensorHistoryRollupManager()
+        self.sensor = self.create_sensor()
+        return
+
+    def test_batch_aggregates_into_every_resolution(self):
+        self.manager.add_sensor_responses([
+            self.create_response( self.sensor, 20.0, self.BASE_DATETIME ),
+            self.create_response( self.sensor, 24.0, self.BASE_DATETIME + timedelta( seconds = 30 )),
+            self.create_response( self.sensor, 22.0, self.BASE_DATETIME + timedelta( minutes = 5 )),
+        ])
+
+        minute_rollup = self.get_rollup( self.sensor, SensorHistoryResolution.ONE_MINUTE, self.BASE_DATETIME )
+        self.assertEqual( minute_rollup.count, 2 )
+        self.assertEqual( minute_rollup.min_value, 20.0 )
+        self.assertEqual( minute_rollup.max_value, 24.0 )
+        self.assertEqual( minute_rollup.mean_value, 22.0 )
+        self.assertEqual( minute_rollup.last_value, 24.0 )
+
+        for resolution in [ SensorHistoryResolution.FIFTEEN_MINUTES,
+                            SensorHistoryResolution.ONE_HOUR,
+                            SensorHistoryResolution.ONE_DAY ]:
+            rollup = self.get_rollup( self.sensor, resolution, resolution.bucket_start( self.BASE_DATETIME ))
+            self.assertEqual( rollup.count, 3 )
+            self.assertEqual( rollup.mean_value, 22.0 )
+            self.assertEqual( rollup.last_value, 22.0 )
+            continue
+        self.assertEqual( SensorHistoryRollup.objects.count(), 5 )
+
+    def test_later_batches_merge_into_existing_buckets(self):
+        self.manager.add_sensor_responses([
+            self.create_response( self.sensor, 10.0, self.BASE_DATETIME + timedelta( seconds = 20 )),
+        ])
+        # Arrives later but is older, so it must not become the last value.
+        self.manager.add_sensor_responses([
+            self.create_response( self.sensor, 4.0, self.BASE_DATETIME + timedelta( seconds = 10 )),
+            self.create_response( self.sensor, 16.0, self.BASE_DATETIME + timedelta( minutes = 2 )),
+        ])
+
+        minute_rollup = self.get_rollup( self.sensor, SensorHistoryResolution.ONE_MINUTE, self.BASE_DATETIME )
+        self.assertEqual( minute_rollup.count, 2 )
+        self.assertEqual( minute_rollup.min_value, 4.0 )
+        self.assertEqual( minute_rollup.last_value, 10.0 )
+
+        hour_rollup = self.get_rollup( self.sensor, SensorHistoryResolution.ONE_HOUR, self.BASE_DATETIME )
+        self.assertEqual( hour_rollup.count, 3 )
+        self.assertEqual( hour_rollup.max_value, 16.0 )
+        self.assertEqual( hour_rollup.total, 30.0 )
+        self.assertEqual( hour_rollup.last_value, 16.0 )
+
+    def test_batch_uses_constant_number_of_queries(self):
+        self.manager.add_sensor_responses([
+            self.create_response( self.sensor, 1.0, self.BASE_DATETIME ),
+        ])
+        response_list = [
+            self.create_response( self.sensor, float(x), self.BASE_DATETIME + timedelta( seconds = 20 * x ))
+            for x in range( 30 )
+        ]
+        with CaptureQueriesContext( connection ) as context:
+            self.manager.add_sensor_responses( response_list )
+        # Select, bulk update, bulk insert and the transaction savepoint pair.
+        self.assertLessEqual( len( context.captured_queries ), 5 )
+
+    def test_non_numeric_sensors_and_values_are_skipped(self):
+        on_off_sensor = self.create_sensor( entity_state_type_str = 'ON_OFF', name = 'Switch' )
+        no_history_sensor = self.create_sensor( name = 'NoHistory', persist_history = False )
+        self.manager.add_sensor_responses([
+            self.create_response( on_off_sensor, 'on', self.BASE_DATETIME ),
+            self.create_response( no_history_sensor, 5.0, self.BASE_DATETIME ),
+            self.create_response( self.sensor, 'unavailable', self.BASE_DATETIME ),
+            self.create_response( self.sensor, 'nan', self.BASE_DATETIME ),
+        ])
+        self.assertFalse( SensorHistoryRollup.objects.exists() )
+
+
+class TestSensorHistoryRollupBackfill( RollupTestMixin, BaseTestCase ):
+
+    def setUp(self):
+        super().setUp()
+        self.manager = SensorHistoryRollupManager()
+        self.sensor = self.create_sensor()
+        return
+
+    def test_backfill_matches_incremental_rollups(self):
+        rng = random.Random( 37 )
+        response_list = list()
+        for index in range( 400 ):
+            timestamp = self.BASE_DATETIME + timedelta( seconds = rng.randint( 0, 3 * 24 * 3600 ))
+            value = round( rng.uniform( -10, 40 ), 2 )
+            response_list.append( self.create_response( self.sensor, value, timestamp ))
+            continue
+        response_list.append( self.create_response( self.sensor, 'unknown', self.BASE_DATETIME ))
+        SensorHistory.objects.bulk_create([ x.to_sensor_history() for x in response_list ])
+
+        # Uneven batches, in arrival order rather than time order.
+        for start_index in range( 0, len( response_list ), 37 ):
+            self.manager.add_sensor_responses( response_list[start_index:start_index + 37] )
+            continue
+        incremental = self._rollup_map()
+
+        rollup_count = self.manager.backfill_sensor( self.sensor )
+        backfilled = self._rollup_map()
+
+        self.assertEqual( rollup_count, len( incremental ))
+        self.assertEqual( set( backfilled.keys() ), set( incremental.keys() ))
+        for bucket_key, values in incremental.items():
+            backfilled_values = backfilled[bucket_key]
+            self.assertEqual( backfilled_values[0], values[0] )
+            for index in range( 1, 4 ):
+                self.assertAlmostEqual( backfilled_values[index], values[index], places = 6 )
+                continue
+            continue
+
+    def test_backfill_replaces_existing_rollups(self):
+        self.manager.add_sensor_responses([
+            self.create_response( self.sensor, 99.0, self.BASE_DATETIME ),
+        ])
+        SensorHistory.objects.create(
+            sensor = self.sensor,
+            value = '5',
+            response_datetime = self.BASE_DATETIME,
+        )
+        self.assertEqual( self.manager.backfill_sensor( self.sensor ), 4 )
+        minute_rollup = self.get_rollup( self.sensor, SensorHistoryResolution.ONE_MINUTE, self.BASE_DATETIME )
+        self.assertEqual( minute_rollup.count, 1 )
+        self.assertEqual( minute_rollup.max_value, 5.0 )
+
+    def _rollup_map(self):
+        return {
+            ( x.resolution_str, x.bucket_start ): ( x.count, x.min_value, x.max_value, x.total, x.last_value )
+            for x in SensorHistoryRollup.objects.filter( sensor = self.sensor )
+        }
+
+
+class TestSensorHistorySeries( RollupTestMixin, BaseTestCase ):
+
+    def setUp(self):
+        super().setUp()
+        self.manager = SensorHistoryRollupManager()
+        self.sensor = self.create_sensor()
+        datetimeproxy.set( self.BASE_DATETIME + timedelta( days = 2 ))
+        return
+
+    def test_choose_resolution_fits_point_budget(self):
+        end_datetime = datetimeproxy.now()
+        for span, max_points, expected in [
+                ( timedelta( hours = 1 ), 500, SensorHistoryResolution.ONE_MINUTE ),
+                ( timedelta( days = 1 ), 500, SensorHistoryResolution.FIFTEEN_MINUTES ),
+                ( timedelta( days = 1 ), 50, SensorHistoryResolution.ONE_HOUR ),
+                ( timedelta( days = 30 ), 50, SensorHistoryResolution.ONE_DAY ),
+                ( timedelta( days = 3650 ), 50, SensorHistoryResolution.ONE_DAY ),
+        ]:
+            resolution = self.manager.choose_resolution(
+                start_datetime = end_datetime - span,
+                end_datetime = end_datetime,
+                max_points = max_points,
+            )
+            self.assertEqual( resolution, expected, f'{span} / {max_points}' )
+            continue
+
+    def test_choose_resolution_skips_trimmed_resolutions(self):
+        # Fits 1-minute buckets, but those are only kept for a week.
+        start_datetime = datetimeproxy.now() - timedelta( days = 30 )
+        resolution = self.manager.choose_resolution(
+            start_datetime = start_datetime,
+            end_datetime = start_datetime + timedelta( hours = 1 ),
+            max_points = 500,
+        )
+        self.assertEqual( resolution, SensorHistoryResolution.FIFTEEN_MINUTES )
+
+    def test_series_reads_buckets_in_one_query(self):
+        self.manager.add_sensor_responses([
+            self.create_response( self.sensor, float(x), self.BASE_DATETIME + timedelta( minutes = 10 * x ))
+            for x in range( 24 )
+        ])
+        with CaptureQueriesContext( connection ) as context:
+            series = self.manager.get_history_series(
+                sensor = self.sensor,
+                start_datetime = self.BASE_DATETIME,
+                end_datetime = self.BASE_DATETIME + timedelta( hours = 4 ),
+                max_points = 10,
+            )
+        self.assertEqual( len( context.captured_queries ), 1 )
+        self.assertEqual( series.resolution, SensorHistoryResolution.ONE_HOUR )
+        self.assertEqual( [ x.count for x in series.point_list ], [ 6, 6, 6, 6 ] )
+        self.assertEqual( series.point_list[0].mean_value, 2.5 )
+        self.assertEqual( series.point_list[-1].last_value, 23.0 )
+
+    def test_invalid_max_points(self):
+        with self.assertRaises( ValueError ):
+            self.manager.get_history_series(
+                sensor = self.sensor,
+                start_datetime = self.BASE_DATETIME,
+                end_datetime = self.BASE_DATETIME,
+                max_points = 0,
+            )
+
+
+class TestSensorHistoryManagerRollups( RollupTestMixin, AsyncTaskTestCase ):
+    """ Needs TransactionTestCase semantics so worker threads see the sensor row. """
+
+    def test_persisted_responses_update_rollups(self):
+        sensor = self.create_sensor()
+        response_list = [
+            self.create_response( sensor, 12.5, self.BASE_DATETIME ),
+            self.create_response( sensor, 13.5, self.BASE_DATETIME + timedelta( seconds = 5 )),
+        ]
+        self.run_async( SensorHistoryManager().add_to_sensor_history( response_list ))
+
+        self.assertEqual( SensorHistory.objects.filter( sensor = sensor ).count(), 2 )
+        minute_rollup = self.get_rollup( sensor, SensorHistoryResolution.ONE_MINUTE, self.BASE_DATETIME )
+        self.assertEqual( minute_rollup.count, 2 )
+        self.assertEqual( minute_rollup.mean_value, 13.0 )
+
+
+class TestSensorHistorySeriesView( RollupTestMixin, SyncViewTestCase ):
+
+    def setUp(self):
+        super().setUp()
+        self.sensor = self.create_sensor()
+        SensorHistoryRollupManager().add_sensor_responses([
+            self.create_response( self.sensor, 3.0, self.BASE_DATETIME ),
+            self.create_response( self.sensor, 5.0, self.BASE_DATETIME + timedelta( minutes = 1 )),
+        ])
+        datetimeproxy.set( self.BASE_DATETIME + timedelta( hours = 1 ))
+        self.url = reverse( 'sense_sensor_history_series', kwargs = { 'sensor_id': self.sensor.id } )
+        return
+
+    def test_series_json(self):
+        response = self.client.get( self.url, {
+            'start': self.BASE_DATETIME.isoformat(),
+            'end': ( self.BASE_DATETIME + timedelta( minutes = 5 )).isoformat(),
+            'max_points': 100,
+        })
+        self.assertSuccessResponse( response )
+        data = response.json()
+        self.assertEqual( data['resolution'], str( SensorHistoryResolution.ONE_MINUTE ))
+        self.assertEqual( data['bucket_secs'], 60 )
+        self.assertEqual( [ x['mean'] for x in data['points'] ], [ 3.0, 5.0 ] )
+
+    def test_bad_parameters(self):
+        for params in [ { 'start': 'yesterday' },
+                        { 'start': '2026-03-01T12:00:00' },
+                        { 'max_points': 0 },
+                        { 'start': '2026-03-02T00:00:00Z', 'end': '2026-03-01T00:00:00Z' } ]:
+            response = self.client.get( self.url, params )
+            self.assertEqual( response.status_code, 400, params )
+            continue
+
+    def test_unknown_sensor(self):
+        response = self.client.get( reverse( 'sense_sensor_history_series',
+                                             kwargs = { 'sensor_id': self.sensor.id + 100 } ))
+        self.assertEqual( response.status_code, 404 )
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 import json
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from django.urls import reverse
 
@@ -10,7 +10,7 @@ from hi.apps.entity.enums import EntityStateValue
 from hi.integrations.transient_models import IntegrationKey
 
 from .models import Sensor, SensorHistory
-from .enums import CorrelationRole
+from .enums import CorrelationRole, SensorHistoryResolution
 from .sensor_history_urls import (
     sensor_history_details_url,
     sensor_history_video_browse_url,
@@ -156,3 +156,38 @@ class SensorResponse:
             correlation_id = sensor_response_dict.get('correlation_id'),
             sensor_history_id = sensor_response_dict.get('sensor_history_id'),
         )
+
+
+@dataclass
+class SensorHistoryPoint:
+    bucket_start  : datetime
+    min_value     : float
+    max_value     : float
+    mean_value    : float
+    last_value    : float
+    count         : int
+
+    def to_dict(self):
+        return {
+            'bucket_start': self.bucket_start.isoformat(),
+            'min': self.min_value,
+            'max': self.max_value,
+            'mean': self.mean_value,
+            'last': self.last_value,
+            'count': self.count,
+        }
+
+
+@dataclass
+class SensorHistorySeries:
+    sensor_id     : int
+    resolution    : SensorHistoryResolution
+    point_list    : List[ SensorHistoryPoint ]
+
+    def to_dict(self):
+        return {
+            'sensor_id': self.sensor_id,
+            'resolution': str(self.resolution),
+            'bucket_secs': self.resolution.bucket_secs,
+            'points': [ x.to_dict() for x in self.point_list ],
+        }
@@ -8,4 +8,8 @@ urlpatterns = [
     path( 'sensor/response/details/<int:sensor_history_id>',
           views.SensorHistoryDetailsView.as_view(),
           name='sense_sensor_history_details'),
+
+    path( 'sensor/<int:sensor_id>/history/series',
+          views.SensorHistorySeriesView.as_view(),
+          name='sense_sensor_history_series'),
 ]
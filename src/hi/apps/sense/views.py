@@ -1,7 +1,14 @@
+from datetime import datetime, timedelta
 import logging
 
+from django.core.exceptions import BadRequest
+from django.http import JsonResponse
+from django.views.generic import View
+
+import hi.apps.common.datetimeproxy as datetimeproxy
 from hi.hi_async_view import HiModalView
 
+from .sensor_history_rollup_manager import SensorHistoryRollupManager
 from .transient_models import SensorResponse
 from .view_mixins import SenseViewMixin
 
@@ -28,3 +35,57 @@ class SensorHistoryDetailsView( HiModalView, SenseViewMixin ):
             'sensor_response': sensor_response,
         }
         return self.modal_response( request, context )
+
+
+class SensorHistorySeriesView( View, SenseViewMixin ):
+    """
+    Chart data for a numeric sensor over a time range, as rollup buckets
+    at the finest resolution that fits the requested number of points.
+    """
+
+    StartAttr = 'start'
+    EndAttr = 'end'
+    MaxPointsAttr = 'max_points'
+
+    DEFAULT_RANGE = timedelta( days = 1 )
+    DEFAULT_MAX_POINTS = 500
+    MAX_MAX_POINTS = 5000
+
+    def get( self, request, *args, **kwargs ):
+        sensor = self.get_sensor( request, *args, **kwargs )
+
+        end_datetime = self._get_datetime_param( request, self.EndAttr )
+        if end_datetime is None:
+            end_datetime = datetimeproxy.now()
+        start_datetime = self._get_datetime_param( request, self.StartAttr )
+        if start_datetime is None:
+            start_datetime = end_datetime - self.DEFAULT_RANGE
+        if start_datetime > end_datetime:
+            raise BadRequest( 'Start is after end.' )
+
+        try:
+            max_points = int( request.GET.get( self.MaxPointsAttr, self.DEFAULT_MAX_POINTS ))
+        except ( TypeError, ValueError ):
+            raise BadRequest( 'Invalid max points.' )
+        if not ( 1 <= max_points <= self.MAX_MAX_POINTS ):
+            raise BadRequest( f'Max points must be between 1 and {self.MAX_MAX_POINTS}.' )
+
+        sensor_history_series = SensorHistoryRollupManager().get_history_series(
+            sensor = sensor,
+            start_datetime = start_datetime,
+            end_datetime = end_datetime,
+            max_points = max_points,
+        )
+        return JsonResponse( sensor_history_series.to_dict() )
+
+    def _get_datetime_param( self, request, name : str ) -> datetime:
+        value = request.GET.get( name )
+        if not value:
+            return None
+        try:
+            value_datetime = datetime.fromisoformat( value.replace( 'Z', '+00:00' ))
+        except ( TypeError, ValueError ):
+            raise BadRequest( f'Missing or invalid date/time format "{value}".' )
+        if value_datetime.tzinfo is None:
+            raise BadRequest( f'Date/time must include a timezone "{value}".' )
+        return value_datetime
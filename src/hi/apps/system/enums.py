@@ -258,3 +258,22 @@ class HealthAggregationRule(LabeledEnum):
             return cls.MAJORITY_SOURCES_HEALTHY  # Most sources must be healthy
         else:
             return cls.ANY_SOURCE_HEALTHY  # At least one source must work
+
+
+class TimingMetricType(LabeledEnum):
+    """ Groups of in-process timing histograms shown on the System Info page. """
+
+    MONITOR_CYCLE        = ( 'Monitor Cycle Duration',
+                             'Time each periodic monitor cycle (do_work) takes.' )
+    MONITOR_START_LAG    = ( 'Monitor Start Lag',
+                             'How late each monitor cycle starts relative to its interval.' )
+    EVENT_LOOP_LAG       = ( 'Event Loop Lag',
+                             'How long each background event loop is blocked past a scheduled wake-up.' )
+    EXECUTOR_QUEUE_WAIT  = ( 'Executor Queue Wait',
+                             'Round trip of a no-op through each sync_to_async executor.' )
+    EVENT_ACTION_LATENCY = ( 'Event Action Latency',
+                             'From event detection to its alarm or control action completing.' )
+    LOCK_WAIT            = ( 'Lock Wait',
+                             'How long each acquisition of a named lock waited for it.' )
+    EMAIL_DELIVERY       = ( 'Email Delivery Latency',
+                             'From an email being queued to the mail server accepting it.' )
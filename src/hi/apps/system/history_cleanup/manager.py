@@ -15,7 +15,8 @@ from hi.apps.common.history_table_manager import (
 )
 from hi.apps.control.models import ControllerHistory
 from hi.apps.event.models import EventHistory
-from hi.apps.sense.models import SensorHistory
+from hi.apps.sense.enums import SensorHistoryResolution
+from hi.apps.sense.models import SensorHistory, SensorHistoryRollup
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,18 @@ class HistoryCleanupManager:
                     deletion_batch_size = 1000    # Delete 1K per cycle
                 ),
             },
+            {
+                'name': 'SensorHistoryRollup (1 minute)',
+                'manager': self._sensor_history_rollup_table_manager(
+                    SensorHistoryResolution.ONE_MINUTE,
+                ),
+            },
+            {
+                'name': 'SensorHistoryRollup (15 minutes)',
+                'manager': self._sensor_history_rollup_table_manager(
+                    SensorHistoryResolution.FIFTEEN_MINUTES,
+                ),
+            },
             {
                 'name': 'ControllerHistory',
                 'manager': HistoryTableManager(
@@ -72,6 +85,16 @@ class HistoryCleanupManager:
             },
         ]
 
+    def _sensor_history_rollup_table_manager( self, resolution : SensorHistoryResolution ):
+        # Coarser resolutions are small enough to keep indefinitely.
+        return HistoryTableManager(
+            queryset = SensorHistoryRollup.objects.filter( resolution_str = str(resolution) ),
+            date_field_name = 'bucket_start',
+            min_days_retention = resolution.min_retention_days,
+            max_records_limit = 200000,
+            deletion_batch_size = 1000,
+        )
+
     def cleanup_next_batch(self) -> CleanupResult:
         """
         Perform cleanup on the next batch across all history tables.
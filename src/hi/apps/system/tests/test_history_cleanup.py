@@ -155,12 +155,16 @@ class HistoryCleanupManagerTests(TransactionTestCase):
         """Test that HistoryCleanupManager initializes correctly."""
         manager = HistoryCleanupManager()
 
-        # Should have 3 table managers configured
-        self.assertEqual(len(manager._table_managers), 3)
+        # Should have 5 table managers configured
+        self.assertEqual(len(manager._table_managers), 5)
 
         # Check table names
         table_names = [config['name'] for config in manager._table_managers]
-        expected_names = ['SensorHistory', 'ControllerHistory', 'EventHistory']
+        expected_names = ['SensorHistory',
+                          'SensorHistoryRollup (1 minute)',
+                          'SensorHistoryRollup (15 minutes)',
+                          'ControllerHistory',
+                          'EventHistory']
         self.assertEqual(set(table_names), set(expected_names))
 
     def test_cleanup_with_empty_tables(self):
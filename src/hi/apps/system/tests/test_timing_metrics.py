@@ -0,0 +1,161 @@
+import asyncio
+import logging
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from hi.apps.monitor.periodic_monitor import PeriodicMonitor
+from hi.apps.system.enums import TimingMetricType
+from hi.apps.system.provider_info import ProviderInfo
+from hi.apps.system.timing_metrics import (
+    EventLoopLagSampler,
+    TimingHistogram,
+    TimingMetrics,
+)
+from hi.testing.async_task_utils import AsyncTaskFastTestCase
+from hi.testing.view_test_base import SyncViewTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class _TimedTestMonitor( PeriodicMonitor ):
+
+    def __init__(self):
+        super().__init__( id = 'timed-test-monitor', interval_secs = 1 )
+        return
+
+    @classmethod
+    def get_provider_info(cls) -> ProviderInfo:
+        return ProviderInfo(
+            provider_id = 'timed_test_monitor',
+            provider_name = 'Timed Test Monitor',
+            description = '',
+        )
+
+    async def do_work(self):
+        raise ValueError( 'Failed cycles are still timed.' )
+
+
+class TestTimingHistogram(TestCase):
+
+    def test_buckets_and_percentiles(self):
+        histogram = TimingHistogram( name = 'test' )
+        for _ in range( 90 ):
+            histogram.record( 0.003 )
+            continue
+        for _ in range( 9 ):
+            histogram.record( 0.2 )
+            continue
+        histogram.record( 90.0 )
+
+        self.assertEqual( histogram.count, 100 )
+        self.assertEqual( histogram.percentile_ms( 50 ), 5.0 )
+        self.assertEqual( histogram.percentile_ms( 90 ), 5.0 )
+        self.assertEqual( histogram.percentile_ms( 99 ), 250.0 )
+        self.assertEqual( histogram.percentile_ms( 100 ), 90000.0 )
+
+        data = histogram.to_dict()
+        self.assertEqual( data['buckets']['le_5ms'], 90 )
+        self.assertEqual( data['buckets']['le_250ms'], 9 )
+        self.assertEqual( data['buckets']['overflow'], 1 )
+        self.assertEqual( data['last_ms'], 90000.0 )
+
+    def test_percentile_capped_by_max(self):
+        histogram = TimingHistogram( name = 'test' )
+        histogram.record( 0.0003 )
+        self.assertAlmostEqual( histogram.percentile_ms( 50 ), 0.3 )
+
+    def test_empty_histogram(self):
+        data = TimingHistogram( name = 'test' ).to_dict()
+        self.assertEqual( data['count'], 0 )
+        self.assertIsNone( data['p50_ms'] )
+        self.assertIsNone( data['mean_ms'] )
+
+
+class TestTimingMetrics(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        TimingMetrics().__init_singleton__()
+        return
+
+    def test_histograms_grouped_by_type_and_sorted_by_name(self):
+        timing_metrics = TimingMetrics()
+        timing_metrics.record( TimingMetricType.MONITOR_CYCLE, 'zwave', 0.01 )
+        timing_metrics.record( TimingMetricType.MONITOR_CYCLE, 'hass', 0.02 )
+        timing_metrics.record( TimingMetricType.MONITOR_CYCLE, 'hass', 0.03 )
+
+        data = timing_metrics.to_dict()
+        histogram_list = data[str(TimingMetricType.MONITOR_CYCLE)]['histograms']
+        self.assertEqual( [ x['name'] for x in histogram_list ], [ 'hass', 'zwave' ] )
+        self.assertEqual( histogram_list[0]['count'], 2 )
+        self.assertEqual( data[str(TimingMetricType.EVENT_LOOP_LAG)]['histograms'], [] )
+        self.assertEqual( len( timing_metrics.get_display_data() ), len( TimingMetricType ))
+
+
+class TestTimingInstrumentation(AsyncTaskFastTestCase):
+
+    def setUp(self):
+        super().setUp()
+        TimingMetrics().__init_singleton__()
+        return
+
+    def test_monitor_cycle_is_recorded(self):
+        monitor = _TimedTestMonitor()
+        self.run_async( monitor.run_query() )
+        histogram = TimingMetrics().get_histogram( TimingMetricType.MONITOR_CYCLE, monitor.id )
+        self.assertEqual( histogram.count, 1 )
+
+    def test_sampler_records_loop_lag_and_executor_wait(self):
+        sampler = EventLoopLagSampler( loop_name = 'Test Loop' )
+
+        async def test_logic():
+            with patch.object( EventLoopLagSampler, 'SAMPLE_INTERVAL_SECS', 0.01 ):
+                await sampler.sample()
+                await sampler.sample()
+            return
+
+        self.run_async( test_logic() )
+        timing_metrics = TimingMetrics()
+        lag_histogram = timing_metrics.get_histogram( TimingMetricType.EVENT_LOOP_LAG, 'Test Loop' )
+        self.assertEqual( lag_histogram.count, 2 )
+
+        # Executors are only probed on every Nth sample.
+        executor_histogram_list = timing_metrics.get_histogram_list( TimingMetricType.EXECUTOR_QUEUE_WAIT )
+        self.assertEqual( [ x.count for x in executor_histogram_list ], [ 1, 1 ] )
+
+    def test_sampler_run_survives_sample_errors(self):
+        sampler = EventLoopLagSampler( loop_name = 'Test Loop' )
+        call_list = list()
+
+        async def failing_sample():
+            call_list.append( True )
+            if len( call_list ) >= 3:
+                raise asyncio.CancelledError()
+            raise RuntimeError( 'sample failed' )
+
+        async def test_logic():
+            with patch.object( sampler, 'sample', failing_sample ):
+                with self.assertRaises( asyncio.CancelledError ):
+                    await sampler.run()
+            return
+
+        self.run_async( test_logic() )
+        self.assertEqual( len( call_list ), 3 )
+
+
+class TestSystemTimingMetricsView(SyncViewTestCase):
+
+    def test_export_json(self):
+        TimingMetrics().record( TimingMetricType.MONITOR_CYCLE, 'view-test-monitor', 0.01 )
+        response = self.client.get( reverse( 'system_timing_metrics' ))
+        self.assertSuccessResponse( response )
+        self.assertJsonResponse( response )
+        histogram_list = response.json()[str(TimingMetricType.MONITOR_CYCLE)]['histograms']
+        self.assertIn( 'view-test-monitor', [ x['name'] for x in histogram_list ] )
+
+    def test_system_info_shows_timing(self):
+        response = self.client.get( reverse( 'system_info' ))
+        self.assertSuccessResponse( response )
+        self.assertTemplateRendered( response, 'system/panes/timing_metrics.html' )
@@ -0,0 +1,206 @@
+"""
+In-process timing instrumentation: fixed-bucket latency histograms for
+periodic monitor cycles, background event loop lag and sync_to_async
+executor queue waits.  Everything lives in memory and is exported via
+the System Info page (and its JSON view), so no external metrics
+collector is needed.
+"""
+import asyncio
+from bisect import bisect_left
+import logging
+from threading import Lock
+import time
+from typing import Dict, List
+
+from asgiref.sync import sync_to_async
+
+from hi.apps.common.singleton import Singleton
+
+from .enums import TimingMetricType
+
+logger = logging.getLogger(__name__)
+
+
+class TimingHistogram:
+    """
+    Counts of timings in fixed buckets.  Percentiles are reported as the
+    upper bound of the bucket they fall in (the maximum for the last,
+    unbounded bucket), so they are conservative to within a bucket.
+    """
+
+    BUCKET_UPPER_BOUNDS_MS = [
+        1, 2, 5, 10, 25, 50, 100, 250, 500,
+        1000, 2500, 5000, 10000, 30000, 60000,
+    ]
+
+    def __init__( self, name : str ):
+        self._name = name
+        self._lock = Lock()
+        self._bucket_counts = [ 0 ] * ( len( self.BUCKET_UPPER_BOUNDS_MS ) + 1 )
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._last_ms = None
+        return
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record( self, elapsed_secs : float ):
+        elapsed_ms = max( elapsed_secs, 0.0 ) * 1000.0
+        bucket_index = bisect_left( self.BUCKET_UPPER_BOUNDS_MS, elapsed_ms )
+        with self._lock:
+            self._bucket_counts[bucket_index] += 1
+            self._count += 1
+            self._total_ms += elapsed_ms
+            self._max_ms = max( self._max_ms, elapsed_ms )
+            self._last_ms = elapsed_ms
+        return
+
+    def percentile_ms( self, percentile : float ) -> float:
+        with self._lock:
+            return self._percentile_ms( percentile )
+
+    def _percentile_ms( self, percentile : float ) -> float:
+        if not self._count:
+            return None
+        target_count = self._count * percentile / 100.0
+        cumulative_count = 0
+        for bucket_index, bucket_count in enumerate( self._bucket_counts ):
+            cumulative_count += bucket_count
+            if bucket_count and ( cumulative_count >= target_count ):
+                if bucket_index < len( self.BUCKET_UPPER_BOUNDS_MS ):
+                    return float( min( self.BUCKET_UPPER_BOUNDS_MS[bucket_index], self._max_ms ))
+                return self._max_ms
+            continue
+        return self._max_ms
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            bucket_labels = [ f'le_{x}ms' for x in self.BUCKET_UPPER_BOUNDS_MS ] + [ 'overflow' ]
+            return {
+                'name': self._name,
+                'count': self._count,
+                'mean_ms': round( self._total_ms / self._count, 3 ) if self._count else None,
+                'p50_ms': self._percentile_ms( 50 ),
+                'p90_ms': self._percentile_ms( 90 ),
+                'p99_ms': self._percentile_ms( 99 ),
+                'max_ms': round( self._max_ms, 3 ) if self._count else None,
+                'last_ms': round( self._last_ms, 3 ) if self._last_ms is not None else None,
+                'buckets': dict( zip( bucket_labels, self._bucket_counts )),
+            }
+
+
+class TimingMetrics( Singleton ):
+
+    def __init_singleton__(self):
+        self._lock = Lock()
+        self._histogram_map : Dict[ TimingMetricType, Dict[ str, TimingHistogram ]] = {
+            x: dict() for x in TimingMetricType
+        }
+        return
+
+    def record( self,
+                timing_metric_type  : TimingMetricType,
+                name                : str,
+                elapsed_secs        : float ):
+        self.get_histogram( timing_metric_type, name ).record( elapsed_secs )
+        return
+
+    def get_histogram( self,
+                       timing_metric_type  : TimingMetricType,
+                       name                : str ) -> TimingHistogram:
+        histogram = self._histogram_map[timing_metric_type].get( name )
+        if histogram is None:
+            with self._lock:
+                histogram = self._histogram_map[timing_metric_type].setdefault(
+                    name, TimingHistogram( name = name ),
+                )
+        return histogram
+
+    def get_histogram_list( self, timing_metric_type : TimingMetricType ) -> List[ TimingHistogram ]:
+        with self._lock:
+            histogram_list = list( self._histogram_map[timing_metric_type].values() )
+        histogram_list.sort( key = lambda x: x.name )
+        return histogram_list
+
+    def to_dict(self) -> Dict:
+        return {
+            str(timing_metric_type): {
+                'label': timing_metric_type.label,
+                'histograms': [ x.to_dict() for x in self.get_histogram_list( timing_metric_type ) ],
+            }
+            for timing_metric_type in TimingMetricType
+        }
+
+    def get_display_data(self) -> List[ Dict ]:
+        return [
+            {
+                'label': timing_metric_type.label,
+                'description': timing_metric_type.description,
+                'histograms': [ x.to_dict() for x in self.get_histogram_list( timing_metric_type ) ],
+            }
+            for timing_metric_type in TimingMetricType
+        ]
+
+
+def _executor_probe():
+    return
+
+
+class EventLoopLagSampler:
+    """
+    Runs as a task in a background event loop.  Each sample sleeps for
+    the sample interval and records how much later than requested the
+    loop woke up, which is how long other work held the loop.  Every
+    few samples it also times a no-op through each sync_to_async
+    executor, which is the queue wait any sync call would see.
+    """
+
+    SAMPLE_INTERVAL_SECS = 1.0
+    EXECUTOR_SAMPLE_EVERY = 10
+
+    THREAD_SENSITIVE_EXECUTOR_NAME = 'sync_to_async (thread sensitive)'
+    THREAD_POOL_EXECUTOR_NAME = 'sync_to_async (thread pool)'
+
+    def __init__( self, loop_name : str ):
+        self._loop_name = loop_name
+        self._sample_count = 0
+        return
+
+    async def run(self):
+        while True:
+            try:
+                await self.sample()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning( f'Event loop lag sampling failed for {self._loop_name}: {e}' )
+            continue
+
+    async def sample(self):
+        start_time = time.perf_counter()
+        await asyncio.sleep( self.SAMPLE_INTERVAL_SECS )
+        lag_secs = time.perf_counter() - start_time - self.SAMPLE_INTERVAL_SECS
+        TimingMetrics().record( TimingMetricType.EVENT_LOOP_LAG, self._loop_name, lag_secs )
+
+        self._sample_count += 1
+        if ( self._sample_count % self.EXECUTOR_SAMPLE_EVERY ) == 1:
+            await self._sample_executor( self.THREAD_SENSITIVE_EXECUTOR_NAME, thread_sensitive = True )
+            await self._sample_executor( self.THREAD_POOL_EXECUTOR_NAME, thread_sensitive = False )
+        return
+
+    async def _sample_executor( self, executor_name : str, thread_sensitive : bool ):
+        start_time = time.perf_counter()
+        await sync_to_async( _executor_probe, thread_sensitive = thread_sensitive )()
+        TimingMetrics().record(
+            TimingMetricType.EXECUTOR_QUEUE_WAIT,
+            executor_name,
+            time.perf_counter() - start_time,
+        )
+        return
@@ -10,6 +10,10 @@ urlpatterns = [
           views.SystemInfoView.as_view(), 
           name = 'system_info' ),
 
+    path( 'timing-metrics',
+          views.SystemTimingMetricsView.as_view(),
+          name = 'system_timing_metrics' ),
+
     re_path( r'^health/(?P<provider_id>[\w\.\-]+)$',
              views.SystemHealthStatusView.as_view(),
              name = 'system_health_status' ),
@@ -1,18 +1,24 @@
 import logging
 
-from django.http import Http404
+from django.http import Http404, JsonResponse
+from django.views.generic import View
 
 from hi.hi_async_view import HiModalView
 
 from hi.apps.common.asyncio_utils import BackgroundTaskMonitor
+from hi.apps.common.lock_service import LockService
+from hi.apps.common.mail_delivery import MailDeliveryService
+from hi.apps.common.mjpeg_relay import MjpegRelay
 from hi.apps.config.enums import ConfigPageType
 from hi.apps.config.views import ConfigPageView
+from hi.apps.event.event_action_dispatcher import EventActionDispatcher
 from hi.apps.monitor.monitor_manager import AppMonitorManager
 from hi.apps.weather.weather_source_manager import WeatherSourceManager
 
 from hi.integrations.integration_manager import IntegrationManager
 
 from .asyncio_health_provider import AsyncioHealthStatusProvider
+from .timing_metrics import TimingMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -60,9 +66,22 @@ class SystemInfoView( ConfigPageView ):
             'framework_health_providers': framework_health_providers,
             'weather_provider': WeatherSourceManager(),
             'background_task_provider': AsyncioHealthStatusProvider(),
+            'event_action_dispatcher': EventActionDispatcher(),
+            'mail_delivery_service': MailDeliveryService(),
+            'mjpeg_relay': MjpegRelay(),
+            'lock_service': LockService(),
+            'lock_stats_list': LockService().get_stats_list(),
+            'timing_metric_groups': TimingMetrics().get_display_data(),
         }
 
 
+class SystemTimingMetricsView( View ):
+    """ The System Info timing histograms as JSON. """
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse( TimingMetrics().to_dict() )
+
+
 class SystemHealthStatusView(HiModalView):
     """View for displaying monitor health status in a modal."""
 
@@ -80,6 +99,12 @@ class SystemHealthStatusView(HiModalView):
 
         if provider_id == 'hi.apps.weather.weather_sources':
             return WeatherHealthStatusDetailsView().get( request, *args, **kwargs )
+
+        if provider_id == EventActionDispatcher.get_provider_info().provider_id:
+            context = {
+                'health_status_provider': EventActionDispatcher(),
+            }
+            return self.modal_response( request, context )
         
         if provider_id.startswith( 'hi.services' ) or provider_id.startswith( 'hi.integrations' ):
             return self.get_integration_status_response(
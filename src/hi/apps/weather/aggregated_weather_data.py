@@ -1,6 +1,6 @@
 from dataclasses import dataclass, fields
 import logging
-from typing import Dict, Type
+from typing import Dict, Iterable, Set, Type
 
 import hi.apps.common.datetimeproxy as datetimeproxy
 from hi.units import UnitQuantity
@@ -41,13 +41,16 @@ class AggregatedWeatherData:
     
     def add_source_data( self,
                          data_point_source     : DataPointSource,
-                         source_interval_data  : IntervalEnvironmentalData ):
+                         source_interval_data  : IntervalEnvironmentalData ) -> Set[ str ]:
         """
         Add source data that overlaps with this aggregated interval.
         
         Args:
             data_point_source: The data source providing the data
             source_interval_data: Interval data from the source that overlaps
+
+        Returns:
+            Names of the fields that received a data point
         """
         assert isinstance( source_interval_data.data, self.data_class )
         assert self.interval_data.interval.overlaps( source_interval_data.interval )
@@ -60,6 +63,7 @@ class AggregatedWeatherData:
         
         from .model_helpers import is_datapoint_field
 
+        field_name_set = set()
         for a_field in fields( source_data ):
             field_name = a_field.name
             
@@ -71,21 +75,29 @@ class AggregatedWeatherData:
             # Skip None values to avoid type confusion during aggregation
             if source_data_point is not None:
                 self.source_data[field_name][data_point_source][source_interval] = source_data_point
+                field_name_set.add( field_name )
             continue
-        return
+        return field_name_set
                   
-    def reaggregate_source_data( self ):
+    def reaggregate_source_data( self, field_names : Iterable[ str ] = None ):
         """
-        Re-aggregate all source data into the target interval.
+        Re-aggregate source data into the target interval.
         
         This method processes all source data that has been added and creates
         aggregated data points using appropriate aggregation strategies for
         different data point types.
+
+        Args:
+            field_names: Limit the work to these fields (default all)
         """
         if not self.source_data:
             return
+
+        if field_names is None:
+            field_names = self.source_data.keys()
         
-        for field_name, source_map in self.source_data.items():
+        for field_name in field_names:
+            source_map = self.source_data[field_name]
 
             data_point_source = self.get_best_data_point_source( source_map )
             if data_point_source is None:
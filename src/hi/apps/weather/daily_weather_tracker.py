@@ -5,7 +5,14 @@ Generalized tracking of daily weather statistics using calendar days in local ti
 Provides fallback values when weather APIs don't provide daily extremes or aggregations.
 
 Currently implements:
-- Temperature min/max tracking
+- Temperature min/max/sum/count tracking
+
+Statistics are accumulated in memory and read without any cache I/O.
+Changed entries are written to the cache from the weather monitor's
+periodic loop (at most every FLUSH_INTERVAL_SECS), when the local day
+rolls over and when the monitor stops, so the cache only serves to
+warm-start after a restart.  Completed days are kept as compact
+summaries and fill in temperatures missing from the weather history.
 
 Designed for easy extension to track other weather fields like:
 - Humidity min/max
@@ -14,10 +21,13 @@ Designed for easy extension to track other weather fields like:
 - Precipitation totals
 - etc.
 """
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 import json
 import logging
-from datetime import datetime
-from typing import Optional, Tuple, Dict, Any
+from threading import Lock
+import time
+from typing import Optional, Tuple, Dict, Any, List
 
 import hi.apps.common.datetimeproxy as datetimeproxy
 from django.core.cache import cache
@@ -35,6 +45,26 @@ from hi.units import UnitQuantity
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DailyFieldStats:
+    """ One location/day/field accumulator, in the same shape as its cache entry. """
+
+    stats     : Dict[str, Any]  = field( default_factory = dict )
+    is_dirty  : bool            = False
+
+
+@dataclass
+class DailyFieldSummary:
+    """ Compact form of a completed day, retained for trend display. """
+
+    date_key   : str
+    units      : Optional[str]    = None
+    min_value  : Optional[float]  = None
+    max_value  : Optional[float]  = None
+    avg_value  : Optional[float]  = None
+    count      : int              = 0
+
+
 class DailyWeatherTracker(Singleton):
     """
     Tracks daily weather statistics for fallback values.
@@ -59,6 +89,13 @@ class DailyWeatherTracker(Singleton):
     # Field names
     FIELD_TEMPERATURE = 'temperature'
 
+    # Changed statistics are written to the cache at most this often
+    # (and at day rollover) by flush_if_due().
+    FLUSH_INTERVAL_SECS = 60.0
+
+    # Number of completed days kept as compact summaries.
+    HISTORY_DAYS = 7
+
     TRACE = False  # For debugging
     
     def __init_singleton__(self):
@@ -68,6 +105,12 @@ class DailyWeatherTracker(Singleton):
             abbreviation="DWT",
             priority=1000  # Low priority fallback source
         )
+        self._lock = Lock()
+        self._field_stats_map : Dict[ Tuple[ str, str, str ], DailyFieldStats ] = dict()
+        self._current_date_key : str = None
+        self._history_map : Dict[ Tuple[ str, str ], Dict[ str, DailyFieldSummary ]] = dict()
+        self._last_flush_time = time.monotonic()
+        return
     
     def record_weather_conditions( self,
                                    weather_conditions_data : WeatherConditionsData,
@@ -94,7 +137,7 @@ class DailyWeatherTracker(Singleton):
                 value=temp_celsius,
                 units='degree_Celsius',
                 timestamp=temp_timestamp,
-                track_stats=[self.STAT_MIN, self.STAT_MAX]
+                track_stats=[self.STAT_MIN, self.STAT_MAX, self.STAT_SUM, self.STAT_COUNT]
             )
         else:
             logger.warning(f"record_weather_conditions called for {location_key} but no temperature data available")
@@ -130,12 +173,7 @@ class DailyWeatherTracker(Singleton):
             if not min_data or not max_data:
                 return None, None
             
-            # Create fallback station
-            fallback_station = Station(
-                source=self._fallback_source,
-                station_id="daily_tracker",
-                name="Daily Weather Tracker"
-            )
+            fallback_station = self._create_fallback_station()
             
             # Create NumericDataPoint objects
             min_datapoint = NumericDataPoint(
@@ -173,6 +211,84 @@ class DailyWeatherTracker(Singleton):
             logger.exception(f"Error getting weather stats: {e}")
             return WeatherStats()
     
+    def get_daily_history( self,
+                           location_key : str = "default",
+                           field_name   : str = FIELD_TEMPERATURE,
+                           days         : int = HISTORY_DAYS ) -> List[DailyFieldSummary]:
+        """
+        Get compact summaries of the completed days before today, oldest first.
+        
+        Args:
+            location_key: Unique identifier for the location
+            field_name: Name of the weather field (e.g., 'temperature')
+            days: Maximum number of days to return
+        """
+        today_date_key = self._get_date_key_today()
+        with self._lock:
+            history = self._get_history( location_key, field_name )
+            return [ history[date_key] for date_key in sorted( history )
+                     if date_key < today_date_key ][-days:]
+
+    def get_temperature_history( self, location_key : str = "default" ) -> Dict[ str, NumericDataPoint ]:
+        """
+        Get the temperature range of each retained completed day, keyed by
+        local date ('YYYY-MM-DD'), as fallback data for the weather history.
+        """
+        tz_name = ConsoleSettingsHelper().get_tz_name()
+        fallback_station = self._create_fallback_station()
+        temperature_map = dict()
+        for summary in self.get_daily_history( location_key, self.FIELD_TEMPERATURE ):
+            if ( summary.min_value is None ) or ( summary.max_value is None ):
+                continue
+            temperature_map[summary.date_key] = NumericDataPoint(
+                station = fallback_station,
+                source_datetime = datetimeproxy.date_to_datetime_day_begin(
+                    datetimeproxy.date_str_to_date( summary.date_key ),
+                    tz_name,
+                ),
+                quantity_min = UnitQuantity( summary.min_value, summary.units ),
+                quantity_max = UnitQuantity( summary.max_value, summary.units ),
+                quantity_ave = ( UnitQuantity( summary.avg_value, summary.units )
+                                 if summary.avg_value is not None else None ),
+            )
+            continue
+        return temperature_map
+
+    def flush_if_due(self) -> int:
+        """ Flush when FLUSH_INTERVAL_SECS have passed since the last flush. """
+        with self._lock:
+            if time.monotonic() - self._last_flush_time < self.FLUSH_INTERVAL_SECS:
+                return 0
+        return self.flush()
+
+    def flush(self) -> int:
+        """ Write all changed statistics to the cache. Returns the number written. """
+        with self._lock:
+            pending_list = list()
+            for ( location_key, date_key, field_name ), field_stats in self._field_stats_map.items():
+                if not field_stats.is_dirty:
+                    continue
+                field_stats.is_dirty = False
+                # Stat entries are replaced rather than mutated, so a
+                # shallow copy is a consistent snapshot.
+                pending_list.append( ( location_key, date_key, field_name, dict( field_stats.stats )) )
+                continue
+            self._last_flush_time = time.monotonic()
+
+        stored_count = 0
+        for location_key, date_key, field_name, stats in pending_list:
+            try:
+                self._store_field_stats( location_key, date_key, field_name, stats )
+                stored_count += 1
+            except Exception as e:
+                logger.warning( f'Problem storing daily {field_name} stats for {location_key}: {e}' )
+                with self._lock:
+                    field_stats = self._field_stats_map.get( ( location_key, date_key, field_name ))
+                    if field_stats:
+                        field_stats.is_dirty = True
+            continue
+        return stored_count
+    
     def _record_field_value( self, 
                              location_key : str, 
                              field_name   : str, 
@@ -194,56 +310,58 @@ class DailyWeatherTracker(Singleton):
         try:
             # Get current date in local timezone
             date_key = self._get_date_key_today()
+
+            with self._lock:
+                self._roll_over_if_needed( date_key )
+                daily_field_stats = self._get_daily_field_stats( location_key, date_key, field_name )
+                field_stats = daily_field_stats.stats
+                logger.debug( f'Start field stats [value={value}] = {field_stats}' )
             
-            # Get current field statistics
-            field_stats = self._get_field_stats(location_key, date_key, field_name)
-            logger.debug( f'Start field stats [value={value}] = {field_stats}' )
+                # Update statistics
+                updated = False
             
-            # Update statistics
-            updated = False
+                if self.STAT_MIN in track_stats:
+                    min_data = field_stats.get(self.STAT_MIN)
+                    if not min_data or value < min_data['value']:
+                        field_stats[self.STAT_MIN] = {
+                            'value': value,
+                            'units': units,
+                            'timestamp': timestamp.isoformat()
+                        }
+                        updated = True
             
-            if self.STAT_MIN in track_stats:
-                min_data = field_stats.get(self.STAT_MIN)
-                if not min_data or value < min_data['value']:
-                    field_stats[self.STAT_MIN] = {
-                        'value': value,
+                if self.STAT_MAX in track_stats:
+                    max_data = field_stats.get(self.STAT_MAX)
+                    if not max_data or value > max_data['value']:
+                        field_stats[self.STAT_MAX] = {
+                            'value': value,
+                            'units': units,
+                            'timestamp': timestamp.isoformat()
+                        }
+                        updated = True
+            
+                if self.STAT_SUM in track_stats:
+                    sum_data = field_stats.get(self.STAT_SUM, {'value': 0, 'units': units})
+                    field_stats[self.STAT_SUM] = {
+                        'value': sum_data['value'] + value,
                         'units': units,
-                        'timestamp': timestamp.isoformat()
+                        'last_updated': timestamp.isoformat()
                     }
                     updated = True
-            
-            if self.STAT_MAX in track_stats:
-                max_data = field_stats.get(self.STAT_MAX)
-                if not max_data or value > max_data['value']:
-                    field_stats[self.STAT_MAX] = {
-                        'value': value,
-                        'units': units,
-                        'timestamp': timestamp.isoformat()
+
+                if self.STAT_COUNT in track_stats:
+                    count_data = field_stats.get(self.STAT_COUNT, {'value': 0})
+                    field_stats[self.STAT_COUNT] = {
+                        'value': count_data['value'] + 1,
+                        'last_updated': timestamp.isoformat()
                     }
                     updated = True
-            
-            if self.STAT_SUM in track_stats:
-                sum_data = field_stats.get(self.STAT_SUM, {'value': 0, 'units': units})
-                field_stats[self.STAT_SUM] = {
-                    'value': sum_data['value'] + value,
-                    'units': units,
-                    'last_updated': timestamp.isoformat()
-                }
-                updated = True
-
-            if self.STAT_COUNT in track_stats:
-                count_data = field_stats.get(self.STAT_COUNT, {'value': 0})
-                field_stats[self.STAT_COUNT] = {
-                    'value': count_data['value'] + 1,
-                    'last_updated': timestamp.isoformat()
-                }
-                updated = True
-            
-            logger.debug( f'End field stats [updated={updated}] = {field_stats}' )
+
+                if updated:
+                    daily_field_stats.is_dirty = True
+                logger.debug( f'End field stats [updated={updated}] = {field_stats}' )
                 
-            # Store updated statistics if changed
             if updated:
-                self._store_field_stats(location_key, date_key, field_name, field_stats)
                 logger.debug( f"Updated daily {field_name} stats for {date_key} at location {location_key}: "
                               f"min={field_stats.get('min', {}).get('value', 'None')}°C, "
                               f"max={field_stats.get('max', {}).get('value', 'None')}°C, "
@@ -255,10 +373,48 @@ class DailyWeatherTracker(Singleton):
         except Exception as e:
             logger.exception(f"Error recording {field_name} value: {e}")
     
+    def _create_fallback_station(self) -> Station:
+        return Station(
+            source=self._fallback_source,
+            station_id="daily_tracker",
+            name="Daily Weather Tracker"
+        )
+
     def _get_field_stats(self, location_key: str, date_key: str, field_name: str) -> Dict[str, Any]:
+        """Get a copy of the field statistics, loading from cache only on first use."""
+        with self._lock:
+            field_stats = self._get_daily_field_stats( location_key, date_key, field_name ).stats
+            return { stat_name: dict( stat_data ) for stat_name, stat_data in field_stats.items() }
+    
+    def _get_field_stats_today(self, location_key: str, field_name: str) -> Dict[str, Any]:
+        """Get today's field statistics."""
+        date_key = self._get_date_key_today()
+        return self._get_field_stats(location_key, date_key, field_name)
+
+    def _get_daily_field_stats( self,
+                                location_key : str,
+                                date_key     : str,
+                                field_name   : str ) -> DailyFieldStats:
+        """ Caller must hold the lock. """
+        stats_key = ( location_key, date_key, field_name )
+        daily_field_stats = self._field_stats_map.get( stats_key )
+        if daily_field_stats is None:
+            # Remembered even when empty so the cache is read once per key.
+            daily_field_stats = DailyFieldStats(
+                stats = self._load_field_stats( location_key, date_key, field_name ),
+            )
+            self._field_stats_map[stats_key] = daily_field_stats
+        return daily_field_stats
+    
+    def _load_field_stats(self, location_key: str, date_key: str, field_name: str) -> Dict[str, Any]:
         """Get field statistics from cache."""
         cache_key = self._get_cache_key(location_key, date_key, field_name)
-        stats_json = cache.get(cache_key)
+        try:
+            stats_json = cache.get(cache_key)
+        except Exception as e:
+            # Carry on from memory alone; the next flush rewrites the entry.
+            logger.warning( f'Problem loading daily {field_name} stats for {date_key}: {e}' )
+            return {}
 
         if self.TRACE:
             logger.debug( f'Retrieve field stats [key={cache_key}] - {stats_json}' )
@@ -271,11 +427,6 @@ class DailyWeatherTracker(Singleton):
         
         return {}
     
-    def _get_field_stats_today(self, location_key: str, field_name: str) -> Dict[str, Any]:
-        """Get today's field statistics."""
-        date_key = self._get_date_key_today()
-        return self._get_field_stats(location_key, date_key, field_name)
-    
     def _store_field_stats( self,
                             location_key : str,
                             date_key     : str,
@@ -287,6 +438,79 @@ class DailyWeatherTracker(Singleton):
         logger.debug( f'Store field stats [key={cache_key}] - {stats_json}' )
         cache.set(cache_key, stats_json, timeout=self.CACHE_TIMEOUT_SECONDS)
         return
+
+    def _roll_over_if_needed( self, date_key : str ) -> None:
+        """
+        Caller must hold the lock.  When the local day changes, writes out
+        and drops every other day's accumulator, keeping a compact summary.
+        """
+        if date_key == self._current_date_key:
+            return
+        self._current_date_key = date_key
+        for stats_key in list( self._field_stats_map.keys() ):
+            location_key, stats_date_key, field_name = stats_key
+            if stats_date_key == date_key:
+                continue
+            daily_field_stats = self._field_stats_map.pop( stats_key )
+            if daily_field_stats.is_dirty:
+                try:
+                    self._store_field_stats( location_key, stats_date_key, field_name, daily_field_stats.stats )
+                except Exception as e:
+                    # The day's summary is still kept in history below.
+                    logger.warning( f'Problem storing daily {field_name} stats'
+                                    f' for {location_key} on {stats_date_key}: {e}' )
+            self._add_to_history( location_key, field_name, stats_date_key, daily_field_stats.stats )
+            continue
+        return
+
+    def _get_history( self, location_key : str, field_name : str ) -> Dict[ str, DailyFieldSummary ]:
+        """ Caller must hold the lock. Warm-starts from the cache on first use. """
+        history_key = ( location_key, field_name )
+        history = self._history_map.get( history_key )
+        if history is not None:
+            return history
+        history = dict()
+        self._history_map[history_key] = history
+        today = datetimeproxy.now( ConsoleSettingsHelper().get_tz_name() ).date()
+        for days_ago in range( 1, self.HISTORY_DAYS + 1 ):
+            date_key = ( today - timedelta( days = days_ago )).strftime( '%Y-%m-%d' )
+            stats = self._load_field_stats( location_key, date_key, field_name )
+            self._add_to_history( location_key, field_name, date_key, stats )
+            continue
+        return history
+
+    def _add_to_history( self,
+                         location_key : str,
+                         field_name   : str,
+                         date_key     : str,
+                         stats        : Dict[str, Any] ) -> None:
+        """ Caller must hold the lock. """
+        summary = self._summarize_field_stats( date_key, stats )
+        if summary is None:
+            return
+        history = self._get_history( location_key, field_name )
+        history[date_key] = summary
+        for old_date_key in sorted( history )[:-self.HISTORY_DAYS]:
+            del history[old_date_key]
+            continue
+        return
+
+    def _summarize_field_stats( self, date_key : str, stats : Dict[str, Any] ) -> Optional[DailyFieldSummary]:
+        min_data = stats.get( self.STAT_MIN )
+        max_data = stats.get( self.STAT_MAX )
+        sum_data = stats.get( self.STAT_SUM )
+        count = stats.get( self.STAT_COUNT, {} ).get( 'value', 0 )
+        if not min_data and not max_data and not count:
+            return None
+        units = next(( data['units'] for data in ( min_data, max_data, sum_data ) if data ), None )
+        return DailyFieldSummary(
+            date_key = date_key,
+            units = units,
+            min_value = min_data['value'] if min_data else None,
+            max_value = max_data['value'] if max_data else None,
+            avg_value = ( sum_data['value'] / count ) if ( sum_data and count ) else None,
+            count = count,
+        )
     
     def clear_today(self, location_key: str = "default", field_name: Optional[str] = None) -> None:
         """
@@ -298,6 +522,8 @@ class DailyWeatherTracker(Singleton):
         """
         if field_name:
             date_key = self._get_date_key_today()
+            with self._lock:
+                self._field_stats_map[( location_key, date_key, field_name )] = DailyFieldStats()
             cache_key = self._get_cache_key(location_key, date_key, field_name)
             cache.delete(cache_key)
             logger.debug(f"Cleared today's {field_name} data for {location_key}")
@@ -1,6 +1,7 @@
+import bisect
 from datetime import timedelta
 import logging
-from typing import List
+from typing import Dict, List, Set, Tuple
 import pytz
 
 import hi.apps.common.datetimeproxy as datetimeproxy
@@ -33,6 +34,8 @@ class IntervalDataManager:
         self._is_order_ascending = is_order_ascending 
         self._data_class = data_class
         self._aggregated_interval_data_list = list()
+        self._sorted_aggregated_interval_data_list = list()
+        self._sorted_interval_end_list = list()
         self._was_initialized = False
         
         # For daily intervals (24-hour), use local timezone boundaries
@@ -63,36 +66,69 @@ class IntervalDataManager:
         # Update intervals first to handle time passage (remove old, add new intervals)
         self._update_intervals()
         
-        self._add_source_data_to_interval_data(
+        touched_field_names_map = self._add_source_data_to_interval_data(
             data_point_source = data_point_source,
             source_interval_data_list = new_interval_data_list,
         )
-        for aggregated_interval_data in self._aggregated_interval_data_list:
-            aggregated_interval_data.reaggregate_source_data()
+        # Only the buckets and fields this source touched can change, so
+        # everything else keeps its previous aggregate.
+        for aggregated_interval_data, field_name_set in touched_field_names_map.values():
+            aggregated_interval_data.reaggregate_source_data( field_names = field_name_set )
             continue
         return
         
-    def _add_source_data_to_interval_data( self,
-                                           data_point_source          : DataPointSource,
-                                           source_interval_data_list  : List[ IntervalEnvironmentalData ] ):
-        """ Distribute source interval data into the existing aggregate intervals it overlaps with. """
+    def _add_source_data_to_interval_data(
+            self,
+            data_point_source          : DataPointSource,
+            source_interval_data_list  : List[ IntervalEnvironmentalData ]
+    ) -> Dict[ TimeInterval, Tuple[ AggregatedWeatherData, Set[ str ]]]:
+        """
+        Distribute source interval data into the existing aggregate
+        intervals it overlaps with. Returns the aggregates touched (keyed
+        by their interval) with the field names each one received.
+        """
 
         if self.TRACE:
             logger.debug( f'Adding interval data from:'
                           f' {data_point_source.id} [{len(source_interval_data_list)} intervals]' )
-            
+
+        touched_field_names_map = dict()
         for source_interval_data in source_interval_data_list:
-            for aggregated_interval_data in self._aggregated_interval_data_list:
-                existing_interval = aggregated_interval_data.interval_data.interval
-                overlaps = existing_interval.overlaps( source_interval_data.interval )
-                if overlaps:
-                    aggregated_interval_data.add_source_data(
-                        data_point_source = data_point_source,
-                        source_interval_data = source_interval_data,
-                    )
+            for aggregated_interval_data in self._get_overlapping_aggregated_interval_data(
+                    source_interval = source_interval_data.interval ):
+                field_name_set = aggregated_interval_data.add_source_data(
+                    data_point_source = data_point_source,
+                    source_interval_data = source_interval_data,
+                )
+                if not field_name_set:
+                    continue
+                time_interval = aggregated_interval_data.interval_data.interval
+                if time_interval not in touched_field_names_map:
+                    touched_field_names_map[time_interval] = ( aggregated_interval_data, set() )
+                touched_field_names_map[time_interval][1].update( field_name_set )
                 continue
             continue
-        return
+        return touched_field_names_map
+
+    def _get_overlapping_aggregated_interval_data(
+            self,
+            source_interval : TimeInterval ) -> List[ AggregatedWeatherData ]:
+        """
+        The aggregate intervals are contiguous and non-overlapping, so a
+        binary search on their end times finds the first one a source
+        interval overlaps. Daily intervals follow local midnight and are
+        not all 24 hours (DST), which rules out plain grid arithmetic.
+        """
+        overlapping_list = list()
+        index = bisect.bisect_right( self._sorted_interval_end_list, source_interval.start )
+        while index < len( self._sorted_aggregated_interval_data_list ):
+            aggregated_interval_data = self._sorted_aggregated_interval_data_list[index]
+            if aggregated_interval_data.interval_data.interval.start >= source_interval.end:
+                break
+            overlapping_list.append( aggregated_interval_data )
+            index += 1
+            continue
+        return overlapping_list
         
     def _update_intervals( self ):
         """ Adjust the intervals based on current time (truncating old, adding new) """
@@ -118,6 +154,12 @@ class IntervalDataManager:
             continue
 
         self._aggregated_interval_data_list = new_aggregated_interval_data_list
+        self._sorted_aggregated_interval_data_list = sorted(
+            new_aggregated_interval_data_list,
+            key = lambda item: item.interval_data.interval.start,
+        )
+        self._sorted_interval_end_list = [ item.interval_data.interval.end
+                                           for item in self._sorted_aggregated_interval_data_list ]
         return
         
     def _get_calculated_intervals( self ):
@@ -9,6 +9,7 @@ from hi.apps.alert.alert_mixins import AlertMixin
 from hi.apps.config.settings_mixins import SettingsMixin
 from hi.apps.system.provider_info import ProviderInfo
 
+from .daily_weather_tracker import DailyWeatherTracker
 from .weather_settings_helper import WeatherSettingsHelper
 from .weather_source_discovery import WeatherSourceDiscovery
 from .weather_source_manager import WeatherSourceManager
@@ -35,12 +36,21 @@ class WeatherMonitor( PeriodicMonitor, AlertMixin, SettingsMixin ):
         return
 
     async def initialize(self) -> None:
-        self._query_interval_secs = (
-            await self._settings_helper.get_default_polling_interval_secs_async()
-        )
+        polling_interval_secs = await self._settings_helper.get_default_polling_interval_secs_async()
         discovered_sources = WeatherSourceDiscovery.discover_weather_data_source_instances()
         self._weather_data_source_instance_list = discovered_sources
 
+        # Priority data (e.g., alerts) must refresh faster than the full
+        # polls, so tick at the shortest priority interval. Full fetches
+        # are still gated by each source's own polling interval.
+        interval_secs_list = [ polling_interval_secs ]
+        for weather_data_source in discovered_sources:
+            priority_interval_secs = weather_data_source.get_priority_polling_interval_secs()
+            if priority_interval_secs:
+                interval_secs_list.append( priority_interval_secs )
+            continue
+        self._query_interval_secs = min( interval_secs_list )
+
         weather_source_manager = WeatherSourceManager()
         weather_source_manager.add_api_health_status_provider_multi(
             api_health_status_provider_sequence = discovered_sources,
@@ -97,23 +107,36 @@ class WeatherMonitor( PeriodicMonitor, AlertMixin, SettingsMixin ):
 
         disabled_count = 0
         
-        task_list = list()
+        fetch_func_list = list()
+        priority_fetch_func_list = list()
         for weather_data_source in self._weather_data_source_instance_list:
             is_enabled = await self._settings_helper.is_weather_source_enabled_async(
                 weather_data_source.id
             )
-            if is_enabled:
-                task = asyncio.create_task( weather_data_source.fetch() )
-                task_list.append( task )
-            else:
+            if not is_enabled:
                 weather_data_source.record_disabled()
                 disabled_count += 1
                 logger.debug( f'Weather source {weather_data_source.id} is disabled, skipping' )
+            elif weather_data_source.is_fetch_due():
+                fetch_func_list.append( weather_data_source.fetch )
+            else:
+                # Between full polls, only the priority data (e.g.,
+                # alerts) is refreshed.
+                priority_fetch_func_list.append( weather_data_source.fetch_priority )
             continue
 
-        if task_list:
-            await asyncio.gather( *task_list )
-            message = f'Used {len(task_list)} weather sources, {disabled_count} disabled.'
+        # Priority fetches go first so they never wait behind the full
+        # fetches, which are slow and carry large payloads.
+        if priority_fetch_func_list:
+            await asyncio.gather( *[ asyncio.create_task( fetch_func() ) for fetch_func in priority_fetch_func_list ] )
+        if fetch_func_list:
+            await asyncio.gather( *[ asyncio.create_task( fetch_func() ) for fetch_func in fetch_func_list ] )
+
+        DailyWeatherTracker().flush_if_due()
+
+        source_count = len( fetch_func_list ) + len( priority_fetch_func_list )
+        if source_count:
+            message = f'Used {source_count} weather sources, {disabled_count} disabled.'
             self.record_healthy( message )
             weather_source_manager.record_healthy( message )
         else:
@@ -123,3 +146,8 @@ class WeatherMonitor( PeriodicMonitor, AlertMixin, SettingsMixin ):
             weather_source_manager.record_warning( message )
         return
 
+    async def cleanup(self) -> None:
+        # Persist the day's statistics so a restart does not lose them.
+        DailyWeatherTracker().flush()
+        await super().cleanup()
+        return
@@ -44,6 +44,8 @@ class TestDailyWeatherTracker(unittest.TestCase):
         mock_console_helper.return_value.get_tz_name.return_value = 'UTC'
 
         self.tracker = DailyWeatherTracker()
+        # The singleton accumulates in memory, so start each test empty.
+        self.tracker.__init_singleton__()
         
         # Create test data point source and station
         self.test_source = DataPointSource(
@@ -253,6 +255,7 @@ class TestDailyWeatherTracker(unittest.TestCase):
             # Record temperature
             conditions = self.create_test_weather_conditions(25.0)
             self.tracker.record_weather_conditions(conditions, location_key=location_key)
+            self.tracker.flush()
             
             # Manually check cache contents
             date_key = self.base_time.strftime('%Y-%m-%d')
@@ -532,6 +535,126 @@ class TestDailyWeatherTracker(unittest.TestCase):
             self.assertAlmostEqual(min_celsius, 27.2, places=1)  # Should be updated to current
             self.assertAlmostEqual(max_celsius, 31.1, places=1)  # Should remain the higher value
     
+    def test_reads_and_records_do_not_touch_cache_until_flush(self):
+        location_key = f"test_location_{self.test_id}"
+
+        with patch('hi.apps.common.datetimeproxy.now', return_value=self.base_time):
+            self.tracker.record_weather_conditions(self.create_test_weather_conditions(20.0), location_key)
+            with patch('hi.apps.weather.daily_weather_tracker.cache') as mock_cache:
+                for temp in [18.0, 25.0, 22.0]:
+                    self.tracker.record_weather_conditions(self.create_test_weather_conditions(temp), location_key)
+                    continue
+                min_temp, max_temp = self.tracker.get_temperature_min_max_today(location_key)
+                summary = self.tracker.get_daily_summary(location_key)
+            mock_cache.get.assert_not_called()
+            mock_cache.set.assert_not_called()
+
+            self.assertEqual(min_temp.quantity_ave.magnitude, 18.0)
+            self.assertEqual(max_temp.quantity_ave.magnitude, 25.0)
+            self.assertEqual(summary['fields']['temperature'][self.tracker.STAT_COUNT]['value'], 4)
+
+            self.assertEqual(self.tracker.flush(), 1)
+            self.assertEqual(self.tracker.flush(), 0)
+
+    def test_flush_if_due_waits_for_interval(self):
+        location_key = f"test_location_{self.test_id}"
+        date_key = self.base_time.strftime('%Y-%m-%d')
+        cache_key = self.tracker._get_cache_key(location_key, date_key, 'temperature')
+
+        with patch('hi.apps.common.datetimeproxy.now', return_value=self.base_time):
+            self.tracker.record_weather_conditions(self.create_test_weather_conditions(20.0), location_key)
+            with patch.object(DailyWeatherTracker, 'FLUSH_INTERVAL_SECS', 0.0):
+                self.tracker.record_weather_conditions(self.create_test_weather_conditions(15.0), location_key)
+            # Recording alone never writes the cache.
+            self.assertIsNone(cache.get(cache_key))
+            self.assertEqual(self.tracker.flush_if_due(), 0)
+
+            with patch.object(DailyWeatherTracker, 'FLUSH_INTERVAL_SECS', 0.0):
+                self.assertEqual(self.tracker.flush_if_due(), 1)
+        self.assertEqual(json.loads(cache.get(cache_key))[self.tracker.STAT_MIN]['value'], 15.0)
+
+    def test_warm_start_from_cache_after_restart(self):
+        location_key = f"test_location_{self.test_id}"
+
+        with patch('hi.apps.common.datetimeproxy.now', return_value=self.base_time):
+            self.tracker.record_weather_conditions(self.create_test_weather_conditions(20.0), location_key)
+            self.tracker.flush()
+            self.tracker.__init_singleton__()
+
+            self.tracker.record_weather_conditions(self.create_test_weather_conditions(24.0), location_key)
+            min_temp, max_temp = self.tracker.get_temperature_min_max_today(location_key)
+
+        self.assertEqual(min_temp.quantity_ave.magnitude, 20.0)
+        self.assertEqual(max_temp.quantity_ave.magnitude, 24.0)
+
+    def test_day_rollover_flushes_and_keeps_compact_history(self):
+        location_key = f"test_location_{self.test_id}"
+        day1 = self.base_time
+        day2 = self.base_time + timedelta(days=1)
+
+        with patch('hi.apps.common.datetimeproxy.now', return_value=day1):
+            for temp in [10.0, 20.0, 30.0]:
+                self.tracker.record_weather_conditions(self.create_test_weather_conditions(temp, day1), location_key)
+                continue
+        with patch('hi.apps.common.datetimeproxy.now', return_value=day2):
+            self.tracker.record_weather_conditions(self.create_test_weather_conditions(5.0, day2), location_key)
+            history = self.tracker.get_daily_history(location_key)
+
+        day1_cache_key = self.tracker._get_cache_key(location_key, day1.strftime('%Y-%m-%d'), 'temperature')
+        self.assertEqual(json.loads(cache.get(day1_cache_key))[self.tracker.STAT_MAX]['value'], 30.0)
+
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0].date_key, '2024-03-15')
+        self.assertEqual((history[0].min_value, history[0].max_value), (10.0, 30.0))
+        self.assertAlmostEqual(history[0].avg_value, 20.0)
+        self.assertEqual(history[0].count, 3)
+
+        # History of past days also warm-starts from the cache.
+        self.tracker.__init_singleton__()
+        with patch('hi.apps.common.datetimeproxy.now', return_value=day2):
+            history = self.tracker.get_daily_history(location_key)
+        self.assertEqual([summary.date_key for summary in history], ['2024-03-15'])
+
+    def test_day_rollover_survives_cache_store_error(self):
+        location_key = f"test_location_{self.test_id}"
+        day1 = self.base_time
+        day2 = self.base_time + timedelta(days=1)
+
+        with patch('hi.apps.common.datetimeproxy.now', return_value=day1):
+            for temp in [10.0, 30.0]:
+                self.tracker.record_weather_conditions(self.create_test_weather_conditions(temp, day1), location_key)
+                continue
+        with patch('hi.apps.common.datetimeproxy.now', return_value=day2):
+            with patch('hi.apps.weather.daily_weather_tracker.cache.set', side_effect=ConnectionError('down')):
+                self.tracker.record_weather_conditions(self.create_test_weather_conditions(5.0, day2), location_key)
+            history = self.tracker.get_daily_history(location_key)
+            min_temp, max_temp = self.tracker.get_temperature_min_max_today(location_key)
+
+        self.assertEqual([(summary.date_key, summary.min_value, summary.max_value) for summary in history],
+                         [('2024-03-15', 10.0, 30.0)])
+        self.assertEqual(min_temp.quantity_ave.magnitude, 5.0)
+        self.assertEqual(max_temp.quantity_ave.magnitude, 5.0)
+
+    def test_temperature_history_by_date(self):
+        location_key = f"test_location_{self.test_id}"
+        day1 = self.base_time
+        day2 = self.base_time + timedelta(days=1)
+
+        with patch('hi.apps.common.datetimeproxy.now', return_value=day1):
+            for temp in [10.0, 30.0]:
+                self.tracker.record_weather_conditions(self.create_test_weather_conditions(temp, day1), location_key)
+                continue
+        with patch('hi.apps.common.datetimeproxy.now', return_value=day2):
+            self.tracker.record_weather_conditions(self.create_test_weather_conditions(5.0, day2), location_key)
+            temperature_map = self.tracker.get_temperature_history(location_key)
+
+        self.assertEqual(list(temperature_map.keys()), ['2024-03-15'])
+        temperature = temperature_map['2024-03-15']
+        self.assertEqual(temperature.quantity_min.magnitude, 10.0)
+        self.assertEqual(temperature.quantity_max.magnitude, 30.0)
+        self.assertAlmostEqual(temperature.quantity_ave.magnitude, 20.0)
+        self.assertEqual(temperature.source_datetime, datetime(2024, 3, 15, tzinfo=pytz.UTC))
+
     # ============= ORIGINAL TESTS (TO BE DEPRECATED) =============
     
     def test_extensibility_for_future_fields(self):
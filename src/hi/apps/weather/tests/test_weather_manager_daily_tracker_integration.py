@@ -11,7 +11,14 @@ from django.utils import timezone
 import pytz
 
 from hi.apps.weather.weather_manager import WeatherManager
-from hi.apps.weather.transient_models import WeatherConditionsData, NumericDataPoint, Station
+from hi.apps.weather.transient_models import (
+    IntervalWeatherHistory,
+    NumericDataPoint,
+    Station,
+    TimeInterval,
+    WeatherConditionsData,
+    WeatherHistoryData,
+)
 from hi.apps.weather.weather_data_source import WeatherDataSource
 from hi.transient_models import GeographicLocation
 from hi.units import UnitQuantity
@@ -63,6 +70,8 @@ class TestWeatherManagerDailyTrackerIntegration(AsyncTaskFastTestCase):
         # Create weather manager instance
         self.weather_manager = WeatherManager()
         self.weather_manager.ensure_initialized()
+        # The tracker accumulates in memory, so start each test empty.
+        self.weather_manager._daily_weather_tracker.__init_singleton__()
         
         # Create test data source
         self.mock_source = MockWeatherDataSource()
@@ -335,3 +344,39 @@ class TestWeatherManagerDailyTrackerIntegration(AsyncTaskFastTestCase):
         # Should still be None (no fallback data available)
         self.assertIsNone(result_conditions.temperature_min_today)
         self.assertIsNone(result_conditions.temperature_max_today)
+
+    def test_daily_history_filled_from_tracked_temperatures(self):
+        location_key = "history_location"
+        day1 = self.base_time - timedelta(days=2)
+        day2 = self.base_time - timedelta(days=1)
+        tracker = self.weather_manager._daily_weather_tracker
+
+        with patch('hi.apps.console.console_helper.ConsoleSettingsHelper.get_tz_name', return_value='UTC'), \
+             patch.object(self.weather_manager, '_get_location_key', return_value=location_key):
+            for day, temps in [(day1, [10.0, 20.0]), (day2, [12.0, 18.0]), (self.base_time, [15.0])]:
+                with patch('hi.apps.common.datetimeproxy.now', return_value=day):
+                    for temp in temps:
+                        tracker.record_weather_conditions(self.create_test_conditions(temp, day), location_key)
+                        continue
+                continue
+
+            # The sources cover day2, but without a temperature.
+            day2_start = datetime(2024, 3, 14, tzinfo=pytz.UTC)
+            source_history = IntervalWeatherHistory(
+                interval=TimeInterval(start=day2_start, end=day2_start + timedelta(days=1)),
+                data=WeatherHistoryData(),
+            )
+            self.weather_manager._daily_history.data_list = [source_history]
+            with patch('hi.apps.common.datetimeproxy.now', return_value=self.base_time):
+                daily_history = self.weather_manager.get_daily_history()
+
+        self.assertEqual([item.interval.start.day for item in daily_history.data_list], [14, 13])
+        day2_temperature = daily_history.data_list[0].data.temperature
+        self.assertEqual((day2_temperature.quantity_min.magnitude, day2_temperature.quantity_max.magnitude),
+                         (12.0, 18.0))
+        day1_temperature = daily_history.data_list[1].data.temperature
+        self.assertEqual((day1_temperature.quantity_min.magnitude, day1_temperature.quantity_max.magnitude),
+                         (10.0, 20.0))
+        # The stored source history is left as the sources reported it.
+        self.assertIsNone(source_history.data.temperature)
+        self.assertEqual(self.weather_manager._daily_history.data_list, [source_history])
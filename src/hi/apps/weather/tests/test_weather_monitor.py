@@ -0,0 +1,74 @@
+import logging
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+
+import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.apps.weather.daily_weather_tracker import DailyWeatherTracker
+from hi.apps.weather.monitors import WeatherMonitor
+from hi.apps.weather.weather_source_discovery import WeatherSourceDiscovery
+from hi.apps.weather.weather_sources.nws import NationalWeatherService
+from hi.testing.async_task_utils import AsyncTaskFastTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class TestWeatherMonitorDailyTrackerFlush(AsyncTaskFastTestCase):
+
+    async def test_do_work_flushes_tracker_when_due(self):
+        monitor = WeatherMonitor()
+        with patch.object(monitor._settings_helper, 'get_startup_warmup_secs_async',
+                          new_callable=AsyncMock, return_value=0), \
+             patch.object(DailyWeatherTracker, 'flush_if_due') as mock_flush_if_due:
+            await monitor.do_work()
+        mock_flush_if_due.assert_called_once()
+
+    async def test_cleanup_flushes_tracker(self):
+        monitor = WeatherMonitor()
+        with patch.object(DailyWeatherTracker, 'flush') as mock_flush:
+            await monitor.cleanup()
+        mock_flush.assert_called_once()
+
+
+class TestWeatherMonitorPriorityPolling(AsyncTaskFastTestCase):
+
+    def setUp(self):
+        super().setUp()
+        datetimeproxy.reset()
+        self.nws = NationalWeatherService()
+        self.redis_patcher = patch.object(self.nws, '_redis_client', fakeredis.FakeRedis(decode_responses=True))
+        self.redis_patcher.start()
+        self.monitor = WeatherMonitor()
+        return
+
+    def tearDown(self):
+        self.redis_patcher.stop()
+        datetimeproxy.reset()
+        super().tearDown()
+        return
+
+    async def test_alerts_refresh_between_full_polls(self):
+        settings_helper = self.monitor._settings_helper
+        with patch.object(WeatherSourceDiscovery, 'discover_weather_data_source_instances',
+                          return_value=[self.nws]), \
+             patch.object(settings_helper, 'get_default_polling_interval_secs_async',
+                          new_callable=AsyncMock, return_value=600), \
+             patch.object(settings_helper, 'is_weather_source_enabled_async',
+                          new_callable=AsyncMock, return_value=True), \
+             patch.object(settings_helper, 'get_startup_warmup_secs_async',
+                          new_callable=AsyncMock, return_value=0), \
+             patch.object(self.nws, 'get_data', new_callable=AsyncMock) as mock_get_data, \
+             patch.object(self.nws, 'get_priority_data', new_callable=AsyncMock) as mock_get_priority_data, \
+             patch.object(DailyWeatherTracker, 'flush_if_due'):
+            await self.monitor.initialize()
+            interval_secs = self.monitor._query_interval_secs
+            self.assertEqual(interval_secs, NationalWeatherService.ALERTS_FETCH_POLICY.min_interval_secs)
+
+            # Simulate the monitor loop over one full NWS polling interval.
+            for _ in range(600 // interval_secs):
+                await self.monitor.do_work()
+                datetimeproxy.increment(seconds=interval_secs)
+                continue
+
+        self.assertEqual(mock_get_data.await_count, 1)
+        self.assertEqual(mock_get_priority_data.await_count, 600 // interval_secs - 1)
@@ -3,6 +3,7 @@ from datetime import datetime
 import logging
 import redis
 import requests
+from typing import Any, Callable, Dict
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -13,6 +14,11 @@ from hi.apps.console.console_helper import ConsoleSettingsHelper
 from hi.apps.system.api_health_status_provider import ApiHealthStatusProvider
 from hi.apps.system.provider_info import ProviderInfo
 from hi.apps.weather.transient_models import DataPointSource
+from hi.apps.weather.weather_fetch_scheduler import (
+    WeatherFetchContext,
+    WeatherFetchPolicy,
+    WeatherFetchScheduler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +94,22 @@ class WeatherDataSource( ApiHealthStatusProvider ):
     async def get_data(self):
         """ Main method periodically called to fetch data """
         pass
+
+    async def get_priority_data(self):
+        """
+        Override in subclasses with data that must stay current between
+        full polls (e.g., alerts). Called on every monitor pass, ahead of
+        all full fetches and regardless of this source's polling interval.
+        """
+        return
+
+    def get_priority_polling_interval_secs(self) -> int:
+        """
+        Override alongside get_priority_data() with how often that data
+        should be refreshed. The weather monitor runs at least this often.
+        None means there is no priority data.
+        """
+        return None
     
     def requires_api_key(self) -> bool:
         """Override in subclasses that require an API key."""
@@ -128,6 +150,7 @@ class WeatherDataSource( ApiHealthStatusProvider ):
         #
         self._redis_client = get_redis_client()
         self._redis_last_poll_key = f'ws:last:dt:{self._id}'
+        self._fetch_scheduler = WeatherFetchScheduler( weather_data_source = self )
         return
 
     @property
@@ -154,6 +177,10 @@ class WeatherDataSource( ApiHealthStatusProvider ):
     def redis_client(self):
         return self._redis_client
 
+    @property
+    def fetch_scheduler(self) -> WeatherFetchScheduler:
+        return self._fetch_scheduler
+
     @property
     def geographic_location(self):
         return self._console_settings_helper.get_geographic_location()
@@ -169,8 +196,9 @@ class WeatherDataSource( ApiHealthStatusProvider ):
                        operation_name : str,
                        url            : str,
                        *,
-                       headers        : dict  = None,
-                       timeout        : float = None ) -> dict:
+                       headers        : dict                 = None,
+                       timeout        : float                = None,
+                       fetch_context  : WeatherFetchContext  = None ) -> dict:
         """Issue a GET, track it for API health, and return parsed JSON.
 
         Wraps the entire request lifecycle (HTTP status check + JSON
@@ -184,17 +212,38 @@ class WeatherDataSource( ApiHealthStatusProvider ):
         ``requests.get`` call would let HTTP errors slip through as
         ``SUCCESS`` because ``requests`` returns a Response object
         even for non-2xx status — that was the original bug.
+
+        With a ``fetch_context``, its validators are sent as conditional
+        request headers and the response metadata is recorded back into
+        it. A 304 response returns ``None``.
         """
         if timeout is None:
             timeout = self.get_api_timeout()
+        if fetch_context and fetch_context.request_headers:
+            headers = { **( headers or {} ), **fetch_context.request_headers }
         with self.api_call_context( operation_name ):
             response = requests.get(
                 url,
                 headers = headers,
                 timeout = timeout,
             )
+            if fetch_context:
+                fetch_context.apply_response( response )
+                if fetch_context.is_not_modified:
+                    return None
             response.raise_for_status()
             return response.json()
+
+    def _get_scheduled_json( self,
+                             cache_key     : str,
+                             fetch_policy  : WeatherFetchPolicy,
+                             api_func      : Callable[ [ WeatherFetchContext ], Dict[ str, Any ]] ) -> Dict[ str, Any ]:
+        """ Cached while fresh, then revalidated. See WeatherFetchScheduler. """
+        return self._fetch_scheduler.get_json(
+            cache_key = cache_key,
+            fetch_policy = fetch_policy,
+            api_func = api_func,
+        )
     
     def _get_weather_settings_helper(self):
         """Lazy initialization of weather settings helper to avoid circular imports."""
@@ -252,6 +301,19 @@ class WeatherDataSource( ApiHealthStatusProvider ):
             self.record_error( message )
             logger.exception( message )
         return
+
+    def is_fetch_due(self) -> bool:
+        """ Whether fetch() would run get_data() now (see the restart note there). """
+        return bool( not self.polling_started or self.can_fetch() )
+
+    async def fetch_priority(self):
+        try:
+            await self.get_priority_data()
+        except Exception as e:
+            message = f'Problem with weather source priority data: {self.label}: {e}'
+            self.record_error( message )
+            logger.exception( message )
+        return
     
     def can_fetch(self):
 
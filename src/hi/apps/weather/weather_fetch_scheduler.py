@@ -0,0 +1,219 @@
+"""
+Decides when each weather API resource is fetched again, and revalidates
+it with a conditional request rather than re-downloading it.
+
+Each resource (one cache key) has a policy giving the range its refresh
+interval may move within.  After every fetch the interval is taken from
+the upstream freshness headers when present; otherwise it backs off
+while the content stays the same and drops back to the minimum when it
+changes.  The last body is kept with its ETag / Last-Modified validators
+well past the refresh interval, so an expired resource is revalidated
+and an unchanged one costs a 304 instead of the full payload.
+"""
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass( frozen = True )
+class WeatherFetchPolicy:
+
+    min_interval_secs  : float
+    max_interval_secs  : float
+
+
+@dataclass
+class WeatherFetchContext:
+    """ Carries validators into one API request and the response metadata back out. """
+
+    request_headers  : Dict[ str, str ]  = field( default_factory = dict )
+    is_not_modified  : bool              = False
+    etag             : Optional[ str ]   = None
+    last_modified    : Optional[ str ]   = None
+    max_age_secs     : Optional[ float ] = None
+
+    def apply_response( self, response ):
+        self.is_not_modified = bool( response.status_code == 304 )
+        headers = response.headers
+        etag = headers.get( 'ETag' )
+        if isinstance( etag, str ) and etag:
+            self.etag = etag
+        last_modified = headers.get( 'Last-Modified' )
+        if isinstance( last_modified, str ) and last_modified:
+            self.last_modified = last_modified
+        self.max_age_secs = self._parse_max_age_secs( headers )
+        return
+
+    def _parse_max_age_secs( self, headers ) -> Optional[ float ]:
+        cache_control = headers.get( 'Cache-Control' )
+        if isinstance( cache_control, str ):
+            match = re.search( r'(?:^|[,\s])max-age=(\d+)', cache_control )
+            if match:
+                return float( match.group(1) )
+        expires = headers.get( 'Expires' )
+        if isinstance( expires, str ):
+            try:
+                expires_datetime = parsedate_to_datetime( expires )
+                date_header = headers.get( 'Date' )
+                if isinstance( date_header, str ):
+                    now_datetime = parsedate_to_datetime( date_header )
+                else:
+                    now_datetime = datetime.now( timezone.utc )
+                return max( 0.0, ( expires_datetime - now_datetime ).total_seconds() )
+            except ( TypeError, ValueError ):
+                logger.debug( f'Ignoring unparseable Expires header: {expires}' )
+        return None
+
+
+@dataclass
+class WeatherFetchState:
+    """ What is kept between fetches of one resource to revalidate it. """
+
+    data             : Dict[ str, Any ]
+    content_hash     : str
+    interval_secs    : float
+    unchanged_count  : int               = 0
+    etag             : Optional[ str ]   = None
+    last_modified    : Optional[ str ]   = None
+
+    def get_validator_headers(self) -> Dict[ str, str ]:
+        validator_headers = dict()
+        if self.etag:
+            validator_headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            validator_headers['If-Modified-Since'] = self.last_modified
+        return validator_headers
+
+    def to_json(self) -> str:
+        return json.dumps( asdict( self ))
+
+    @classmethod
+    def from_json( cls, state_str : str ) -> 'WeatherFetchState':
+        return cls( **json.loads( state_str ))
+
+
+class WeatherFetchScheduler:
+
+    BACKOFF_FACTOR = 1.5
+
+    # Long enough to survive restarts and the longest refresh interval,
+    # so an expired resource can still be revalidated.
+    REVALIDATE_RETENTION_SECS = 2 * 24 * 60 * 60
+
+    def __init__( self, weather_data_source ):
+        self._weather_data_source = weather_data_source
+        self._not_modified_count = 0
+        self._changed_count = 0
+        self._unchanged_count = 0
+        return
+
+    def get_json( self,
+                  cache_key     : str,
+                  fetch_policy  : WeatherFetchPolicy,
+                  api_func      : Callable[ [ WeatherFetchContext ], Dict[ str, Any ]] ) -> Dict[ str, Any ]:
+        """
+        Returns the resource from the cache while it is fresh, otherwise
+        fetches it via api_func, which must pass the context through to
+        WeatherDataSource._api_get_json().
+        """
+        weather_data_source = self._weather_data_source
+        redis_client = weather_data_source.redis_client
+        is_cache_enabled = weather_data_source.is_cache_enabled
+
+        if is_cache_enabled:
+            data_str = redis_client.get( cache_key )
+            if data_str:
+                logger.debug( f'{weather_data_source.abbreviation} data from cache: {cache_key}' )
+                weather_data_source.record_cache_hit()
+                return json.loads( data_str )
+
+        weather_data_source.record_cache_miss()
+        revalidate_key = self._get_revalidate_key( cache_key )
+        fetch_state = self._load_fetch_state( revalidate_key ) if is_cache_enabled else None
+        fetch_context = WeatherFetchContext(
+            request_headers = fetch_state.get_validator_headers() if fetch_state else dict(),
+        )
+        data = api_func( fetch_context )
+
+        if fetch_context.is_not_modified and fetch_state:
+            self._not_modified_count += 1
+            data = fetch_state.data
+        if not data:
+            return data
+
+        data_str = json.dumps( data )
+        content_hash = hashlib.sha1( data_str.encode( 'utf-8' )).hexdigest()
+        is_changed = bool( not fetch_state or ( content_hash != fetch_state.content_hash ))
+        interval_secs = self.get_next_interval_secs(
+            fetch_policy = fetch_policy,
+            previous_interval_secs = fetch_state.interval_secs if fetch_state else None,
+            is_changed = is_changed,
+            max_age_secs = fetch_context.max_age_secs,
+        )
+        if is_changed:
+            self._changed_count += 1
+        else:
+            self._unchanged_count += 1
+
+        next_fetch_state = WeatherFetchState(
+            data = data,
+            content_hash = content_hash,
+            interval_secs = interval_secs,
+            unchanged_count = 0 if is_changed else fetch_state.unchanged_count + 1,
+            etag = fetch_context.etag,
+            last_modified = fetch_context.last_modified,
+        )
+        # A 304 need not repeat the validators; keep the ones we sent.
+        if fetch_state and fetch_context.is_not_modified:
+            next_fetch_state.etag = next_fetch_state.etag or fetch_state.etag
+            next_fetch_state.last_modified = next_fetch_state.last_modified or fetch_state.last_modified
+
+        redis_client.set( cache_key, data_str, ex = max( 1, int( interval_secs )))
+        redis_client.set( revalidate_key, next_fetch_state.to_json(), ex = self.REVALIDATE_RETENTION_SECS )
+        logger.debug( f'{weather_data_source.abbreviation} fetched {cache_key}:'
+                      f' changed={is_changed}, next in {interval_secs:.0f}s' )
+        return data
+
+    def get_next_interval_secs( self,
+                                fetch_policy            : WeatherFetchPolicy,
+                                previous_interval_secs  : Optional[ float ],
+                                is_changed              : bool,
+                                max_age_secs            : Optional[ float ] ) -> float:
+        if is_changed or previous_interval_secs is None:
+            interval_secs = fetch_policy.min_interval_secs
+        else:
+            interval_secs = previous_interval_secs * self.BACKOFF_FACTOR
+
+        # Asking again before upstream's own freshness lifetime only
+        # gets the same answer back.
+        if max_age_secs:
+            interval_secs = max( interval_secs, max_age_secs )
+        return min( max( interval_secs, fetch_policy.min_interval_secs ),
+                    fetch_policy.max_interval_secs )
+
+    def get_status(self) -> Dict[ str, int ]:
+        return {
+            'not_modified': self._not_modified_count,
+            'changed': self._changed_count,
+            'unchanged': self._unchanged_count,
+        }
+
+    def _get_revalidate_key( self, cache_key : str ) -> str:
+        return f'{cache_key}:revalidate'
+
+    def _load_fetch_state( self, revalidate_key : str ) -> Optional[ WeatherFetchState ]:
+        try:
+            state_str = self._weather_data_source.redis_client.get( revalidate_key )
+            if not state_str:
+                return None
+            return WeatherFetchState.from_json( state_str )
+        except Exception as e:
+            logger.warning( f'Discarding bad weather fetch state {revalidate_key}: {e}' )
+        return None
@@ -1,5 +1,6 @@
 import asyncio
-from dataclasses import fields
+from dataclasses import fields, replace
+from datetime import timedelta
 import logging
 import threading
 from typing import Dict, List
@@ -32,6 +33,7 @@ from .transient_models import (
     IntervalWeatherForecast,
     IntervalWeatherHistory,
     IntervalAstronomical,
+    TimeInterval,
     WeatherAlert,
     WeatherPaneStatus,
     WeatherStats,
@@ -211,7 +213,10 @@ class WeatherManager( Singleton, SettingsMixin, AlertMixin ):
     
     def get_daily_history(self) -> DailyHistory:
         with self._data_sync_lock:
-            return self._daily_history
+            history_data_list = list( self._daily_history.data_list )
+        return DailyHistory(
+            data_list = self._add_tracked_temperature_history( history_data_list ),
+        )
 
     def get_daily_astronomical_data(self) -> DailyAstronomicalData:
         with self._data_sync_lock:
@@ -483,6 +488,46 @@ class WeatherManager( Singleton, SettingsMixin, AlertMixin ):
         logger.debug(f'Updated daily history: {len(history_data_list)} items in data_list')
         return
 
+    def _add_tracked_temperature_history(
+            self, history_data_list : List[IntervalWeatherHistory] ) -> List[IntervalWeatherHistory]:
+        """
+        Fill in the daily temperature range from the local tracker for days
+        the weather sources report without one, or do not cover at all.
+        """
+        temperature_map = self._daily_weather_tracker.get_temperature_history(
+            self._get_location_key()
+        )
+        if not temperature_map:
+            return history_data_list
+
+        tz_name = ConsoleSettingsHelper().get_tz_name()
+        result_list = []
+        for interval_history in history_data_list:
+            date_key = datetimeproxy.to_date_str(
+                datetimeproxy.change_timezone( interval_history.interval.start, tz_name )
+            )
+            temperature = temperature_map.pop( date_key, None )
+            if temperature and interval_history.data and not interval_history.data.temperature:
+                interval_history = replace(
+                    interval_history,
+                    data = replace( interval_history.data, temperature = temperature ),
+                )
+            result_list.append( interval_history )
+            continue
+
+        for temperature in temperature_map.values():
+            result_list.append( IntervalWeatherHistory(
+                interval = TimeInterval(
+                    start = temperature.source_datetime,
+                    end = temperature.source_datetime + timedelta( days = 1 ),
+                ),
+                data = WeatherHistoryData( temperature = temperature ),
+            ))
+            continue
+
+        result_list.sort( key = lambda item: item.interval.start, reverse = True )
+        return result_list
+
     def _update_daily_astronomical_from_manager(self):
         """Update canonical daily astronomical data from aggregated interval data."""
         astronomical_data_list = []
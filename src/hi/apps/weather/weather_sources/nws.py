@@ -1,5 +1,4 @@
 from datetime import datetime
-import json
 import logging
 from typing import Any, Dict, List
 
@@ -7,6 +6,7 @@ import hi.apps.common.datetimeproxy as datetimeproxy
 import hi.apps.common.geo_utils as geo_utils
 from hi.apps.common.utils import str_to_bool
 from hi.apps.weather.weather_data_source import WeatherDataSource
+from hi.apps.weather.weather_fetch_scheduler import WeatherFetchContext, WeatherFetchPolicy
 from hi.apps.weather.enums import (
     WeatherPhenomenonModifier, 
     WindDirection,
@@ -44,11 +44,28 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
     SOURCE_ID = 'nws'
     BASE_URL = "https://api.weather.gov/"
     
-    POINTS_DATA_CACHE_EXPIRY_SECS = 12 * 60 * 60  # Data can change, but not often
-    STATIONS_DATA_CACHE_EXPIRY_SECS = 12 * 60 * 60  # Data can change, but not often
-    OBSERVATIONS_DATA_CACHE_EXPIRY_SECS = 5 * 60  # Cache for rate-limit risk reduction
-    FORECAST_DATA_CACHE_EXPIRY_SECS = 60 * 60
-    ALERTS_DATA_CACHE_EXPIRY_SECS = 10 * 60  # Alerts can change frequently, short cache
+    # Refresh interval ranges. Within each range, the interval follows
+    # upstream Cache-Control/Expires and backs off while data is unchanged.
+    POINTS_FETCH_POLICY = WeatherFetchPolicy(  # Data can change, but not often
+        min_interval_secs = 12 * 60 * 60,
+        max_interval_secs = 24 * 60 * 60,
+    )
+    STATIONS_FETCH_POLICY = WeatherFetchPolicy(  # Data can change, but not often
+        min_interval_secs = 12 * 60 * 60,
+        max_interval_secs = 24 * 60 * 60,
+    )
+    OBSERVATIONS_FETCH_POLICY = WeatherFetchPolicy(  # Stations seem to report only hourly
+        min_interval_secs = 5 * 60,
+        max_interval_secs = 20 * 60,
+    )
+    FORECAST_FETCH_POLICY = WeatherFetchPolicy(  # Large payloads, regenerated every hour or so
+        min_interval_secs = 60 * 60,
+        max_interval_secs = 3 * 60 * 60,
+    )
+    ALERTS_FETCH_POLICY = WeatherFetchPolicy(  # Small payload; revalidated on every monitor pass
+        min_interval_secs = 60,
+        max_interval_secs = 5 * 60,
+    )
 
     @classmethod
     def weather_source_id(cls):
@@ -96,6 +113,13 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
             logger.warning( 'Weather manager not available. Skipping NWS weather fetch.' )
             return
 
+        # Alerts first so they are never held up behind the large
+        # forecast payloads. Usually a cache hit after get_priority_data().
+        await self._update_weather_alerts(
+            weather_manager = weather_manager,
+            geographic_location = geographic_location,
+        )
+
         # Fetch current conditions
         try:
             current_conditions_data = self.get_current_conditions(
@@ -135,6 +159,28 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
         except Exception as e:
             self._log_fetch_error( 'daily forecast', e )
 
+        # Note: NWS does not provide historical weather data or astronomical data
+        # These would need to be fetched from other sources if needed
+        
+        return
+
+    def get_priority_polling_interval_secs(self) -> int:
+        return self.ALERTS_FETCH_POLICY.min_interval_secs
+
+    async def get_priority_data(self):
+        geographic_location = self.geographic_location
+        if not geographic_location:
+            return
+        weather_manager = await self.weather_manager_async()
+        if not weather_manager:
+            return
+        await self._update_weather_alerts(
+            weather_manager = weather_manager,
+            geographic_location = geographic_location,
+        )
+        return
+
+    async def _update_weather_alerts( self, weather_manager, geographic_location : GeographicLocation ):
         # Fetch weather alerts. Always push the result — even an empty
         # list — so removed-upstream alerts clear from our stored list.
         # NWS /alerts/active is contractually the full set of active
@@ -149,10 +195,6 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
             )
         except Exception as e:
             self._log_fetch_error( 'weather alerts', e )
-
-        # Note: NWS does not provide historical weather data or astronomical data
-        # These would need to be fetched from other sources if needed
-        
         return
 
     def get_current_conditions( self, geographic_location : GeographicLocation ) -> WeatherConditionsData:
@@ -486,87 +528,63 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
         return interval_weather_forecast_list
         
     def _get_observations_data( self, station : Station ) -> Dict[ str, Any ]:
-        cache_key = f'ws:{self.id}:observations:{station.key}'
-        observations_data_str = self.redis_client.get( cache_key )
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:observations:{station.key}',
+            fetch_policy = self.OBSERVATIONS_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_observations_data_from_api(
+                station = station,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        if not self.is_cache_enabled:
-            observations_data_str = None
-            
-        if observations_data_str:
-            logger.debug( 'NWS observations data from cache.' )
-            self.record_cache_hit()
-            observations_data = json.loads( observations_data_str )
-            return observations_data
-
-        self.record_cache_miss()
-        observations_data = self._get_observations_data_from_api( station = station )
-        if observations_data:
-            observations_data_str = json.dumps( observations_data )
-            self.redis_client.set( cache_key, observations_data_str,
-                                   ex = self.OBSERVATIONS_DATA_CACHE_EXPIRY_SECS  )
-        return observations_data
-
-    def _get_observations_data_from_api( self, station : Station ) -> Dict[ str, Any ]:
+    def _get_observations_data_from_api( self,
+                                         station        : Station,
+                                         fetch_context  : WeatherFetchContext  = None ) -> Dict[ str, Any ]:
         return self._api_get_json(
             operation_name = 'nws_observations',
             url = station.observations_url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
 
     def _get_forecast_hourly_data( self, station : Station ) -> Dict[ str, Any ]:
-        cache_key = f'ws:{self.id}:forecast-hourly:{station.key}'
-        forecast_hourly_data_str = self.redis_client.get( cache_key )
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:forecast-hourly:{station.key}',
+            fetch_policy = self.FORECAST_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_forecast_hourly_data_from_api(
+                station = station,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        if not self.is_cache_enabled:
-            forecast_hourly_data_str = None
-            
-        if forecast_hourly_data_str:
-            logger.debug( 'NWS hourly forecast data from cache.' )
-            self.record_cache_hit()
-            forecast_hourly_data = json.loads( forecast_hourly_data_str )
-            return forecast_hourly_data
-
-        self.record_cache_miss()
-        forecast_hourly_data = self._get_forecast_hourly_data_from_api( station = station )
-        if forecast_hourly_data:
-            forecast_hourly_data_str = json.dumps( forecast_hourly_data )
-            self.redis_client.set( cache_key, forecast_hourly_data_str,
-                                   ex = self.FORECAST_DATA_CACHE_EXPIRY_SECS  )
-        return forecast_hourly_data
-
-    def _get_forecast_hourly_data_from_api( self, station : Station ) -> Dict[ str, Any ]:
+    def _get_forecast_hourly_data_from_api( self,
+                                            station        : Station,
+                                            fetch_context  : WeatherFetchContext  = None ) -> Dict[ str, Any ]:
         return self._api_get_json(
             operation_name = 'nws_forecast_hourly',
             url = station.forecast_url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
 
     def _get_forecast_12h_data( self, station : Station ) -> Dict[ str, Any ]:
-        cache_key = f'ws:{self.id}:forecast-12h:{station.key}'
-        forecast_12h_data_str = self.redis_client.get( cache_key )
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:forecast-12h:{station.key}',
+            fetch_policy = self.FORECAST_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_forecast_12h_data_from_api(
+                station = station,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        if not self.is_cache_enabled:
-            forecast_12h_data_str = None
-            
-        if forecast_12h_data_str:
-            logger.debug( 'NWS 12h forecast data from cache.' )
-            self.record_cache_hit()
-            forecast_12h_data = json.loads( forecast_12h_data_str )
-            return forecast_12h_data
-
-        self.record_cache_miss()
-        forecast_12h_data = self._get_forecast_12h_data_from_api( station = station )
-        if forecast_12h_data:
-            forecast_12h_data_str = json.dumps( forecast_12h_data )
-            self.redis_client.set( cache_key, forecast_12h_data_str,
-                                   ex = self.FORECAST_DATA_CACHE_EXPIRY_SECS  )
-        return forecast_12h_data
-
-    def _get_forecast_12h_data_from_api( self, station : Station ) -> Dict[ str, Any ]:
+    def _get_forecast_12h_data_from_api( self,
+                                         station        : Station,
+                                         fetch_context  : WeatherFetchContext  = None ) -> Dict[ str, Any ]:
         return self._api_get_json(
             operation_name = 'nws_forecast',
             url = station.forecast_url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
     
     def _get_station( self, geographic_location : GeographicLocation  ) -> Station:
@@ -577,27 +595,18 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
         )
     
     def _get_stations_data( self, geographic_location : GeographicLocation ) -> Dict[ str, Any ]:
-        cache_key = f'ws:{self.id}:stations:{geographic_location}'
-        stations_data_str = self.redis_client.get( cache_key )
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:stations:{geographic_location}',
+            fetch_policy = self.STATIONS_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_stations_data_from_api(
+                geographic_location = geographic_location,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        if not self.is_cache_enabled:
-            stations_data_str = None
-            
-        if stations_data_str:
-            logger.debug( 'NWS stations data from cache.' )
-            self.record_cache_hit()
-            stations_data = json.loads( stations_data_str )
-            return stations_data
-
-        self.record_cache_miss()
-        stations_data = self._get_stations_data_from_api( geographic_location = geographic_location )
-        if stations_data:
-            stations_data_str = json.dumps( stations_data )
-            self.redis_client.set( cache_key, stations_data_str,
-                                   ex = self.STATIONS_DATA_CACHE_EXPIRY_SECS  )
-        return stations_data
-
-    def _get_stations_data_from_api( self, geographic_location : GeographicLocation ) -> Dict[ str, Any ]:
+    def _get_stations_data_from_api( self,
+                                     geographic_location  : GeographicLocation,
+                                     fetch_context        : WeatherFetchContext  = None ) -> Dict[ str, Any ]:
         # Can cache this data, expires 12 hours-ish (they do not change often)
         points_data = self._get_points_data( geographic_location = geographic_location )
         stations_url = points_data['properties']['observationStations']
@@ -606,30 +615,22 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
             operation_name = 'nws_stations',
             url = stations_url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
         
     def _get_points_data( self, geographic_location : GeographicLocation ) -> Dict[ str, Any ]:
-        cache_key = f'ws:{self.id}:points:{geographic_location}'
-        points_data_str = self.redis_client.get( cache_key )
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:points:{geographic_location}',
+            fetch_policy = self.POINTS_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_points_data_from_api(
+                geographic_location = geographic_location,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        if not self.is_cache_enabled:
-            points_data_str = None
-            
-        if points_data_str:
-            logger.debug( 'NWS points data from cache.' )
-            self.record_cache_hit()
-            points_data = json.loads( points_data_str )
-            return points_data
-
-        self.record_cache_miss()
-        points_data = self._get_points_data_from_api( geographic_location = geographic_location )
-        if points_data:
-            points_data_str = json.dumps( points_data )
-            self.redis_client.set( cache_key, points_data_str,
-                                   ex = self.POINTS_DATA_CACHE_EXPIRY_SECS  )
-        return points_data
-
-    def _get_points_data_from_api( self, geographic_location : GeographicLocation ) -> Dict[ str, Any ]:
+    def _get_points_data_from_api( self,
+                                   geographic_location  : GeographicLocation,
+                                   fetch_context        : WeatherFetchContext  = None ) -> Dict[ str, Any ]:
         # Can cache this data, expires 12 hours-ish (they do not change often)
         points_url = f'{self._get_base_url()}points/{geographic_location.latitude},{geographic_location.longitude}'
 
@@ -637,6 +638,7 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
             operation_name = 'nws_points',
             url = points_url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
     
     def _get_closest_station( self,
@@ -1026,29 +1028,18 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
 
     def _get_alerts_data( self, geographic_location : GeographicLocation ) -> Dict[str, Any]:
         """Get alerts data from cache or API."""
-        cache_key = f'ws:{self.id}:alerts:{geographic_location.latitude:.3f}:{geographic_location.longitude:.3f}'
-        alerts_data_str = self.redis_client.get(cache_key)
-
-        if not self.is_cache_enabled:
-            alerts_data_str = None
-            
-        if alerts_data_str:
-            logger.debug('NWS alerts data from cache.')
-            self.record_cache_hit()
-            alerts_data = json.loads(alerts_data_str)
-            return alerts_data
-
-        self.record_cache_miss()
-        alerts_data = self._get_alerts_data_from_api(
-            geographic_location = geographic_location,
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:alerts:{geographic_location.latitude:.3f}:{geographic_location.longitude:.3f}',
+            fetch_policy = self.ALERTS_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_alerts_data_from_api(
+                geographic_location = geographic_location,
+                fetch_context = fetch_context,
+            ),
         )
-        if alerts_data:
-            alerts_data_str = json.dumps(alerts_data)
-            self.redis_client.set(cache_key, alerts_data_str,
-                                  ex = self.ALERTS_DATA_CACHE_EXPIRY_SECS)
-        return alerts_data
 
-    def _get_alerts_data_from_api( self, geographic_location : GeographicLocation ) -> Dict[str, Any]:
+    def _get_alerts_data_from_api( self,
+                                   geographic_location  : GeographicLocation,
+                                   fetch_context        : WeatherFetchContext  = None ) -> Dict[str, Any]:
         """Make API call to NWS for alerts data."""
         alerts_url = f'{self._get_base_url()}alerts/active?point={geographic_location.latitude},{geographic_location.longitude}'
         logger.debug(f'NWS alerts API request: {alerts_url}')
@@ -1057,6 +1048,7 @@ class NationalWeatherService( WeatherDataSource, WeatherMixin ):
             operation_name = 'nws_alerts',
             url = alerts_url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
 
     def _parse_alerts_data( self, 
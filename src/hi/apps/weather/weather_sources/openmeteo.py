@@ -6,6 +6,7 @@ from typing import Any, Dict, List
 
 import hi.apps.common.datetimeproxy as datetimeproxy
 from hi.apps.weather.weather_data_source import WeatherDataSource
+from hi.apps.weather.weather_fetch_scheduler import WeatherFetchContext, WeatherFetchPolicy
 from hi.apps.weather.transient_models import (
     BooleanDataPoint,
     NumericDataPoint,
@@ -33,8 +34,14 @@ class OpenMeteo(WeatherDataSource, WeatherMixin):
     BASE_URL = "https://api.open-meteo.com/v1/"
     ARCHIVE_BASE_URL = "https://archive-api.open-meteo.com/v1/archive"
     
-    CURRENT_DATA_CACHE_EXPIRY_SECS = 10 * 60  # Cache for 10 minutes
-    FORECAST_DATA_CACHE_EXPIRY_SECS = 60 * 60  # Cache for 1 hour
+    CURRENT_FETCH_POLICY = WeatherFetchPolicy(
+        min_interval_secs = 10 * 60,
+        max_interval_secs = 30 * 60,
+    )
+    FORECAST_FETCH_POLICY = WeatherFetchPolicy(
+        min_interval_secs = 60 * 60,
+        max_interval_secs = 3 * 60 * 60,
+    )
     HISTORICAL_DATA_CACHE_EXPIRY_SECS = 30 * 24 * 60 * 60  # 30 days - historical data rarely changes
     
     
@@ -720,27 +727,18 @@ class OpenMeteo(WeatherDataSource, WeatherMixin):
         return interval_weather_history_list
         
     def _get_current_weather_data(self, geographic_location: GeographicLocation) -> Dict[str, Any]:
-        cache_key = f'ws:{self.id}:current:{geographic_location}'
-        current_data_str = self.redis_client.get(cache_key)
-
-        if not self.is_cache_enabled:
-            current_data_str = None
-            
-        if current_data_str:
-            logger.debug('OpenMeteo current weather data from cache.')
-            self.record_cache_hit()
-            current_data = json.loads(current_data_str)
-            return current_data
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:current:{geographic_location}',
+            fetch_policy = self.CURRENT_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_current_weather_data_from_api(
+                geographic_location = geographic_location,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        self.record_cache_miss()
-        current_data = self._get_current_weather_data_from_api(geographic_location = geographic_location)
-        if current_data:
-            current_data_str = json.dumps(current_data)
-            self.redis_client.set(cache_key, current_data_str,
-                                  ex = self.CURRENT_DATA_CACHE_EXPIRY_SECS)
-        return current_data
-
-    def _get_current_weather_data_from_api(self, geographic_location: GeographicLocation) -> Dict[str, Any]:
+    def _get_current_weather_data_from_api( self,
+                                            geographic_location  : GeographicLocation,
+                                            fetch_context        : WeatherFetchContext  = None ) -> Dict[str, Any]:
         # Request current weather plus additional hourly data for current hour
         url = (f"{self._get_base_url()}forecast?"
                f"latitude={geographic_location.latitude}&"
@@ -753,30 +751,22 @@ class OpenMeteo(WeatherDataSource, WeatherMixin):
             operation_name = 'openmeteo_current',
             url = url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
 
     def _get_hourly_forecast_data(self, geographic_location: GeographicLocation) -> Dict[str, Any]:
-        cache_key = f'ws:{self.id}:forecast-hourly:{geographic_location}'
-        forecast_data_str = self.redis_client.get(cache_key)
-
-        if not self.is_cache_enabled:
-            forecast_data_str = None
-            
-        if forecast_data_str:
-            logger.debug('OpenMeteo hourly forecast data from cache.')
-            self.record_cache_hit()
-            forecast_data = json.loads(forecast_data_str)
-            return forecast_data
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:forecast-hourly:{geographic_location}',
+            fetch_policy = self.FORECAST_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_hourly_forecast_data_from_api(
+                geographic_location = geographic_location,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        self.record_cache_miss()
-        forecast_data = self._get_hourly_forecast_data_from_api(geographic_location = geographic_location)
-        if forecast_data:
-            forecast_data_str = json.dumps(forecast_data)
-            self.redis_client.set(cache_key, forecast_data_str,
-                                  ex = self.FORECAST_DATA_CACHE_EXPIRY_SECS)
-        return forecast_data
-
-    def _get_hourly_forecast_data_from_api(self, geographic_location: GeographicLocation) -> Dict[str, Any]:
+    def _get_hourly_forecast_data_from_api( self,
+                                            geographic_location  : GeographicLocation,
+                                            fetch_context        : WeatherFetchContext  = None ) -> Dict[str, Any]:
         # Request 7 days of hourly forecast data
         url = (f"{self._get_base_url()}forecast?"
                f"latitude={geographic_location.latitude}&"
@@ -789,30 +779,22 @@ class OpenMeteo(WeatherDataSource, WeatherMixin):
             operation_name = 'openmeteo_forecast_hourly',
             url = url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
 
     def _get_daily_forecast_data(self, geographic_location: GeographicLocation) -> Dict[str, Any]:
-        cache_key = f'ws:{self.id}:forecast-daily:{geographic_location}'
-        forecast_data_str = self.redis_client.get(cache_key)
-
-        if not self.is_cache_enabled:
-            forecast_data_str = None
-            
-        if forecast_data_str:
-            logger.debug('OpenMeteo daily forecast data from cache.')
-            self.record_cache_hit()
-            forecast_data = json.loads(forecast_data_str)
-            return forecast_data
+        return self._get_scheduled_json(
+            cache_key = f'ws:{self.id}:forecast-daily:{geographic_location}',
+            fetch_policy = self.FORECAST_FETCH_POLICY,
+            api_func = lambda fetch_context: self._get_daily_forecast_data_from_api(
+                geographic_location = geographic_location,
+                fetch_context = fetch_context,
+            ),
+        )
 
-        self.record_cache_miss()
-        forecast_data = self._get_daily_forecast_data_from_api(geographic_location = geographic_location)
-        if forecast_data:
-            forecast_data_str = json.dumps(forecast_data)
-            self.redis_client.set(cache_key, forecast_data_str,
-                                  ex = self.FORECAST_DATA_CACHE_EXPIRY_SECS)
-        return forecast_data
-
-    def _get_daily_forecast_data_from_api(self, geographic_location: GeographicLocation) -> Dict[str, Any]:
+    def _get_daily_forecast_data_from_api( self,
+                                           geographic_location  : GeographicLocation,
+                                           fetch_context        : WeatherFetchContext  = None ) -> Dict[str, Any]:
         # Request 14 days of daily forecast data
         url = (f"{self._get_base_url()}forecast?"
                f"latitude={geographic_location.latitude}&"
@@ -825,6 +807,7 @@ class OpenMeteo(WeatherDataSource, WeatherMixin):
             operation_name = 'openmeteo_forecast_daily',
             url = url,
             headers = self._headers,
+            fetch_context = fetch_context,
         )
 
     def _get_historical_weather_data( self,
@@ -3,6 +3,7 @@ import os
 from django.core.signals import request_started
 
 from hi.apps.common.asyncio_utils import start_background_event_loop
+from hi.apps.event.event_action_dispatcher import EventActionDispatcher
 from hi.apps.monitor.monitor_manager import AppMonitorManager
 from hi.integrations.integration_manager import IntegrationManager
 
@@ -45,6 +46,9 @@ class HiBackgroundTaskHelper:
         if cls._background_requests_started:
             return
         
+        logger.info( 'Starting EventActionDispatcher ...' )
+        EventActionDispatcher().start()
+
         logger.info( 'Starting AppMonitorManager ...' )
         start_background_event_loop(
             task_function = AppMonitorManager().initialize,
@@ -0,0 +1,85 @@
+import logging
+from threading import Lock
+from typing import Callable, Dict, Tuple
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.middleware.csrf import get_token
+from django.utils.safestring import SafeString, mark_safe
+
+from hi.apps.collection.models import Collection
+from hi.apps.common.singleton import Singleton
+from hi.apps.location.models import Location, LocationView
+
+logger = logging.getLogger(__name__)
+
+
+class HiGridChromeCache( Singleton ):
+    """
+    Rendered top and bottom panes of the HiGridView page chrome.
+
+    The panes list the locations, location views and collections, which
+    only change in edit mode, and otherwise depend on only a few view
+    parameters (view type, selected location view/collection, edit
+    mode), which callers fold into the pane key.  Any save/delete of the
+    listed models bumps a generation counter, which discards all
+    rendered panes.
+
+    The CSRF token is per session, so panes are rendered with a
+    placeholder token that is swapped for the request's token on each
+    use.
+    """
+
+    CSRF_TOKEN_PLACEHOLDER = 'HiGridChromeCsrfTokenPlaceholder'
+
+    def __init_singleton__(self):
+        self._pane_html_map : Dict[ Tuple, str ] = dict()
+        self._generation = 0
+        self._lock = Lock()
+        return
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._pane_html_map = dict()
+        return
+
+    def get_pane_html( self,
+                       request    : HttpRequest,
+                       pane_key   : Tuple,
+                       render_fn  : Callable[ [ Dict ], str ] ) -> SafeString:
+        """
+        The render_fn is given extra context to render with and must
+        produce output that depends only on the pane_key and the cached
+        models.
+        """
+        with self._lock:
+            generation = self._generation
+            pane_html = self._pane_html_map.get( pane_key )
+
+        if pane_html is None:
+            pane_html = render_fn({ 'csrf_token': self.CSRF_TOKEN_PLACEHOLDER })
+            with self._lock:
+                if self._generation == generation:
+                    self._pane_html_map[pane_key] = pane_html
+
+        if self.CSRF_TOKEN_PLACEHOLDER in pane_html:
+            pane_html = pane_html.replace( self.CSRF_TOKEN_PLACEHOLDER, get_token( request ))
+        return mark_safe( pane_html )
+
+
+@receiver( post_save, sender = Location )
+@receiver( post_save, sender = LocationView )
+@receiver( post_save, sender = Collection )
+@receiver( post_delete, sender = Location )
+@receiver( post_delete, sender = LocationView )
+@receiver( post_delete, sender = Collection )
+def hi_grid_chrome_model_changed( sender, instance, **kwargs ):
+    logger.debug( f'Invalidating grid chrome panes on {sender.__name__} change.' )
+    HiGridChromeCache().invalidate()
+    return
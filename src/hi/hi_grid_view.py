@@ -4,7 +4,7 @@ import urllib.parse
 
 from django.http import HttpRequest
 from django.shortcuts import redirect, render
-from django.template.loader import get_template
+from django.template.loader import get_template, render_to_string
 from django.urls import resolve
 from django.views.generic import View
 
@@ -21,6 +21,7 @@ from hi.constants import DIVID
 from hi.enums import ViewType
 from hi.exceptions import ForceRedirectException, ForceSynchronousException
 from hi.hi_async_view import HiSideView
+from hi.hi_grid_chrome_cache import HiGridChromeCache
 
 logger = logging.getLogger(__name__)
     
@@ -80,6 +81,56 @@ class HiGridView( View ):
         }
         return ( self.BOTTOM_TEMPLATE_NAME, context )
 
+    def get_top_pane_html( self, request, *args, **kwargs ) -> str:
+        """
+        Served from the chrome cache, so the top template and context must
+        depend only on the models and view parameters in the key.
+        """
+        view_parameters = request.view_parameters
+        pane_key = (
+            self.TOP_TEMPLATE_NAME,
+            view_parameters.view_type,
+            view_parameters.location_view_id,
+            view_parameters.is_editing,
+        )
+        return HiGridChromeCache().get_pane_html(
+            request = request,
+            pane_key = pane_key,
+            render_fn = lambda extra_context: self._render_pane(
+                request,
+                self.get_top_template_name_and_context( request, *args, **kwargs ),
+                extra_context,
+            ),
+        )
+
+    def get_bottom_pane_html( self, request, *args, **kwargs ) -> str:
+        """
+        Served from the chrome cache, so the bottom template and context
+        must depend only on the models and view parameters in the key.
+        """
+        view_parameters = request.view_parameters
+        pane_key = (
+            self.BOTTOM_TEMPLATE_NAME,
+            view_parameters.view_type,
+            view_parameters.collection_id,
+            view_parameters.is_editing,
+        )
+        return HiGridChromeCache().get_pane_html(
+            request = request,
+            pane_key = pane_key,
+            render_fn = lambda extra_context: self._render_pane(
+                request,
+                self.get_bottom_template_name_and_context( request, *args, **kwargs ),
+                extra_context,
+            ),
+        )
+
+    def _render_pane( self, request, template_name_and_context, extra_context ) -> str:
+        template_name, context = template_name_and_context
+        context = dict( context )
+        context.update( extra_context )
+        return render_to_string( template_name, context, request = request )
+
     def get_side_template_name_and_context( self, request, *args, **kwargs ):
         """ Subclasses can override this i sneeded. """
         try:
@@ -122,21 +173,13 @@ class HiGridView( View ):
         ( side_template_name,
           side_template_context ) = self.get_side_template_name_and_context( request, *args, **kwargs )
 
-        ( top_template_name,
-          top_template_context ) = self.get_top_template_name_and_context( request, *args, **kwargs )
-
-        ( bottom_template_name,
-          bottom_template_context ) = self.get_bottom_template_name_and_context( request, *args, **kwargs )
-
         context.update( side_template_context )
-        context.update( top_template_context )
-        context.update( bottom_template_context )
         
         context.update({
             'main_template_name': self.get_main_template_name(),
             'side_template_name': side_template_name,
-            'top_template_name': top_template_name,
-            'bottom_template_name': bottom_template_name,
+            'top_pane_html': self.get_top_pane_html( request, *args, **kwargs ),
+            'bottom_pane_html': self.get_bottom_pane_html( request, *args, **kwargs ),
         })
 
         return render( request, self.HI_GRID_TEMPLATE_NAME, context )
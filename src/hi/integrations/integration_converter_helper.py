@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from hi.apps.sense.sensor_response_manager import SensorResponseMixin
-from hi.units import UnitQuantity
+from hi.units import get_unit_conversion
 
 from .integration_metadata_cache import IntegrationMetadataCache
 from .transient_models import IntegrationKey
@@ -145,13 +145,18 @@ class IntegrationConverterHelper:
             from_unit : Optional[str],
             to_unit   : Optional[str],
     ) -> float:
-        """Pure-Python Pint conversion between unit strings.
-        Pass-through when either side is missing or the units
-        already match. Defensive on parse failures so a malformed
-        unit string never raises into the converter call sites."""
+        """Conversion between unit strings via the compiled
+        conversion registry (Pint is only consulted the first time a
+        unit pair is seen). Pass-through when either side is missing
+        or the units already match. Defensive on parse failures so a
+        malformed unit string never raises into the converter call
+        sites."""
         if not from_unit or not to_unit or from_unit == to_unit:
             return value
+        unit_conversion = get_unit_conversion( from_unit, to_unit )
+        if unit_conversion is None:
+            return value
         try:
-            return UnitQuantity( value, from_unit ).to( to_unit ).magnitude
+            return unit_conversion.convert( value )
         except Exception:
             return value
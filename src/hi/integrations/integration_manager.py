@@ -3,7 +3,7 @@ import asyncio
 import json
 import logging
 import threading
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from django.apps import apps
 from django.conf import settings
@@ -12,11 +12,12 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 from hi.apps.attribute.enums import AttributeType
-from hi.apps.common.delayed_signal_processor import DelayedSignalProcessor
+from hi.apps.common.model_change_dispatcher import ModelChangeSet, ModelChangeTopic
 from hi.apps.common.singleton import Singleton
 from hi.apps.common.module_utils import import_module_safe
 from hi.apps.entity.models import Entity
 from hi.apps.system.health_status_provider import HealthStatusProvider
+from hi.apps.system.timing_metrics import EventLoopLagSampler
 
 from .entity_operations import EntityIntegrationOperations
 from .enums import IntegrationAttributeType, IntegrationDisableMode
@@ -170,6 +171,8 @@ class IntegrationManager( Singleton ):
             self._initialized = True
 
             self._monitor_event_loop = event_loop
+            asyncio.create_task( EventLoopLagSampler( loop_name = 'Integration Monitors' ).run(),
+                                 name = 'Integration-event-loop-lag' )
 
             logger.info("Discovering and starting integration monitors...")
             await self._load_integration_data()
@@ -620,18 +623,23 @@ class IntegrationManager( Singleton ):
             )
         return
     
-    def notify_integration_settings_changed(self):
+    def notify_integration_settings_changed( self, integration_ids : Iterable[ int ] = None ):
         """
-        Notify all integrations that their settings have changed.
+        Notify integrations that their settings have changed.
         
         This method is called when Integration or IntegrationAttribute models
-        are modified. It loops through all discovered integrations and calls
-        their gateway's notify_settings_changed() method to reload configuration.
+        are modified. Only the integrations whose rows changed (by Integration
+        database id) are notified, or all of them when no ids are given, and
+        each reloads its configuration via its gateway's notify_settings_changed().
         """
-        logger.debug('Integration settings changed - notifying all integrations')
+        logger.debug( f'Integration settings changed - notifying integrations: {integration_ids}' )
+        integration_id_set = set( integration_ids ) if integration_ids is not None else None
         
-        for integration_data in self._integration_data_map.values():
+        for integration_data in list( self._integration_data_map.values() ):
             integration_id = integration_data.integration_id
+            if (( integration_id_set is not None )
+                    and ( integration_data.integration.id not in integration_id_set )):
+                continue
             try:
                 # Notify the integration gateway that settings have changed
                 integration_gateway = integration_data.integration_gateway
@@ -640,19 +648,20 @@ class IntegrationManager( Singleton ):
                     
             except Exception as e:
                 logger.exception(f'Could not notify {integration_id} integration: {e}')
+            continue
+        return
 
 
-def _integration_manager_reload_callback():
-    """Callback function for delayed integration manager reload."""
-    integration_manager = IntegrationManager()
-    integration_manager.notify_integration_settings_changed()
+def _apply_integration_changes( change_set : ModelChangeSet ):
+    IntegrationManager().notify_integration_settings_changed(
+        integration_ids = change_set.get_ids( 'integration' ),
+    )
+    return
 
 
-# Create delayed signal processor for integration changes
-_integration_processor = DelayedSignalProcessor(
-    name="integration_manager",
-    callback_func=_integration_manager_reload_callback,
-    delay_seconds=0.1
+_integration_changes = ModelChangeTopic(
+    name = 'integration_manager',
+    callback_func = _apply_integration_changes,
 )
 
 
@@ -664,8 +673,12 @@ def integration_model_changed(sender, instance, **kwargs):
     """
     Handle changes to Integration and IntegrationAttribute models.
     
-    This signal handler schedules the IntegrationManager to notify all
-    integration monitors after the transaction commits.
+    After the transaction commits, only the integrations whose rows
+    changed are notified.
     """
     logger.debug(f'Integration model change detected: {sender.__name__}')
-    _integration_processor.schedule_processing()
+    if isinstance( instance, IntegrationAttribute ):
+        _integration_changes.record( 'integration', instance.integration_id )
+    else:
+        _integration_changes.record( 'integration', instance.id )
+    return
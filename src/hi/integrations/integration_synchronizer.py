@@ -17,7 +17,7 @@ from typing import Any, Dict, List, Optional
 
 from django.db import transaction
 
-from hi.apps.common.database_lock import ExclusionLockContext
+from hi.apps.common.lock_service import ExclusionLockContext
 from hi.apps.entity.entity_placement import (
     EntityPlacementInput,
     EntityPlacementItem,
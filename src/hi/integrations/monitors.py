@@ -10,11 +10,13 @@ its ``check_needs_sync()``. Sync-check rides on the same opt-in
 surface as full sync — an integration without a synchronizer
 naturally opts out of the periodic drift check too. Per-integration
 calls are wrapped in try/except so one integration's transient
-failure does not abort the cycle for the others. Sequential (not
-parallel) iteration is deliberate: we hit one upstream at a time
-across all integrations, which avoids lock-step CPU bursts when
-monitors of multiple integrations would otherwise align at the long
-boundary.
+failure does not abort the cycle for the others. The integrations
+are checked concurrently, each under its own timeout, so a slow or
+hung upstream delays neither the other integrations' checks nor the
+cycle as a whole. Each check is a single upstream fetch, and most
+skip their HI-side query entirely (see
+``IntegrationSyncCheck.compute_delta_if_changed``), so running them
+together is a short burst rather than sustained load.
 
 Lifecycle: started from ``IntegrationManager`` after the
 per-integration health monitors have been launched. Stopped from the
@@ -25,6 +27,7 @@ their underlying manager / client is not yet ready are reported as
 errors for this cycle only and the next cycle catches them.
 """
 
+import asyncio
 import logging
 
 from hi.apps.alert.enums import AlarmLevel
@@ -41,6 +44,7 @@ class IntegrationSyncCheckMonitor( PeriodicMonitor ):
 
     MONITOR_ID = 'hi.integrations.sync_check_monitor'
     INTERVAL_SECS = IntegrationSyncCheck.INTERVAL_SECS
+    CHECK_TIMEOUT_SECS = 5 * 60
 
     def __init__( self ):
         super().__init__(
@@ -77,16 +81,33 @@ class IntegrationSyncCheckMonitor( PeriodicMonitor ):
 
         outcome_counts = { outcome: 0 for outcome in SyncCheckOutcome }
 
-        for integration_data in integration_data_list:
-            if integration_data.is_paused:
-                continue
-            outcome = await self._check_one_integration( integration_data )
+        outcome_list = await asyncio.gather( *[
+            self._check_one_integration_with_timeout( integration_data )
+            for integration_data in integration_data_list
+            if not integration_data.is_paused
+        ])
+        for outcome in outcome_list:
             outcome_counts[ outcome ] += 1
             continue
 
         self._record_cycle_health( outcome_counts )
         return
 
+    async def _check_one_integration_with_timeout(
+            self,
+            integration_data : IntegrationData ) -> SyncCheckOutcome:
+        try:
+            return await asyncio.wait_for(
+                self._check_one_integration( integration_data ),
+                timeout = self.CHECK_TIMEOUT_SECS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f'Sync check timed out for {integration_data.integration_id}'
+                f' after {self.CHECK_TIMEOUT_SECS}s'
+            )
+            return SyncCheckOutcome.ERROR
+
     async def _check_one_integration(
             self,
             integration_data : IntegrationData ) -> SyncCheckOutcome:
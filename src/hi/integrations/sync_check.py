@@ -20,17 +20,29 @@ State is stored via ``django.core.cache`` (Redis-backed in
 production); no DB model. Frozen dataclasses pickle cleanly through
 the cache backend, so no custom serialization is needed; the cache
 TTL bounds the impact of any class rename.
+
+Most cycles find nothing changed, so probes that go through
+``IntegrationSyncCheck.compute_delta_if_changed`` remember a
+fingerprint of each side's key set and skip the HI-side query and
+the diff when neither side has changed since the previous cycle.
 """
 
+import hashlib
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, Set
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Callable, Dict, Optional, Set
 
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 import hi.apps.common.datetimeproxy as datetimeproxy
 from hi.apps.common.enums import LabeledEnum
+from hi.apps.common.singleton import Singleton
+from hi.apps.entity.models import Entity
 
 from .transient_models import IntegrationKey
 
@@ -99,6 +111,88 @@ class SyncCheckResult:
         return self.delta.needs_sync
 
 
+@dataclass(frozen=True)
+class KeySetFingerprint:
+    """
+    Compact stand-in for a set of ``IntegrationKey``: the count plus a
+    digest of the sorted canonical key strings. Equal fingerprints
+    mean equal key sets (up to digest collisions).
+    """
+    count   : int
+    digest  : str
+
+    @classmethod
+    def from_keys( cls, keys : Set[ IntegrationKey ] ) -> 'KeySetFingerprint':
+        hasher = hashlib.blake2b( digest_size = 16 )
+        for key_str in sorted( str( x ) for x in keys ):
+            hasher.update( key_str.encode() )
+            hasher.update( b'\n' )
+            continue
+        return cls(
+            count = len( keys ),
+            digest = hasher.hexdigest(),
+        )
+
+
+@dataclass(frozen=True)
+class FingerprintedDelta:
+    """ The outcome of one probe's comparison and what it was computed from. """
+    upstream_fingerprint  : KeySetFingerprint
+    current_fingerprint   : KeySetFingerprint
+    entity_generation     : int
+    checked_at            : datetime
+    delta                 : SyncDelta
+
+
+class SyncCheckFingerprints( Singleton ):
+    """
+    In-process memory of each integration's last compared key sets.
+
+    The HI side of the comparison only changes when entities do, so
+    entity saves and deletes bump a generation counter instead of the
+    probe re-querying the entity table every cycle. Writes that send
+    no signals (another process, queryset updates) are covered by
+    only trusting an entry for ``MAX_REUSE_SECS``.
+    """
+
+    MAX_REUSE_SECS = 24 * 60 * 60
+
+    def __init_singleton__(self):
+        self._fingerprinted_delta_map : Dict[ str, FingerprintedDelta ] = dict()
+        self._entity_generation = 0
+        self._lock = Lock()
+        return
+
+    @property
+    def entity_generation(self) -> int:
+        return self._entity_generation
+
+    def entities_changed(self):
+        with self._lock:
+            self._entity_generation += 1
+        return
+
+    def get( self, integration_id : str ) -> Optional[ FingerprintedDelta ]:
+        with self._lock:
+            fingerprinted_delta = self._fingerprinted_delta_map.get( integration_id )
+        if fingerprinted_delta is None:
+            return None
+        age = datetimeproxy.now() - fingerprinted_delta.checked_at
+        if age > timedelta( seconds = self.MAX_REUSE_SECS ):
+            return None
+        return fingerprinted_delta
+
+    def set( self, integration_id : str, fingerprinted_delta : FingerprintedDelta ):
+        with self._lock:
+            self._fingerprinted_delta_map[integration_id] = fingerprinted_delta
+        return
+
+    def clear( self, integration_id : str ):
+        with self._lock:
+            self._fingerprinted_delta_map.pop( integration_id, None )
+        return
+
+
 class IntegrationSyncCheck:
     """
     Namespace for the sync-check primitives: cache access, the
@@ -138,6 +232,60 @@ class IntegrationSyncCheck:
             removed = set( current_keys )  - set( upstream_keys ),
         )
 
+    @classmethod
+    async def compute_delta_if_changed(
+            cls,
+            integration_id   : str,
+            upstream_keys    : Set[ IntegrationKey ],
+            current_keys_fn  : Callable[ [], Set[ IntegrationKey ] ] ) -> SyncDelta:
+        """
+        ``compute_delta`` for probes that fetch the full upstream key
+        set every cycle. ``current_keys_fn`` is the (synchronous, DB
+        reading) fetch of the HI-side keys; it is not called when no
+        entity has changed since the previous cycle and the upstream
+        fingerprint matches that cycle's. When the HI-side keys are
+        fetched but both fingerprints still match, the previous delta
+        is reused without diffing.
+        """
+        fingerprints = SyncCheckFingerprints()
+        entity_generation = fingerprints.entity_generation
+        upstream_fingerprint = KeySetFingerprint.from_keys( upstream_keys )
+        previous = fingerprints.get( integration_id )
+
+        if (( previous is not None )
+                and ( previous.upstream_fingerprint == upstream_fingerprint )
+                and ( previous.entity_generation == entity_generation )):
+            logger.debug( f'sync-check for {integration_id}: key sets unchanged' )
+            return previous.delta
+
+        # The upstream fetch (the slow, network-bound part) ran before
+        # this on its own worker thread. This is a short indexed DB read,
+        # so it stays on the thread-sensitive executor with the rest of
+        # Django's database access.
+        current_keys = await sync_to_async( current_keys_fn, thread_sensitive = True )()
+        current_fingerprint = KeySetFingerprint.from_keys( current_keys )
+        if (( previous is not None )
+                and ( previous.upstream_fingerprint == upstream_fingerprint )
+                and ( previous.current_fingerprint == current_fingerprint )):
+            delta = previous.delta
+        else:
+            delta = cls.compute_delta(
+                upstream_keys = upstream_keys,
+                current_keys = current_keys,
+            )
+
+        fingerprints.set(
+            integration_id = integration_id,
+            fingerprinted_delta = FingerprintedDelta(
+                upstream_fingerprint = upstream_fingerprint,
+                current_fingerprint = current_fingerprint,
+                entity_generation = entity_generation,
+                checked_at = datetimeproxy.now(),
+                delta = delta,
+            ),
+        )
+        return delta
+
     @classmethod
     def get_state( cls, integration_id : str ) -> Optional[ SyncCheckResult ]:
         """Return the most recent cached result, or None if no probe
@@ -273,6 +421,7 @@ class IntegrationSyncCheck:
         if not integration_id:
             return
         cache.delete( cls._cache_key( integration_id ) )
+        SyncCheckFingerprints().clear( integration_id )
         logger.debug( f'sync-check state cleared for {integration_id}' )
 
     @classmethod
@@ -333,3 +482,12 @@ class IntegrationSyncCheck:
             noun = 'item' if delta.removed_count == 1 else 'items'
             pieces.append( f'{delta.removed_count} {noun} removed upstream' )
         return f'{integration_label}: {", ".join(pieces)}.'
+
+
+@receiver( post_save, sender = Entity )
+@receiver( post_delete, sender = Entity )
+def sync_check_entity_changed( sender, instance, **kwargs ):
+    # Any entity, not just those of the instance's current integration:
+    # a detached entity has already lost its old integration_id.
+    SyncCheckFingerprints().entities_changed()
+    return
@@ -274,6 +274,34 @@ class IntegrationManagerTestCase(TestCase):
         error_message = str(context.exception)
         self.assertIn('Unknown integration id "unknown_integration"', error_message)
 
+    def test_notify_integration_settings_changed_only_notifies_changed_integrations(self):
+        """Test settings change notification is targeted by Integration row id."""
+        manager = IntegrationManager()
+        integration_data_map = dict()
+        for integration_id in ['test_integration_1', 'test_integration_2']:
+            integration = Integration.objects.create(
+                integration_id=integration_id,
+                is_enabled=True
+            )
+            gateway = MockIntegrationGateway(integration_id)
+            gateway.notify_settings_changed = Mock()
+            integration_data_map[integration_id] = IntegrationData(
+                integration_gateway=gateway,
+                integration=integration
+            )
+            continue
+        manager._integration_data_map = integration_data_map
+        data1 = integration_data_map['test_integration_1']
+        data2 = integration_data_map['test_integration_2']
+
+        manager.notify_integration_settings_changed(integration_ids={data2.integration.id})
+        data1.integration_gateway.notify_settings_changed.assert_not_called()
+        data2.integration_gateway.notify_settings_changed.assert_called_once()
+
+        manager.notify_integration_settings_changed()
+        data1.integration_gateway.notify_settings_changed.assert_called_once()
+        self.assertEqual(data2.integration_gateway.notify_settings_changed.call_count, 2)
+
     def test_refresh_integrations_from_db(self):
         """Test database refresh for all integration models."""
         manager = IntegrationManager()
@@ -10,19 +10,26 @@ hide as more integrations are added.
 
 import asyncio
 import logging
+import threading
+import time
 from unittest.mock import Mock, patch
 
 from django.core.cache import cache
 from django.test import TestCase
 
+from hi.apps.entity.models import Entity
 from hi.integrations.sync_check import (
     IntegrationSyncCheck,
+    KeySetFingerprint,
+    SyncCheckFingerprints,
     SyncCheckOutcome,
     SyncCheckResult,
     SyncDelta,
 )
 from hi.integrations.monitors import IntegrationSyncCheckMonitor
 from hi.integrations.transient_models import IntegrationKey
+from hi.services.hass.hass_manager import HassManager
+from hi.services.homebox.hb_manager import HomeBoxManager
 
 
 def _key(name: str, integration_id: str = 'test') -> IntegrationKey:
@@ -114,6 +121,77 @@ class ComputeDeltaTests(TestCase):
         self.assertFalse(delta.needs_sync)
 
 
+class KeySetFingerprintTests(TestCase):
+
+    def test_order_and_case_independent(self):
+        self.assertEqual(
+            KeySetFingerprint.from_keys([_key('a'), _key('B')]),
+            KeySetFingerprint.from_keys({_key('b'), _key('A')}),
+        )
+
+    def test_differs_when_a_key_changes(self):
+        fingerprint = KeySetFingerprint.from_keys({_key('a'), _key('b')})
+        self.assertEqual(fingerprint.count, 2)
+        self.assertNotEqual(fingerprint, KeySetFingerprint.from_keys({_key('a'), _key('c')}))
+        self.assertNotEqual(fingerprint, KeySetFingerprint.from_keys({_key('a')}))
+
+
+class ComputeDeltaIfChangedTests(TestCase):
+    """The fingerprint short-circuit in front of compute_delta."""
+
+    INTEGRATION_ID = 'fingerprint_test'
+
+    def setUp(self):
+        SyncCheckFingerprints().clear(self.INTEGRATION_ID)
+        self.current_keys = {_key('a'), _key('b')}
+        self.current_keys_fetch_count = 0
+
+    def _current_keys_fn(self):
+        self.current_keys_fetch_count += 1
+        return set(self.current_keys)
+
+    def _check(self, upstream_keys):
+        return asyncio.run(IntegrationSyncCheck.compute_delta_if_changed(
+            integration_id=self.INTEGRATION_ID,
+            upstream_keys=upstream_keys,
+            current_keys_fn=self._current_keys_fn,
+        ))
+
+    def test_unchanged_key_sets_skip_the_current_keys_fetch(self):
+        first_delta = self._check({_key('a'), _key('c')})
+        self.assertEqual(first_delta.added, {_key('c')})
+        self.assertEqual(first_delta.removed, {_key('b')})
+
+        second_delta = self._check({_key('c'), _key('a')})
+        self.assertEqual(self.current_keys_fetch_count, 1)
+        self.assertEqual(second_delta, first_delta)
+
+    def test_upstream_change_recomputes(self):
+        self._check({_key('a'), _key('b')})
+        delta = self._check({_key('a'), _key('b'), _key('c')})
+        self.assertEqual(self.current_keys_fetch_count, 2)
+        self.assertEqual(delta.added, {_key('c')})
+
+    def test_entity_change_refetches_current_keys(self):
+        self._check({_key('a'), _key('b'), _key('c')})
+        self.current_keys.add(_key('c'))
+        Entity.objects.create(
+            name='New Entity',
+            entity_type_str='light',
+            integration_id='test',
+            integration_name='c',
+        )
+        delta = self._check({_key('a'), _key('b'), _key('c')})
+        self.assertEqual(self.current_keys_fetch_count, 2)
+        self.assertFalse(delta.needs_sync)
+
+    def test_clear_state_forgets_fingerprints(self):
+        self._check({_key('a'), _key('b')})
+        IntegrationSyncCheck.clear_state(self.INTEGRATION_ID)
+        self._check({_key('a'), _key('b')})
+        self.assertEqual(self.current_keys_fetch_count, 2)
+
+
 class BuildResultAndSummaryTests(TestCase):
 
     def test_in_sync_message_is_concise(self):
@@ -624,6 +702,109 @@ class IntegrationSyncCheckMonitorTests(TestCase):
         )
 
 
+class IntegrationSyncCheckConcurrencyTests(TestCase):
+    """Integrations are checked concurrently, each under a timeout."""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def _slow_gateway(self, delay_secs, delta, started_list):
+        gateway = Mock()
+        synchronizer = Mock()
+
+        async def check_needs_sync():
+            started_list.append(asyncio.get_running_loop().time())
+            await asyncio.sleep(delay_secs)
+            return delta
+
+        synchronizer.check_needs_sync = check_needs_sync
+        gateway.get_synchronizer = Mock(return_value=synchronizer)
+        return gateway
+
+    def _run_with(self, monitor, integration_data_list):
+        manager = Mock()
+        manager.get_integration_data_list.return_value = integration_data_list
+        with patch(
+            'hi.integrations.integration_manager.IntegrationManager',
+            return_value=manager,
+        ):
+            asyncio.run(monitor.do_work())
+
+    def test_integrations_are_checked_concurrently(self):
+        started_list = []
+        data_list = [
+            _StubIntegrationData(name, name.upper(), self._slow_gateway(0.2, SyncDelta(), started_list))
+            for name in ('a', 'b', 'c')
+        ]
+        self._run_with(IntegrationSyncCheckMonitor(), data_list)
+
+        self.assertEqual(len(started_list), 3)
+        # All started before the first one finished.
+        self.assertLess(max(started_list) - min(started_list), 0.2)
+        for name in ('a', 'b', 'c'):
+            self.assertIsNotNone(IntegrationSyncCheck.get_state(name))
+
+    def test_slow_integration_times_out_without_blocking_others(self):
+        started_list = []
+        slow = _StubIntegrationData('slow', 'Slow', self._slow_gateway(5.0, SyncDelta(), started_list))
+        fast = _StubIntegrationData(
+            'fast', 'Fast', self._slow_gateway(0.0, SyncDelta(added={_key('k')}), started_list),
+        )
+        monitor = IntegrationSyncCheckMonitor()
+        monitor.CHECK_TIMEOUT_SECS = 0.1
+        self._run_with(monitor, [slow, fast])
+
+        self.assertIsNone(IntegrationSyncCheck.get_state('slow'))
+        self.assertTrue(IntegrationSyncCheck.get_state('fast').needs_sync)
+        self.assertIn('1 integration probe error', monitor.health_status.last_message)
+
+    def test_blocking_upstream_fetches_overlap(self):
+        """The managers' sync API calls run on separate worker threads,
+        not queued one after another on the thread-sensitive executor."""
+        interval_list = []
+        interval_lock = threading.Lock()
+
+        def blocking_fetch(**kwargs):
+            start_time = time.monotonic()
+            time.sleep(0.3)
+            with interval_lock:
+                interval_list.append((start_time, time.monotonic()))
+            return []
+
+        hass_manager = Mock(fetch_hass_states_from_api=blocking_fetch)
+        hb_manager = Mock(fetch_hb_items_from_api=blocking_fetch)
+
+        def gateway_for(fetch_async):
+            gateway = Mock()
+            synchronizer = Mock()
+
+            async def check_needs_sync():
+                await fetch_async()
+                return SyncDelta()
+
+            synchronizer.check_needs_sync = check_needs_sync
+            gateway.get_synchronizer = Mock(return_value=synchronizer)
+            return gateway
+
+        data_list = [
+            _StubIntegrationData('hass', 'HASS', gateway_for(
+                lambda: HassManager.fetch_hass_states_from_api_async(hass_manager, verbose=False))),
+            _StubIntegrationData('hb', 'HB', gateway_for(
+                lambda: HomeBoxManager.fetch_hb_items_from_api_async(hb_manager, verbose=False))),
+        ]
+        self._run_with(IntegrationSyncCheckMonitor(), data_list)
+
+        self.assertEqual(len(interval_list), 2)
+        # Both fetches started before either one finished.
+        self.assertLess(max(start for start, _ in interval_list),
+                        min(end for _, end in interval_list))
+        for name in ('hass', 'hb'):
+            self.assertIsNotNone(IntegrationSyncCheck.get_state(name))
+
+
 class IntegrationSynchronizerPostSyncHookTests(TestCase):
     """The post-sync hook clears (writes a zero-delta SyncCheckResult
     with current timestamp) on a successful sync, and leaves the
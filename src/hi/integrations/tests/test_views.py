@@ -1226,9 +1226,10 @@ class RefineViewTests(SyncViewTestCase):
             response.url,
             reverse('location_view', kwargs={'location_view_id': self.location_view.id}),
         )
-        # Session reflects edit mode + chosen view.
-        self.assertEqual(self.client.session.get('view_mode'), str(ViewMode.EDIT))
-        self.assertEqual(self.client.session.get('location_view_id'), self.location_view.id)
+        # View parameters reflect edit mode + chosen view.
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual(view_parameters.view_mode, ViewMode.EDIT)
+        self.assertEqual(view_parameters.location_view_id, self.location_view.id)
 
     def test_refine_404s_for_unknown_view(self):
         response = self.client.get(reverse(
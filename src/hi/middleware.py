@@ -31,12 +31,26 @@ class ViewMiddleware:
     
     def __call__(self, request):
         self._set_view_parameters( request )
-        return self.get_response( request )
+        response = self.get_response( request )
+        self._save_view_parameters( request, response )
+        return response
 
     def _set_view_parameters( self, request ):
         request.view_parameters = ViewParameters.from_session( request )
         return
 
+    def _save_view_parameters( self, request, response ):
+        cookie_token = ViewParameters.get_cookie_token( request )
+        token = getattr( request, 'view_parameters_token', None )
+        if token is None:
+            if cookie_token is not None:
+                return
+            # Moves a console's view out of the session on its first request.
+            token = request.view_parameters.to_token()
+        if token != cookie_token:
+            ViewParameters.set_cookie_token( response, token )
+        return
+
     
 class ExceptionMiddleware:
 
@@ -230,11 +230,14 @@ class HassManager( SingletonManager, AggregateHealthProvider, ApiHealthStatusPro
     async def fetch_hass_states_from_api_async( self, verbose : bool = True ) -> Dict[ str, HassState ]:
         """
         Async version of fetch_hass_states_from_api for use in async contexts (monitors).
-        Uses sync_to_async to properly handle the synchronous API call.
+        Uses sync_to_async to properly handle the synchronous API call. The
+        call is network-bound and touches no database state, so it runs off
+        the shared thread-sensitive executor and other integrations' checks
+        are not queued behind it.
         """
         return await sync_to_async(
             self.fetch_hass_states_from_api,
-            thread_sensitive=True
+            thread_sensitive=False
         )(verbose=verbose)
     
     def test_client_with_attributes(
@@ -1,7 +1,6 @@
 import logging
 from typing import Dict, List, Optional
 
-from asgiref.sync import sync_to_async
 from django.db import transaction
 
 from hi.apps.entity.models import Entity
@@ -67,10 +66,10 @@ class HassSynchronizer( IntegrationSynchronizer, HassMixin ):
             HassConverter.hass_device_to_integration_key( hass_device )
             for hass_device in hass_device_id_to_device.values()
         }
-        current_keys = await sync_to_async( self._get_current_integration_keys )()
-        return IntegrationSyncCheck.compute_delta(
+        return await IntegrationSyncCheck.compute_delta_if_changed(
+            integration_id = HassMetaData.integration_id,
             upstream_keys = upstream_keys,
-            current_keys = current_keys,
+            current_keys_fn = self._get_current_integration_keys,
         )
 
     @staticmethod
@@ -5,9 +5,11 @@ from unittest.mock import Mock, patch
 from django.test import TestCase
 
 from hi.apps.entity.models import Entity
+from hi.integrations.sync_check import SyncCheckFingerprints
 from hi.integrations.sync_result import IntegrationSyncResult
 from hi.integrations.transient_models import IntegrationKey
 
+from hi.services.hass.hass_metadata import HassMetaData
 from hi.services.hass.hass_sync import HassSynchronizer
 from hi.services.hass.hass_models import HassState
 
@@ -380,6 +382,12 @@ class TestHassSynchronizerCheckNeedsSync(AsyncTaskTestCase):
     (``fetch_hass_states_from_api_async``) is mocked.
     """
 
+    def setUp(self):
+        super().setUp()
+        # Table flushes between tests send no delete signals, so forget
+        # key fingerprints from earlier tests.
+        SyncCheckFingerprints().clear(HassMetaData.integration_id)
+
     def _hass_key(self, name: str):
         from hi.integrations.transient_models import IntegrationKey
         from hi.services.hass.hass_metadata import HassMetaData
@@ -3,8 +3,9 @@ import mimetypes
 import os
 
 from django.db import transaction
-from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 
+from hi.apps.attribute.blob_store import AttributeBlobStore
 from hi.apps.attribute.enums import AttributeType, AttributeValueType
 from hi.apps.entity.enums import EntityType
 from hi.apps.entity.models import Entity, EntityAttribute
@@ -26,6 +27,9 @@ class HbConverter:
         ( 'manufacturer', 'Manufacturer' ),
     ]
 
+    HB_ATTACHMENT_FINGERPRINT_KEYS = [ 'id', 'updatedAt', 'size' ]
+    ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY = 'attachment_fingerprints'
+
     @classmethod
     def create_models_for_hb_item( cls,
                                    hb_item : HbItem,
@@ -84,6 +88,12 @@ class HbConverter:
                 entity.can_add_custom_attributes = HbMetaData.can_add_custom_attributes
 
             new_payload = cls.hb_item_to_entity_payload( hb_item = hb_item )
+            # Owned by the attachment sync: what it last downloaded.
+            attachment_fingerprints = ( entity.integration_payload or {} ).get(
+                cls.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY
+            )
+            if attachment_fingerprints is not None:
+                new_payload[cls.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY] = attachment_fingerprints
             if entity.integration_payload != new_payload:
                 entity.integration_payload = new_payload
                 messages.append( f'Integration payload updated for {entity}.' )
@@ -241,14 +251,26 @@ class HbConverter:
             return f'{filename}{guessed_extension}'
         return filename
 
+    @classmethod
+    def hb_attachment_to_fingerprint( cls, hb_attachment: Dict ) -> str:
+        """
+        What changes when the attachment's content does.  Compared
+        against the fingerprint recorded at the last download so
+        unchanged attachments are not downloaded again.
+        """
+        return '|'.join([
+            str( hb_attachment.get( key, '' ) or '' ).strip()
+            for key in cls.HB_ATTACHMENT_FINGERPRINT_KEYS
+        ])
+
     @classmethod
     def hb_item_to_attachment_field_list( cls, hb_item: HbItem ) -> List[Dict]:
+        """
+        Attachment metadata only.  Content is fetched separately, via
+        download_hb_attachment(), for the attachments that need it.
+        """
         attachment_list = []
 
-        if not getattr( hb_item, 'client', None ):
-            logger.warning( f'HomeBox item {hb_item.id} has no client; cannot download attachments' )
-            return attachment_list
-
         for attachment in list( hb_item.attachments or [] ):
             if not isinstance( attachment, dict ):
                 continue
@@ -263,26 +285,6 @@ class HbConverter:
             )
             attachment_mime_type = str( attachment.get( 'mimeType', '' ) or '' ).strip()
 
-            downloaded_attachment = None
-            try:
-                downloaded_attachment = hb_item.client.download_attachment(
-                    item_id = hb_item.id,
-                    attachment_id = attachment_id,
-                )
-            except Exception as e:
-                logger.warning(
-                    'Unable to download HomeBox attachment '
-                    f'{attachment_id} for item {hb_item.id}: {e}'
-                )
-                continue
-
-            if not downloaded_attachment:
-                logger.warning(
-                    'Missing downloaded content for HomeBox attachment '
-                    f'{attachment_id} (item {hb_item.id}); skipping attachment'
-                )
-                continue
-
             attachment_list.append({
                 'id': f'attachment:{attachment_id}',
                 'type': 'attachment',
@@ -292,11 +294,45 @@ class HbConverter:
                 'booleanValue': None,
                 'mimeType': attachment_mime_type,
                 'attachment': attachment,
-                'downloaded_attachment': downloaded_attachment,
+                'fingerprint': cls.hb_attachment_to_fingerprint( hb_attachment = attachment ),
             })
 
         return attachment_list
 
+    @classmethod
+    def download_hb_attachment( cls, hb_item: HbItem, hb_attachment: Dict ) -> bool:
+        """
+        Adds the downloaded content to an entry from
+        hb_item_to_attachment_field_list().  Returns False if it could
+        not be downloaded.
+        """
+        if not getattr( hb_item, 'client', None ):
+            logger.warning( f'HomeBox item {hb_item.id} has no client; cannot download attachments' )
+            return False
+
+        attachment_id = str( hb_attachment.get( 'attachment', {} ).get( 'id', '' ) or '' ).strip()
+        try:
+            downloaded_attachment = hb_item.client.download_attachment(
+                item_id = hb_item.id,
+                attachment_id = attachment_id,
+            )
+        except Exception as e:
+            logger.warning(
+                'Unable to download HomeBox attachment '
+                f'{attachment_id} for item {hb_item.id}: {e}'
+            )
+            return False
+
+        if not downloaded_attachment:
+            logger.warning(
+                'Missing downloaded content for HomeBox attachment '
+                f'{attachment_id} (item {hb_item.id}); skipping attachment'
+            )
+            return False
+
+        hb_attachment['downloaded_attachment'] = downloaded_attachment
+        return True
+
     @classmethod
     def hb_attachment_to_attribute_name( cls, hb_attachment: Dict ) -> str:
         return str(hb_attachment.get('name', '')).strip()
@@ -336,27 +372,14 @@ class HbConverter:
 
     @classmethod
     def hb_attachment_to_attribute_payload( cls, hb_attachment: Dict, order_id: int ) -> Optional[Dict]:
+        """
+        Without downloaded content (an unchanged attachment) the payload
+        has no 'file_value' or 'file_mime_type', so only the metadata is
+        synchronized.
+        """
         if not isinstance( hb_attachment, dict ):
             return None
 
-        downloaded_attachment = hb_attachment.get( 'downloaded_attachment' )
-        if not downloaded_attachment or not isinstance( downloaded_attachment, dict ):
-            logger.warning(
-                'HomeBox attachment payload missing downloaded_attachment; '
-                'skipping attribute creation'
-            )
-            return None
-
-        raw_content = downloaded_attachment.get( 'content' )
-        if not raw_content:
-            logger.warning('HomeBox attachment payload missing content; skipping attribute creation')
-            return None
-
-        mime_type = str( downloaded_attachment.get( 'mime_type', '' ) ).strip()
-        if not mime_type:
-            logger.warning('HomeBox attachment payload missing mime_type; skipping attribute creation')
-            return None
-
         attachment_info = hb_attachment.get( 'attachment' )
         if not attachment_info or not isinstance( attachment_info, dict ):
             logger.warning('HomeBox attachment payload missing attachment info; skipping attribute creation')
@@ -367,11 +390,6 @@ class HbConverter:
             logger.warning( 'HomeBox attachment missing integration key; skipping attribute creation' )
             return None
 
-        filename = cls.hb_attachment_to_filename(
-            hb_attachment = attachment_info,
-            mime_type = mime_type,
-        )
-
         payload = {
             'name': cls.hb_attachment_to_attribute_name( hb_attachment = hb_attachment ),
             'value': hb_attachment.get('textValue', ''),
@@ -381,11 +399,37 @@ class HbConverter:
             'is_required': False,
             'order_id': order_id,
             'integration_key_str': str( integration_key ),
-            'file_mime_type': mime_type if mime_type else None,
         }
 
-        payload['file_value'] = ContentFile( raw_content, name = filename )
+        downloaded_attachment = hb_attachment.get( 'downloaded_attachment' )
+        if downloaded_attachment is None:
+            return payload
+        if not isinstance( downloaded_attachment, dict ):
+            logger.warning(
+                'HomeBox attachment payload has invalid downloaded_attachment; '
+                'skipping attribute creation'
+            )
+            return None
 
+        raw_content = downloaded_attachment.get( 'content' )
+        if not raw_content:
+            logger.warning('HomeBox attachment payload missing content; skipping attribute creation')
+            return None
+
+        mime_type = str( downloaded_attachment.get( 'mime_type', '' ) ).strip()
+        if not mime_type:
+            logger.warning('HomeBox attachment payload missing mime_type; skipping attribute creation')
+            return None
+
+        filename = cls.hb_attachment_to_filename(
+            hb_attachment = attachment_info,
+            mime_type = mime_type,
+        )
+        payload['file_mime_type'] = mime_type
+        payload['file_value'] = AttributeBlobStore( EntityAttribute ).save_blob(
+            content = raw_content,
+            filename = filename,
+        )
         return payload
 
     @classmethod
@@ -444,7 +488,7 @@ class HbConverter:
             hb_attachment = hb_attachment,
             order_id = order_id,
         )
-        if not payload:
+        if not payload or not payload.get( 'file_value' ):
             return None
 
         return EntityAttribute.objects.create(
@@ -464,7 +508,7 @@ class HbConverter:
         if not payload:
             return False
 
-        incoming_file = payload.pop( 'file_value', None )
+        incoming_blob_name = payload.pop( 'file_value', None )
 
         was_changed = False
         for field_name, field_value in payload.items():
@@ -472,11 +516,35 @@ class HbConverter:
                 setattr( attribute, field_name, field_value )
                 was_changed = True
 
-        if incoming_file and not attribute.file_value:
-            attribute.file_value = incoming_file
+        # Blob names are content addressed, so an unchanged name means
+        # unchanged content.
+        if incoming_blob_name and ( attribute.file_value.name != incoming_blob_name ):
+            cls._delete_replaced_attribute_file( attribute = attribute )
+            attribute.file_value = incoming_blob_name
             was_changed = True
 
         if was_changed:
             attribute.save()
 
         return was_changed
+
+    @classmethod
+    def _delete_replaced_attribute_file( cls, attribute: EntityAttribute ):
+        """
+        Blobs are left for the unreferenced blob cleanup.  Files stored
+        before blobs were used belong to this attribute alone.
+        """
+        file_name = attribute.file_value.name
+        if not file_name or AttributeBlobStore.is_blob_name( file_name ):
+            return
+        for path in [ file_name, attribute.thumbnail_relative_path ]:
+            if not path:
+                continue
+            try:
+                if default_storage.exists( path ):
+                    default_storage.delete( path )
+            except Exception as e:
+                logger.warning( f'Error deleting replaced attachment file {path}: {e}' )
+            continue
+        attribute.clear_thumbnail_exists_cache()
+        return
@@ -159,7 +159,7 @@ class HomeBoxManager( SingletonManager, AggregateHealthProvider, ApiHealthStatus
     async def fetch_hb_items_from_api_async( self, verbose : bool = True ) -> list:
         return await sync_to_async(
             self.fetch_hb_items_from_api,
-            thread_sensitive = True,
+            thread_sensitive = False,
         )(verbose=verbose)
 
     def fetch_hb_items_summary_from_api( self ) -> list:
@@ -184,7 +184,7 @@ class HomeBoxManager( SingletonManager, AggregateHealthProvider, ApiHealthStatus
     async def fetch_hb_items_summary_from_api_async( self ) -> list:
         return await sync_to_async(
             self.fetch_hb_items_summary_from_api,
-            thread_sensitive = True,
+            thread_sensitive = False,
         )()
     
     def test_client_with_attributes(
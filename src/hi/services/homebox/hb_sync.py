@@ -1,9 +1,9 @@
 import logging
 from typing import Dict, List, Optional
 
-from asgiref.sync import sync_to_async
 from django.db import transaction
 
+from hi.apps.attribute.blob_store import AttributeBlobStore
 from hi.apps.entity.models import Entity, EntityAttribute
 
 from hi.integrations.integration_synchronizer import IntegrationSynchronizer
@@ -63,10 +63,10 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
             if item.get('id') is not None
             and item.get('archived') is not True
         }
-        current_keys = await sync_to_async( self._get_current_integration_keys )()
-        return IntegrationSyncCheck.compute_delta(
+        return await IntegrationSyncCheck.compute_delta_if_changed(
+            integration_id = HbMetaData.integration_id,
             upstream_keys = upstream_keys,
-            current_keys = current_keys,
+            current_keys_fn = self._get_current_integration_keys,
         )
 
     @staticmethod
@@ -110,8 +110,11 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
 
         # Existing-entity updates do not need re-placement; only
         # newly-created entities surface in the dispatcher.
+        self._attachment_blobs_changed = False
         created_entities = self._sync_helper_entities(
             item_list = item_list, result = result )
+        if self._attachment_blobs_changed:
+            AttributeBlobStore( EntityAttribute ).remove_unreferenced_blobs()
         if created_entities:
             result.placement_input = self.group_entities_for_placement(
                 entities = created_entities,
@@ -253,6 +256,7 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
                         entity : Entity,
                         result : IntegrationSyncResult ):
         self._remove_entity_intelligently( entity, result )
+        self._attachment_blobs_changed = True
         return
 
     def _sync_helper_entity_attributes( self,
@@ -287,6 +291,9 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
 
         integration_key_to_attr = self._get_existing_hb_attributes(entity = entity)
 
+        previous_fingerprints = self._get_attachment_fingerprints( entity = entity )
+        synced_fingerprints = dict()
+
         with transaction.atomic():
 
             for integration_key, field_data in integration_key_to_regular_field.items():
@@ -318,6 +325,25 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
                 hb_attachment, order_id = hb_attachment_tuple
                 attribute = integration_key_to_attr.get( integration_key )
 
+                attachment_field_id = hb_attachment.get( 'id' )
+                fingerprint = hb_attachment.get( 'fingerprint' )
+                needs_download = bool(
+                    not attribute
+                    or not attribute.file_value
+                    or previous_fingerprints.get( attachment_field_id ) != fingerprint
+                )
+                if needs_download:
+                    if HbConverter.download_hb_attachment( hb_item = hb_item, hb_attachment = hb_attachment ):
+                        self._attachment_blobs_changed = True
+                    elif not attribute:
+                        continue
+                    else:
+                        # Keep the current file; not recording the
+                        # fingerprint retries the download next sync.
+                        fingerprint = None
+                if fingerprint is not None:
+                    synced_fingerprints[attachment_field_id] = fingerprint
+
                 if attribute:
                     self._update_attachment_attribute(
                         attribute = attribute,
@@ -348,6 +374,12 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
                     del integration_key_to_attr[field_key]
                 continue
 
+            if synced_fingerprints != previous_fingerprints:
+                self._set_attachment_fingerprints(
+                    entity = entity,
+                    attachment_fingerprints = synced_fingerprints,
+                )
+
         # An attribute-level change still means this entity was
         # modified by the sync. Mark it in updated_list (with dedup
         # against the entity-level path above) so the operator
@@ -364,6 +396,24 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
             result.updated_list.append( entity.name )
         return
     
+    def _get_attachment_fingerprints( self, entity: Entity ) -> Dict[ str, str ]:
+        integration_payload = entity.integration_payload
+        if not isinstance( integration_payload, dict ):
+            return dict()
+        attachment_fingerprints = integration_payload.get( HbConverter.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY )
+        if not isinstance( attachment_fingerprints, dict ):
+            return dict()
+        return attachment_fingerprints
+
+    def _set_attachment_fingerprints( self,
+                                      entity: Entity,
+                                      attachment_fingerprints: Dict[ str, str ] ):
+        integration_payload = dict( entity.integration_payload or {} )
+        integration_payload[HbConverter.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY] = attachment_fingerprints
+        entity.integration_payload = integration_payload
+        entity.save( update_fields = [ 'integration_payload' ] )
+        return
+
     def _get_existing_hb_attributes( self, entity: Entity ) -> Dict[ IntegrationKey, EntityAttribute ]:
         integration_key_to_attribute = dict()
 
@@ -425,6 +475,8 @@ class HomeBoxSynchronizer( IntegrationSynchronizer, HomeBoxMixin ):
         # an inconsistency between HI and the integration's source
         # of truth.
         old_name = attribute.name
+        if attribute.file_value:
+            self._attachment_blobs_changed = True
         attribute.delete( hard_delete = True )
         message_list.append( f'Field attribute removed: {old_name}' )
         return
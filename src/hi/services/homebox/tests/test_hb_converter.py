@@ -3,18 +3,24 @@ from unittest.mock import Mock
 
 from django.test import TestCase
 
+from hi.apps.attribute.blob_store import AttributeBlobStore
 from hi.apps.attribute.enums import AttributeValueType
 from hi.apps.entity.enums import EntityType
 from hi.apps.entity.models import Entity
 from hi.services.homebox.hb_converter import HbConverter
 from hi.services.homebox.hb_metadata import HbMetaData
 from hi.services.homebox.hb_models import HbItem
+from hi.testing.base_test_case import BaseTestCase
 
 
 logging.disable(logging.CRITICAL)
 
 
-class TestHbConverter(TestCase):
+class TestHbConverter(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(self.in_memory_media_storage())
 
     def _mock_item(self, item_id='item-1', name='Item 1', description='desc', quantity=1):
         api_dict = {
@@ -131,14 +137,45 @@ class TestHbConverter(TestCase):
             'source_url': 'https://example/download',
         }
 
+        # Listing attachments does not download them.
         attachment_field_list = HbConverter.hb_item_to_attachment_field_list(hb_item=item)
+        item.client.download_attachment.assert_not_called()
         attachment_data = attachment_field_list[0]
+        self.assertEqual(attachment_data['fingerprint'], 'att-1||')
+
+        metadata_payload = HbConverter.hb_attachment_to_attribute_payload(hb_attachment=attachment_data, order_id=0)
+        self.assertEqual(metadata_payload['name'], 'Manual')
+        self.assertNotIn('file_value', metadata_payload)
+
+        self.assertTrue(HbConverter.download_hb_attachment(hb_item=item, hb_attachment=attachment_data))
         payload = HbConverter.hb_attachment_to_attribute_payload(hb_attachment=attachment_data, order_id=0)
 
         self.assertEqual(payload['value_type_str'], str(AttributeValueType.FILE))
         self.assertEqual(payload['name'], 'Manual')
         self.assertEqual(payload['file_mime_type'], 'text/plain')
-        self.assertIn('file_value', payload)
+        self.assertTrue(AttributeBlobStore.is_blob_name(payload['file_value']))
+
+    def test_attachment_fingerprint_tracks_updated_at_and_size(self):
+        attachment = {'id': 'att-1', 'updatedAt': '2026-01-01T00:00:00Z', 'size': 1024}
+        fingerprint = HbConverter.hb_attachment_to_fingerprint(hb_attachment=attachment)
+        self.assertEqual(fingerprint, 'att-1|2026-01-01T00:00:00Z|1024')
+        attachment['size'] = 2048
+        self.assertNotEqual(HbConverter.hb_attachment_to_fingerprint(hb_attachment=attachment), fingerprint)
+
+    def test_update_models_keeps_attachment_fingerprints(self):
+        item = self._mock_item(item_id='item-fingerprints')
+        entity = HbConverter.create_models_for_hb_item(hb_item=item)
+        entity.integration_payload[HbConverter.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY] = {'attachment:a': 'a||'}
+        entity.save()
+
+        messages = HbConverter.update_models_for_hb_item(entity=entity, hb_item=item)
+
+        self.assertEqual(messages, [])
+        entity.refresh_from_db()
+        self.assertEqual(
+            entity.integration_payload[HbConverter.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY],
+            {'attachment:a': 'a||'},
+        )
 
     def test_create_and_update_file_attribute_from_attachment(self):
         item = self._mock_item(item_id='item-file-sync')
@@ -174,8 +211,20 @@ class TestHbConverter(TestCase):
         self.assertEqual(created_attribute.value_type_str, str(AttributeValueType.FILE))
         self.assertTrue(bool(created_attribute.file_value))
 
-        # File should not be overwritten when already present.
+        # Same content re-downloaded: the file is left alone.
         original_name = created_attribute.file_value.name
+        was_changed = HbConverter.update_attribute_from_hb_attachment(
+            attribute=created_attribute,
+            hb_attachment=attachment_data,
+            order_id=1,
+        )
+
+        self.assertTrue(was_changed)
+        created_attribute.refresh_from_db()
+        self.assertEqual(created_attribute.order_id, 1)
+        self.assertEqual(created_attribute.file_value.name, original_name)
+
+        # Changed content moves the attribute to the new blob.
         attachment_data['downloaded_attachment'] = {
             'content': b'v2',
             'mime_type': 'text/plain; charset=utf-8',
@@ -190,8 +239,34 @@ class TestHbConverter(TestCase):
 
         self.assertTrue(was_changed)
         created_attribute.refresh_from_db()
-        self.assertEqual(created_attribute.order_id, 1)
-        self.assertEqual(created_attribute.file_value.name, original_name)
+        self.assertNotEqual(created_attribute.file_value.name, original_name)
+        self.assertEqual(created_attribute.file_value.read(), b'v2')
+
+    def test_identical_attachments_share_one_blob(self):
+        item = self._mock_item(item_id='item-shared')
+        entity = HbConverter.create_models_for_hb_item(hb_item=item)
+
+        attribute_list = []
+        for attachment_id in ['att-a', 'att-b']:
+            attachment_data = {
+                'id': f'attachment:{attachment_id}',
+                'type': 'attachment',
+                'name': 'Manual',
+                'textValue': 'Manual',
+                'attachment': {'id': attachment_id, 'title': 'Manual.pdf'},
+                'downloaded_attachment': {
+                    'content': b'same manual',
+                    'mime_type': 'application/pdf',
+                },
+            }
+            attribute_list.append(HbConverter.create_attribute_from_hb_attachment(
+                entity=entity,
+                hb_attachment=attachment_data,
+                order_id=0,
+            ))
+            continue
+
+        self.assertEqual(attribute_list[0].file_value.name, attribute_list[1].file_value.name)
 
 
 
@@ -5,8 +5,10 @@ from unittest.mock import ANY, Mock, patch
 from django.test import SimpleTestCase
 
 from hi.apps.entity.models import Entity
+from hi.integrations.sync_check import SyncCheckFingerprints
 from hi.integrations.sync_result import IntegrationSyncResult
 from hi.integrations.transient_models import IntegrationKey
+from hi.services.homebox.hb_converter import HbConverter
 from hi.services.homebox.hb_metadata import HbMetaData
 from hi.services.homebox.hb_sync import HomeBoxSynchronizer
 from hi.testing.async_task_utils import AsyncTaskTestCase
@@ -306,6 +308,76 @@ class TestHomeBoxSynchronizer(SimpleTestCase):
         self.assertEqual(result.info_list, [])
 
 
+class TestHomeBoxSynchronizerAttachmentDownloads(SimpleTestCase):
+
+    def _sync_attachment( self, previous_fingerprints, download_succeeds = True ):
+        synchronizer = HomeBoxSynchronizer()
+        entity = Mock(name='entity')
+        entity.id = 10
+        entity.integration_payload = {
+            HbConverter.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY: previous_fingerprints,
+        }
+        attachment_key = IntegrationKey(
+            integration_id=HbMetaData.integration_id,
+            integration_name='field:attachment:att-1',
+        )
+        attachment = {
+            'id': 'attachment:att-1',
+            'name': 'Manual',
+            'fingerprint': 'att-1|2026-02-01|100',
+        }
+        existing_attr = Mock(name='existing_attr')
+        existing_attr.entity_id = entity.id
+
+        with patch('hi.services.homebox.hb_sync.transaction.atomic', return_value=nullcontext()), \
+                patch('hi.services.homebox.hb_sync.HbConverter.hb_item_to_attribute_field_list',
+                      return_value=[]), \
+                patch('hi.services.homebox.hb_sync.HbConverter.hb_item_to_attachment_field_list',
+                      return_value=[attachment]), \
+                patch('hi.services.homebox.hb_sync.HbConverter.hb_attachment_to_integration_key',
+                      return_value=attachment_key), \
+                patch('hi.services.homebox.hb_sync.HbConverter.download_hb_attachment',
+                      return_value=download_succeeds) as download_mock, \
+                patch.object(synchronizer, '_get_existing_hb_attributes',
+                             return_value={attachment_key: existing_attr}), \
+                patch.object(synchronizer, '_update_attachment_attribute'):
+            synchronizer._sync_helper_entity_attributes(
+                entity=entity,
+                hb_item=Mock(),
+                result=IntegrationSyncResult(title='HomeBox Import Result'),
+            )
+        return entity, download_mock
+
+    def test_unchanged_attachment_is_not_downloaded(self):
+        entity, download_mock = self._sync_attachment(
+            previous_fingerprints={'attachment:att-1': 'att-1|2026-02-01|100'},
+        )
+        download_mock.assert_not_called()
+        entity.save.assert_not_called()
+
+    def test_changed_attachment_is_downloaded_and_fingerprint_recorded(self):
+        entity, download_mock = self._sync_attachment(
+            previous_fingerprints={'attachment:att-1': 'att-1|2026-01-01|90'},
+        )
+        download_mock.assert_called_once()
+        self.assertEqual(
+            entity.integration_payload[HbConverter.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY],
+            {'attachment:att-1': 'att-1|2026-02-01|100'},
+        )
+        entity.save.assert_called_once_with(update_fields=['integration_payload'])
+
+    def test_failed_download_keeps_attachment_and_retries(self):
+        entity, download_mock = self._sync_attachment(
+            previous_fingerprints={'attachment:att-1': 'att-1|2026-01-01|90'},
+            download_succeeds=False,
+        )
+        download_mock.assert_called_once()
+        self.assertEqual(
+            entity.integration_payload[HbConverter.ATTACHMENT_FINGERPRINTS_PAYLOAD_KEY],
+            {},
+        )
+
+
 class TestHomeBoxSynchronizerSyncResultGrouping(SimpleTestCase):
     """Phase 2 grouping behavior: HomeBox has no domain notion of
     grouping, so every imported item lands in `ungrouped_items`.
@@ -417,6 +489,12 @@ class TestHomeBoxSynchronizerCheckNeedsSync(AsyncTaskTestCase):
     under SQLite when using a plain ``TestCase``.
     """
 
+    def setUp(self):
+        super().setUp()
+        # Table flushes between tests send no delete signals, so forget
+        # key fingerprints from earlier tests.
+        SyncCheckFingerprints().clear(HbMetaData.integration_id)
+
     def _hb_key(self, name: str):
         return IntegrationKey(
             integration_id=HbMetaData.integration_id,
@@ -138,7 +138,7 @@ class ZoneMinderGateway( IntegrationGateway, ZoneMinderMixin ):
             # Extract monitor ID from integration name (format: "monitor.{id}")
             try:
                 monitor_id = int(entity.integration_name.split('.')[1])
-                video_url = self.zm_manager().get_video_stream_url(monitor_id)
+                video_url = self.zm_manager().get_relayed_video_stream_url(monitor_id)
                 
                 return VideoStream(
                     stream_type=VideoStreamType.URL,
@@ -0,0 +1,41 @@
+import logging
+from unittest.mock import Mock, patch
+
+from django.urls import reverse
+
+from hi.apps.common.mjpeg_relay import MjpegRelay, MjpegRelayFullError
+from hi.services.zoneminder.zm_manager import ZoneMinderManager
+from hi.testing.view_test_base import SyncViewTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class TestZmMonitorStreamView(SyncViewTestCase):
+
+    @patch.object(MjpegRelay, 'subscribe')
+    def test_stream_is_served_from_relay(self, mock_subscribe):
+        frame_part = MjpegRelay().encode_part( b'\xff\xd8jpeg\xff\xd9' )
+        subscription = Mock()
+        subscription.__iter__ = Mock( return_value = iter([ frame_part ]) )
+        mock_subscribe.return_value = subscription
+
+        url = reverse('zm_monitor_stream', kwargs={'monitor_id': 3})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], MjpegRelay().content_type)
+        self.assertEqual(response['X-Accel-Buffering'], 'no')
+        self.assertEqual(b''.join(response.streaming_content), frame_part)
+        self.assertEqual(mock_subscribe.call_args.kwargs['stream_key'], 'zm.monitor.3')
+        response.close()
+        subscription.close.assert_called_once()
+
+    @patch.object(ZoneMinderManager, 'get_video_stream_url', return_value='http://zm/cgi-bin/nph-zms?monitor=3')
+    @patch.object(MjpegRelay, 'subscribe', side_effect=MjpegRelayFullError('full'))
+    def test_full_relay_redirects_to_zoneminder(self, mock_subscribe, mock_get_url):
+        url = reverse('zm_monitor_stream', kwargs={'monitor_id': 3})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], 'http://zm/cgi-bin/nph-zms?monitor=3')
+        mock_get_url.assert_called_once_with(3)
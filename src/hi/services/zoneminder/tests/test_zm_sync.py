@@ -11,6 +11,7 @@ from hi.apps.sense.models import Sensor
 
 from hi.integrations.entity_operations import EntityIntegrationOperations
 from hi.integrations.integration_manager import IntegrationManager
+from hi.integrations.sync_check import SyncCheckFingerprints
 from hi.integrations.sync_result import IntegrationSyncResult
 from hi.integrations.transient_models import IntegrationKey
 
@@ -1272,6 +1273,12 @@ class TestZoneMinderSynchronizerCheckNeedsSync(AsyncTaskTestCase):
     load-bearing piece this test class pins.
     """
 
+    def setUp(self):
+        super().setUp()
+        # Table flushes between tests send no delete signals, so forget
+        # key fingerprints from earlier tests.
+        SyncCheckFingerprints().clear(ZmMetaData.integration_id)
+
     def _zm_key(self, name: str):
         return IntegrationKey(
             integration_id=ZmMetaData.integration_id,
@@ -6,12 +6,15 @@ every integration (see hi/integrations/urls.py). Add
 ZoneMinder-specific URLs here when an integration genuinely needs an
 endpoint the framework does not provide. URLs added here mount under
 ``services/zoneminder/``.
-
-Currently no integration-specific endpoints are required.
 """
-from django.urls import re_path  # noqa: F401
+from django.urls import path
+
+from . import views
 
-from . import views  # noqa: F401
 
+urlpatterns = [
 
-urlpatterns = []
+    path( 'monitor/stream/<int:monitor_id>',
+          views.ZmMonitorStreamView.as_view(),
+          name='zm_monitor_stream'),
+]
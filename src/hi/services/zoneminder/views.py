@@ -5,6 +5,39 @@ The framework owns lifecycle, configure, sync, and manage views for
 every integration (see hi/integrations/views.py). Define
 ZoneMinder-specific views here only when an integration genuinely
 needs UI the framework does not provide.
-
-Currently no integration-specific views are required.
 """
+import logging
+
+from django.http import HttpResponseRedirect, StreamingHttpResponse
+from django.views.generic import View
+
+from hi.apps.common.mjpeg_relay import MjpegRelay, MjpegRelayFullError
+
+from .zm_manager import ZoneMinderManager
+
+logger = logging.getLogger(__name__)
+
+
+class ZmMonitorStreamView( View ):
+    """Live MJPEG stream for one monitor, shared through the relay so
+    any number of viewers cost ZoneMinder a single upstream stream."""
+
+    def get( self, request, *args, **kwargs ):
+        monitor_id = int( kwargs.get( 'monitor_id' ))
+        zm_manager = ZoneMinderManager()
+        mjpeg_relay = MjpegRelay()
+        try:
+            subscription = mjpeg_relay.subscribe(
+                stream_key = f'zm.monitor.{monitor_id}',
+                upstream_url_func = lambda: zm_manager.get_relay_upstream_url( monitor_id ),
+            )
+        except MjpegRelayFullError as e:
+            # Better a direct ZM stream than tying up every web thread.
+            logger.warning( f'{e} Sending monitor {monitor_id} viewer to ZoneMinder directly.' )
+            return HttpResponseRedirect( zm_manager.get_video_stream_url( monitor_id ))
+
+        response = StreamingHttpResponse( subscription, content_type = mjpeg_relay.content_type )
+        response['Cache-Control'] = 'no-cache, no-store'
+        # Frames must reach the browser as they arrive, not when nginx's buffer fills.
+        response['X-Accel-Buffering'] = 'no'
+        return response
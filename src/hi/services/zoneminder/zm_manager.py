@@ -8,6 +8,8 @@ from .pyzm_client.helpers.State import State as ZmState
 from .pyzm_client.helpers.globals import logger as pyzm_logger
 from typing import Dict, List, Optional
 
+from django.urls import reverse
+
 import hi.apps.common.datetimeproxy as datetimeproxy
 from hi.apps.common.singleton_manager import SingletonManager
 from hi.apps.common.utils import str_to_bool
@@ -275,7 +277,7 @@ class ZoneMinderManager( SingletonManager, AggregateHealthProvider, ApiHealthSta
         """
         return await sync_to_async(
             self.get_zm_states,
-            thread_sensitive=True
+            thread_sensitive=False
         )(force_load=force_load)
     
     async def get_zm_monitors_async( self, force_load : bool = False ) -> List[ ZmMonitor ]:
@@ -285,7 +287,7 @@ class ZoneMinderManager( SingletonManager, AggregateHealthProvider, ApiHealthSta
         """
         return await sync_to_async(
             self.get_zm_monitors,
-            thread_sensitive=True
+            thread_sensitive=False
         )(force_load=force_load)
     
     async def get_zm_events_async( self, options : Dict[ str, str ] ) -> List[ ZmEvent ]:
@@ -295,7 +297,7 @@ class ZoneMinderManager( SingletonManager, AggregateHealthProvider, ApiHealthSta
         """
         return await sync_to_async(
             self.get_zm_events,
-            thread_sensitive=True
+            thread_sensitive=False
         )(options=options)
     
     def _zm_integration_key( self ) -> IntegrationKey:
@@ -367,6 +369,25 @@ class ZoneMinderManager( SingletonManager, AggregateHealthProvider, ApiHealthSta
             f'&_t={timestamp}'
         )
 
+    def get_relayed_video_stream_url( self, monitor_id : int ):
+        """Browser-facing live stream URL. Points at the in-app MJPEG
+        relay so all viewers of a monitor share one ZoneMinder stream
+        instead of each costing ZM its own decoder and encoder."""
+        import time
+        timestamp = int(time.time())
+        relative_url = reverse( 'zm_monitor_stream', kwargs = { 'monitor_id': monitor_id } )
+        return f'{relative_url}?_t={timestamp}'
+
+    def get_relay_upstream_url( self, monitor_id : int ):
+        """Live stream URL for the in-app MJPEG relay to read. Unlike the
+        browser-facing URL this carries the API credentials, since the
+        relay has no ZoneMinder session cookie to lean on."""
+        video_url = self.get_video_stream_url( monitor_id )
+        auth = self.zm_client.get_auth()
+        if auth:
+            video_url = f'{video_url}&{auth}'
+        return video_url
+
     def get_event_video_stream_url( self, event_id : int ):
         # Add timestamp for cache busting to help with connection management
         import time
@@ -2,7 +2,6 @@ import logging
 from .pyzm_client.helpers.Monitor import Monitor as ZmMonitor
 from typing import Dict, Optional
 
-from asgiref.sync import sync_to_async
 from django.db import transaction
 
 from hi.apps.entity.enums import EntityType
@@ -74,12 +73,10 @@ class ZoneMinderSynchronizer( IntegrationSynchronizer, ZoneMinderMixin ):
             )
             for zm_monitor in zm_monitors
         }
-        current_keys = await sync_to_async( self._get_current_monitor_integration_keys )(
-            prefix = prefix,
-        )
-        return IntegrationSyncCheck.compute_delta(
+        return await IntegrationSyncCheck.compute_delta_if_changed(
+            integration_id = ZmMetaData.integration_id,
             upstream_keys = upstream_keys,
-            current_keys = current_keys,
+            current_keys_fn = lambda: self._get_current_monitor_integration_keys( prefix = prefix ),
         )
 
     @staticmethod
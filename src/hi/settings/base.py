@@ -392,6 +392,13 @@ EMAIL_USE_SSL = ENV.EMAIL_USE_SSL
 #
 BASE_URL_FOR_EMAIL_LINKS = f'http://{SITE_DOMAIN}'
 
+# ====================
+# Alert Settings
+
+# Most active alerts held at once. When full, the least important,
+# oldest alert is evicted to make room for a new one.
+ALERT_QUEUE_MAX_SIZE = 500
+
 
 # ====================
 # Development-related Settings
@@ -0,0 +1,135 @@
+"""
+Synthetic load for the HASS simulator.
+
+  create   Build (or rebuild) a HASS profile of many entities from the
+           load templates and make it current.  Run against the
+           simulator settings, then restart the simulator or re-select
+           the profile in its UI so the running server loads it.
+
+             ./manage.py hass_load create --entities 3000 --seed 7 \\
+                 --settings=hi.settings.simulator
+
+  start    Start state churn in the running simulator.
+  stop     Stop it.
+  status   Show generated vs served change rates.
+
+             ./manage.py hass_load start --rate 500 --pattern bursty --seed 7
+
+Ingestion capacity is where the served change rate (changes that
+reached an /api/states response) stops tracking the generated rate,
+or HI falls behind the served rate.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+import requests
+
+from hi.simulator.profile.models import SimProfile
+from hi.simulator.profile.profile_manager import ProfileManager
+from hi.simulator.services.hass.apps import HassConfig
+from hi.simulator.services.hass.enums import HassLoadPattern
+from hi.simulator.services.hass.load_templates import build_load_entity_fields
+from hi.simulator.services.models import DbSimEntity
+
+
+class Command(BaseCommand):
+    help = 'Create HASS load profiles and drive synthetic state churn in the simulator.'
+
+    BULK_CREATE_BATCH_SIZE = 500
+    REQUEST_TIMEOUT_SECS = 10
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers( dest = 'action', required = True )
+
+        create_parser = subparsers.add_parser( 'create', help = 'Create a load profile.' )
+        create_parser.add_argument( '--entities', type = int, default = 1000,
+                                    help = 'Number of entities.' )
+        create_parser.add_argument( '--seed', type = int, default = 0,
+                                    help = 'Seed for the entity mix.' )
+        create_parser.add_argument( '--profile', default = 'load',
+                                    help = 'Profile name (replaced if it exists).' )
+
+        start_parser = subparsers.add_parser( 'start', help = 'Start state churn.' )
+        start_parser.add_argument( '--rate', type = float, default = 100.0,
+                                   help = 'Average state changes per second.' )
+        start_parser.add_argument( '--pattern', default = str( HassLoadPattern.default() ),
+                                   choices = [ str(x) for x in HassLoadPattern ],
+                                   help = 'How changes are spread over time.' )
+        start_parser.add_argument( '--seed', type = int, default = 0,
+                                   help = 'Seed for the change sequence.' )
+        start_parser.add_argument( '--burst-secs', type = float, default = 5.0,
+                                   help = 'Seconds between bursts for the bursty pattern.' )
+
+        subparsers.add_parser( 'stop', help = 'Stop state churn.' )
+        subparsers.add_parser( 'status', help = 'Show load status.' )
+
+        for subparser in subparsers.choices.values():
+            if subparser is create_parser:
+                continue
+            subparser.add_argument( '--simulator-url', default = 'http://127.0.0.1:7411',
+                                    help = 'Base URL of the running simulator.' )
+            continue
+        return
+
+    def handle(self, *args, **options):
+        action = options['action']
+        if action == 'create':
+            self._create_profile(
+                name = options['profile'],
+                entity_count = options['entities'],
+                seed = options['seed'],
+            )
+            return
+
+        load_url = options['simulator_url'].rstrip( '/' ) + '/services/hass/load'
+        try:
+            if action == 'start':
+                response = requests.post(
+                    f'{load_url}/start',
+                    json = {
+                        'rate': options['rate'],
+                        'pattern': options['pattern'],
+                        'seed': options['seed'],
+                        'burst_secs': options['burst_secs'],
+                    },
+                    timeout = self.REQUEST_TIMEOUT_SECS,
+                )
+            elif action == 'stop':
+                response = requests.post( f'{load_url}/stop', timeout = self.REQUEST_TIMEOUT_SECS )
+            else:
+                response = requests.get( f'{load_url}/status', timeout = self.REQUEST_TIMEOUT_SECS )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise CommandError( f'Simulator load request failed: {e}' )
+
+        self.stdout.write( json.dumps( response.json(), indent = 2 ))
+        return
+
+    def _create_profile( self, name : str, entity_count : int, seed : int ):
+        if entity_count < 1:
+            raise CommandError( '--entities must be at least 1' )
+        module_key = HassConfig.name
+
+        with transaction.atomic():
+            SimProfile.objects.filter( module_key = module_key, name = name ).delete()
+            profile = SimProfile.objects.create( module_key = module_key, name = name )
+            db_sim_entity_list = [
+                DbSimEntity(
+                    sim_profile = profile,
+                    entity_fields_class_id = template.fields_class.class_id(),
+                    sim_entity_type_str = str( template.sim_entity_type ),
+                    sim_entity_fields_json = sim_entity_fields.to_json_dict(),
+                )
+                for template, sim_entity_fields in build_load_entity_fields(
+                    entity_count = entity_count,
+                    seed = seed,
+                )
+            ]
+            DbSimEntity.objects.bulk_create( db_sim_entity_list, batch_size = self.BULK_CREATE_BATCH_SIZE )
+
+        ProfileManager().set_current( module_key, profile )
+        self.stdout.write( self.style.SUCCESS(
+            f'Created HASS profile "{name}" with {entity_count} entities (now current).'
+        ))
+        return
@@ -29,6 +29,13 @@ own profile namespace), so the seed catalog is partitioned by module:
                             the operator toggles individually to
                             exercise the active-alerts feed.
 
+  Benchmark (``--benchmark`` only)
+    * benchmark           — HASS profile of N sensors/switches and M
+                            cameras (``--benchmark-entities``,
+                            ``--benchmark-cameras``), always recreated
+                            and made current. Pair with the
+                            ``run_benchmark`` command on the HI side.
+
 Re-running the command is a no-op for profiles that already exist.
 Pass ``--reset`` to delete the matching profile (and its entities)
 before recreating. Pass ``--module <short>`` (``hass``, ``homebox``,
@@ -123,6 +130,8 @@ from hi.simulator.weather_sources.nws.apps import NwsWeatherSimConfig
 from hi.simulator.weather_sources.nws.models import NwsSimAlert
 
 
+BENCHMARK_PROFILE_NAME = 'benchmark'
+
 # Short module aliases for the --module CLI flag, mapped to the full
 # AppConfig.name used as ``SimProfile.module_key``.
 MODULE_SHORT_NAMES = {
@@ -159,10 +168,37 @@ class Command(BaseCommand):
             ),
         )
 
+        parser.add_argument(
+            '--benchmark',
+            action = 'store_true',
+            help = (
+                'Seed only the HASS "benchmark" profile, recreating it '
+                'and making it the current HASS profile.'
+            ),
+        )
+        parser.add_argument(
+            '--benchmark-entities',
+            type = int,
+            default = 100,
+            help = 'Number of non-camera entities in the benchmark profile.',
+        )
+        parser.add_argument(
+            '--benchmark-cameras',
+            type = int,
+            default = 10,
+            help = 'Number of cameras in the benchmark profile.',
+        )
+
     def handle(self, *args, **options):
         reset = options.get('reset', False)
         module_filter = options.get('module')
 
+        if options.get('benchmark'):
+            self._benchmark_entity_count = options['benchmark_entities']
+            self._benchmark_camera_count = options['benchmark_cameras']
+            self._seed_benchmark_profile()
+            return
+
         registry = self._build_registry()
         if module_filter:
             target_module_key = MODULE_SHORT_NAMES[ module_filter ]
@@ -255,6 +291,20 @@ class Command(BaseCommand):
         except Exception:  # pragma: no cover - defensive on first-run
             pass
 
+    def _seed_benchmark_profile(self):
+        module_key = HassConfig.name
+        self.stdout.write( f'\n[{module_key}]' )
+        self._seed_profile(
+            module_key = module_key,
+            name = BENCHMARK_PROFILE_NAME,
+            builder = self._build_hass_benchmark,
+            reset = True,
+        )
+        profile = SimProfile.objects.get( module_key = module_key, name = BENCHMARK_PROFILE_NAME )
+        ProfileManager().set_current( module_key, profile )
+        self.stdout.write( f'  current {BENCHMARK_PROFILE_NAME}' )
+        return
+
     # ----- module-agnostic builders -----
 
     def _build_empty(self, profile: SimProfile) -> int:
@@ -344,6 +394,30 @@ class Command(BaseCommand):
         )
         return profile.db_sim_entities.count()
 
+    def _build_hass_benchmark(self, profile: SimProfile) -> int:
+        # Cycle through common device kinds so the load mixes numeric
+        # sensors, binary sensors and controllable switches.
+        entity_adders = [
+            self._add_hass_temperature_sensor,
+            self._add_hass_motion_sensor,
+            self._add_hass_switch,
+            self._add_hass_humidity_sensor,
+            self._add_hass_door_contact,
+            self._add_hass_power_meter,
+        ]
+        for index in range( self._benchmark_entity_count ):
+            entity_adder = entity_adders[ index % len( entity_adders ) ]
+            entity_adder( profile, f'Bench Device {index + 1:04}' )
+            continue
+        for index in range( self._benchmark_camera_count ):
+            self._add_hass_camera(
+                profile,
+                f'Bench Camera {index + 1:03}',
+                f'bench_camera_{index + 1:03}',
+            )
+            continue
+        return profile.db_sim_entities.count()
+
     # ----- HomeBox builders -----
 
     def _build_homebox_baseline(self, profile: SimProfile) -> int:
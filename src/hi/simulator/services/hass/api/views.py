@@ -9,6 +9,7 @@ from django.views.generic import View
 
 from hi.simulator.media import render_jpeg_frame
 from hi.simulator.services.hass.api_composers import HassApiComposer
+from hi.simulator.services.hass.load_generator import HassLoadGenerator
 from hi.simulator.services.hass.service_dispatchers import HassServiceDispatcher
 from hi.simulator.services.hass.simulator import HassSimulator
 
@@ -43,6 +44,7 @@ class AllStatesView( View ):
             api_dicts = []
             for sim_entity in hass_simulator.sim_entities:
                 api_dicts.extend( HassApiComposer.compose( sim_entity ) )
+            HassLoadGenerator().record_states_served()
             return JsonResponse( api_dicts, safe = False )
 
         except Exception:
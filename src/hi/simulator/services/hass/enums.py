@@ -0,0 +1,17 @@
+from hi.apps.common.enums import LabeledEnum
+
+
+class HassLoadPattern(LabeledEnum):
+    """
+    How the load generator spreads its state changes over time.  All
+    patterns use the configured rate as their average; they differ in
+    how bunched up the changes are and which states receive them.
+    """
+
+    STEADY  = ( 'Steady' , 'Changes evenly spaced at the configured rate.' )
+    BURSTY  = ( 'Bursty' , 'Same average rate, delivered in bursts every burst interval.' )
+    STORM   = ( 'Storm'  , 'A multiple of the rate, mostly hitting a small set of hot states.' )
+
+    @classmethod
+    def default(cls):
+        return cls.STEADY
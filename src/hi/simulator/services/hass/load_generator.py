@@ -0,0 +1,301 @@
+"""
+Synthetic state churn for the HASS simulator.
+
+Drives the values of the current profile's SimStates from a background
+thread so HI's HASS ingestion can be exercised at production-like
+change rates without real hardware.  Pair with a profile of many
+entities (see the ``hass_load create`` management command).
+
+The sequence of state changes is deterministic for a given seed and
+profile; only their wall-clock spacing depends on thread scheduling.
+"""
+from collections import deque
+from dataclasses import dataclass
+import logging
+import random
+from threading import Event, Lock, Thread
+import time
+from typing import Callable, Dict, List
+
+from hi.apps.common.singleton import Singleton
+from hi.apps.common.utils import str_to_bool
+from hi.simulator.services.enums import SimStateType
+
+from .enums import HassLoadPattern
+from .sim_models import HassState
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HassLoadConfig:
+
+    rate_per_sec  : float            = 10.0
+    pattern       : HassLoadPattern  = HassLoadPattern.STEADY
+    seed          : int              = 0
+    burst_secs    : float            = 5.0
+
+    MAX_RATE_PER_SEC = 100000.0
+
+    @classmethod
+    def from_dict( cls, data : Dict ) -> 'HassLoadConfig':
+        """ Raises ValueError for missing or out of range values. """
+        try:
+            config = cls(
+                rate_per_sec = float( data.get( 'rate', cls.rate_per_sec )),
+                pattern = HassLoadPattern.from_name( data.get( 'pattern', str(cls.pattern) )),
+                seed = int( data.get( 'seed', cls.seed )),
+                burst_secs = float( data.get( 'burst_secs', cls.burst_secs )),
+            )
+        except TypeError as te:
+            raise ValueError( f'Bad load config: {te}' )
+        if not ( 0 < config.rate_per_sec <= cls.MAX_RATE_PER_SEC ):
+            raise ValueError( f'Rate must be in (0, {cls.MAX_RATE_PER_SEC}]: {config.rate_per_sec}' )
+        if config.burst_secs <= 0:
+            raise ValueError( f'Burst interval must be positive: {config.burst_secs}' )
+        return config
+
+    def to_dict(self):
+        return {
+            'rate': self.rate_per_sec,
+            'pattern': str(self.pattern),
+            'seed': self.seed,
+            'burst_secs': self.burst_secs,
+        }
+
+
+class HassLoadValueGenerator:
+    """ Next values for SimStates, staying within each state's bounds and choices. """
+
+    BINARY_SIM_STATE_TYPES = {
+        SimStateType.ON_OFF,
+        SimStateType.OPEN_CLOSE,
+        SimStateType.MOVEMENT,
+        SimStateType.PRESENCE,
+        SimStateType.CONNECTIVITY,
+        SimStateType.HIGH_LOW,
+        SimStateType.MOISTURE,
+    }
+    RANDOM_WALK_FRACTION = 0.05
+
+    @classmethod
+    def is_drivable( cls, sim_state : HassState ) -> bool:
+        if sim_state.choices or ( sim_state.sim_state_type in cls.BINARY_SIM_STATE_TYPES ):
+            return True
+        return bool( cls._to_float( sim_state.value ) is not None )
+
+    @classmethod
+    def next_value( cls, sim_state : HassState, rng : random.Random ) -> str:
+        """ A value different from the current one, or None if there is none to pick. """
+        choice_values = [ x[0] for x in sim_state.choices if x[0] != sim_state.value ]
+        if choice_values:
+            return rng.choice( choice_values )
+        if sim_state.choices:
+            return None
+        if sim_state.sim_state_type in cls.BINARY_SIM_STATE_TYPES:
+            return 'off' if str_to_bool( sim_state.value ) else 'on'
+
+        current_value = cls._to_float( sim_state.value )
+        if current_value is None:
+            return None
+        min_value = cls._to_float( sim_state.min_value )
+        max_value = cls._to_float( sim_state.max_value )
+        if ( min_value is not None ) and ( max_value is not None ) and ( max_value > min_value ):
+            step = ( max_value - min_value ) * cls.RANDOM_WALK_FRACTION
+        else:
+            step = max( abs( current_value ) * cls.RANDOM_WALK_FRACTION, 1.0 )
+        new_value = current_value + rng.uniform( -step, step )
+        if min_value is not None:
+            new_value = max( new_value, min_value )
+        if max_value is not None:
+            new_value = min( new_value, max_value )
+
+        # Keep the precision style of the current value (e.g., '70' vs '70.5').
+        if '.' in str( sim_state.value ):
+            return f'{new_value:.1f}'
+        return str( int( round( new_value )))
+
+    @staticmethod
+    def _to_float( value ) -> float:
+        try:
+            return float( value )
+        except ( TypeError, ValueError ):
+            return None
+
+
+class HassLoadGenerator( Singleton ):
+    """
+    Changes SimState values at the configured rate and pattern, and
+    counts what /api/states readers actually observe: the distinct
+    states whose value changed between consecutive responses.  When
+    the generator outpaces the readers, changes to the same state
+    coalesce, so served changes can trail generated changes.
+    """
+
+    TICK_SECS = 0.1
+    POOL_REFRESH_SECS = 1.0
+    RATE_WINDOW_SECS = 10.0
+    STORM_RATE_MULTIPLIER = 10
+    STORM_HOT_STATE_STRIDE = 10  # Every Nth state is hot.
+    STORM_HOT_PROBABILITY = 0.9
+
+    def __init_singleton__(self):
+        self._lock = Lock()
+        self._thread = None
+        self._stop_event = Event()
+        self._config = None
+        self._sim_state_list_provider = None
+        self._reset( config = None )
+        return
+
+    def _reset( self, config : HassLoadConfig ):
+        self._config = config
+        self._rng = random.Random( config.seed if config else 0 )
+        self._pool : List[ HassState ] = list()
+        self._pool_age_secs = self.POOL_REFRESH_SECS
+        self._due_changes = 0.0
+        self._since_burst_secs = 0.0
+        self._running_secs = 0.0
+        self._generated_total = 0
+        self._served_request_count = 0
+        self._served_changes_total = 0
+        self._changed_state_keys = set()
+        self._generated_history = deque()
+        self._served_history = deque()
+        return
+
+    @property
+    def is_running(self) -> bool:
+        return bool( self._thread and self._thread.is_alive() )
+
+    def start( self,
+               config                   : HassLoadConfig,
+               sim_state_list_provider  : Callable[ [], List[ HassState ]] ):
+        self.stop()
+        with self._lock:
+            self._reset( config = config )
+            self._sim_state_list_provider = sim_state_list_provider
+        self._stop_event = Event()
+        self._thread = Thread(
+            target = self._run,
+            name = 'HassLoadGenerator',
+            daemon = True,
+        )
+        self._thread.start()
+        logger.info( f'HASS load generator started: {config.to_dict()}' )
+        return
+
+    def stop(self):
+        if not self._thread:
+            return
+        self._stop_event.set()
+        self._thread.join( timeout = 5 )
+        self._thread = None
+        logger.info( 'HASS load generator stopped.' )
+        return
+
+    def _run(self):
+        last_time = time.monotonic()
+        while not self._stop_event.wait( self.TICK_SECS ):
+            now_time = time.monotonic()
+            try:
+                self.advance( elapsed_secs = now_time - last_time )
+            except Exception:
+                logger.exception( 'Problem generating HASS load.' )
+            last_time = now_time
+            continue
+        return
+
+    def advance( self, elapsed_secs : float ) -> int:
+        """ Applies the changes due over elapsed_secs and returns how many were applied. """
+        with self._lock:
+            if not self._config:
+                return 0
+            self._running_secs += elapsed_secs
+            self._pool_age_secs += elapsed_secs
+            if self._pool_age_secs >= self.POOL_REFRESH_SECS:
+                # Picks up profile switches and entity edits.
+                self._pool = [ x for x in self._sim_state_list_provider()
+                               if HassLoadValueGenerator.is_drivable( x ) ]
+                self._pool_age_secs = 0.0
+
+            change_count = self._take_due_change_count( elapsed_secs )
+            applied_count = 0
+            for _ in range( change_count if self._pool else 0 ):
+                sim_state = self._pick_sim_state()
+                value_str = HassLoadValueGenerator.next_value( sim_state, self._rng )
+                if value_str is None:
+                    continue
+                sim_state.set_value_from_string( value_str = value_str )
+                self._changed_state_keys.add( ( sim_state.sim_entity_id, sim_state.sim_state_id ) )
+                applied_count += 1
+                continue
+
+            self._generated_total += applied_count
+            self._append_history( self._generated_history, applied_count )
+        return applied_count
+
+    def _take_due_change_count( self, elapsed_secs : float ) -> int:
+        config = self._config
+        rate_per_sec = config.rate_per_sec
+        if config.pattern == HassLoadPattern.STORM:
+            rate_per_sec *= self.STORM_RATE_MULTIPLIER
+        self._due_changes += rate_per_sec * elapsed_secs
+
+        if config.pattern == HassLoadPattern.BURSTY:
+            self._since_burst_secs += elapsed_secs
+            if self._since_burst_secs < config.burst_secs:
+                return 0
+            self._since_burst_secs = 0.0
+
+        change_count = int( self._due_changes )
+        self._due_changes -= change_count
+        return change_count
+
+    def _pick_sim_state(self) -> HassState:
+        pool_size = len( self._pool )
+        if (( self._config.pattern == HassLoadPattern.STORM )
+                and ( self._rng.random() < self.STORM_HOT_PROBABILITY )):
+            hot_count = ( pool_size + self.STORM_HOT_STATE_STRIDE - 1 ) // self.STORM_HOT_STATE_STRIDE
+            return self._pool[ self._rng.randrange( hot_count ) * self.STORM_HOT_STATE_STRIDE ]
+        return self._pool[ self._rng.randrange( pool_size ) ]
+
+    def record_states_served(self):
+        """ Called as each /api/states response is composed. """
+        with self._lock:
+            if not self._config:
+                return
+            served_change_count = len( self._changed_state_keys )
+            self._changed_state_keys = set()
+            self._served_request_count += 1
+            self._served_changes_total += served_change_count
+            self._append_history( self._served_history, served_change_count )
+        return
+
+    def _append_history( self, history : deque, count : int ):
+        now_secs = self._running_secs
+        history.append( ( now_secs, count ) )
+        while history and ( history[0][0] < now_secs - self.RATE_WINDOW_SECS ):
+            history.popleft()
+            continue
+        return
+
+    def _history_rate( self, history : deque ) -> float:
+        window_secs = min( self._running_secs, self.RATE_WINDOW_SECS )
+        if window_secs <= 0:
+            return 0.0
+        return round( sum( x[1] for x in history ) / window_secs, 2 )
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            return {
+                'is_running': self.is_running,
+                'config': self._config.to_dict() if self._config else None,
+                'running_secs': round( self._running_secs, 1 ),
+                'pool_size': len( self._pool ),
+                'generated_total': self._generated_total,
+                'generated_per_sec': self._history_rate( self._generated_history ),
+                'served_requests': self._served_request_count,
+                'served_changes_total': self._served_changes_total,
+                'served_changes_per_sec': self._history_rate( self._served_history ),
+            }
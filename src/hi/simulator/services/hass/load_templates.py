@@ -0,0 +1,106 @@
+"""
+Entity templates for mass-creating HASS load profiles.
+
+The weights give a sensor-heavy mix across the HA domains HI imports
+(sensor, binary_sensor, switch, light, cover, lock, fan, climate and
+camera), roughly what a large real installation looks like.
+"""
+from dataclasses import dataclass, field
+import random
+from typing import Dict, List, Tuple, Type
+
+from hi.simulator.services.base_models import SimEntityFields
+from hi.simulator.services.enums import SimEntityType
+
+from .sim_models import (
+    HASS_SIM_ENTITY_DEFINITION_LIST,
+    HassCameraSimEntityFields,
+    HassColorSmartBulbFields,
+    HassDoorContactSensorFields,
+    HassFanFields,
+    HassGarageCoverFields,
+    HassHumiditySensorFields,
+    HassLockFields,
+    HassMotionSensorFields,
+    HassOutletFields,
+    HassPowerMeterFields,
+    HassPresenceSensorFields,
+    HassSmartBulbFields,
+    HassSwitchFields,
+    HassTempHumiditySensorFields,
+    HassTemperatureSensorFields,
+    HassThermostatFields,
+    HassWaterLeakSensorFields,
+    HassWindowBlindCoverFields,
+    HassWindowContactSensorFields,
+)
+
+
+@dataclass( frozen = True )
+class HassLoadTemplate:
+
+    label         : str
+    fields_class  : Type[ SimEntityFields ]
+    weight        : int
+    # Fields that must differ per entity, formatted with the entity number.
+    unique_field_formats  : Dict[ str, str ]  = field( default_factory = dict )
+
+    @property
+    def sim_entity_type(self) -> SimEntityType:
+        return HASS_SIM_ENTITY_TYPE_MAP[ self.fields_class ]
+
+    def create_fields( self, number : int ) -> SimEntityFields:
+        fields_kwargs = {
+            name: name_format.format( number = number )
+            for name, name_format in self.unique_field_formats.items()
+        }
+        return self.fields_class(
+            name = f'Load {self.label} {number:05}',
+            **fields_kwargs,
+        )
+
+
+HASS_SIM_ENTITY_TYPE_MAP = {
+    x.sim_entity_fields_class: x.sim_entity_type for x in HASS_SIM_ENTITY_DEFINITION_LIST
+}
+
+HASS_LOAD_TEMPLATE_LIST = [
+    HassLoadTemplate( 'Temperature'   , HassTemperatureSensorFields    , 12 ),
+    HassLoadTemplate( 'Humidity'      , HassHumiditySensorFields       , 6 ),
+    HassLoadTemplate( 'Climate Pair'  , HassTempHumiditySensorFields   , 6 ),
+    HassLoadTemplate( 'Power'         , HassPowerMeterFields           , 10 ),
+    HassLoadTemplate( 'Motion'        , HassMotionSensorFields         , 10 ),
+    HassLoadTemplate( 'Door'          , HassDoorContactSensorFields    , 6 ),
+    HassLoadTemplate( 'Window'        , HassWindowContactSensorFields  , 6 ),
+    HassLoadTemplate( 'Presence'      , HassPresenceSensorFields       , 4 ),
+    HassLoadTemplate( 'Leak'          , HassWaterLeakSensorFields      , 3 ),
+    HassLoadTemplate( 'Switch'        , HassSwitchFields               , 8 ),
+    HassLoadTemplate( 'Outlet'        , HassOutletFields               , 6 ),
+    HassLoadTemplate( 'Bulb'          , HassSmartBulbFields            , 6 ),
+    HassLoadTemplate( 'Color Bulb'    , HassColorSmartBulbFields       , 3 ),
+    HassLoadTemplate( 'Blind'         , HassWindowBlindCoverFields     , 3 ),
+    HassLoadTemplate( 'Garage'        , HassGarageCoverFields          , 1 ),
+    HassLoadTemplate( 'Lock'          , HassLockFields                 , 2 ),
+    HassLoadTemplate( 'Fan'           , HassFanFields                  , 2 ),
+    HassLoadTemplate( 'Thermostat'    , HassThermostatFields           , 2 ),
+    HassLoadTemplate( 'Camera'        , HassCameraSimEntityFields      , 4,
+                      { 'entity_id_suffix': 'load_camera_{number:05}' } ),
+]
+
+
+def build_load_entity_fields( entity_count  : int,
+                              seed          : int ) -> List[ Tuple[ HassLoadTemplate, SimEntityFields ]]:
+    """
+    ( template, fields ) pairs for entity_count entities, drawn from the
+    template weights.  The same seed always gives the same entities.
+    """
+    rng = random.Random( seed )
+    template_list = rng.choices(
+        HASS_LOAD_TEMPLATE_LIST,
+        weights = [ x.weight for x in HASS_LOAD_TEMPLATE_LIST ],
+        k = entity_count,
+    )
+    return [
+        ( template, template.create_fields( number = index + 1 ))
+        for index, template in enumerate( template_list )
+    ]
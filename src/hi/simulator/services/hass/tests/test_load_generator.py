@@ -0,0 +1,165 @@
+import logging
+import random
+
+from django.test import TestCase
+
+from hi.simulator.services.hass.enums import HassLoadPattern
+from hi.simulator.services.hass.load_generator import (
+    HassLoadConfig,
+    HassLoadGenerator,
+    HassLoadValueGenerator,
+)
+from hi.simulator.services.hass.load_templates import build_load_entity_fields
+from hi.simulator.services.hass.sim_models import (
+    HassCameraSimEntityFields,
+    HassHumiditySensorFields,
+    HassHumiditySensorState,
+    HassMultiFeatureFanDirectionState,
+    HassMultiFeatureFanFields,
+    HassSwitchFields,
+    HassSwitchState,
+    HassTemperatureSensorFields,
+    HassTemperatureSensorState,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+def _make_state_list( count ):
+    state_list = list()
+    for index in range( count ):
+        if index % 2:
+            state_list.append( HassSwitchState(
+                sim_entity_id = index,
+                sim_entity_fields = HassSwitchFields( name = f'Switch {index}' ),
+            ))
+        else:
+            state_list.append( HassTemperatureSensorState(
+                sim_entity_id = index,
+                sim_entity_fields = HassTemperatureSensorFields( name = f'Temp {index}' ),
+            ))
+        continue
+    return state_list
+
+
+class TestHassLoadValueGenerator(TestCase):
+
+    def test_binary_state_toggles(self):
+        state = HassSwitchState( sim_entity_id = 1, sim_entity_fields = HassSwitchFields( name = 'S' ))
+        rng = random.Random( 0 )
+        self.assertEqual( HassLoadValueGenerator.next_value( state, rng ), 'on' )
+        state.value = 'on'
+        self.assertEqual( HassLoadValueGenerator.next_value( state, rng ), 'off' )
+
+    def test_numeric_state_stays_in_bounds(self):
+        state = HassTemperatureSensorState(
+            sim_entity_id = 1,
+            sim_entity_fields = HassTemperatureSensorFields( name = 'T' ),
+        )
+        rng = random.Random( 0 )
+        for _ in range( 500 ):
+            state.set_value_from_string( HassLoadValueGenerator.next_value( state, rng ))
+            self.assertGreaterEqual( float( state.value ), state.min_value )
+            self.assertLessEqual( float( state.value ), state.max_value )
+            continue
+
+    def test_discrete_state_picks_other_choice(self):
+        state = HassMultiFeatureFanDirectionState(
+            sim_entity_id = 1,
+            sim_entity_fields = HassMultiFeatureFanFields( name = 'F' ),
+        )
+        value = HassLoadValueGenerator.next_value( state, random.Random( 0 ))
+        self.assertIn( value, [ x[0] for x in state.choices ] )
+        self.assertNotEqual( value, state.value )
+
+    def test_humidity_state_is_drivable(self):
+        state = HassHumiditySensorState(
+            sim_entity_id = 1,
+            sim_entity_fields = HassHumiditySensorFields( name = 'H' ),
+        )
+        self.assertTrue( HassLoadValueGenerator.is_drivable( state ))
+
+
+class TestHassLoadConfig(TestCase):
+
+    def test_from_dict(self):
+        config = HassLoadConfig.from_dict( { 'rate': '50', 'pattern': 'storm', 'seed': 4 } )
+        self.assertEqual( config.rate_per_sec, 50.0 )
+        self.assertEqual( config.pattern, HassLoadPattern.STORM )
+        self.assertEqual( config.seed, 4 )
+
+    def test_from_dict_rejects_bad_values(self):
+        for data in [ { 'rate': 0 }, { 'rate': 'fast' }, { 'pattern': 'wavy' }, { 'burst_secs': -1 } ]:
+            with self.assertRaises( ValueError ):
+                HassLoadConfig.from_dict( data )
+            continue
+
+
+class TestHassLoadGenerator(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.generator = HassLoadGenerator()
+        self.generator.stop()
+        return
+
+    def _prepare( self, state_list, **config_kwargs ):
+        self.generator._reset( config = HassLoadConfig( **config_kwargs ))
+        self.generator._sim_state_list_provider = lambda: state_list
+        return
+
+    def test_steady_rate_applies_fractional_changes(self):
+        self._prepare( _make_state_list( 20 ), rate_per_sec = 25, seed = 1 )
+        applied_counts = [ self.generator.advance( 0.1 ) for _ in range( 10 ) ]
+        self.assertEqual( sum( applied_counts ), 25 )
+        self.assertTrue( all( x in ( 2, 3 ) for x in applied_counts ))
+
+    def test_same_seed_gives_same_changes(self):
+        value_lists = list()
+        for _ in range( 2 ):
+            state_list = _make_state_list( 20 )
+            self._prepare( state_list, rate_per_sec = 50, seed = 9 )
+            for _ in range( 10 ):
+                self.generator.advance( 0.1 )
+                continue
+            value_lists.append( [ x.value for x in state_list ] )
+            continue
+        self.assertEqual( value_lists[0], value_lists[1] )
+
+    def test_bursty_holds_changes_until_burst(self):
+        self._prepare( _make_state_list( 20 ), rate_per_sec = 10,
+                       pattern = HassLoadPattern.BURSTY, burst_secs = 1.0 )
+        applied_counts = [ self.generator.advance( 0.25 ) for _ in range( 4 ) ]
+        self.assertEqual( applied_counts, [ 0, 0, 0, 10 ] )
+
+    def test_storm_multiplies_rate_onto_hot_states(self):
+        state_list = _make_state_list( 100 )
+        self._prepare( state_list, rate_per_sec = 100, pattern = HassLoadPattern.STORM, seed = 2 )
+        self.assertEqual( self.generator.advance( 1.0 ), 1000 )
+        hot_ids = { x.sim_entity_id for x in state_list[::HassLoadGenerator.STORM_HOT_STATE_STRIDE] }
+        changed_ids = { x[0] for x in self.generator._changed_state_keys }
+        self.assertTrue( hot_ids.issubset( changed_ids ))
+
+    def test_served_changes_coalesce_between_reads(self):
+        state_list = _make_state_list( 4 )
+        self._prepare( state_list, rate_per_sec = 100, seed = 3 )
+        self.assertEqual( self.generator.advance( 1.0 ), 100 )
+        self.generator.record_states_served()
+        self.generator.record_states_served()
+        status = self.generator.get_status()
+        self.assertEqual( status['generated_total'], 100 )
+        self.assertEqual( status['served_requests'], 2 )
+        self.assertEqual( status['served_changes_total'], 4 )
+
+
+class TestHassLoadTemplates(TestCase):
+
+    def test_entities_are_deterministic_and_unique(self):
+        first = build_load_entity_fields( entity_count = 300, seed = 5 )
+        second = build_load_entity_fields( entity_count = 300, seed = 5 )
+        self.assertEqual( [ x[1] for x in first ], [ x[1] for x in second ] )
+        self.assertEqual( len( { x[1].name for x in first } ), 300 )
+        camera_suffixes = [ x[1].entity_id_suffix for x in first
+                            if isinstance( x[1], HassCameraSimEntityFields ) ]
+        self.assertEqual( len( camera_suffixes ), len( set( camera_suffixes )))
+        self.assertGreater( len( { type( x[1] ) for x in first } ), 10 )
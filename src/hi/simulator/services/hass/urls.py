@@ -10,4 +10,16 @@ urlpatterns = [
           name = 'hass_home' ),
 
     path( 'api/', include('hi.simulator.services.hass.api.urls' )),
+
+    path( 'load/start',
+          views.LoadStartView.as_view(),
+          name = 'hass_load_start' ),
+
+    path( 'load/stop',
+          views.LoadStopView.as_view(),
+          name = 'hass_load_stop' ),
+
+    path( 'load/status',
+          views.LoadStatusView.as_view(),
+          name = 'hass_load_status' ),
 ]
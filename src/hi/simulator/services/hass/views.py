@@ -1,8 +1,56 @@
+import json
+
+from django.core.exceptions import BadRequest
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 
+from .load_generator import HassLoadConfig, HassLoadGenerator
+from .simulator import HassSimulator
+
 
 class HomeView( View ):
 
     def get(self, request, *args, **kwargs):
         pass
-   
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class LoadStartView( View ):
+    """
+    Starts (or restarts) the synthetic state churn.  The JSON body may
+    set "rate" (changes/sec), "pattern" (steady, bursty, storm), "seed"
+    and "burst_secs".  Responds with the load status.
+    """
+
+    def post(self, request, *args, **kwargs):
+        try:
+            data = json.loads( request.body ) if request.body else dict()
+            config = HassLoadConfig.from_dict( data )
+        except json.JSONDecodeError as jde:
+            raise BadRequest( f'Request body is not JSON: {jde}' )
+        except ValueError as ve:
+            raise BadRequest( str(ve) )
+
+        load_generator = HassLoadGenerator()
+        load_generator.start(
+            config = config,
+            sim_state_list_provider = HassSimulator().get_hass_sim_state_list,
+        )
+        return JsonResponse( load_generator.get_status() )
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class LoadStopView( View ):
+
+    def post(self, request, *args, **kwargs):
+        load_generator = HassLoadGenerator()
+        load_generator.stop()
+        return JsonResponse( load_generator.get_status() )
+
+
+class LoadStatusView( View ):
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse( HassLoadGenerator().get_status() )
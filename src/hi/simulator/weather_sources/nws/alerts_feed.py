@@ -0,0 +1,78 @@
+"""
+NWS-shaped /alerts/active feed for the simulator.
+
+Kept free of model imports so the feed (and its conditional-request
+handling) can be driven from plain objects.  Like the real API, the
+response carries an ETag and a Cache-Control lifetime; a request whose
+If-None-Match still matches gets a bodyless 304.  The ETag covers the
+feature ids only: ``effective`` / ``expires`` are re-derived from "now"
+on every request, but the alert itself has not changed until its row
+is saved again (which changes the feature id).
+"""
+from datetime import datetime, timedelta
+import hashlib
+from typing import Any, Dict, List, Sequence
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, quote_etag
+
+ALERTS_MAX_AGE_SECS = 60
+
+
+def build_alerts_feed( alert_list : Sequence, now : datetime ) -> Dict[ str, Any ]:
+    features : List[ Dict[str, Any] ] = []
+    for alert in alert_list:
+        effective = now + timedelta( seconds = alert.effective_offset_secs )
+        expires = now + timedelta( seconds = alert.expires_offset_secs )
+        properties : Dict[ str, Any ] = {
+            'event': alert.event_name,
+            'headline': alert.headline,
+            'description': alert.description,
+            'instruction': alert.instruction,
+            'areaDesc': alert.area_desc,
+            'status': alert.status_str,
+            'severity': alert.severity_str,
+            'urgency': alert.urgency_str,
+            'certainty': alert.certainty_str,
+            'category': alert.category_str,
+            'effective': effective.isoformat(),
+            'expires': expires.isoformat(),
+            'onset': effective.isoformat(),
+            'ends': expires.isoformat(),
+        }
+        if alert.event_code:
+            properties['eventCode'] = {
+                'NationalWeatherService': [ alert.event_code ],
+            }
+        # Feature id changes on each row save (toggle / edit) so
+        # the main app treats each issuance as distinct, matching
+        # real NWS where every Update / Cancel publishes a new
+        # identifier. Repeat polls of an unchanged row share the
+        # same id.
+        issuance = int( alert.updated_datetime.timestamp() )
+        features.append({
+            'id': f'sim-nws-alert-{alert.id}-{issuance}',
+            'properties': properties,
+        })
+        continue
+    return { 'features': features }
+
+
+def get_alerts_feed_etag( alerts_feed : Dict[ str, Any ] ) -> str:
+    feature_ids = '\n'.join( sorted( feature['id'] for feature in alerts_feed['features'] ))
+    return quote_etag( hashlib.sha1( feature_ids.encode( 'utf-8' )).hexdigest() )
+
+
+def alerts_feed_response( request     : HttpRequest,
+                          alert_list  : Sequence,
+                          now         : datetime ) -> HttpResponse:
+    alerts_feed = build_alerts_feed( alert_list = alert_list, now = now )
+    etag = get_alerts_feed_etag( alerts_feed )
+    not_modified_response = get_conditional_response( request, etag = etag )
+    if not_modified_response is not None:
+        response = not_modified_response
+    else:
+        response = JsonResponse( alerts_feed )
+        response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age={ALERTS_MAX_AGE_SECS}'
+    return response
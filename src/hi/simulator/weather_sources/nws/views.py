@@ -1,14 +1,12 @@
 import logging
-from datetime import timedelta
-from typing import Any, Dict, List
 
-from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.views.generic import View
 
 import hi.apps.common.antinode as antinode
 import hi.apps.common.datetimeproxy as datetimeproxy
 
+from .alerts_feed import alerts_feed_response
 from .forms import NwsSimAlertForm
 from .models import NwsSimAlert
 
@@ -19,42 +17,11 @@ class NwsAlertsActiveView( View ):
     """NWS-shaped /alerts/active endpoint backed by NwsSimAlert rows."""
 
     def get( self, request, *args, **kwargs ):
-        features : List[ Dict[str, Any] ] = []
-        now = datetimeproxy.now()
-        for alert in NwsSimAlert.objects.filter( is_active = True ):
-            effective = now + timedelta( seconds = alert.effective_offset_secs )
-            expires = now + timedelta( seconds = alert.expires_offset_secs )
-            properties : Dict[ str, Any ] = {
-                'event': alert.event_name,
-                'headline': alert.headline,
-                'description': alert.description,
-                'instruction': alert.instruction,
-                'areaDesc': alert.area_desc,
-                'status': alert.status_str,
-                'severity': alert.severity_str,
-                'urgency': alert.urgency_str,
-                'certainty': alert.certainty_str,
-                'category': alert.category_str,
-                'effective': effective.isoformat(),
-                'expires': expires.isoformat(),
-                'onset': effective.isoformat(),
-                'ends': expires.isoformat(),
-            }
-            if alert.event_code:
-                properties['eventCode'] = {
-                    'NationalWeatherService': [ alert.event_code ],
-                }
-            # Feature id changes on each row save (toggle / edit) so
-            # the main app treats each issuance as distinct, matching
-            # real NWS where every Update / Cancel publishes a new
-            # identifier. Repeat polls of an unchanged row share the
-            # same id.
-            issuance = int( alert.updated_datetime.timestamp() )
-            features.append({
-                'id': f'sim-nws-alert-{alert.id}-{issuance}',
-                'properties': properties,
-            })
-        return JsonResponse( { 'features': features } )
+        return alerts_feed_response(
+            request = request,
+            alert_list = NwsSimAlert.objects.filter( is_active = True ),
+            now = datetimeproxy.now(),
+        )
 
 
 class NwsSimAlertAddView( View ):
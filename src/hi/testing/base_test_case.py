@@ -11,6 +11,7 @@ from django.test import TestCase, RequestFactory
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.view_model_cache import ViewModelCache
 from hi.view_parameters import ViewParameters
 from hi.enums import ViewMode, ViewType
 
@@ -31,6 +32,10 @@ class BaseTestCase(TestCase):
 
         datetimeproxy.reset()
 
+        # Test transactions roll back without sending delete signals, so
+        # rows cached by an earlier test could otherwise reappear.
+        ViewModelCache().invalidate()
+
         self.async_http_headers = {
             'HTTP_X_REQUESTED_WITH': 'XMLHttpRequest',
         }
@@ -0,0 +1,138 @@
+import io
+import logging
+from typing import Dict, List
+
+from django.db import transaction
+
+from hi.apps.common.svg_models import SvgViewBox
+from hi.apps.entity.entity_placement import EntityPlacer
+from hi.apps.entity.enums import EntityType
+from hi.apps.entity.models import Entity
+from hi.apps.location.location_manager import LocationManager
+from hi.apps.location.models import Location, LocationView
+from hi.apps.sense.models import Sensor
+from hi.integrations.integration_manager import IntegrationManager
+from hi.integrations.models import Integration
+from hi.integrations.sync_result import IntegrationSyncResult
+from hi.integrations.transient_models import IntegrationKey
+from hi.services.hass.enums import HassAttributeType
+from hi.services.hass.hass_manager import HassManager
+from hi.services.hass.hass_metadata import HassMetaData
+from hi.services.hass.hass_sync import HassSynchronizer
+
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkHome:
+    """
+    The HI side of a benchmark home.  The devices come from the
+    simulator's HASS "benchmark" profile (see the seed_sim_profiles
+    --benchmark option): the Home Assistant integration is pointed at
+    the simulator and its entities imported with the normal sync, then
+    spread over generated locations so location views have realistic
+    content.
+    """
+
+    HASS_SIMULATOR_PATH = '/services/hass'
+    HASS_API_TOKEN = 'benchmark'
+    LOCATION_NAME_PREFIX = 'Benchmark Location'
+    SVG_VIEWBOX = SvgViewBox( x = 0, y = 0, width = 1000, height = 800 )
+    SVG_FRAGMENT = '<rect x="10" y="10" width="980" height="780" fill="none" stroke="black" />'
+
+    def configure_hass_integration( self, simulator_url : str ) -> Integration:
+        integration, _ = Integration.objects.get_or_create(
+            integration_id = HassMetaData.integration_id,
+        )
+        IntegrationManager().ensure_all_attributes_exist(
+            integration_metadata = HassMetaData,
+            integration = integration,
+        )
+        attribute_map = integration.attributes_by_integration_key
+        attribute_values = {
+            HassAttributeType.API_BASE_URL: simulator_url.rstrip( '/' ) + self.HASS_SIMULATOR_PATH,
+            HassAttributeType.API_TOKEN: self.HASS_API_TOKEN,
+        }
+        for attribute_type, value in attribute_values.items():
+            attribute = attribute_map[ IntegrationKey(
+                integration_id = HassMetaData.integration_id,
+                integration_name = str(attribute_type),
+            )]
+            attribute.value = value
+            attribute.save()
+            continue
+
+        integration.is_enabled = True
+        integration.is_paused = False
+        integration.save()
+        HassManager().notify_settings_changed()
+        return integration
+
+    def import_hass_entities(self) -> IntegrationSyncResult:
+        is_initial_import = not Entity.objects.filter(
+            integration_id = HassMetaData.integration_id,
+        ).exists()
+        result = HassSynchronizer().sync( is_initial_import = is_initial_import )
+        for error in result.error_list:
+            logger.warning( f'Benchmark HASS import: {error}' )
+            continue
+        return result
+
+    def build_locations( self, location_count : int ) -> List[ LocationView ]:
+        """ Replaces any previous benchmark locations with location_count new ones. """
+        for location in Location.objects.filter( name__startswith = self.LOCATION_NAME_PREFIX ):
+            location.delete()
+            continue
+
+        location_view_list = list()
+        for index in range( location_count ):
+            location = LocationManager().create_location(
+                name = f'{self.LOCATION_NAME_PREFIX} {index + 1:02}',
+                svg_fragment_filename = f'location/svg/benchmark-{index + 1:02}.svg',
+                svg_fragment_file = io.StringIO( self.SVG_FRAGMENT ),
+                svg_viewbox = self.SVG_VIEWBOX,
+            )
+            location_view_list.append( location.views.order_by( 'order_id' ).first() )
+            continue
+        return location_view_list
+
+    def place_entities( self, location_view_list : List[ LocationView ] ):
+        """ Deals the imported entities round-robin into the location views. """
+        if not location_view_list:
+            return
+        entity_list = list( Entity.objects.filter(
+            integration_id = HassMetaData.integration_id,
+        ).order_by( 'id' ))
+        view_count = len( location_view_list )
+        with transaction.atomic():
+            for view_index, location_view in enumerate( location_view_list ):
+                EntityPlacer().place_entities_in_view(
+                    entities = entity_list[view_index::view_count],
+                    location_view = location_view,
+                )
+                continue
+        return
+
+    def get_location_view_list(self) -> List[ LocationView ]:
+        return list( LocationView.objects.filter(
+            location__name__startswith = self.LOCATION_NAME_PREFIX,
+        ).select_related( 'location' ).order_by( 'location__order_id', 'order_id' ))
+
+    def get_counts(self) -> Dict[ str, int ]:
+        entity_queryset = Entity.objects.filter( integration_id = HassMetaData.integration_id )
+        return {
+            'entities': entity_queryset.count(),
+            'cameras': entity_queryset.filter( entity_type_str = str( EntityType.CAMERA )).count(),
+            'sensors': Sensor.objects.filter( integration_id = HassMetaData.integration_id ).count(),
+            'locations': Location.objects.filter( name__startswith = self.LOCATION_NAME_PREFIX ).count(),
+            'location_views': len( self.get_location_view_list() ),
+        }
+
+    def get_sensor_map(self) -> Dict[ str, Sensor ]:
+        """ HASS entity id to sensor, for sensors that report numeric values. """
+        return {
+            sensor.integration_name: sensor
+            for sensor in Sensor.objects.filter(
+                integration_id = HassMetaData.integration_id,
+            ).select_related( 'entity_state' )
+            if sensor.entity_state.entity_state_type.is_numeric
+        }
@@ -0,0 +1,90 @@
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import json
+from typing import Dict, List
+
+import numpy as np
+
+
+@dataclass
+class LatencySummary:
+    """ Distribution of a set of timings, in milliseconds. """
+
+    count     : int    = 0
+    mean_ms   : float  = None
+    p50_ms    : float  = None
+    p90_ms    : float  = None
+    p99_ms    : float  = None
+    max_ms    : float  = None
+
+    @classmethod
+    def from_seconds( cls, seconds_list : List[ float ] ) -> 'LatencySummary':
+        if not seconds_list:
+            return cls()
+        millis = np.array( seconds_list, dtype = np.float64 ) * 1000.0
+        p50, p90, p99 = np.percentile( millis, [ 50, 90, 99 ] )
+        return cls(
+            count = len( seconds_list ),
+            mean_ms = round( float( millis.mean() ), 3 ),
+            p50_ms = round( float( p50 ), 3 ),
+            p90_ms = round( float( p90 ), 3 ),
+            p99_ms = round( float( p99 ), 3 ),
+            max_ms = round( float( millis.max() ), 3 ),
+        )
+
+    def to_dict(self):
+        return asdict( self )
+
+
+@dataclass
+class BenchmarkResult:
+    name          : str
+    latency       : LatencySummary      = field( default_factory = LatencySummary )
+    error_count   : int                 = 0
+    metrics       : Dict[ str, object ] = field( default_factory = dict )
+    skip_reason   : str                 = None
+
+    @property
+    def is_skipped(self) -> bool:
+        return bool( self.skip_reason )
+
+    def to_dict(self):
+        result_dict = {
+            'name': self.name,
+            'latency': self.latency.to_dict(),
+            'error_count': self.error_count,
+            'metrics': self.metrics,
+        }
+        if self.skip_reason:
+            result_dict['skip_reason'] = self.skip_reason
+        return result_dict
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Machine-readable results of one benchmark run.  The "results" map is
+    keyed by benchmark name so runs can be compared key by key.
+    """
+
+    started_datetime  : datetime
+    config            : Dict[ str, object ]
+    home              : Dict[ str, int ]           = field( default_factory = dict )
+    result_list       : List[ BenchmarkResult ]    = field( default_factory = list )
+    duration_secs     : float                      = None
+
+    def add_result( self, result : BenchmarkResult ):
+        self.result_list.append( result )
+        return
+
+    def to_dict(self):
+        return {
+            'started': self.started_datetime.isoformat(),
+            'duration_secs': self.duration_secs,
+            'config': self.config,
+            'home': self.home,
+            'results': { x.name: x.to_dict() for x in self.result_list },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps( self.to_dict(), indent = 2, sort_keys = True )
@@ -0,0 +1,312 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+import requests
+
+from hi.apps.api.views import StatusView
+from hi.apps.location.models import LocationView
+
+from .benchmark_home import BenchmarkHome
+from .benchmark_models import BenchmarkResult, LatencySummary
+
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkClient:
+    """ Issues GET requests against HI and returns ( status code, parsed JSON or None ). """
+
+    def get_json( self, path : str ) -> Tuple[ int, object ]:
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def close(self):
+        return
+
+
+class InProcessBenchmarkClient( BenchmarkClient ):
+    """ Requests handled in this process, so timings exclude the network and web server. """
+
+    def __init__(self):
+        self._client = Client()
+        return
+
+    def get( self, path : str ):
+        return self._client.get( path )
+
+    def get_json( self, path : str ) -> Tuple[ int, object ]:
+        response = self._client.get( path )
+        if response.get( 'Content-Type', '' ).startswith( 'application/json' ):
+            return response.status_code, response.json()
+        return response.status_code, None
+
+
+class LiveBenchmarkClient( BenchmarkClient ):
+    """ Requests to a running HI server, which must not require sign-in. """
+
+    TIMEOUT_SECS = 30
+
+    def __init__( self, base_url : str ):
+        self._base_url = base_url.rstrip( '/' )
+        self._session = requests.Session()
+        return
+
+    def get_json( self, path : str ) -> Tuple[ int, object ]:
+        response = self._session.get( f'{self._base_url}{path}', timeout = self.TIMEOUT_SECS )
+        if response.headers.get( 'Content-Type', '' ).startswith( 'application/json' ):
+            return response.status_code, response.json()
+        return response.status_code, None
+
+    def close(self):
+        self._session.close()
+        return
+
+
+def in_process_settings():
+    """ Lets the in-process client through sign-in and host checks. """
+    return override_settings(
+        SUPPRESS_AUTHENTICATION = True,
+        ALLOWED_HOSTS = list( settings.ALLOWED_HOSTS ) + [ 'testserver' ],
+    )
+
+
+class BenchmarkRunner:
+    """
+    The individual benchmarks.  Each returns a BenchmarkResult, with a
+    skip reason when the run is not configured for it.
+
+    Status polling goes through client_factory (one client per poller)
+    so it can target either this process or a running server.  Location
+    view rendering is always in-process since it also counts the
+    database queries each render makes.  Ingestion latency needs both
+    the simulator and a running server, whose integration monitors do
+    the ingesting.
+    """
+
+    INGESTION_POLL_INTERVAL_SECS = 0.1
+
+    def __init__( self,
+                  client_factory  : Callable[ [], BenchmarkClient ],
+                  simulator_url   : str            = None,
+                  is_live         : bool           = False,
+                  home            : BenchmarkHome  = None ):
+        self._client_factory = client_factory
+        self._simulator_url = simulator_url.rstrip( '/' ) if simulator_url else None
+        self._is_live = is_live
+        self._home = home if home is not None else BenchmarkHome()
+        return
+
+    def run_location_views( self,
+                            location_view_list  : List[ LocationView ],
+                            repeat_count        : int ) -> BenchmarkResult:
+        result = BenchmarkResult( name = 'location_view_render' )
+        if not location_view_list:
+            result.skip_reason = 'No benchmark location views (run with --setup).'
+            return result
+
+        client = InProcessBenchmarkClient()
+        cold_seconds_list = list()
+        warm_seconds_list = list()
+        query_count_list = list()
+        for location_view in location_view_list:
+            url = reverse( 'location_view', kwargs = { 'location_view_id': location_view.id } )
+            for repeat_index in range( repeat_count + 1 ):
+                with CaptureQueriesContext( connection ) as context:
+                    start_time = time.perf_counter()
+                    response = client.get( url )
+                    elapsed_secs = time.perf_counter() - start_time
+                if response.status_code != 200:
+                    result.error_count += 1
+                    continue
+                # The first render of each view also fills the caches.
+                if repeat_index == 0:
+                    cold_seconds_list.append( elapsed_secs )
+                else:
+                    warm_seconds_list.append( elapsed_secs )
+                    query_count_list.append( len( context.captured_queries ))
+                continue
+            continue
+
+        result.latency = LatencySummary.from_seconds( warm_seconds_list )
+        result.metrics = {
+            'view_count': len( location_view_list ),
+            'cold_latency': LatencySummary.from_seconds( cold_seconds_list ).to_dict(),
+            'query_count_min': min( query_count_list, default = None ),
+            'query_count_max': max( query_count_list, default = None ),
+        }
+        return result
+
+    def run_status_polling( self,
+                            poller_count      : int,
+                            polls_per_poller  : int ) -> BenchmarkResult:
+        result = BenchmarkResult( name = 'api_status_polling' )
+
+        # Untimed, and lets the first request initialize the lazily created
+        # singletons before concurrent pollers would race to do so.
+        warm_up_client = self._client_factory()
+        try:
+            warm_up_client.get_json( self._status_path() )
+        finally:
+            warm_up_client.close()
+
+        start_time = time.perf_counter()
+        if poller_count == 1:
+            poller_result_list = [ self._poll_status( polls_per_poller ) ]
+        else:
+            with ThreadPoolExecutor( max_workers = poller_count ) as executor:
+                poller_result_list = list( executor.map(
+                    self._poll_status_in_thread, [ polls_per_poller ] * poller_count ))
+        elapsed_secs = time.perf_counter() - start_time
+
+        seconds_list = list()
+        for poller_seconds_list, poller_error_count in poller_result_list:
+            seconds_list.extend( poller_seconds_list )
+            result.error_count += poller_error_count
+            continue
+        result.latency = LatencySummary.from_seconds( seconds_list )
+        result.metrics = {
+            'pollers': poller_count,
+            'polls': len( seconds_list ) + result.error_count,
+            'requests_per_sec': round( len( seconds_list ) / elapsed_secs, 2 ) if elapsed_secs else None,
+            'target': 'live' if self._is_live else 'in_process',
+        }
+        return result
+
+    def _poll_status_in_thread( self, poll_count : int ) -> Tuple[ List[ float ], int ]:
+        try:
+            return self._poll_status( poll_count )
+        finally:
+            # In-process requests open a database connection per thread.
+            connections.close_all()
+
+    def _poll_status( self, poll_count : int ) -> Tuple[ List[ float ], int ]:
+        client = self._client_factory()
+        seconds_list = list()
+        error_count = 0
+        last_timestamp = None
+        try:
+            for _ in range( poll_count ):
+                start_time = time.perf_counter()
+                status_code, data = client.get_json( self._status_path( last_timestamp ))
+                elapsed_secs = time.perf_counter() - start_time
+                if status_code != 200 or data is None:
+                    error_count += 1
+                    continue
+                seconds_list.append( elapsed_secs )
+                # Consoles send back the previous server time, as should we.
+                last_timestamp = data.get( StatusView.ServerTimestampAttr )
+                continue
+        except requests.RequestException as e:
+            logger.warning( f'Status poller stopped: {e}' )
+            error_count += 1
+        finally:
+            client.close()
+        return seconds_list, error_count
+
+    def run_ingestion_latency( self,
+                               sample_count  : int,
+                               timeout_secs  : float ) -> BenchmarkResult:
+        """
+        Time from setting a sensor value in the HASS simulator until the
+        changed value shows in the entity state status of /api/status.
+        """
+        result = BenchmarkResult( name = 'ingestion_latency' )
+        if not ( self._is_live and self._simulator_url ):
+            result.skip_reason = 'Needs both --simulator-url and --hi-url.'
+            return result
+
+        candidate_list = self._get_ingestion_candidates()
+        if not candidate_list:
+            result.skip_reason = 'No numeric HASS sensors found in both the simulator and HI.'
+            return result
+
+        client = self._client_factory()
+        seconds_list = list()
+        try:
+            for sample_index in range( sample_count ):
+                hass_entity_id, entity_state_id, value = candidate_list[ sample_index % len( candidate_list ) ]
+                new_value = round( value + 1.0 + ( sample_index % 7 ), 1 )
+                candidate_list[ sample_index % len( candidate_list ) ] = ( hass_entity_id, entity_state_id, new_value )
+                elapsed_secs = self._time_one_ingestion(
+                    client = client,
+                    hass_entity_id = hass_entity_id,
+                    entity_state_id = entity_state_id,
+                    value = new_value,
+                    timeout_secs = timeout_secs,
+                )
+                if elapsed_secs is None:
+                    result.error_count += 1
+                else:
+                    seconds_list.append( elapsed_secs )
+                continue
+        finally:
+            client.close()
+
+        result.latency = LatencySummary.from_seconds( seconds_list )
+        result.metrics = {
+            'samples': sample_count,
+            'timeouts': result.error_count,
+            'sensor_count': len( candidate_list ),
+        }
+        return result
+
+    def _get_ingestion_candidates(self) -> List[ Tuple[ str, int, float ]]:
+        """ ( HASS entity id, HI entity state id, current value ) of numeric sensors. """
+        sensor_map = self._home.get_sensor_map()
+        response = requests.get( f'{self._simulator_url}{BenchmarkHome.HASS_SIMULATOR_PATH}/api/states',
+                                 timeout = LiveBenchmarkClient.TIMEOUT_SECS )
+        response.raise_for_status()
+        candidate_list = list()
+        for state_dict in response.json():
+            sensor = sensor_map.get( state_dict.get( 'entity_id' ))
+            if sensor is None:
+                continue
+            try:
+                value = float( state_dict.get( 'state' ))
+            except ( TypeError, ValueError ):
+                continue
+            candidate_list.append( ( state_dict['entity_id'], sensor.entity_state_id, value ) )
+            continue
+        return candidate_list
+
+    def _time_one_ingestion( self,
+                             client           : BenchmarkClient,
+                             hass_entity_id   : str,
+                             entity_state_id  : int,
+                             value            : float,
+                             timeout_secs     : float ) -> float:
+        baseline_row = self._get_status_row( client, entity_state_id )
+        response = requests.post(
+            f'{self._simulator_url}{BenchmarkHome.HASS_SIMULATOR_PATH}/api/states/{hass_entity_id}',
+            json = { 'state': str(value) },
+            timeout = LiveBenchmarkClient.TIMEOUT_SECS,
+        )
+        response.raise_for_status()
+        start_time = time.perf_counter()
+
+        # Compared as a whole since HI may convert units or round the value.
+        while ( time.perf_counter() - start_time ) < timeout_secs:
+            if self._get_status_row( client, entity_state_id ) != baseline_row:
+                return time.perf_counter() - start_time
+            time.sleep( self.INGESTION_POLL_INTERVAL_SECS )
+            continue
+        logger.warning( f'Ingestion of {hass_entity_id} not seen within {timeout_secs}s' )
+        return None
+
+    def _get_status_row( self, client : BenchmarkClient, entity_state_id : int ) -> Dict:
+        _, data = client.get_json( self._status_path() )
+        if not data:
+            return None
+        return data.get( StatusView.EntityStateStatusMapAttr, dict() ).get( str( entity_state_id ))
+
+    def _status_path( self, last_timestamp : str = None ) -> str:
+        path = reverse( 'api_status' )
+        if last_timestamp:
+            path += '?' + urlencode( { StatusView.LastServerTimestampAttr: last_timestamp } )
+        return path
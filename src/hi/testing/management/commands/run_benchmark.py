@@ -0,0 +1,134 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+import hi.apps.common.datetimeproxy as datetimeproxy
+from hi.testing.benchmark.benchmark_home import BenchmarkHome
+from hi.testing.benchmark.benchmark_models import BenchmarkReport
+from hi.testing.benchmark.benchmark_runner import (
+    BenchmarkRunner,
+    InProcessBenchmarkClient,
+    LiveBenchmarkClient,
+    in_process_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """
+    End-to-end performance benchmark against the simulator.
+
+    Seed the simulator first with:
+
+        ./manage.py seed_sim_profiles --benchmark --settings=hi.settings.simulator
+
+    and run the simulator.  Then "--setup" points the Home Assistant
+    integration at it, imports its entities and builds benchmark
+    locations.  Location view rendering is measured in-process.  Status
+    polling targets --hi-url when given (in-process otherwise), and
+    ingestion latency needs --hi-url since the running server's
+    integration monitors do the ingesting.  That server must run with
+    authentication suppressed.  Results are written as JSON.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--simulator-url',
+            default = 'http://127.0.0.1:7411',
+            help = 'Base URL of the running simulator.',
+        )
+        parser.add_argument(
+            '--hi-url',
+            default = None,
+            help = 'Base URL of a running HI server for live polling and ingestion.',
+        )
+        parser.add_argument(
+            '--setup',
+            action = 'store_true',
+            help = 'Configure the HASS integration, import entities and build locations first.',
+        )
+        parser.add_argument( '--locations', type = int, default = 4,
+                             help = 'Number of benchmark locations built by --setup.' )
+        parser.add_argument( '--render-repeats', type = int, default = 5,
+                             help = 'Warm renders per location view.' )
+        parser.add_argument( '--pollers', type = int, default = 8,
+                             help = 'Concurrent /api/status pollers.' )
+        parser.add_argument( '--polls', type = int, default = 50,
+                             help = 'Polls per poller.' )
+        parser.add_argument( '--ingestion-samples', type = int, default = 10,
+                             help = 'Simulator value changes to time.' )
+        parser.add_argument( '--ingestion-timeout', type = float, default = 30.0,
+                             help = 'Seconds to wait for each change to show in /api/status.' )
+        parser.add_argument( '--output', default = None,
+                             help = 'Write the JSON report to this file instead of stdout.' )
+        return
+
+    def handle(self, *args, **options):
+        for option_name in [ 'locations', 'render_repeats', 'pollers', 'polls', 'ingestion_samples' ]:
+            if options[option_name] < 1:
+                raise CommandError( f'--{option_name.replace("_", "-")} must be at least 1' )
+
+        home = BenchmarkHome()
+        if options['setup']:
+            self._setup_home( home, options )
+
+        hi_url = options['hi_url']
+        if hi_url:
+            client_factory = lambda: LiveBenchmarkClient( hi_url )  # noqa: E731
+        else:
+            client_factory = InProcessBenchmarkClient
+        runner = BenchmarkRunner(
+            client_factory = client_factory,
+            simulator_url = options['simulator_url'],
+            is_live = bool( hi_url ),
+            home = home,
+        )
+        report = BenchmarkReport(
+            started_datetime = datetimeproxy.now(),
+            config = { key: options[key] for key in [
+                'simulator_url', 'hi_url', 'locations', 'render_repeats', 'pollers',
+                'polls', 'ingestion_samples', 'ingestion_timeout',
+            ]},
+            home = home.get_counts(),
+        )
+
+        start_time = time.perf_counter()
+        with in_process_settings():
+            report.add_result( runner.run_location_views(
+                location_view_list = home.get_location_view_list(),
+                repeat_count = options['render_repeats'],
+            ))
+            report.add_result( runner.run_status_polling(
+                poller_count = options['pollers'],
+                polls_per_poller = options['polls'],
+            ))
+        report.add_result( runner.run_ingestion_latency(
+            sample_count = options['ingestion_samples'],
+            timeout_secs = options['ingestion_timeout'],
+        ))
+        report.duration_secs = round( time.perf_counter() - start_time, 3 )
+
+        report_json = report.to_json()
+        if options['output']:
+            with open( options['output'], 'w' ) as fh:
+                fh.write( report_json + '\n' )
+            self.stdout.write( self.style.SUCCESS( f'Wrote benchmark report to {options["output"]}' ))
+        else:
+            self.stdout.write( report_json )
+        return
+
+    def _setup_home( self, home : BenchmarkHome, options ):
+        self.stderr.write( f'Configuring HASS integration for {options["simulator_url"]}' )
+        home.configure_hass_integration( simulator_url = options['simulator_url'] )
+        try:
+            sync_result = home.import_hass_entities()
+        except Exception as e:
+            raise CommandError( f'HASS import from simulator failed: {e}' )
+        if sync_result.error_list:
+            self.stderr.write( f'HASS import reported {len(sync_result.error_list)} errors' )
+        location_view_list = home.build_locations( location_count = options['locations'] )
+        home.place_entities( location_view_list )
+        self.stderr.write( f'Benchmark home: {home.get_counts()}' )
+        return
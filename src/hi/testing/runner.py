@@ -12,6 +12,7 @@ import fakeredis
 from django.test import override_settings
 from django.test.runner import DiscoverRunner
 
+from hi.apps.common.model_change_dispatcher import ModelChangeDispatcher
 import hi.apps.common.redis_client as redis_client_module
 
 LOCMEM_CACHE = {
@@ -38,9 +39,15 @@ class HiTestRunner( DiscoverRunner ):
         # does not execute FLUSHDB on real Redis.
         self._cache_override = override_settings( CACHES = LOCMEM_CACHE )
         self._cache_override.enable()
+
+        # Deliver model changes on the committing thread so no
+        # background thread holds SQLite locks while tests write.
+        self._original_deliver_synchronously = ModelChangeDispatcher.DELIVER_SYNCHRONOUSLY
+        ModelChangeDispatcher.DELIVER_SYNCHRONOUSLY = True
         return
 
     def teardown_test_environment( self, **kwargs ):
+        ModelChangeDispatcher.DELIVER_SYNCHRONOUSLY = self._original_deliver_synchronously
         self._cache_override.disable()
         redis_client_module._g_global_redis_client = self._original_redis_client
         redis_client_module._g_global_redis_initialized_attempted = self._original_redis_initialized
@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+import json
+import logging
+
+from hi.apps.entity.models import Entity, EntityState
+from hi.apps.location.models import LocationView
+from hi.apps.sense.models import Sensor
+from hi.services.hass.hass_metadata import HassMetaData
+from hi.testing.base_test_case import BaseTestCase
+from hi.testing.benchmark.benchmark_home import BenchmarkHome
+from hi.testing.benchmark.benchmark_models import BenchmarkReport, BenchmarkResult, LatencySummary
+from hi.testing.benchmark.benchmark_runner import (
+    BenchmarkRunner,
+    InProcessBenchmarkClient,
+    in_process_settings,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class TestBenchmarkModels(BaseTestCase):
+
+    def test_latency_summary_percentiles_in_millis(self):
+        summary = LatencySummary.from_seconds( [ x / 1000.0 for x in range( 1, 101 ) ] )
+        self.assertEqual( summary.count, 100 )
+        self.assertAlmostEqual( summary.mean_ms, 50.5 )
+        self.assertAlmostEqual( summary.p50_ms, 50.5 )
+        self.assertAlmostEqual( summary.p99_ms, 99.01 )
+        self.assertAlmostEqual( summary.max_ms, 100.0 )
+
+    def test_latency_summary_empty(self):
+        summary = LatencySummary.from_seconds( [] )
+        self.assertEqual( summary.count, 0 )
+        self.assertIsNone( summary.p50_ms )
+
+    def test_report_json_keys_results_by_name(self):
+        report = BenchmarkReport(
+            started_datetime = datetime( 2026, 3, 1, tzinfo = timezone.utc ),
+            config = { 'pollers': 2 },
+        )
+        report.add_result( BenchmarkResult( name = 'a', latency = LatencySummary.from_seconds( [ 0.01 ] )))
+        report.add_result( BenchmarkResult( name = 'b', skip_reason = 'not configured' ))
+        data = json.loads( report.to_json() )
+        self.assertEqual( data['config'], { 'pollers': 2 } )
+        self.assertEqual( data['results']['a']['latency']['count'], 1 )
+        self.assertEqual( data['results']['b']['skip_reason'], 'not configured' )
+        self.assertNotIn( 'skip_reason', data['results']['a'] )
+
+
+class TestBenchmarkRunner(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.home = BenchmarkHome()
+        for index in range( 4 ):
+            entity = Entity.objects.create(
+                name = f'Bench Device {index}',
+                entity_type_str = 'THERMOMETER',
+                integration_id = HassMetaData.integration_id,
+                integration_name = f'bench_device_{index}',
+            )
+            entity_state = EntityState.objects.create(
+                entity = entity,
+                entity_state_type_str = 'TEMPERATURE' if index % 2 else 'ON_OFF',
+            )
+            Sensor.objects.create(
+                name = f'Bench Sensor {index}',
+                entity_state = entity_state,
+                sensor_type_str = 'DEFAULT',
+                integration_id = HassMetaData.integration_id,
+                integration_name = f'sensor.bench_device_{index}',
+            )
+            continue
+        self.runner = BenchmarkRunner(
+            client_factory = InProcessBenchmarkClient,
+            home = self.home,
+        )
+        return
+
+    def test_location_views_render_and_count_queries(self):
+        with self.isolated_media_root():
+            location_view_list = self.home.build_locations( location_count = 2 )
+            self.home.place_entities( location_view_list )
+            with in_process_settings():
+                result = self.runner.run_location_views(
+                    location_view_list = self.home.get_location_view_list(),
+                    repeat_count = 2,
+                )
+        self.assertFalse( result.is_skipped )
+        self.assertEqual( result.error_count, 0 )
+        self.assertEqual( result.latency.count, 4 )
+        self.assertEqual( result.metrics['view_count'], 2 )
+        self.assertGreater( result.metrics['query_count_max'], 0 )
+        self.assertEqual( self.home.get_counts()['location_views'], 2 )
+
+    def test_rebuilding_locations_replaces_previous(self):
+        with self.isolated_media_root():
+            self.home.build_locations( location_count = 3 )
+            self.home.build_locations( location_count = 2 )
+        self.assertEqual( LocationView.objects.filter(
+            location__name__startswith = BenchmarkHome.LOCATION_NAME_PREFIX ).count(), 2 )
+
+    def test_status_polling_in_process(self):
+        with in_process_settings():
+            result = self.runner.run_status_polling( poller_count = 1, polls_per_poller = 3 )
+        self.assertEqual( result.error_count, 0 )
+        self.assertEqual( result.latency.count, 3 )
+        self.assertEqual( result.metrics['target'], 'in_process' )
+
+    def test_sensor_map_has_only_numeric_sensors(self):
+        self.assertEqual( sorted( self.home.get_sensor_map().keys() ),
+                          [ 'sensor.bench_device_1', 'sensor.bench_device_3' ] )
+
+    def test_ingestion_skipped_without_live_server(self):
+        result = self.runner.run_ingestion_latency( sample_count = 2, timeout_secs = 1 )
+        self.assertTrue( result.is_skipped )
@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional
 import json
 
 from django.contrib.auth import get_user_model
+from django.core import signing
 from django.http import HttpResponse
 from django.test import Client
 
@@ -132,31 +133,47 @@ class ViewTestBase(BaseTestCase):
             self.assertTemplateRendered(response, template)
         return response
 
-    # Session Management Convenience Methods
-    
+    # View Parameter Convenience Methods
+    #
+    # The console view parameters are kept in a signed cookie (see
+    # ViewParameters), so these read and write the test client's cookie.
+
+    def getClientViewParameters(self) -> ViewParameters:
+        """Get the view parameters the client will send on its next request."""
+        morsel = self.client.cookies.get(ViewParameters.COOKIE_NAME)
+        if not morsel or not morsel.value:
+            return ViewParameters()
+        cookie_signer = signing.get_cookie_signer(
+            salt=ViewParameters.COOKIE_NAME + ViewParameters.COOKIE_SALT
+        )
+        return ViewParameters.from_token(cookie_signer.unsign(morsel.value))
+
+    def setClientViewParameters(self, view_parameters: ViewParameters):
+        """Set the view parameters the client sends on subsequent requests."""
+        cookie_signer = signing.get_cookie_signer(
+            salt=ViewParameters.COOKIE_NAME + ViewParameters.COOKIE_SALT
+        )
+        self.client.cookies[ViewParameters.COOKIE_NAME] = cookie_signer.sign(view_parameters.to_token())
+
     def setSessionViewType(self, view_type: ViewType):
-        """Set the view_type in the session for subsequent requests."""
-        session = self.client.session
-        session['view_type'] = str(view_type)
-        session.save()
+        """Set the view_type for subsequent requests."""
+        self.setSessionViewParameters(view_type=view_type)
     
     def setSessionViewMode(self, view_mode: ViewMode):
-        """Set the view_mode in the session for subsequent requests."""
-        session = self.client.session
-        session['view_mode'] = str(view_mode)
-        session.save()
+        """Set the view_mode for subsequent requests."""
+        self.setSessionViewParameters(view_mode=view_mode)
     
     def setSessionLocationView(self, location_view: Optional[LocationView]):
-        """Set the location_view_id in the session for subsequent requests."""
-        session = self.client.session
-        session['location_view_id'] = location_view.id if location_view else None
-        session.save()
+        """Set the location_view_id for subsequent requests."""
+        view_parameters = self.getClientViewParameters()
+        view_parameters.location_view_id = location_view.id if location_view else None
+        self.setClientViewParameters(view_parameters)
     
     def setSessionCollection(self, collection: Optional[Collection]):
-        """Set the collection_id in the session for subsequent requests."""
-        session = self.client.session
-        session['collection_id'] = collection.id if collection else None
-        session.save()
+        """Set the collection_id for subsequent requests."""
+        view_parameters = self.getClientViewParameters()
+        view_parameters.collection_id = collection.id if collection else None
+        self.setClientViewParameters(view_parameters)
     
     def setSessionViewParameters(self,
                                  view_type: Optional[ViewType] = None,
@@ -164,16 +181,16 @@ class ViewTestBase(BaseTestCase):
                                  location_view: Optional[LocationView] = None,
                                  collection: Optional[Collection] = None):
         """Convenience method to set multiple view parameters at once."""
-        session = self.client.session
+        view_parameters = self.getClientViewParameters()
         if view_type is not None:
-            session['view_type'] = str(view_type)
+            view_parameters.view_type = view_type
         if view_mode is not None:
-            session['view_mode'] = str(view_mode)
+            view_parameters.view_mode = view_mode
         if location_view is not None:
-            session['location_view_id'] = location_view.id
+            view_parameters.location_view_id = location_view.id
         if collection is not None:
-            session['collection_id'] = collection.id
-        session.save()
+            view_parameters.collection_id = collection.id
+        self.setClientViewParameters(view_parameters)
 
 
 class SyncTestMixin:
@@ -0,0 +1,92 @@
+import logging
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from hi.apps.collection.models import Collection
+from hi.apps.location.models import Location, LocationView
+from hi.enums import ViewMode, ViewType
+from hi.hi_grid_chrome_cache import HiGridChromeCache
+from hi.hi_grid_view import HiGridView
+from hi.testing.base_test_case import BaseTestCase
+
+logging.disable(logging.CRITICAL)
+
+
+class TestHiGridChromeCache(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.location = Location.objects.create(
+            name = 'Main House',
+            svg_fragment_filename = 'test.svg',
+            svg_view_box_str = '0 0 100 100',
+        )
+        self.location_view = LocationView.objects.create(
+            location = self.location,
+            name = 'Kitchen View',
+            location_view_type_str = 'default',
+            svg_view_box_str = '0 0 100 100',
+            svg_rotate = 0.0,
+            svg_style_name_str = 'color',
+        )
+        self.collection = Collection.objects.create(
+            name = 'Lights',
+            collection_type_str = 'other',
+            collection_view_type_str = 'grid',
+        )
+        self.view = HiGridView()
+        return
+
+    def create_request( self, **kwargs ):
+        kwargs.setdefault( 'view_type', ViewType.LOCATION_VIEW )
+        kwargs.setdefault( 'location_view_id', self.location_view.id )
+        return self.create_hi_request( **kwargs )
+
+    def render_panes( self, request ):
+        with CaptureQueriesContext( connection ) as context:
+            top_html = self.view.get_top_pane_html( request )
+            bottom_html = self.view.get_bottom_pane_html( request )
+        return top_html, bottom_html, len( context.captured_queries )
+
+    def test_panes_rendered_once_and_served_without_queries(self):
+        top_html, bottom_html, _ = self.render_panes( self.create_request() )
+        self.assertIn( 'Kitchen View', top_html )
+        self.assertIn( 'Main House', top_html )
+        self.assertIn( 'Lights', bottom_html )
+
+        cached_top_html, cached_bottom_html, query_count = self.render_panes( self.create_request() )
+        self.assertEqual( query_count, 0 )
+        self.assertEqual( cached_top_html, top_html )
+
+    def test_model_changes_invalidate_panes(self):
+        generation = HiGridChromeCache().generation
+        self.render_panes( self.create_request() )
+
+        self.collection.name = 'Cameras'
+        self.collection.save()
+        self.assertGreater( HiGridChromeCache().generation, generation )
+
+        _, bottom_html, _ = self.render_panes( self.create_request() )
+        self.assertIn( 'Cameras', bottom_html )
+
+        self.location_view.delete()
+        top_html, _, _ = self.render_panes( self.create_request() )
+        self.assertNotIn( 'Kitchen View', top_html )
+
+    def test_edit_mode_is_part_of_the_key(self):
+        top_html, _, _ = self.render_panes( self.create_request() )
+        edit_top_html, _, _ = self.render_panes( self.create_request( view_mode = ViewMode.EDIT ))
+        self.assertIn( 'EXIT EDIT', edit_top_html )
+        self.assertNotIn( 'EXIT EDIT', top_html )
+
+    def test_csrf_token_is_per_request(self):
+        first_request = self.create_request()
+        second_request = self.create_request()
+        _, first_bottom_html, _ = self.render_panes( first_request )
+        _, second_bottom_html, _ = self.render_panes( second_request )
+
+        self.assertNotIn( HiGridChromeCache.CSRF_TOKEN_PLACEHOLDER, first_bottom_html )
+        self.assertIn( 'csrfmiddlewaretoken', second_bottom_html )
+        self.assertNotEqual( first_request.META['CSRF_COOKIE'], second_request.META['CSRF_COOKIE'] )
+        self.assertNotIn( first_request.META['CSRF_COOKIE'], second_bottom_html )
@@ -0,0 +1,119 @@
+import logging
+import time
+
+from hi.apps.console.enums import DisplayUnits
+from hi.testing.base_test_case import BaseTestCase
+from hi.units import (
+    IMPERIAL_TO_METRIC_UNITS,
+    UnitQuantity,
+    get_display_quantity,
+    get_display_unit_conversion,
+    get_unit_conversion,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class TestUnitConversion(BaseTestCase):
+
+    SAMPLE_VALUES = [ -40.0, -3.5, 0.0, 1.0, 21.7, 68.0, 1013.25, 123456.0 ]
+
+    def test_compiled_conversions_match_pint_for_all_display_pairs(self):
+        for imperial_unit, metric_unit in IMPERIAL_TO_METRIC_UNITS.items():
+            for from_unit, to_unit in [ ( imperial_unit, metric_unit ), ( metric_unit, imperial_unit ) ]:
+                unit_conversion = get_unit_conversion( from_unit, to_unit )
+                self.assertTrue( unit_conversion.is_affine, f'{from_unit} -> {to_unit}' )
+                for value in self.SAMPLE_VALUES:
+                    expected = UnitQuantity( value, from_unit ).to( to_unit ).magnitude
+                    self.assertAlmostEqual(
+                        unit_conversion.convert( value ), expected,
+                        delta = 1e-9 * max( 1.0, abs( expected )),
+                        msg = f'{value} {from_unit} -> {to_unit}',
+                    )
+                continue
+            continue
+        return
+
+    def test_string_units_are_resolved(self):
+        unit_conversion = get_unit_conversion( '°C', 'degF' )
+        self.assertAlmostEqual( unit_conversion.convert( 100.0 ), 212.0 )
+        self.assertEqual( unit_conversion.unit_symbol, '°F' )
+        self.assertIs( get_unit_conversion( '°C', 'degF' ), unit_conversion )
+
+    def test_same_unit_is_identity(self):
+        unit_conversion = get_unit_conversion( 'W', 'W' )
+        self.assertTrue( unit_conversion.is_identity )
+        self.assertEqual( unit_conversion.convert( 12.5 ), 12.5 )
+
+    def test_non_affine_pair_falls_back_to_pint(self):
+        unit_conversion = get_unit_conversion( 'dBm', 'mW' )
+        self.assertFalse( unit_conversion.is_affine )
+        self.assertAlmostEqual( unit_conversion.convert( 10.0 ), 10.0 )
+        self.assertAlmostEqual( unit_conversion.convert( 20.0 ), 100.0 )
+
+    def test_unknown_or_incompatible_units_have_no_conversion(self):
+        self.assertIsNone( get_unit_conversion( 'not_a_unit', 'W' ))
+        self.assertIsNone( get_unit_conversion( 'W', 'degC' ))
+
+    def test_display_conversion_matches_get_display_quantity(self):
+        for unit_str in [ 'degF', '°C', 'mph', 'km/h', 'inHg', 'W', 'lx', '%' ]:
+            for display_units in DisplayUnits:
+                expected = get_display_quantity( UnitQuantity( 21.7, unit_str ), display_units )
+                unit_conversion = get_display_unit_conversion( unit_str, display_units )
+                self.assertEqual( unit_conversion.to_unit, expected.units )
+                self.assertEqual( unit_conversion.unit_symbol, f'{expected.units:~P}' )
+                self.assertAlmostEqual( unit_conversion.convert( 21.7 ), expected.magnitude )
+                continue
+            continue
+        return
+
+    def test_display_conversion_override(self):
+        unit_conversion = get_display_unit_conversion( 'kW', DisplayUnits.IMPERIAL, override_unit = 'W' )
+        self.assertEqual( unit_conversion.unit_symbol, 'W' )
+        self.assertAlmostEqual( unit_conversion.convert( 1.5 ), 1500.0 )
+
+        # An incompatible override displays the stored unit.
+        unit_conversion = get_display_unit_conversion( 'degC', DisplayUnits.IMPERIAL, override_unit = 'W' )
+        self.assertTrue( unit_conversion.is_identity )
+        self.assertEqual( unit_conversion.unit_symbol, '°C' )
+
+    def test_display_conversion_for_unknown_unit(self):
+        self.assertIsNone( get_display_unit_conversion( 'not_a_unit', DisplayUnits.METRIC ))
+
+
+class TestUnitConversionBenchmark(BaseTestCase):
+    """
+    Micro-benchmark of a compiled conversion against building a Pint
+    Quantity and converting it per value, the way the display and
+    ingestion paths used to.
+    """
+
+    ITERATIONS = 2000
+
+    def _seconds( self, convert_fn ):
+        start_time = time.perf_counter()
+        for index in range( self.ITERATIONS ):
+            convert_fn( float( index ))
+            continue
+        return time.perf_counter() - start_time
+
+    def test_compiled_conversion_is_faster_than_pint(self):
+        def pint_path( value ):
+            quantity = UnitQuantity( value, 'degF' )
+            display_quantity = get_display_quantity( quantity, DisplayUnits.METRIC )
+            return ( round( display_quantity.magnitude, 1 ), f'{display_quantity.units:~P}' )
+
+        def compiled_path( value ):
+            unit_conversion = get_display_unit_conversion( 'degF', DisplayUnits.METRIC )
+            return ( round( unit_conversion.convert( value ), 1 ), unit_conversion.unit_symbol )
+
+        self.assertEqual( pint_path( 68.0 ), compiled_path( 68.0 ))
+        pint_seconds = self._seconds( pint_path )
+        compiled_seconds = self._seconds( compiled_path )
+        logging.getLogger(__name__).info(
+            f'Pint: {pint_seconds / self.ITERATIONS * 1e6:.2f}us/value,'
+            f' compiled: {compiled_seconds / self.ITERATIONS * 1e6:.2f}us/value' )
+
+        # Loose bound so a loaded machine cannot make this flaky; the
+        # measured gap is well over an order of magnitude.
+        self.assertLess( compiled_seconds * 5, pint_seconds )
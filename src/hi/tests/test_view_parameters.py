@@ -0,0 +1,183 @@
+import logging
+
+from django.core import signing
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from hi.apps.collection.models import Collection
+from hi.apps.location.models import Location, LocationView
+from hi.enums import ViewMode, ViewType
+from hi.testing.base_test_case import BaseTestCase
+from hi.testing.view_test_base import SyncViewTestCase
+from hi.view_model_cache import ViewModelCache
+from hi.view_parameters import ViewParameters
+
+logging.disable(logging.CRITICAL)
+
+
+class ViewModelTestMixin:
+
+    def create_location( self, name, order_id = 0 ):
+        return Location.objects.create(
+            name = name,
+            svg_fragment_filename = 'test.svg',
+            svg_view_box_str = '0 0 100 100',
+            order_id = order_id,
+        )
+
+    def create_location_view( self, location, name, order_id = 0 ):
+        return LocationView.objects.create(
+            location = location,
+            name = name,
+            location_view_type_str = 'default',
+            svg_view_box_str = '0 0 100 100',
+            svg_rotate = 0.0,
+            svg_style_name_str = 'color',
+            order_id = order_id,
+        )
+
+    def create_collection( self, name ):
+        return Collection.objects.create(
+            name = name,
+            collection_type_str = 'other',
+            collection_view_type_str = 'grid',
+        )
+
+
+class TestViewParametersToken(BaseTestCase):
+
+    def signed_cookie_request( self, token ):
+        cookie_signer = signing.get_cookie_signer(
+            salt = ViewParameters.COOKIE_NAME + ViewParameters.COOKIE_SALT )
+        request = RequestFactory().get( '/' )
+        request.COOKIES[ViewParameters.COOKIE_NAME] = cookie_signer.sign( token )
+        request.session = { 'view_type': str( ViewType.CONFIGURATION ) }
+        return request
+
+    def test_token_round_trip(self):
+        view_parameters = ViewParameters(
+            view_type = ViewType.COLLECTION,
+            view_mode = ViewMode.EDIT,
+            location_view_id = 12,
+            collection_id = 7,
+        )
+        restored = ViewParameters.from_token( view_parameters.to_token() )
+        self.assertEqual( restored, view_parameters )
+
+        restored = ViewParameters.from_token( ViewParameters().to_token() )
+        self.assertIsNone( restored.location_view_id )
+        self.assertIsNone( restored.collection_id )
+
+    def test_malformed_token_gives_defaults(self):
+        view_parameters = ViewParameters.from_token( 'bogus' )
+        self.assertEqual( view_parameters.view_type, ViewType.default() )
+        self.assertEqual( view_parameters.view_mode, ViewMode.default() )
+        self.assertIsNone( view_parameters.location_view_id )
+
+    def test_cookie_takes_precedence_over_session(self):
+        request = self.signed_cookie_request( f'{ViewType.COLLECTION}|{ViewMode.MONITOR}||3' )
+        view_parameters = ViewParameters.from_session( request )
+        self.assertEqual( view_parameters.view_type, ViewType.COLLECTION )
+        self.assertEqual( view_parameters.collection_id, 3 )
+
+    def test_tampered_cookie_falls_back_to_session(self):
+        request = self.signed_cookie_request( f'{ViewType.COLLECTION}|{ViewMode.MONITOR}||3' )
+        request.COOKIES[ViewParameters.COOKIE_NAME] += 'x'
+        view_parameters = ViewParameters.from_session( request )
+        self.assertEqual( view_parameters.view_type, ViewType.CONFIGURATION )
+        self.assertIsNone( view_parameters.collection_id )
+
+
+class TestViewParametersCookie( ViewModelTestMixin, SyncViewTestCase ):
+
+    def setUp(self):
+        super().setUp()
+        self.collection = self.create_collection( 'Lights' )
+        return
+
+    def test_view_change_is_saved_to_cookie_not_session(self):
+        response = self.client.get( reverse( 'collection_view',
+                                             kwargs = { 'collection_id': self.collection.id } ))
+        self.assertSuccessResponse( response )
+        self.assertIn( ViewParameters.COOKIE_NAME, response.cookies )
+
+        view_parameters = self.getClientViewParameters()
+        self.assertEqual( view_parameters.view_type, ViewType.COLLECTION )
+        self.assertEqual( view_parameters.collection_id, self.collection.id )
+        self.assertNotIn( 'collection_id', self.client.session )
+
+    def test_unchanged_view_does_not_reset_cookie(self):
+        url = reverse( 'collection_view', kwargs = { 'collection_id': self.collection.id } )
+        self.client.get( url )
+        response = self.client.get( url )
+        self.assertSuccessResponse( response )
+        self.assertNotIn( ViewParameters.COOKIE_NAME, response.cookies )
+
+    def test_session_view_moves_to_cookie(self):
+        session = self.client.session
+        session['view_type'] = str( ViewType.COLLECTION )
+        session['collection_id'] = self.collection.id
+        session.save()
+
+        response = self.client.get( reverse( 'api_status' ))
+        self.assertIn( ViewParameters.COOKIE_NAME, response.cookies )
+        self.assertEqual( self.getClientViewParameters().collection_id, self.collection.id )
+
+
+class TestViewModelCache( ViewModelTestMixin, BaseTestCase ):
+
+    def test_lookups_after_first_load_make_no_queries(self):
+        location = self.create_location( 'Main House' )
+        location_view = self.create_location_view( location, 'Kitchen' )
+        collection = self.create_collection( 'Lights' )
+        view_parameters = ViewParameters(
+            location_view_id = location_view.id,
+            collection_id = collection.id,
+        )
+        self.assertEqual( view_parameters.location_view.name, 'Kitchen' )
+        self.assertEqual( view_parameters.collection.name, 'Lights' )
+
+        view_parameters = ViewParameters(
+            location_view_id = location_view.id,
+            collection_id = collection.id,
+        )
+        with CaptureQueriesContext( connection ) as context:
+            self.assertEqual( view_parameters.location_view.name, 'Kitchen' )
+            self.assertEqual( view_parameters.location.name, 'Main House' )
+            self.assertEqual( view_parameters.collection.name, 'Lights' )
+        self.assertEqual( len( context.captured_queries ), 0 )
+
+    def test_default_location_view_follows_order(self):
+        second_location = self.create_location( 'Second', order_id = 2 )
+        first_location = self.create_location( 'First', order_id = 1 )
+        self.create_location_view( second_location, 'Second View' )
+        self.create_location_view( first_location, 'Later View', order_id = 5 )
+        first_view = self.create_location_view( first_location, 'Earlier View', order_id = 3 )
+
+        view_parameters = ViewParameters()
+        self.assertEqual( view_parameters.location_view, first_view )
+        self.assertEqual( view_parameters.location_view_id, first_view.id )
+        self.assertEqual( view_parameters.location, first_location )
+
+    def test_changes_invalidate_cache(self):
+        location = self.create_location( 'Main House' )
+        location_view = self.create_location_view( location, 'Kitchen' )
+        cache = ViewModelCache()
+        self.assertEqual( cache.get_location_view( location_view.id ).name, 'Kitchen' )
+
+        location_view.name = 'Pantry'
+        location_view.save()
+        self.assertEqual( cache.get_location_view( location_view.id ).name, 'Pantry' )
+
+        location_view.delete()
+        view_parameters = ViewParameters( location_view_id = location_view.id )
+        self.assertIsNone( view_parameters.location_view )
+        self.assertIsNone( view_parameters.location_view_id )
+
+    def test_returned_instances_are_independent(self):
+        collection = self.create_collection( 'Lights' )
+        cache = ViewModelCache()
+        cache.get_collection( collection.id ).name = 'Changed'
+        self.assertEqual( cache.get_collection( collection.id ).name, 'Lights' )
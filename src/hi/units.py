@@ -1,4 +1,10 @@
+from dataclasses import dataclass
+from functools import lru_cache
+import math
+from typing import Optional, Union
+
 from pint import UnitRegistry
+from pint import Unit as PintUnit
 from hi.apps.console.enums import DisplayUnits
 
 ureg = UnitRegistry()
@@ -81,4 +87,127 @@ def get_display_quantity( quantity : UnitQuantity, display_units : DisplayUnits
         except Exception:
             pass
     return quantity
-    
+
+
+# Compiled conversions
+#
+# Building a Quantity and calling ``.to()`` costs tens of microseconds,
+# which adds up on the status display and integration ingestion paths
+# that convert every value they touch.  Nearly every conversion between
+# two units is affine, so each ( from, to ) pair is resolved through Pint
+# once and then applied as plain float arithmetic.  The few that are not
+# (logarithmic units such as dBm <-> mW) keep using Pint.
+
+# Magnitudes used to check that a pair is affine before compiling it.
+# The scale is then measured over a wide span so the float error in
+# Pint's own offset arithmetic is negligible relative to it.
+_AFFINE_PROBE_VALUES = ( -40.0, 1000.0 )
+_AFFINE_SCALE_SPAN = 1.0e6
+
+
+@dataclass( frozen = True )
+class UnitConversion:
+    """ A unit pair resolved to ``to_value = from_value * scale + offset``. """
+
+    from_unit    : PintUnit
+    to_unit      : PintUnit
+    scale        : float
+    offset       : float
+    unit_symbol  : str   # Abbreviated pretty form of to_unit (the "~P" format)
+    is_identity  : bool  = False
+    is_affine    : bool  = True
+
+    def convert( self, value : float ) -> float:
+        if self.is_identity:
+            return value
+        if self.is_affine:
+            return value * self.scale + self.offset
+        return UnitQuantity( value, self.from_unit ).to( self.to_unit ).magnitude
+
+
+def _parse_unit( unit : Union[ str, PintUnit ] ) -> PintUnit:
+    # Parsed through a Quantity, the way get_display_quantity() sees
+    # units, so a unit string maps to an equal key in the display maps.
+    return UnitQuantity( 1.0, unit ).units
+
+
+def _format_unit_symbol( unit : PintUnit ) -> str:
+    try:
+        return f'{unit:~P}'
+    except Exception:
+        return ''
+
+
+def _compile_unit_conversion( from_unit : PintUnit, to_unit : PintUnit ) -> UnitConversion:
+    """ Raises if the units are not compatible. """
+    if from_unit == to_unit:
+        return UnitConversion(
+            from_unit = from_unit,
+            to_unit = to_unit,
+            scale = 1.0,
+            offset = 0.0,
+            unit_symbol = _format_unit_symbol( to_unit ),
+            is_identity = True,
+        )
+
+    def pint_convert( value ):
+        return float( UnitQuantity( value, from_unit ).to( to_unit ).magnitude )
+
+    offset = pint_convert( 0.0 )
+    scale = pint_convert( 1.0 ) - offset
+    is_affine = all([ math.isclose( pint_convert( x ), x * scale + offset, rel_tol = 1e-9, abs_tol = 1e-9 )
+                      for x in _AFFINE_PROBE_VALUES ])
+    if is_affine:
+        scale = ( pint_convert( _AFFINE_SCALE_SPAN ) - offset ) / _AFFINE_SCALE_SPAN
+    return UnitConversion(
+        from_unit = from_unit,
+        to_unit = to_unit,
+        scale = scale,
+        offset = offset,
+        unit_symbol = _format_unit_symbol( to_unit ),
+        is_affine = is_affine,
+    )
+
+
+@lru_cache( maxsize = 4096 )
+def get_unit_conversion( from_unit : Union[ str, PintUnit ],
+                         to_unit    : Union[ str, PintUnit ] ) -> Optional[ UnitConversion ]:
+    """
+    The compiled conversion between two units, or None if either unit
+    is unknown or they are not compatible.
+    """
+    try:
+        return _compile_unit_conversion( _parse_unit( from_unit ), _parse_unit( to_unit ) )
+    except Exception:
+        return None
+
+
+@lru_cache( maxsize = 4096 )
+def get_display_unit_conversion( unit           : Union[ str, PintUnit ],
+                                 display_units  : DisplayUnits,
+                                 override_unit  : Optional[ str ]  = None ) -> Optional[ UnitConversion ]:
+    """
+    The compiled conversion from a stored unit to the unit it should be
+    displayed in: the override unit if given, else the display_units
+    counterpart per get_display_quantity().  Falls back to displaying the
+    stored unit when the target is not compatible.  None only if the
+    stored unit is unknown.
+    """
+    try:
+        from_unit = _parse_unit( unit )
+    except Exception:
+        return None
+
+    if override_unit is not None:
+        target_unit_list = [ override_unit ]
+    else:
+        conversion_map = DisplayUnitsConversionMaps.get( display_units, IMPERIAL_TO_METRIC_UNITS )
+        target_unit_list = [ conversion_map[from_unit] ] if from_unit in conversion_map else []
+
+    for target_unit in target_unit_list:
+        try:
+            return _compile_unit_conversion( from_unit, _parse_unit( target_unit ) )
+        except Exception:
+            continue
+    return _compile_unit_conversion( from_unit, from_unit )
+
@@ -0,0 +1,132 @@
+import logging
+from threading import Lock
+from typing import Dict, List, Tuple, Type
+
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from hi.apps.collection.models import Collection
+from hi.apps.common.singleton import Singleton
+from hi.apps.location.models import Location, LocationView
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRowTable:
+    """ Field values of every row of one model, keyed by id. """
+
+    def __init__( self, model_class : Type[ models.Model ] ):
+        self._model_class = model_class
+        self._field_names = [ x.attname for x in model_class._meta.concrete_fields ]
+        self._id_index = self._field_names.index( 'id' )
+        self._order_id_index = self._field_names.index( 'order_id' )
+        self._row_map : Dict[ int, Tuple ] = {
+            row[self._id_index]: row
+            for row in model_class.objects.values_list( *self._field_names )
+        }
+        return
+
+    def get( self, row_id : int ) -> models.Model:
+        row = self._row_map.get( row_id )
+        if row is None:
+            return None
+        # A new instance per call so callers can modify what they get.
+        return self._model_class.from_db( None, self._field_names, row )
+
+    def ordered_ids( self, **filters ) -> List[ int ]:
+        """ Ids in (order_id, id) order, limited to rows matching the field values given. """
+        filter_items = [ ( self._field_names.index( x ), y ) for x, y in filters.items() ]
+        rows = [ row for row in self._row_map.values()
+                 if all( row[index] == value for index, value in filter_items ) ]
+        rows.sort( key = lambda row: ( row[self._order_id_index], row[self._id_index] ))
+        return [ row[self._id_index] for row in rows ]
+
+
+class ViewModelCache( Singleton ):
+    """
+    In-process copy of the locations, location views and collections that
+    every console request resolves from its view parameters.
+
+    These tables are small and only change while editing, so they are
+    loaded whole on first use after a change, and any save/delete of them
+    discards the copy.  Lookups return fresh model instances and make no
+    database queries.
+    """
+
+    def __init_singleton__(self):
+        self._location_table = None
+        self._location_view_table = None
+        self._collection_table = None
+        self._generation = 0
+        self._lock = Lock()
+        return
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._location_table = None
+            self._location_view_table = None
+            self._collection_table = None
+        return
+
+    def get_location_view( self, location_view_id : int ) -> LocationView:
+        location_view_table, location_table = self._get_location_tables()
+        location_view = location_view_table.get( location_view_id )
+        if location_view:
+            location_view.location = location_table.get( location_view.location_id )
+        return location_view
+
+    def get_default_location_view(self) -> LocationView:
+        """ The first view of the first location, if any. """
+        location_view_table, location_table = self._get_location_tables()
+        location_ids = location_table.ordered_ids()
+        if not location_ids:
+            return None
+        location_view_ids = location_view_table.ordered_ids( location_id = location_ids[0] )
+        if not location_view_ids:
+            return None
+        return self.get_location_view( location_view_ids[0] )
+
+    def get_collection( self, collection_id : int ) -> Collection:
+        with self._lock:
+            generation = self._generation
+            collection_table = self._collection_table
+
+        if collection_table is None:
+            collection_table = ModelRowTable( Collection )
+            with self._lock:
+                if self._generation == generation:
+                    self._collection_table = collection_table
+        return collection_table.get( collection_id )
+
+    def _get_location_tables(self) -> Tuple[ ModelRowTable, ModelRowTable ]:
+        with self._lock:
+            generation = self._generation
+            location_view_table = self._location_view_table
+            location_table = self._location_table
+
+        if location_view_table is None or location_table is None:
+            logger.debug( 'Loading location tables for view model cache.' )
+            location_view_table = ModelRowTable( LocationView )
+            location_table = ModelRowTable( Location )
+            with self._lock:
+                if self._generation == generation:
+                    self._location_view_table = location_view_table
+                    self._location_table = location_table
+        return ( location_view_table, location_table )
+
+
+@receiver( post_save, sender = Location )
+@receiver( post_save, sender = LocationView )
+@receiver( post_save, sender = Collection )
+@receiver( post_delete, sender = Location )
+@receiver( post_delete, sender = LocationView )
+@receiver( post_delete, sender = Collection )
+def view_model_changed( sender, instance, **kwargs ):
+    ViewModelCache().invalidate()
+    return
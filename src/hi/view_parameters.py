@@ -1,15 +1,29 @@
 from dataclasses import dataclass
 
-from django.http import HttpRequest
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
 
 from hi.apps.collection.models import Collection
 from hi.apps.location.models import Location, LocationView
 
 from .enums import ViewMode, ViewType
+from .view_model_cache import ViewModelCache
 
 
 @dataclass
 class ViewParameters:
+    """
+    The console's current view, kept in a small signed cookie rather than
+    in the session so that the frequent console polling requests need no
+    session backend reads or writes.  There is nothing private here: a
+    tampered cookie can only select a view the console could navigate to
+    anyway.  Anything that must not be under client control (e.g., the
+    console lock) belongs in the session.
+    """
+
+    COOKIE_NAME = 'hi_view'
+    COOKIE_SALT = 'hi.view_parameters'
+    TOKEN_SEPARATOR = '|'
 
     # For anything in this view state that needs to be kept in sync with
     # Javascript, add global variables in the base.html template at start
@@ -54,24 +68,16 @@ class ViewParameters:
     def location_view(self) -> LocationView:
         if self._location_view:
             return self._location_view
-        try:            
-            if self.location_view_id is None:
-                location = Location.objects.all().order_by( 'order_id' ).first()
-                if not location:
-                    raise Location.DoesNotExist()
-                self._location_view = location.views.all().order_by( 'order_id' ).first()
-                if not self._location_view:
-                    raise LocationView.DoesNotExist()
-            else:
-                queryset = LocationView.objects.select_related('location')
-                self._location_view = queryset.get( id = self.location_view_id )
-                
-            self.location_view_id = self._location_view.id
-            self._location = self._location_view.location
-            return self._location_view
-        except ( Location.DoesNotExist, LocationView.DoesNotExist ):
+        if self.location_view_id is None:
+            self._location_view = ViewModelCache().get_default_location_view()
+        else:
+            self._location_view = ViewModelCache().get_location_view( self.location_view_id )
+        if not self._location_view:
             self.location_view_id = None
             return None
+        self.location_view_id = self._location_view.id
+        self._location = self._location_view.location
+        return self._location_view
 
     def update_location_view( self, location_view : LocationView ):
         if not location_view:
@@ -96,12 +102,10 @@ class ViewParameters:
             return self._collection
         if self.collection_id is None:
             return None
-        try:
-            self._collection = Collection.objects.get( id = self.collection_id )
-            return self._collection
-        except Collection.DoesNotExist:
+        self._collection = ViewModelCache().get_collection( self.collection_id )
+        if not self._collection:
             self.collection_id = None
-            return None
+        return self._collection
         
     def update_collection( self, collection : Collection ):
         if not collection:
@@ -119,37 +123,88 @@ class ViewParameters:
         return self.collection
         
     def to_session( self, request : HttpRequest ):
-        if not hasattr( request, 'session' ):
-            return
-        request.session['view_type'] = str(self.view_type)
-        request.session['view_mode'] = str(self.view_mode)
-        request.session['location_view_id'] = self.location_view_id
-        request.session['collection_id'] = self.collection_id
+        """
+        Records these as the console's view parameters, which the
+        ViewMiddleware saves to the view cookie if they changed.
+        """
+        request.view_parameters_token = self.to_token()
         return
 
     @staticmethod
     def from_session( request : HttpRequest ):
         if not request:
             return ViewParameters()
+
+        token = ViewParameters.get_cookie_token( request )
+        if token is not None:
+            return ViewParameters.from_token( token )
+
+        # Consoles from before the view cookie have their view in the session.
         if not hasattr( request, 'session' ):
             return ViewParameters()
+        return ViewParameters.from_values(
+            view_type_str = request.session.get( 'view_type' ),
+            view_mode_str = request.session.get( 'view_mode' ),
+            location_view_id_str = request.session.get( 'location_view_id' ),
+            collection_id_str = request.session.get( 'collection_id' ),
+        )
 
-        view_type = ViewType.from_name_safe( name = request.session.get( 'view_type' ))
-        view_mode = ViewMode.from_name_safe( name = request.session.get( 'view_mode' ))
+    def to_token(self) -> str:
+        return self.TOKEN_SEPARATOR.join([
+            str( self.view_type ),
+            str( self.view_mode ),
+            '' if self.location_view_id is None else str( self.location_view_id ),
+            '' if self.collection_id is None else str( self.collection_id ),
+        ])
 
+    @staticmethod
+    def from_token( token : str ):
+        values = token.split( ViewParameters.TOKEN_SEPARATOR )
+        values += [ None ] * ( 4 - len( values ))
+        return ViewParameters.from_values(
+            view_type_str = values[0],
+            view_mode_str = values[1],
+            location_view_id_str = values[2],
+            collection_id_str = values[3],
+        )
+
+    @staticmethod
+    def from_values( view_type_str         : str,
+                     view_mode_str         : str,
+                     location_view_id_str  : str,
+                     collection_id_str     : str ):
         try:
-            location_view_id = int( request.session.get( 'location_view_id' ))
+            location_view_id = int( location_view_id_str )
         except ( TypeError, ValueError ):
             location_view_id = None
         try:
-            collection_id = int( request.session.get( 'collection_id' ))
+            collection_id = int( collection_id_str )
         except ( TypeError, ValueError ):
             collection_id = None
 
         return ViewParameters(
-            view_type = view_type,
-            view_mode = view_mode,
+            view_type = ViewType.from_name_safe( name = view_type_str ),
+            view_mode = ViewMode.from_name_safe( name = view_mode_str ),
             location_view_id = location_view_id,
             collection_id = collection_id,
         )
-    
+
+    @classmethod
+    def get_cookie_token( cls, request : HttpRequest ) -> str:
+        """ None if the request has no valid view cookie. """
+        if not hasattr( request, 'COOKIES' ):
+            return None
+        return request.get_signed_cookie( cls.COOKIE_NAME, default = None, salt = cls.COOKIE_SALT )
+
+    @classmethod
+    def set_cookie_token( cls, response : HttpResponse, token : str ):
+        response.set_signed_cookie(
+            cls.COOKIE_NAME,
+            token,
+            salt = cls.COOKIE_SALT,
+            max_age = settings.SESSION_COOKIE_AGE,
+            secure = settings.SESSION_COOKIE_SECURE,
+            httponly = True,
+            samesite = settings.SESSION_COOKIE_SAMESITE,
+        )
+        return